@@ -0,0 +1,4 @@
+"""パイプライン性能計測用のベンチマークスイート。
+
+``python -m benchmarks run`` で計測し、``python -m benchmarks compare`` でベースラインと比較する。
+"""
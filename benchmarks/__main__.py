@@ -0,0 +1,138 @@
+"""ベンチマークスイートのコマンドラインエントリポイント。"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+from . import api_load
+from .cases import CASES, DEFAULT_TEMPLATE, BenchmarkEnv
+from .harness import (DEFAULT_METRIC, DEFAULT_THRESHOLD, build_result_payload,
+                      compare_results, load_results, measure, write_results)
+from .synthetic import DeckShape
+
+DEFAULT_OUTPUT = Path(".pptx/benchmarks/latest.json")
+_DEFAULT_SHAPE = DeckShape()
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="パイプラインのベンチマーク")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="ベンチマークを実行して結果を JSON に保存する")
+    run_parser.add_argument("--slides", type=int, default=_DEFAULT_SHAPE.slides)
+    run_parser.add_argument("--bullets", type=int, default=_DEFAULT_SHAPE.bullets_per_slide, help="スライドあたりの箇条書き数")
+    run_parser.add_argument("--tables", type=int, default=_DEFAULT_SHAPE.tables)
+    run_parser.add_argument("--table-rows", type=int, default=_DEFAULT_SHAPE.table_rows)
+    run_parser.add_argument("--table-cols", type=int, default=_DEFAULT_SHAPE.table_cols)
+    run_parser.add_argument("--charts", type=int, default=_DEFAULT_SHAPE.charts)
+    run_parser.add_argument("--images", type=int, default=_DEFAULT_SHAPE.images)
+    run_parser.add_argument("--template", type=Path, default=DEFAULT_TEMPLATE)
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--only", action="append", choices=sorted(CASES), help="実行するケース（複数指定可）")
+    run_parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    run_parser.add_argument("--baseline", type=Path, help="指定時は実行後にベースラインと比較する")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    compare_parser = subparsers.add_parser("compare", help="保存済みの結果をベースラインと比較する")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="許容する悪化率 (0.1 = 10%%)")
+    compare_parser.add_argument("--metric", default=DEFAULT_METRIC, choices=["min_s", "median_s", "mean_s"])
+
+    load_parser = subparsers.add_parser("api-load", help="レビュー API を並列リクエストで計測する（p50 / p99）")
+    load_parser.add_argument("--concurrency", type=int, default=api_load.DEFAULT_CONCURRENCY, help="同時ワーカー数（spec 数）")
+    load_parser.add_argument("--iterations", type=int, default=api_load.DEFAULT_ITERATIONS, help="ワーカーあたりの繰り返し回数")
+    load_parser.add_argument("--output", type=Path, help="指定時は集計結果を JSON で保存する")
+
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace) -> int:
+    shape = DeckShape(
+        slides=args.slides,
+        bullets_per_slide=args.bullets,
+        tables=args.tables,
+        table_rows=args.table_rows,
+        table_cols=args.table_cols,
+        charts=args.charts,
+        images=args.images,
+    )
+    names = args.only or list(CASES)
+    results = []
+    with tempfile.TemporaryDirectory(prefix="pptx-bench-") as tmp:
+        env = BenchmarkEnv(shape=shape, workdir=Path(tmp), template_path=args.template)
+        for name in names:
+            target = CASES[name](env)
+            result = measure(name, target, repeat=args.repeat, warmup=args.warmup)
+            summary = result.summary()
+            print(f"{name:<32} median={summary['median_s']:.6f}s min={summary['min_s']:.6f}s")
+            results.append(result)
+
+    payload = build_result_payload(results, shape=shape.as_dict())
+    output = write_results(args.output, payload)
+    print(f"結果を保存しました: {output}")
+
+    if args.baseline is not None:
+        return _report(load_results(args.baseline), payload, threshold=args.threshold, metric=DEFAULT_METRIC)
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    return _report(
+        load_results(args.baseline),
+        load_results(args.current),
+        threshold=args.threshold,
+        metric=args.metric,
+    )
+
+
+def api_load_run(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory(prefix="pptx-api-load-") as tmp:
+        content_store, draft_store, spec_ids = api_load.seed_stores(Path(tmp), max(1, args.concurrency))
+        with api_load.serve(api_load.build_app(content_store, draft_store)) as base_url:
+            try:
+                latencies = asyncio.run(api_load.run_load(base_url, spec_ids, iterations=args.iterations))
+            except RuntimeError as exc:
+                print(exc, file=sys.stderr)
+                return 2
+
+    print(api_load.format_table(latencies))
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        payload = {name: record.summary() for name, record in latencies.items()}
+        args.output.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"結果を保存しました: {args.output}")
+    return 1 if any(record.errors for record in latencies.values()) else 0
+
+
+def _report(baseline: dict, current: dict, *, threshold: float, metric: str) -> int:
+    report = compare_results(baseline, current, threshold=threshold, metric=metric)
+    print(report.format_table())
+    regressions = report.regressions
+    if regressions:
+        names = ", ".join(item.name for item in regressions)
+        print(f"{len(regressions)} 件の性能劣化を検出しました (閾値 {threshold:.0%}): {names}")
+        return 1
+    print("性能劣化は検出されませんでした")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    logging.basicConfig(level=logging.WARNING)
+    args = parse_args(argv)
+    if args.command == "run":
+        return run(args)
+    if args.command == "api-load":
+        return api_load_run(args)
+    return compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
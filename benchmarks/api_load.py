@@ -0,0 +1,221 @@
+"""レビュー API の負荷試験（同時接続時のレイテンシ p50 / p99 を計測する）。
+
+一時ディレクトリ上のストアでコンテンツ承認 API とドラフト API をローカルの uvicorn に載せ、
+httpx.AsyncClient から並列にリクエストを送る。各ワーカーは専用の spec を操作するため、
+If-Match の競合（412）は発生しない前提で計測する。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import socket
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+from fastapi import FastAPI
+
+from pptx_generator.api import create_app
+from pptx_generator.api.draft_app import create_draft_app
+from pptx_generator.api.draft_store import DraftStore
+from pptx_generator.api.store import CardState, ContentStore
+from pptx_generator.models import (ContentElements, ContentSlide,
+                                   DraftDocument, DraftSection, DraftSlideCard)
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_ITERATIONS = 20
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """線形補間でパーセンタイルを求める（``pct`` は 0〜100）。"""
+
+    if not samples:
+        msg = "サンプルが空です"
+        raise ValueError(msg)
+    ordered = sorted(samples)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+@dataclass(slots=True)
+class EndpointLatency:
+    """1 エンドポイント分のレイテンシ（秒）とエラー件数。"""
+
+    name: str
+    samples: list[float] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self) -> dict[str, Any]:
+        if not self.samples:
+            return {"requests": 0, "errors": self.errors}
+        return {
+            "requests": len(self.samples),
+            "errors": self.errors,
+            "p50_ms": percentile(self.samples, 50) * 1000,
+            "p99_ms": percentile(self.samples, 99) * 1000,
+            "max_ms": max(self.samples) * 1000,
+        }
+
+
+def seed_stores(workdir: Path, spec_count: int) -> tuple[ContentStore, DraftStore, list[str]]:
+    """ワーカー数分の spec（カード 1 枚とボード 1 枚）を用意する。"""
+
+    content_store = ContentStore(base_dir=workdir / "content")
+    draft_store = DraftStore(base_dir=workdir / "draft")
+    spec_ids = [f"load-{index:03d}" for index in range(spec_count)]
+    for spec_id in spec_ids:
+        slide = ContentSlide(id="cover", intent="cover", elements=ContentElements(title="Cover", body=["本文"]))
+        content_store.create_cards(spec_id, [CardState(slide=slide)])
+        board = DraftDocument(
+            sections=[
+                DraftSection(
+                    name="Main",
+                    order=1,
+                    slides=[DraftSlideCard(ref_id="cover", order=1, layout_hint="Title")],
+                )
+            ]
+        )
+        draft_store.create_board(spec_id, board)
+    return content_store, draft_store, spec_ids
+
+
+def build_app(content_store: ContentStore, draft_store: DraftStore) -> FastAPI:
+    """両 API を 1 つのアプリケーションにまとめる（パスは重複しない）。"""
+
+    app = create_app(content_store)
+    app.mount("/", create_draft_app(draft_store))
+    return app
+
+
+@contextmanager
+def serve(app: FastAPI) -> Iterator[str]:
+    """アプリケーションを別スレッドの uvicorn で起動し、ベース URL を返す。"""
+
+    import uvicorn
+
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="off"))
+    thread = threading.Thread(target=server.run, name="api-load-server", daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            msg = "負荷試験用サーバーの起動に失敗しました"
+            raise RuntimeError(msg)
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+
+
+async def run_load(
+    base_url: str,
+    spec_ids: list[str],
+    *,
+    iterations: int = DEFAULT_ITERATIONS,
+) -> dict[str, EndpointLatency]:
+    """spec ごとに 1 ワーカーを割り当て、読み取り・条件付き GET・更新を繰り返す。"""
+
+    try:
+        import httpx
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        msg = "API 負荷試験には httpx が必要です（uv sync --extra dev）"
+        raise RuntimeError(msg) from exc
+
+    latencies: dict[str, EndpointLatency] = defaultdict(lambda: EndpointLatency(name=""))
+    headers = _auth_headers()
+
+    async def timed(client: httpx.AsyncClient, name: str, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        started = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        elapsed = time.perf_counter() - started
+        record = latencies[name]
+        record.name = name
+        record.samples.append(elapsed)
+        if response.status_code >= 400:
+            record.errors += 1
+        return response
+
+    async def worker(client: httpx.AsyncClient, spec_id: str) -> None:
+        params = {"spec_id": spec_id}
+        for index in range(iterations):
+            card = await timed(client, "GET content card", "GET", "/v1/content/cards/cover", params=params)
+            etag = card.headers.get("ETag", "")
+            await timed(
+                client,
+                "GET content card (304)",
+                "GET",
+                "/v1/content/cards/cover",
+                params=params,
+                headers={"If-None-Match": etag},
+            )
+            await timed(
+                client,
+                "PATCH content card",
+                "PATCH",
+                "/v1/content/cards/cover",
+                params=params,
+                headers={"If-Match": etag, "X-Actor": "load"},
+                json={"title": f"Cover {index}", "body": ["本文"]},
+            )
+            board = await timed(client, "GET draft board", "GET", "/v1/draft/board", params=params)
+            await timed(
+                client,
+                "PATCH draft hint",
+                "PATCH",
+                "/v1/draft/slides/cover/hint",
+                params=params,
+                headers={"If-Match": board.headers.get("ETag", ""), "X-Actor": "load"},
+                json={"layout_hint": "Title" if index % 2 else "Title and Content"},
+            )
+
+    limits = httpx.Limits(max_connections=len(spec_ids), max_keepalive_connections=len(spec_ids))
+    async with httpx.AsyncClient(base_url=base_url, headers=headers, limits=limits, timeout=30) as client:
+        await asyncio.gather(*(worker(client, spec_id) for spec_id in spec_ids))
+    return dict(latencies)
+
+
+def format_table(latencies: dict[str, EndpointLatency]) -> str:
+    lines = [f"{'endpoint':<28} {'requests':>8} {'p50_ms':>9} {'p99_ms':>9} {'max_ms':>9} {'errors':>6}"]
+    for name, record in latencies.items():
+        summary = record.summary()
+        if not summary["requests"]:
+            continue
+        lines.append(
+            f"{name:<28} {summary['requests']:>8} {summary['p50_ms']:>9.2f} {summary['p99_ms']:>9.2f}"
+            f" {summary['max_ms']:>9.2f} {summary['errors']:>6}"
+        )
+    return "\n".join(lines)
+
+
+def _auth_headers() -> dict[str, str]:
+    # 両 API のトークンが異なる場合は content 側を優先する（負荷試験ではトークン無しを推奨）
+    token = os.environ.get("CONTENT_API_TOKEN") or os.environ.get("DRAFT_API_TOKEN")
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+__all__ = [
+    "DEFAULT_CONCURRENCY",
+    "DEFAULT_ITERATIONS",
+    "EndpointLatency",
+    "build_app",
+    "format_table",
+    "percentile",
+    "run_load",
+    "seed_stores",
+    "serve",
+]
@@ -0,0 +1,178 @@
+"""パイプライン各工程のベンチマークケース。"""
+
+from __future__ import annotations
+
+import itertools
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from pptx_generator.api.store import CardState, ContentStore
+from pptx_generator.generate_ready import generate_ready_to_jobspec
+from pptx_generator.pipeline import (AnalyzerOptions, DraftStructuringOptions,
+                                     DraftStructuringStep, MappingOptions,
+                                     MappingStep, PipelineContext,
+                                     RenderingAuditStep, RenderingOptions,
+                                     SimpleAnalyzerStep, SimpleRendererStep)
+
+from .synthetic import (DeckShape, build_content_document,
+                        build_generate_ready, build_jobspec,
+                        write_layouts_jsonl)
+
+DEFAULT_TEMPLATE = Path("samples/templates/templates.pptx")
+
+
+@dataclass(slots=True)
+class BenchmarkEnv:
+    """ケース間で共有する入力と作業ディレクトリ。"""
+
+    shape: DeckShape
+    workdir: Path
+    template_path: Path = DEFAULT_TEMPLATE
+
+    def subdir(self, name: str) -> Path:
+        path = self.workdir / name
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+
+# setup は計測対象外。戻り値の callable のみ計測する。
+CaseSetup = Callable[[BenchmarkEnv], Callable[[], object]]
+
+
+def _renderer(env: BenchmarkEnv) -> Callable[[], object]:
+    spec = build_jobspec(env.shape)
+    workdir = env.subdir("renderer")
+    step = SimpleRendererStep(RenderingOptions(template_path=env.template_path))
+
+    def run() -> None:
+        step.run(PipelineContext(spec=spec, workdir=workdir))
+
+    return run
+
+
+def _rendered_context(env: BenchmarkEnv, name: str) -> PipelineContext:
+    context = PipelineContext(spec=build_jobspec(env.shape), workdir=env.subdir(name))
+    SimpleRendererStep(RenderingOptions(template_path=env.template_path)).run(context)
+    return context
+
+
+def _analyzer(env: BenchmarkEnv) -> Callable[[], object]:
+    context = _rendered_context(env, "analyzer")
+    step = SimpleAnalyzerStep(AnalyzerOptions())
+
+    def run() -> None:
+        step.run(context)
+
+    return run
+
+
+def _rendering_audit(env: BenchmarkEnv) -> Callable[[], object]:
+    context = _rendered_context(env, "rendering_audit")
+    step = RenderingAuditStep()
+
+    def run() -> None:
+        step.run(context)
+
+    return run
+
+
+def _mapping(env: BenchmarkEnv) -> Callable[[], object]:
+    spec = build_jobspec(env.shape)
+    content = build_content_document(env.shape)
+    workdir = env.subdir("mapping")
+    layouts_path = write_layouts_jsonl(workdir / "layouts.jsonl", env.shape)
+    step = MappingStep(
+        MappingOptions(
+            layouts_path=layouts_path,
+            output_dir=workdir,
+            template_path=env.template_path,
+        )
+    )
+
+    def run() -> None:
+        context = PipelineContext(spec=spec, workdir=workdir)
+        context.add_artifact("content_approved", content)
+        step.run(context)
+
+    return run
+
+
+def _draft_structuring(env: BenchmarkEnv) -> Callable[[], object]:
+    # MockLLMClient を使い、ドラフトボードは作業ディレクトリ配下へ保存する
+    os.environ["PPTX_LLM_PROVIDER"] = "mock"
+    workdir = env.subdir("draft_structuring")
+    os.environ["DRAFT_STORE_DIR"] = str(workdir / "draft_store")
+    spec = build_jobspec(env.shape)
+    content = build_content_document(env.shape)
+    layouts_path = write_layouts_jsonl(workdir / "layouts.jsonl", env.shape)
+    step = DraftStructuringStep(
+        DraftStructuringOptions(layouts_path=layouts_path, output_dir=workdir)
+    )
+
+    def run() -> None:
+        context = PipelineContext(spec=spec, workdir=workdir)
+        context.add_artifact("content_approved", content)
+        step.run(context)
+
+    return run
+
+
+def _content_store(env: BenchmarkEnv) -> Callable[[], object]:
+    store = ContentStore(env.subdir("content_store"))
+    content = build_content_document(env.shape)
+    counter = itertools.count(1)
+
+    def run() -> None:
+        spec_id = f"bench-{next(counter)}"
+        cards = [CardState(slide=slide.model_copy(update={"status": "draft"}, deep=True)) for slide in content.slides]
+        etag = store.create_cards(spec_id, cards)
+        for card in cards:
+            slide_id = card.slide.id
+            etag, _ = store.update_card(
+                spec_id,
+                slide_id,
+                title=None,
+                body=None,
+                table_data=None,
+                note="benchmark",
+                intent=None,
+                type_hint=None,
+                story=None,
+                autofix_applied=None,
+                expected_etag=etag,
+                actor="benchmarks",
+            )
+            etag, _, _ = store.approve_card(
+                spec_id,
+                slide_id,
+                notes=None,
+                applied_autofix=None,
+                expected_etag=etag,
+                actor="benchmarks",
+            )
+            store.get_card(spec_id, slide_id)
+        store.list_logs(spec_id=spec_id, limit=len(cards) * 2)
+
+    return run
+
+
+def _generate_ready_to_jobspec(env: BenchmarkEnv) -> Callable[[], object]:
+    document = build_generate_ready(env.shape)
+
+    def run() -> None:
+        generate_ready_to_jobspec(document)
+
+    return run
+
+
+CASES: dict[str, CaseSetup] = {
+    "renderer": _renderer,
+    "analyzer": _analyzer,
+    "rendering_audit": _rendering_audit,
+    "mapping": _mapping,
+    "draft_structuring": _draft_structuring,
+    "content_store": _content_store,
+    "generate_ready_to_jobspec": _generate_ready_to_jobspec,
+}
@@ -0,0 +1,160 @@
+"""ベンチマークの計測・結果保存・比較ロジック。"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+RESULT_SCHEMA_VERSION = "1"
+DEFAULT_METRIC = "median_s"
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """1 ケース分の計測結果。"""
+
+    name: str
+    samples: list[float]
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "repeat": len(self.samples),
+            "min_s": min(self.samples),
+            "median_s": statistics.median(self.samples),
+            "mean_s": statistics.fmean(self.samples),
+            "stdev_s": statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0,
+            "max_s": max(self.samples),
+        }
+
+
+@dataclass(slots=True)
+class Comparison:
+    """ベースラインとの比較結果。"""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        if self.baseline <= 0:
+            return float("inf") if self.current > 0 else 1.0
+        return self.current / self.baseline
+
+    def is_regression(self, threshold: float) -> bool:
+        return self.ratio > 1.0 + threshold
+
+
+@dataclass(slots=True)
+class ComparisonReport:
+    """比較レポート全体。"""
+
+    metric: str
+    threshold: float
+    comparisons: list[Comparison] = field(default_factory=list)
+    missing: list[str] = field(default_factory=list)
+    added: list[str] = field(default_factory=list)
+
+    @property
+    def regressions(self) -> list[Comparison]:
+        return [item for item in self.comparisons if item.is_regression(self.threshold)]
+
+    def format_table(self) -> str:
+        lines = [f"{'benchmark':<40} {'baseline':>12} {'current':>12} {'ratio':>8}  status"]
+        for item in self.comparisons:
+            status = "REGRESSION" if item.is_regression(self.threshold) else "ok"
+            lines.append(
+                f"{item.name:<40} {item.baseline:>12.6f} {item.current:>12.6f} {item.ratio:>8.3f}  {status}"
+            )
+        for name in self.missing:
+            lines.append(f"{name:<40} {'-':>12} {'-':>12} {'-':>8}  missing")
+        for name in self.added:
+            lines.append(f"{name:<40} {'-':>12} {'-':>12} {'-':>8}  new")
+        return "\n".join(lines)
+
+
+def measure(
+    name: str,
+    target: Callable[[], object],
+    *,
+    repeat: int,
+    warmup: int = 1,
+) -> BenchmarkResult:
+    """``target`` を warmup 後に ``repeat`` 回実行し、経過時間を記録する。"""
+
+    if repeat < 1:
+        msg = "repeat は 1 以上を指定してください"
+        raise ValueError(msg)
+    for _ in range(warmup):
+        target()
+    samples: list[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        target()
+        samples.append(time.perf_counter() - start)
+    return BenchmarkResult(name=name, samples=samples)
+
+
+def build_result_payload(
+    results: Iterable[BenchmarkResult],
+    *,
+    shape: dict[str, Any],
+) -> dict[str, Any]:
+    return {
+        "schema_version": RESULT_SCHEMA_VERSION,
+        "meta": {
+            "generated_at": datetime.now(timezone.utc).isoformat(),
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "shape": shape,
+        },
+        "benchmarks": {result.name: result.summary() for result in results},
+    }
+
+
+def write_results(path: Path, payload: dict[str, Any]) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(payload, dict) or not isinstance(payload.get("benchmarks"), dict):
+        msg = f"ベンチマーク結果の形式が不正です: {path}"
+        raise ValueError(msg)
+    return payload
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    metric: str = DEFAULT_METRIC,
+) -> ComparisonReport:
+    """2 つの結果を比較し、``threshold`` を超えて遅くなったケースを抽出する。"""
+
+    baseline_cases: dict[str, Any] = baseline["benchmarks"]
+    current_cases: dict[str, Any] = current["benchmarks"]
+    report = ComparisonReport(metric=metric, threshold=threshold)
+    for name in sorted(baseline_cases):
+        if name not in current_cases:
+            report.missing.append(name)
+            continue
+        report.comparisons.append(
+            Comparison(
+                name=name,
+                baseline=float(baseline_cases[name][metric]),
+                current=float(current_cases[name][metric]),
+            )
+        )
+    report.added = sorted(set(current_cases) - set(baseline_cases))
+    return report
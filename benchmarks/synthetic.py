@@ -0,0 +1,224 @@
+"""ベンチマーク用の合成デッキ生成器。"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from pptx_generator.models import (ContentApprovalDocument, ContentElements,
+                                   ContentSlide, GenerateReadyDocument,
+                                   GenerateReadyMeta, GenerateReadySlide,
+                                   JobAuth, JobMeta, JobSpec, MappingSlideMeta)
+
+DEFAULT_LAYOUT = "One Column Detail"
+DEFAULT_IMAGE_SOURCE = "samples/assets/logo.png"
+
+_CONTENT_BODY_LIMIT = 6
+_CONTENT_LINE_LIMIT = 40
+
+
+@dataclass(slots=True, frozen=True)
+class DeckShape:
+    """合成デッキの規模を表すパラメータ。
+
+    表・チャート・画像はデッキ全体の個数で指定し、先頭スライドから順に 1 枚 1 要素ずつ配置する。
+    """
+
+    slides: int = 20
+    bullets_per_slide: int = 5
+    tables: int = 4
+    table_rows: int = 6
+    table_cols: int = 4
+    charts: int = 2
+    images: int = 2
+    layout: str = DEFAULT_LAYOUT
+    image_source: str = DEFAULT_IMAGE_SOURCE
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def slide_id(index: int) -> str:
+    return f"s{index:04d}"
+
+
+def build_jobspec_payload(shape: DeckShape) -> dict[str, Any]:
+    """JobSpec 互換の dict を生成する。"""
+
+    slides: list[dict[str, Any]] = []
+    for index in range(1, shape.slides + 1):
+        sid = slide_id(index)
+        slide: dict[str, Any] = {
+            "id": sid,
+            "layout": shape.layout,
+            "title": f"合成スライド {index}",
+            "notes": f"スライド {index} の発表メモ",
+            "bullets": [
+                {
+                    "items": [
+                        {
+                            "id": f"{sid}-b{bullet:02d}",
+                            "text": _bullet_text(index, bullet),
+                            "level": bullet % 2,
+                        }
+                        for bullet in range(1, shape.bullets_per_slide + 1)
+                    ]
+                }
+            ]
+            if shape.bullets_per_slide
+            else [],
+        }
+        if index <= shape.tables:
+            slide["tables"] = [_table_payload(sid, shape)]
+        if index <= shape.charts:
+            slide["charts"] = [_chart_payload(sid)]
+        if index <= shape.images:
+            slide["images"] = [
+                {"id": f"{sid}-image", "source": shape.image_source, "sizing": "fit"}
+            ]
+        slides.append(slide)
+
+    return {
+        "meta": {
+            "schema_version": "1.1",
+            "title": "Synthetic Benchmark Deck",
+            "client": "Benchmark",
+            "author": "benchmarks",
+            "created_at": "2025-01-01",
+            "theme": "standard",
+            "locale": "ja-JP",
+        },
+        "auth": {"created_by": "benchmarks"},
+        "slides": slides,
+    }
+
+
+def build_jobspec(shape: DeckShape) -> JobSpec:
+    return JobSpec.model_validate(build_jobspec_payload(shape))
+
+
+def build_generate_ready(shape: DeckShape) -> GenerateReadyDocument:
+    """generate_ready.json 相当のドキュメントを生成する。"""
+
+    slides: list[GenerateReadySlide] = []
+    for index in range(1, shape.slides + 1):
+        sid = slide_id(index)
+        elements: dict[str, Any] = {
+            "title": f"合成スライド {index}",
+            "note": f"スライド {index} の発表メモ",
+            "body": [_bullet_text(index, bullet) for bullet in range(1, shape.bullets_per_slide + 1)],
+        }
+        if index <= shape.tables:
+            table = _table_payload(sid, shape)
+            elements["table"] = {"headers": table["columns"], "rows": table["rows"]}
+        if index <= shape.charts:
+            chart = _chart_payload(sid)
+            elements["chart"] = {
+                "type": chart["type"],
+                "categories": chart["categories"],
+                "series": chart["series"],
+            }
+        if index <= shape.images:
+            elements["image"] = {"source": shape.image_source, "sizing": "fit"}
+        slides.append(
+            GenerateReadySlide(
+                layout_id=_layout_id(shape.layout),
+                layout_name=shape.layout,
+                elements=elements,
+                meta=MappingSlideMeta(section="Synthetic", page_no=index, sources=[sid]),
+            )
+        )
+
+    spec = build_jobspec_payload(DeckShape(slides=0))
+    return GenerateReadyDocument(
+        slides=slides,
+        meta=GenerateReadyMeta(
+            template_version="synthetic",
+            generated_at="2025-01-01T00:00:00+00:00",
+            job_meta=JobMeta.model_validate(spec["meta"]),
+            job_auth=JobAuth.model_validate(spec["auth"]),
+        ),
+    )
+
+
+def build_content_document(shape: DeckShape) -> ContentApprovalDocument:
+    """承認済みカード一式を生成する。ID は JobSpec のスライド ID と一致させる。"""
+
+    slides: list[ContentSlide] = []
+    for index in range(1, shape.slides + 1):
+        body_count = min(shape.bullets_per_slide, _CONTENT_BODY_LIMIT)
+        slides.append(
+            ContentSlide(
+                id=slide_id(index),
+                intent="overview" if index == 1 else "detail",
+                type_hint="content",
+                elements=ContentElements(
+                    title=f"合成スライド {index}",
+                    body=[
+                        _bullet_text(index, bullet)[:_CONTENT_LINE_LIMIT]
+                        for bullet in range(1, body_count + 1)
+                    ],
+                ),
+                status="approved",
+            )
+        )
+    return ContentApprovalDocument(slides=slides)
+
+
+def write_layouts_jsonl(path: Path, shape: DeckShape) -> Path:
+    """DraftStructuring / Mapping 用の最小 layouts.jsonl を書き出す。"""
+
+    records = [
+        {
+            "layout_id": _layout_id(shape.layout),
+            "layout_name": shape.layout,
+            "usage_tags": ["content", "detail"],
+            "text_hint": {"max_lines": max(shape.bullets_per_slide, 1)},
+            "media_hint": {"allow_table": True},
+        },
+        {
+            "layout_id": "title",
+            "layout_name": "Title",
+            "usage_tags": ["title", "overview"],
+            "text_hint": {"max_lines": 3},
+            "media_hint": {"allow_table": False},
+        },
+    ]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "\n".join(json.dumps(record, ensure_ascii=False) for record in records) + "\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def _bullet_text(slide_index: int, bullet_index: int) -> str:
+    return f"ポイント {slide_index}-{bullet_index}: 合成本文テキスト"
+
+
+def _table_payload(sid: str, shape: DeckShape) -> dict[str, Any]:
+    columns = [f"列{col}" for col in range(1, shape.table_cols + 1)]
+    rows = [
+        [f"R{row}C{col}" for col in range(1, shape.table_cols + 1)]
+        for row in range(1, shape.table_rows + 1)
+    ]
+    return {"id": f"{sid}-table", "columns": columns, "rows": rows}
+
+
+def _chart_payload(sid: str) -> dict[str, Any]:
+    categories = ["Q1", "Q2", "Q3", "Q4"]
+    return {
+        "id": f"{sid}-chart",
+        "type": "bar",
+        "categories": categories,
+        "series": [
+            {"name": "計画", "values": [10, 12, 14, 16]},
+            {"name": "実績", "values": [9, 13, 15, 18]},
+        ],
+    }
+
+
+def _layout_id(layout_name: str) -> str:
+    return layout_name.strip().lower().replace(" ", "_")
@@ -2,5 +2,6 @@
 
 from .app import create_app
 from .draft_app import create_draft_app
+from .job_app import create_job_app
 
-__all__ = ["create_app", "create_draft_app"]
+__all__ = ["create_app", "create_draft_app", "create_job_app"]
@@ -7,10 +7,16 @@ from datetime import datetime
 from typing import Annotated
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from ..models import ContentElements, ContentSlide, ContentTableData
 from . import schemas
-from .store import (CardState, ContentStore, RevisionMismatchError,
+from .audit_log import AuditLogCursorError, cursor_position
+from .change_feed import stream_changes
+from .executor import StoreExecutor, get_default_executor
+from .response_cache import ResponseBodyCache, etag_matches, not_modified
+from .store import (BulkOperationError, CardOperation, CardOperationResult,
+                    CardState, ContentStore, RevisionMismatchError,
                     SlideNotFoundError, SpecAlreadyExistsError, SpecNotFoundError)
 
 
@@ -22,12 +28,17 @@ def _get_auth_token() -> str | None:
     return os.environ.get("CONTENT_API_TOKEN")
 
 
-def create_app(store: ContentStore | None = None) -> FastAPI:
-    """Create FastAPI application instance."""
+def create_app(store: ContentStore | None = None, *, executor: StoreExecutor | None = None) -> FastAPI:
+    """Create FastAPI application instance.
+
+    ハンドラーはイベントループ上で動き、ストア I/O は ``executor``（省略時はプロセス共有）で実行する。
+    """
 
     app = FastAPI(title="Content Approval API", version="1.0.0")
     content_store = store or _create_store()
     api_token = _get_auth_token()
+    card_bodies = ResponseBodyCache()
+    store_executor = executor or get_default_executor()
 
     async def verify_token(authorization: Annotated[str | None, Header(alias="Authorization")] = None) -> None:
         if api_token is None:
@@ -38,13 +49,13 @@ def create_app(store: ContentStore | None = None) -> FastAPI:
         if token != api_token:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid token")
 
-    def get_actor(x_actor: Annotated[str | None, Header(alias="X-Actor")] = None) -> str | None:
+    async def get_actor(x_actor: Annotated[str | None, Header(alias="X-Actor")] = None) -> str | None:
         return x_actor
 
-    def get_request_id(x_request_id: Annotated[str | None, Header(alias="X-Request-ID")] = None) -> str | None:
+    async def get_request_id(x_request_id: Annotated[str | None, Header(alias="X-Request-ID")] = None) -> str | None:
         return x_request_id
 
-    def require_etag(if_match: Annotated[str | None, Header(alias="If-Match")] = None) -> str:
+    async def require_etag(if_match: Annotated[str | None, Header(alias="If-Match")] = None) -> str:
         if not if_match:
             raise HTTPException(
                 status_code=status.HTTP_428_PRECONDITION_REQUIRED,
@@ -59,7 +70,7 @@ def create_app(store: ContentStore | None = None) -> FastAPI:
         responses={409: {"model": schemas.ErrorResponse}},
         dependencies=[Depends(verify_token)],
     )
-    def create_cards(
+    async def create_cards(
         payload: schemas.CreateCardsRequest,
         actor: str | None = Depends(get_actor),
         request_id: str | None = Depends(get_request_id),
@@ -82,7 +93,7 @@ def create_app(store: ContentStore | None = None) -> FastAPI:
             cards.append(CardState(slide=slide, story=card.story.model_dump() if card.story else None))
 
         try:
-            etag = content_store.create_cards(payload.spec_id, cards)
+            etag = await store_executor.run(content_store.create_cards, payload.spec_id, cards)
         except SpecAlreadyExistsError as exc:
             raise HTTPException(
                 status_code=status.HTTP_409_CONFLICT,
@@ -107,7 +118,7 @@ def create_app(store: ContentStore | None = None) -> FastAPI:
         },
         dependencies=[Depends(verify_token)],
     )
-    def update_card(
+    async def update_card(
         slide_id: str,
         payload: schemas.CardUpdate,
         request: Request,
@@ -119,7 +130,8 @@ def create_app(store: ContentStore | None = None) -> FastAPI:
         table = payload.table_data.to_content_table() if payload.table_data else None
 
         try:
-            new_etag, content_hash = content_store.update_card(
+            new_etag, content_hash = await store_executor.run(
+                content_store.update_card,
                 spec_id=spec_id,
                 slide_id=slide_id,
                 title=payload.title,
@@ -156,7 +168,7 @@ def create_app(store: ContentStore | None = None) -> FastAPI:
         },
         dependencies=[Depends(verify_token)],
     )
-    def approve_card(
+    async def approve_card(
         slide_id: str,
         payload: schemas.CardApproveRequest,
         actor: str | None = Depends(get_actor),
@@ -165,7 +177,8 @@ def create_app(store: ContentStore | None = None) -> FastAPI:
         spec_id: str = Query(..., min_length=1),
     ) -> Response:
         try:
-            new_etag, status_value, locked_at = content_store.approve_card(
+            new_etag, status_value, locked_at = await store_executor.run(
+                content_store.approve_card,
                 spec_id=spec_id,
                 slide_id=slide_id,
                 notes=payload.notes,
@@ -200,7 +213,7 @@ def create_app(store: ContentStore | None = None) -> FastAPI:
         },
         dependencies=[Depends(verify_token)],
     )
-    def return_card(
+    async def return_card(
         slide_id: str,
         payload: schemas.CardReturnRequest,
         actor: str | None = Depends(get_actor),
@@ -209,7 +222,8 @@ def create_app(store: ContentStore | None = None) -> FastAPI:
         spec_id: str = Query(..., min_length=1),
     ) -> Response:
         try:
-            new_etag, status_value = content_store.return_card(
+            new_etag, status_value = await store_executor.run(
+                content_store.return_card,
                 spec_id=spec_id,
                 slide_id=slide_id,
                 reason=payload.reason,
@@ -231,64 +245,139 @@ def create_app(store: ContentStore | None = None) -> FastAPI:
             headers={"ETag": new_etag},
         )
 
+    @app.post(
+        "/v1/content/cards/bulk",
+        response_model=schemas.BulkCardResponse,
+        responses={
+            404: {"model": schemas.ErrorResponse},
+            409: {"model": schemas.BulkErrorResponse},
+            412: {"model": schemas.ErrorResponse},
+        },
+        dependencies=[Depends(verify_token)],
+    )
+    async def apply_bulk(
+        payload: schemas.BulkCardRequest,
+        actor: str | None = Depends(get_actor),
+        request_id: str | None = Depends(get_request_id),
+        etag: str = Depends(require_etag),
+        spec_id: str = Query(..., min_length=1),
+    ) -> Response:
+        operations = [_card_operation(item) for item in payload.operations]
+        try:
+            new_etag, results = await store_executor.run(
+                content_store.apply_card_operations,
+                spec_id,
+                operations,
+                expected_etag=etag,
+                actor=actor,
+            )
+        except SpecNotFoundError as exc:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=_error("not_found", str(exc))) from exc
+        except RevisionMismatchError as exc:
+            raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail=_error("conflict", str(exc))) from exc
+        except BulkOperationError as exc:
+            detail = schemas.BulkErrorResponse(
+                error="bulk_failed",
+                message=str(exc),
+                results=[_bulk_result(result) for result in exc.results],
+            )
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail.model_dump(mode="json")) from exc
+
+        body = schemas.BulkCardResponse(revision=new_etag, results=[_bulk_result(result) for result in results])
+        return Response(
+            content=body.model_dump_json(),
+            media_type="application/json",
+            headers={"ETag": new_etag},
+        )
+
     @app.get(
         "/v1/content/cards/{slide_id}",
         response_model=schemas.CardResponse,
         responses={404: {"model": schemas.ErrorResponse}},
         dependencies=[Depends(verify_token)],
     )
-    def get_card(
+    async def get_card(
         slide_id: str,
         spec_id: str = Query(..., min_length=1),
+        if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
     ) -> Response:
+        def load() -> tuple[str, bytes | None]:
+            etag = content_store.get_card_etag(spec_id, slide_id)
+            if etag_matches(if_none_match, etag):
+                return etag, None
+            content = card_bodies.get((spec_id, slide_id), etag)
+            if content is None:
+                card_state, etag = content_store.get_card(spec_id, slide_id)
+                content = _card_body(content_store, spec_id, slide_id, card_state, etag)
+                card_bodies.put((spec_id, slide_id), etag, content)
+            return etag, content
+
         try:
-            card_state, etag = content_store.get_card(spec_id, slide_id)
+            etag, content = await store_executor.run(load)
         except SpecNotFoundError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=_error("not_found", str(exc))) from exc
         except SlideNotFoundError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=_error("not_found", str(exc))) from exc
 
-        history = _history_for_slide(content_store, spec_id, slide_id)
-        body = schemas.CardResponse(
+        if content is None:
+            return not_modified(etag)
+        return Response(content=content, media_type="application/json", headers={"ETag": etag})
+
+    @app.get(
+        "/v1/content/changes",
+        response_class=StreamingResponse,
+        responses={400: {"model": schemas.ErrorResponse}},
+        dependencies=[Depends(verify_token)],
+    )
+    async def stream_card_changes(
+        spec_id: str | None = Query(default=None),
+        cursor: str | None = Query(default=None),
+        follow: bool = Query(default=True),
+        last_event_id: Annotated[str | None, Header(alias="Last-Event-ID")] = None,
+    ) -> StreamingResponse:
+        resume_from = cursor or last_event_id
+        if resume_from:
+            try:
+                cursor_position(resume_from)
+            except AuditLogCursorError as exc:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=_error("invalid_cursor", str(exc))) from exc
+        events = stream_changes(
+            content_store.changes,
+            lambda after: content_store.list_changes(spec_id, after),
             spec_id=spec_id,
-            slide_id=slide_id,
-            title=card_state.slide.elements.title,
-            body=list(card_state.slide.elements.body),
-            table_data=_table_payload(card_state.slide.elements.table_data),
-            note=card_state.slide.elements.note,
-            intent=card_state.slide.intent,
-            type_hint=card_state.slide.type_hint,
-            story=_story_payload(card_state.story),
-            status=card_state.slide.status,
-            revision=etag,
-            history=history,
-        )
-        return Response(
-            content=body.model_dump_json(),
-            media_type="application/json",
-            headers={"ETag": etag},
+            head=lambda: content_store.head_change_cursor(spec_id),
+            cursor=resume_from,
+            follow=follow,
+            executor=store_executor,
         )
+        return StreamingResponse(events, media_type="text/event-stream", headers=_SSE_HEADERS)
 
     @app.get(
         "/v1/content/logs",
         response_model=schemas.LogsResponse,
         dependencies=[Depends(verify_token)],
     )
-    def list_logs(
+    async def list_logs(
         spec_id: str | None = Query(default=None),
         action: str | None = Query(default=None),
         since: str | None = Query(default=None),
         limit: int = Query(default=100, ge=1, le=500),
         offset: int = Query(default=0, ge=0),
+        cursor: str | None = Query(default=None),
     ) -> schemas.LogsResponse:
         since_dt = datetime.fromisoformat(since) if since else None
-        items, next_offset = content_store.list_logs(
-            spec_id=spec_id,
-            action=action,
-            since=since_dt,
-            limit=limit,
-            offset=offset,
-        )
+        try:
+            items, next_cursor = await store_executor.run(
+                content_store.list_logs,
+                spec_id=spec_id,
+                action=action,
+                since=since_dt,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+            )
+        except AuditLogCursorError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=_error("invalid_cursor", str(exc))) from exc
         response_items = [
             schemas.LogEntry(
                 spec_id=item["spec_id"],
@@ -304,7 +393,8 @@ def create_app(store: ContentStore | None = None) -> FastAPI:
         ]
         return schemas.LogsResponse(
             items=response_items,
-            next_offset=str(next_offset) if next_offset is not None else None,
+            next_offset=str(offset + len(items)) if next_cursor is not None and cursor is None else None,
+            next_cursor=next_cursor,
         )
 
     return app
@@ -325,12 +415,57 @@ def _story_payload(story: dict | None) -> schemas.StoryMetadata | None:
     return schemas.StoryMetadata.model_validate(story)
 
 
+def _card_operation(item: schemas.BulkCardOperation) -> CardOperation:
+    if item.action == "update":
+        params: dict[str, object] = {
+            "title": item.title,
+            "body": item.body,
+            "table_data": item.table_data.to_content_table() if item.table_data else None,
+            "note": item.note,
+            "intent": item.intent,
+            "type_hint": item.type_hint,
+            "story": item.story.model_dump() if item.story else None,
+            "autofix_applied": item.autofix_applied,
+        }
+    elif item.action == "approve":
+        params = {"notes": item.notes, "applied_autofix": item.applied_autofix}
+    else:
+        params = {"reason": item.reason, "requested_by": item.requested_by}
+    return CardOperation(slide_id=item.slide_id, action=item.action, params=params)
+
+
+def _bulk_result(result: CardOperationResult) -> schemas.BulkCardResult:
+    return schemas.BulkCardResult(
+        slide_id=result.slide_id,
+        action=result.action,
+        status=result.status,
+        content_hash=result.content_hash,
+        locked_at=result.locked_at,
+        error=result.error,
+    )
+
+
+def _card_body(store: ContentStore, spec_id: str, slide_id: str, card_state: CardState, etag: str) -> bytes:
+    body = schemas.CardResponse(
+        spec_id=spec_id,
+        slide_id=slide_id,
+        title=card_state.slide.elements.title,
+        body=list(card_state.slide.elements.body),
+        table_data=_table_payload(card_state.slide.elements.table_data),
+        note=card_state.slide.elements.note,
+        intent=card_state.slide.intent,
+        type_hint=card_state.slide.type_hint,
+        story=_story_payload(card_state.story),
+        status=card_state.slide.status,
+        revision=etag,
+        history=_history_for_slide(store, spec_id, slide_id),
+    )
+    return body.model_dump_json().encode("utf-8")
+
+
 def _history_for_slide(store: ContentStore, spec_id: str, slide_id: str) -> list[schemas.CardHistoryEntry]:
-    logs, _ = store.list_logs(spec_id=spec_id, action=None, since=None, limit=10_000, offset=0)
     entries = []
-    for entry in logs:
-        if entry["slide_id"] != slide_id:
-            continue
+    for entry in store.list_card_history(spec_id, slide_id):
         entries.append(
             schemas.CardHistoryEntry(
                 action=entry["action"],
@@ -345,5 +480,8 @@ def _history_for_slide(store: ContentStore, spec_id: str, slide_id: str) -> list
     return entries
 
 
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
 def _error(code: str, message: str) -> dict[str, str]:
     return {"error": code, "message": message}
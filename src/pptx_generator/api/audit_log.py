@@ -0,0 +1,401 @@
+"""spec ごとの追記専用監査ログ。
+
+ログ本体は ``<base_dir>/<spec_id>/entries.jsonl`` に 1 行 1 エントリで追記し、
+固定長レコードの索引 ``index.bin``（JSONL 上の位置・時刻・action）と
+対象 ID ごとのシーケンス番号一覧 ``targets/<digest>.bin`` を併せて更新する。
+``reset`` 後も既存カーソルと衝突しないよう、シーケンス番号は ``base`` に記録した値から続ける。
+一覧取得は索引を二分探索してカーソル位置から読むため、履歴の件数に依存しない。
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import heapq
+import json
+import shutil
+import struct
+import threading
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator
+
+from . import json_codec
+
+# JSONL 上のバイト位置, 時刻 (UTC エポックからのマイクロ秒, spec 内で単調非減少), action の crc32
+_INDEX_RECORD = struct.Struct("<QqI")
+_POSTING_RECORD = struct.Struct("<Q")
+_READ_BATCH = 256
+
+_ENTRIES_FILE = "entries.jsonl"
+_INDEX_FILE = "index.bin"
+_TARGETS_DIR = "targets"
+_BASE_FILE = "base"
+
+
+class AuditLogCursorError(ValueError):
+    """カーソルの形式が不正。"""
+
+
+@dataclass(slots=True)
+class AuditLogPage:
+    """一覧取得の結果。``next_cursor`` は続きがある場合のみ設定される。"""
+
+    items: list[dict[str, Any]]
+    next_cursor: str | None
+    cursors: list[str] = field(default_factory=list)
+
+
+class AuditLogStore:
+    """spec ごとの監査ログを追記専用で保存し、索引経由で読み出す。"""
+
+    def __init__(self, base_dir: Path) -> None:
+        self._base_dir = base_dir
+        self._base_dir.mkdir(parents=True, exist_ok=True)
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    # ------------------------------------------------------------------ #
+    # 書き込み
+    # ------------------------------------------------------------------ #
+    def append(self, spec_id: str, entry: dict[str, Any], *, target_id: str | None = None) -> str:
+        """エントリを追記し、その直後から読み始めるためのカーソルを返す。"""
+
+        return self.extend(spec_id, [(entry, target_id)])[-1]
+
+    def extend(self, spec_id: str, entries: Iterable[tuple[dict[str, Any], str | None]]) -> list[str]:
+        """複数のエントリをまとめて追記し、各エントリのカーソルを返す。"""
+
+        spec_dir = self._spec_dir(spec_id)
+        with self._lock(spec_id):
+            spec_dir.mkdir(parents=True, exist_ok=True)
+            index_path = spec_dir / _INDEX_FILE
+            count = self._count_records(index_path)
+            last_ts = self._last_timestamp(index_path, count)
+            sequence = _read_base(spec_dir) + count
+            index_records = bytearray()
+            postings: dict[str, bytearray] = {}
+            cursors: list[str] = []
+            with (spec_dir / _ENTRIES_FILE).open("ab") as entries_file:
+                offset = entries_file.tell()
+                for entry, target_id in entries:
+                    line = json_codec.dumps_bytes(entry) + b"\n"
+                    entries_file.write(line)
+                    last_ts = max(last_ts, _timestamp_us(entry.get("timestamp")))
+                    index_records += _INDEX_RECORD.pack(offset, last_ts, _action_code(entry.get("action")))
+                    if target_id is not None:
+                        postings.setdefault(target_id, bytearray()).extend(_POSTING_RECORD.pack(sequence))
+                    cursors.append(_encode_cursor((last_ts, spec_id, sequence)))
+                    sequence += 1
+                    offset += len(line)
+                entries_file.flush()
+            # 本体を書き終えてから索引を伸ばす（途中で落ちても索引は完結したエントリだけを指す）
+            with index_path.open("ab") as index_file:
+                index_file.write(index_records)
+            if postings:
+                targets_dir = spec_dir / _TARGETS_DIR
+                targets_dir.mkdir(exist_ok=True)
+                for target_id, records in postings.items():
+                    with (targets_dir / _target_filename(target_id)).open("ab") as posting_file:
+                        posting_file.write(records)
+        return cursors
+
+    def reset(self, spec_id: str) -> None:
+        """spec の監査ログを破棄する。シーケンス番号は破棄前の続きから採番する。"""
+
+        spec_dir = self._spec_dir(spec_id)
+        with self._lock(spec_id):
+            base = _read_base(spec_dir) + self._count_records(spec_dir / _INDEX_FILE)
+            shutil.rmtree(spec_dir, ignore_errors=True)
+            if base:
+                spec_dir.mkdir(parents=True, exist_ok=True)
+                (spec_dir / _BASE_FILE).write_text(str(base), encoding="ascii")
+
+    # ------------------------------------------------------------------ #
+    # 読み出し
+    # ------------------------------------------------------------------ #
+    def count(self, spec_id: str) -> int:
+        return self._count_records(self._spec_dir(spec_id) / _INDEX_FILE)
+
+    def query(
+        self,
+        spec_ids: Iterable[str] | None = None,
+        *,
+        action: str | None = None,
+        since: datetime | None = None,
+        limit: int = 100,
+        offset: int = 0,
+        cursor: str | None = None,
+    ) -> AuditLogPage:
+        """(時刻, spec_id, シーケンス番号) の昇順でログを返す。
+
+        ``cursor`` は前ページの ``next_cursor`` で、その直後から読み始める。
+        ``offset`` はカーソル位置からさらに読み飛ばす件数。
+        """
+
+        after = _decode_cursor(cursor) if cursor else None
+        since_us = _timestamp_us(since) if since is not None else None
+        action_code = _action_code(action) if action else None
+        targets = sorted(set(spec_ids)) if spec_ids is not None else self._spec_ids()
+
+        readers: list[_IndexReader] = []
+        heap: list[tuple[int, str, int, int]] = []
+        try:
+            for spec_id in targets:
+                reader = _IndexReader.open(self._spec_dir(spec_id), spec_id)
+                if reader is None:
+                    continue
+                readers.append(reader)
+                position = reader.seek_start(after, since_us)
+                record = reader.record(position)
+                if record is not None:
+                    heap.append((record[1], spec_id, position, len(readers) - 1))
+            heapq.heapify(heap)
+
+            items: list[dict[str, Any]] = []
+            keys: list[tuple[int, str, int]] = []
+            last_key: tuple[int, str, int] | None = None
+            skipped = 0
+            while heap:
+                timestamp, spec_id, position, reader_index = heapq.heappop(heap)
+                reader = readers[reader_index]
+                record = reader.record(position)
+                following = reader.record(position + 1)
+                if following is not None:
+                    heapq.heappush(heap, (following[1], spec_id, position + 1, reader_index))
+                if record is None or (action_code is not None and record[2] != action_code):
+                    continue
+                if action is None and skipped < offset:
+                    skipped += 1
+                    continue
+                entry = reader.entry(record[0]) if action is not None or len(items) < limit else None
+                if entry is not None and action is not None and entry.get("action") != action:
+                    continue
+                if len(items) >= limit:
+                    # 条件に合う次のエントリが残っているので続きのカーソルを返す
+                    return AuditLogPage(items=items, next_cursor=_encode_cursor(last_key), cursors=_encode_cursors(keys))
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                items.append(entry)
+                last_key = (timestamp, spec_id, reader.base + position)
+                keys.append(last_key)
+            return AuditLogPage(items=items, next_cursor=None, cursors=_encode_cursors(keys))
+        finally:
+            for reader in readers:
+                reader.close()
+
+    def head_cursor(self, spec_ids: Iterable[str] | None = None) -> str | None:
+        """現在の末尾（最後に追記されたエントリ）を指すカーソルを返す。ログが空なら ``None``。"""
+
+        head: tuple[int, str, int] | None = None
+        for spec_id in sorted(set(spec_ids)) if spec_ids is not None else self._spec_ids():
+            spec_dir = self._spec_dir(spec_id)
+            index_path = spec_dir / _INDEX_FILE
+            count = self._count_records(index_path)
+            if count == 0:
+                continue
+            key = (self._last_timestamp(index_path, count), spec_id, _read_base(spec_dir) + count - 1)
+            if head is None or key > head:
+                head = key
+        return _encode_cursor(head)
+
+    def by_target(self, spec_id: str, target_id: str, *, start: int = 0) -> list[dict[str, Any]]:
+        """対象 ID に紐づくエントリを追記順で返す。``start`` 件目より前は読み飛ばす。"""
+
+        spec_dir = self._spec_dir(spec_id)
+        posting_path = spec_dir / _TARGETS_DIR / _target_filename(target_id)
+        try:
+            with posting_path.open("rb") as handle:
+                handle.seek(max(start, 0) * _POSTING_RECORD.size)
+                data = handle.read()
+        except FileNotFoundError:
+            return []
+        reader = _IndexReader.open(spec_dir, spec_id)
+        if reader is None:
+            return []
+        try:
+            entries = []
+            usable = len(data) - len(data) % _POSTING_RECORD.size
+            for (sequence,) in _POSTING_RECORD.iter_unpack(data[:usable]):
+                record = reader.record(sequence - reader.base)
+                if record is not None:
+                    entries.append(reader.entry(record[0]))
+            return entries
+        finally:
+            reader.close()
+
+    # ------------------------------------------------------------------ #
+    # 内部処理
+    # ------------------------------------------------------------------ #
+    def _spec_dir(self, spec_id: str) -> Path:
+        return self._base_dir / spec_id
+
+    def _spec_ids(self) -> list[str]:
+        return sorted(path.name for path in self._base_dir.iterdir() if (path / _INDEX_FILE).exists())
+
+    def _lock(self, spec_id: str) -> threading.Lock:
+        with self._locks_guard:
+            lock = self._locks.get(spec_id)
+            if lock is None:
+                lock = threading.Lock()
+                self._locks[spec_id] = lock
+            return lock
+
+    @staticmethod
+    def _count_records(index_path: Path) -> int:
+        try:
+            return index_path.stat().st_size // _INDEX_RECORD.size
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _last_timestamp(index_path: Path, count: int) -> int:
+        if count == 0:
+            return 0
+        with index_path.open("rb") as index_file:
+            index_file.seek((count - 1) * _INDEX_RECORD.size)
+            return _INDEX_RECORD.unpack(index_file.read(_INDEX_RECORD.size))[1]
+
+
+class _IndexReader:
+    """索引とログ本体を開き、レコード単位でランダムアクセスする。"""
+
+    def __init__(self, spec_id: str, index_file: BinaryIO, entries_file: BinaryIO, count: int, base: int = 0) -> None:
+        self.spec_id = spec_id
+        # 索引上の位置 + base がシーケンス番号（カーソルに埋め込む値）
+        self.base = base
+        self._index = index_file
+        self._entries = entries_file
+        self.count = count
+        self._cache_start = -1
+        self._cache: list[tuple[int, int, int]] = []
+
+    @classmethod
+    def open(cls, spec_dir: Path, spec_id: str) -> _IndexReader | None:
+        try:
+            index_file = (spec_dir / _INDEX_FILE).open("rb")
+        except FileNotFoundError:
+            return None
+        try:
+            entries_file = (spec_dir / _ENTRIES_FILE).open("rb")
+        except FileNotFoundError:
+            index_file.close()
+            return None
+        count = (index_file.seek(0, 2) or 0) // _INDEX_RECORD.size
+        return cls(spec_id, index_file, entries_file, count, _read_base(spec_dir))
+
+    def close(self) -> None:
+        self._index.close()
+        self._entries.close()
+
+    def record(self, position: int) -> tuple[int, int, int] | None:
+        if position < 0 or position >= self.count:
+            return None
+        start = self._cache_start
+        if start < 0 or not (start <= position < start + len(self._cache)):
+            # 順方向の読み出しが大半なのでまとめて読み込む
+            self._index.seek(position * _INDEX_RECORD.size)
+            data = self._index.read(min(_READ_BATCH, self.count - position) * _INDEX_RECORD.size)
+            self._cache = list(_INDEX_RECORD.iter_unpack(data))
+            self._cache_start = start = position
+        return self._cache[position - start]
+
+    def entry(self, offset: int) -> dict[str, Any]:
+        self._entries.seek(offset)
+        return json_codec.loads(self._entries.readline())
+
+    def seek_start(self, after: tuple[int, str, int] | None, since_us: int | None) -> int:
+        """カーソルより後ろ、かつ ``since`` 以降となる最初のレコード位置を二分探索で求める。"""
+
+        low = 0
+        if since_us is not None:
+            low = self._bisect(lambda record, position: record[1] < since_us)
+        if after is not None:
+            low = max(low, self._bisect(lambda record, position: (record[1], self.spec_id, self.base + position) <= after))
+        return low
+
+    def _bisect(self, before: Any) -> int:
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            self._index.seek(middle * _INDEX_RECORD.size)
+            record = _INDEX_RECORD.unpack(self._index.read(_INDEX_RECORD.size))
+            if before(record, middle):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+
+def iter_legacy_entries(entries: Iterable[dict[str, Any]], target_key: str) -> Iterator[tuple[dict[str, Any], str | None]]:
+    """状態 JSON に埋め込まれていた旧形式のログを ``extend`` 用に変換する。"""
+
+    for entry in entries:
+        target = entry.get(target_key)
+        yield entry, str(target) if target is not None else None
+
+
+def _read_base(spec_dir: Path) -> int:
+    try:
+        return int((spec_dir / _BASE_FILE).read_text(encoding="ascii"))
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+def _timestamp_us(value: Any) -> int:
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return 0
+    if not isinstance(value, datetime):
+        return 0
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    delta = value - datetime(1970, 1, 1, tzinfo=timezone.utc)
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+def _action_code(action: Any) -> int:
+    return zlib.crc32(str(action or "").encode("utf-8"))
+
+
+def _target_filename(target_id: str) -> str:
+    return hashlib.sha1(target_id.encode("utf-8")).hexdigest() + ".bin"  # noqa: S324
+
+
+def _encode_cursor(key: tuple[int, str, int] | None) -> str | None:
+    if key is None:
+        return None
+    raw = json.dumps([key[0], key[1], key[2]], ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _encode_cursors(keys: list[tuple[int, str, int]]) -> list[str]:
+    return [cursor for cursor in map(_encode_cursor, keys) if cursor is not None]
+
+
+def cursor_position(cursor: str) -> tuple[str, int]:
+    """カーソルが指す (spec_id, spec 内シーケンス番号) を返す。"""
+
+    _, spec_id, position = _decode_cursor(cursor)
+    return spec_id, position
+
+
+def _decode_cursor(cursor: str) -> tuple[int, str, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        timestamp, spec_id, position = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        msg = f"カーソルの形式が正しくありません: {cursor}"
+        raise AuditLogCursorError(msg) from exc
+    if not isinstance(timestamp, int) or not isinstance(spec_id, str) or not isinstance(position, int):
+        msg = f"カーソルの形式が正しくありません: {cursor}"
+        raise AuditLogCursorError(msg)
+    return timestamp, spec_id, position
+
+
+__all__ = ["AuditLogCursorError", "AuditLogPage", "AuditLogStore", "cursor_position", "iter_legacy_entries"]
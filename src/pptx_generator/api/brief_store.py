@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Any, Iterator
 
 from ..brief import BriefCard, BriefSupportingPoint, BriefStoryInfo
+from .state_cache import SpecStateCache
 
 
 class SpecNotFoundError(KeyError):
@@ -75,22 +76,23 @@ class BriefStore:
         env_dir = os.environ.get("BRIEF_STORE_DIR")
         self._base_dir = base_dir or Path(env_dir or ".pptx/prepare/store")
         self._base_dir.mkdir(parents=True, exist_ok=True)
+        self._states = SpecStateCache.from_env(self._base_dir)
 
     # ------------------------------------------------------------------ #
     # 公開 API
     # ------------------------------------------------------------------ #
     def create_cards(self, spec_id: str, cards: list[BriefCardState]) -> str:
-        state_path = self._spec_path(spec_id)
-        if state_path.exists():
-            raise SpecAlreadyExistsError(f"spec '{spec_id}' は既に存在します")
-        state = {
-            "spec_id": spec_id,
-            "revision": 1,
-            "cards": {card.card.card_id: card.to_dict() for card in cards},
-            "logs": [],
-        }
-        self._write_state(spec_id, state)
-        return _etag_from_revision(state["revision"])
+        with self._states.transaction(spec_id):
+            if self._states.exists(spec_id):
+                raise SpecAlreadyExistsError(f"spec '{spec_id}' は既に存在します")
+            state = {
+                "spec_id": spec_id,
+                "revision": 1,
+                "cards": {card.card.card_id: card.to_dict() for card in cards},
+                "logs": [],
+            }
+            self._write_state(spec_id, state)
+            return _etag_from_revision(state["revision"])
 
     def update_card(
         self,
@@ -107,59 +109,60 @@ class BriefStore:
         expected_etag: str,
         actor: str | None,
     ) -> tuple[str, str]:
-        state = self._load_state(spec_id)
-        expected_revision = _parse_etag(expected_etag)
-        self._ensure_revision(state, expected_revision)
-
-        card_state = self._get_card_state(state, card_id)
-        card = card_state.card
-
-        if chapter is not None:
-            card.chapter = chapter
-        if message is not None:
-            card.message = message
-        if narrative is not None:
-            card.narrative = list(narrative)
-        if supporting_points is not None:
-            card.supporting_points = [
-                BriefSupportingPoint(
-                    statement=item["statement"],
-                    evidence=(
-                        None
-                        if not item.get("evidence_type")
-                        else {"type": item["evidence_type"], "value": item.get("evidence_value")}
-                    ),
-                )
-                for item in supporting_points
-            ]
-        if story is not None:
-            card.story = BriefStoryInfo.model_validate(story)
-        if intent_tags is not None:
-            card.intent_tags = [tag for tag in intent_tags if tag]
-        if autofix_applied:
-            existing = set(card.autofix_applied)
-            for patch_id in autofix_applied:
-                if patch_id not in existing:
-                    card.autofix_applied.append(patch_id)
-                    existing.add(patch_id)
-
-        state["cards"][card_id] = card_state.to_dict()
-        state["revision"] += 1
-        self._append_log(
-            state,
-            {
-                "spec_id": spec_id,
-                "card_id": card_id,
-                "action": "update",
-                "actor": actor,
-                "timestamp": _now_iso(),
-                "notes": None,
-                "applied_autofix": autofix_applied,
-            },
-        )
-        self._write_state(spec_id, state)
-        content_hash_raw = json.dumps(card.model_dump(mode="json"), ensure_ascii=False, sort_keys=True)
-        return _etag_from_revision(state["revision"]), _hash_json(content_hash_raw)
+        with self._states.transaction(spec_id):
+            state = self._load_state(spec_id)
+            expected_revision = _parse_etag(expected_etag)
+            self._ensure_revision(state, expected_revision)
+
+            card_state = self._get_card_state(state, card_id)
+            card = card_state.card
+
+            if chapter is not None:
+                card.chapter = chapter
+            if message is not None:
+                card.message = message
+            if narrative is not None:
+                card.narrative = list(narrative)
+            if supporting_points is not None:
+                card.supporting_points = [
+                    BriefSupportingPoint(
+                        statement=item["statement"],
+                        evidence=(
+                            None
+                            if not item.get("evidence_type")
+                            else {"type": item["evidence_type"], "value": item.get("evidence_value")}
+                        ),
+                    )
+                    for item in supporting_points
+                ]
+            if story is not None:
+                card.story = BriefStoryInfo.model_validate(story)
+            if intent_tags is not None:
+                card.intent_tags = [tag for tag in intent_tags if tag]
+            if autofix_applied:
+                existing = set(card.autofix_applied)
+                for patch_id in autofix_applied:
+                    if patch_id not in existing:
+                        card.autofix_applied.append(patch_id)
+                        existing.add(patch_id)
+
+            state["cards"][card_id] = card_state.to_dict()
+            state["revision"] += 1
+            self._append_log(
+                state,
+                {
+                    "spec_id": spec_id,
+                    "card_id": card_id,
+                    "action": "update",
+                    "actor": actor,
+                    "timestamp": _now_iso(),
+                    "notes": None,
+                    "applied_autofix": autofix_applied,
+                },
+            )
+            self._write_state(spec_id, state)
+            content_hash_raw = json.dumps(card.model_dump(mode="json"), ensure_ascii=False, sort_keys=True)
+            return _etag_from_revision(state["revision"]), _hash_json(content_hash_raw)
 
     def approve_card(
         self,
@@ -171,38 +174,39 @@ class BriefStore:
         expected_etag: str,
         actor: str | None,
     ) -> tuple[str, str, datetime]:
-        state = self._load_state(spec_id)
-        expected_revision = _parse_etag(expected_etag)
-        self._ensure_revision(state, expected_revision)
-
-        card_state = self._get_card_state(state, card_id)
-        if card_state.card.status != "approved":
-            card_state.card.status = "approved"
-        if applied_autofix:
-            existing = set(card_state.card.autofix_applied)
-            for patch_id in applied_autofix:
-                if patch_id not in existing:
-                    card_state.card.autofix_applied.append(patch_id)
-                    existing.add(patch_id)
-
-        locked_at = datetime.now(timezone.utc)
-
-        state["cards"][card_id] = card_state.to_dict()
-        state["revision"] += 1
-        self._append_log(
-            state,
-            {
-                "spec_id": spec_id,
-                "card_id": card_id,
-                "action": "approve",
-                "actor": actor,
-                "timestamp": locked_at.isoformat(),
-                "notes": notes,
-                "applied_autofix": applied_autofix,
-            },
-        )
-        self._write_state(spec_id, state)
-        return _etag_from_revision(state["revision"]), card_state.card.status, locked_at
+        with self._states.transaction(spec_id):
+            state = self._load_state(spec_id)
+            expected_revision = _parse_etag(expected_etag)
+            self._ensure_revision(state, expected_revision)
+
+            card_state = self._get_card_state(state, card_id)
+            if card_state.card.status != "approved":
+                card_state.card.status = "approved"
+            if applied_autofix:
+                existing = set(card_state.card.autofix_applied)
+                for patch_id in applied_autofix:
+                    if patch_id not in existing:
+                        card_state.card.autofix_applied.append(patch_id)
+                        existing.add(patch_id)
+
+            locked_at = datetime.now(timezone.utc)
+
+            state["cards"][card_id] = card_state.to_dict()
+            state["revision"] += 1
+            self._append_log(
+                state,
+                {
+                    "spec_id": spec_id,
+                    "card_id": card_id,
+                    "action": "approve",
+                    "actor": actor,
+                    "timestamp": locked_at.isoformat(),
+                    "notes": notes,
+                    "applied_autofix": applied_autofix,
+                },
+            )
+            self._write_state(spec_id, state)
+            return _etag_from_revision(state["revision"]), card_state.card.status, locked_at
 
     def return_card(
         self,
@@ -214,35 +218,45 @@ class BriefStore:
         expected_etag: str,
         actor: str | None,
     ) -> tuple[str, str]:
-        state = self._load_state(spec_id)
-        expected_revision = _parse_etag(expected_etag)
-        self._ensure_revision(state, expected_revision)
-
-        card_state = self._get_card_state(state, card_id)
-        card_state.card.status = "returned"
-
-        state["cards"][card_id] = card_state.to_dict()
-        state["revision"] += 1
-        self._append_log(
-            state,
-            {
-                "spec_id": spec_id,
-                "card_id": card_id,
-                "action": "return",
-                "actor": actor or requested_by,
-                "timestamp": _now_iso(),
-                "notes": reason,
-                "applied_autofix": None,
-            },
-        )
-        self._write_state(spec_id, state)
-        return _etag_from_revision(state["revision"]), card_state.card.status
+        with self._states.transaction(spec_id):
+            state = self._load_state(spec_id)
+            expected_revision = _parse_etag(expected_etag)
+            self._ensure_revision(state, expected_revision)
+
+            card_state = self._get_card_state(state, card_id)
+            card_state.card.status = "returned"
+
+            state["cards"][card_id] = card_state.to_dict()
+            state["revision"] += 1
+            self._append_log(
+                state,
+                {
+                    "spec_id": spec_id,
+                    "card_id": card_id,
+                    "action": "return",
+                    "actor": actor or requested_by,
+                    "timestamp": _now_iso(),
+                    "notes": reason,
+                    "applied_autofix": None,
+                },
+            )
+            self._write_state(spec_id, state)
+            return _etag_from_revision(state["revision"]), card_state.card.status
 
     def get_card(self, spec_id: str, card_id: str) -> tuple[BriefCardState, str]:
-        state = self._load_state(spec_id)
-        card_state = self._get_card_state(state, card_id)
-        etag = _etag_from_revision(state["revision"])
-        return card_state, etag
+        with self._states.transaction(spec_id):
+            state = self._load_state(spec_id)
+            card_state = self._get_card_state(state, card_id)
+            etag = _etag_from_revision(state["revision"])
+            return card_state, etag
+
+    def export_state(self, spec_id: str) -> str:
+        """管理用に spec の状態をインデント付き JSON で返す（保存形式はコンパクト）。"""
+
+        text = self._states.export(spec_id)
+        if text is None:
+            raise SpecNotFoundError(spec_id)
+        return text
 
     def list_logs(
         self,
@@ -257,8 +271,9 @@ class BriefStore:
         for candidate_spec_id in self._iter_spec_ids():
             if spec_id and candidate_spec_id != spec_id:
                 continue
-            state = self._load_state(candidate_spec_id)
-            for entry in state["logs"]:
+            with self._states.lock(candidate_spec_id):
+                entries = list(self._load_state(candidate_spec_id)["logs"])
+            for entry in entries:
                 if action and entry["action"] != action:
                     continue
                 if since and datetime.fromisoformat(entry["timestamp"]) < since:
@@ -275,19 +290,14 @@ class BriefStore:
     # ------------------------------------------------------------------ #
     # 内部ユーティリティ
     # ------------------------------------------------------------------ #
-    def _spec_path(self, spec_id: str) -> Path:
-        return self._base_dir / f"{spec_id}.json"
-
     def _write_state(self, spec_id: str, state: dict[str, Any]) -> None:
-        path = self._spec_path(spec_id)
-        path.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._states.store(spec_id, state)
 
     def _load_state(self, spec_id: str) -> dict[str, Any]:
-        path = self._spec_path(spec_id)
-        if not path.exists():
+        state = self._states.load(spec_id)
+        if state is None:
             raise SpecNotFoundError(spec_id)
-        text = path.read_text(encoding="utf-8")
-        return json.loads(text)
+        return state
 
     def _get_card_state(self, state: dict[str, Any], card_id: str) -> BriefCardState:
         cards = state.get("cards") or {}
@@ -306,5 +316,4 @@ class BriefStore:
         logs.append(entry)
 
     def _iter_spec_ids(self) -> Iterator[str]:
-        for path in self._base_dir.glob("*.json"):
-            yield path.stem
+        yield from self._states.spec_ids()
@@ -0,0 +1,211 @@
+"""監査ログに連動した変更フィード（Server-Sent Events）。
+
+ストアが監査ログへ追記するたびに ``ChangeFeed.publish`` で購読者へ通知する。
+購読者ごとのキューは上限付きで、溢れた購読者は通知を捨てて監査ログから読み直す
+（遅い購読者が書き込み側を詰まらせない）。再開位置は監査ログのカーソルで指定する。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, AsyncIterator, Callable, TypeVar
+
+from . import json_codec
+from .audit_log import cursor_position
+
+if TYPE_CHECKING:
+    from .executor import StoreExecutor
+
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 256
+DEFAULT_HEARTBEAT_INTERVAL = 15.0
+
+T = TypeVar("T")
+
+ChangeReplay = Callable[[str | None], tuple[list["ChangeEvent"], str | None]]
+ChangeHead = Callable[[], str | None]
+
+
+@dataclass(slots=True)
+class ChangeEvent:
+    """1 件の変更通知。``cursor`` はこのイベントの直後から再開するためのカーソル。"""
+
+    spec_id: str
+    target: str
+    action: str
+    revision: str | None
+    cursor: str
+
+    def to_sse(self) -> bytes:
+        payload = {
+            "spec_id": self.spec_id,
+            "target": self.target,
+            "action": self.action,
+            "revision": self.revision,
+        }
+        data = json_codec.dumps(payload)
+        return f"id: {self.cursor}\nevent: change\ndata: {data}\n\n".encode("utf-8")
+
+
+class ChangeSubscription:
+    """イベントループ上で受け取る購読。``ChangeFeed.subscribe`` で生成する。"""
+
+    def __init__(self, feed: ChangeFeed, spec_id: str | None, loop: asyncio.AbstractEventLoop, maxsize: int) -> None:
+        self.spec_id = spec_id
+        self.overflowed = False
+        self._feed = feed
+        self._loop = loop
+        self._queue: asyncio.Queue[ChangeEvent] = asyncio.Queue(maxsize=maxsize)
+
+    def _offer(self, event: ChangeEvent) -> None:
+        if self.overflowed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+    async def get(self, timeout: float) -> ChangeEvent | None:
+        """次のイベントを待つ。タイムアウト時は ``None``。"""
+
+        try:
+            return await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def drained(self) -> bool:
+        return self._queue.empty()
+
+    def close(self) -> None:
+        self._feed._unsubscribe(self)
+
+
+class ChangeFeed:
+    """プロセス内の購読者へ変更イベントを配信する。``publish`` はどのスレッドからでも呼べる。"""
+
+    def __init__(self, *, queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE) -> None:
+        self._queue_size = max(1, queue_size)
+        self._subscribers: set[ChangeSubscription] = set()
+        self._guard = threading.Lock()
+
+    def subscribe(self, spec_id: str | None = None) -> ChangeSubscription:
+        """実行中のイベントループに紐づく購読を作る。``spec_id`` 省略時は全 spec が対象。"""
+
+        subscription = ChangeSubscription(self, spec_id, asyncio.get_running_loop(), self._queue_size)
+        with self._guard:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def publish(self, event: ChangeEvent) -> None:
+        with self._guard:
+            targets = [sub for sub in self._subscribers if sub.spec_id is None or sub.spec_id == event.spec_id]
+        for subscription in targets:
+            try:
+                subscription._loop.call_soon_threadsafe(subscription._offer, event)
+            except RuntimeError:
+                # ループが既に閉じている購読は破棄する
+                self._unsubscribe(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._guard:
+            return len(self._subscribers)
+
+    def _unsubscribe(self, subscription: ChangeSubscription) -> None:
+        with self._guard:
+            self._subscribers.discard(subscription)
+
+
+async def stream_changes(
+    feed: ChangeFeed,
+    replay: ChangeReplay,
+    *,
+    spec_id: str | None,
+    cursor: str | None,
+    follow: bool = True,
+    heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL,
+    executor: StoreExecutor | None = None,
+    head: ChangeHead | None = None,
+) -> AsyncIterator[bytes]:
+    """SSE のバイト列を生成する。
+
+    ``cursor`` があればその直後から監査ログを読み直してから実時間の通知へ切り替える。
+    ``follow=False`` の場合は読み直しだけで終了する。監査ログの読み直しは ``executor``
+    （省略時は ``asyncio.to_thread``）で行う。``cursor`` なしで購読する場合は ``head`` で
+    購読開始時点の末尾を記録し、通知が溢れたときはそこから読み直す（過去の履歴は送らない）。
+    """
+
+    subscription = feed.subscribe(spec_id) if follow else None
+    delivered: dict[str, int] = {}
+    last_cursor = cursor
+    try:
+        if cursor is None and subscription is not None and head is not None:
+            last_cursor = await _run(executor, head)
+        if cursor is not None or not follow:
+            async for chunk in _catch_up(replay, last_cursor, delivered, executor):
+                last_cursor = chunk[0]
+                yield chunk[1]
+        if subscription is None:
+            return
+        yield b": connected\n\n"
+        while True:
+            if subscription.overflowed and subscription.drained():
+                # 取りこぼした通知は監査ログから補う（通知は追記後に送るため必ずログに残っている）
+                subscription.overflowed = False
+                async for chunk in _catch_up(replay, last_cursor, delivered, executor):
+                    last_cursor = chunk[0]
+                    yield chunk[1]
+                continue
+            event = await subscription.get(heartbeat_interval)
+            if event is None:
+                yield b": keep-alive\n\n"
+                continue
+            if not _mark_delivered(delivered, event.cursor):
+                continue
+            last_cursor = event.cursor
+            yield event.to_sse()
+    finally:
+        if subscription is not None:
+            subscription.close()
+
+
+async def _catch_up(
+    replay: ChangeReplay,
+    cursor: str | None,
+    delivered: dict[str, int],
+    executor: StoreExecutor | None,
+) -> AsyncIterator[tuple[str, bytes]]:
+    while True:
+        events, next_cursor = await _run(executor, replay, cursor)
+        for event in events:
+            cursor = event.cursor
+            if _mark_delivered(delivered, event.cursor):
+                yield event.cursor, event.to_sse()
+        if next_cursor is None:
+            return
+        cursor = next_cursor
+
+
+async def _run(executor: StoreExecutor | None, func: Callable[..., T], *args: object) -> T:
+    if executor is not None:
+        return await executor.run(func, *args)
+    return await asyncio.to_thread(func, *args)
+
+
+def _mark_delivered(delivered: dict[str, int], cursor: str) -> bool:
+    spec_id, position = cursor_position(cursor)
+    if position <= delivered.get(spec_id, -1):
+        return False
+    delivered[spec_id] = position
+    return True
+
+
+__all__ = [
+    "ChangeEvent",
+    "ChangeFeed",
+    "ChangeSubscription",
+    "DEFAULT_HEARTBEAT_INTERVAL",
+    "DEFAULT_SUBSCRIBER_QUEUE_SIZE",
+    "stream_changes",
+]
@@ -6,14 +6,21 @@ import os
 from typing import Annotated
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from .draft_schemas import (AppendixUpdateRequest, DraftBoardResponse,
-                            DraftLogEntriesResponse, LayoutHintUpdateRequest,
-                            MoveSlideRequest, RevisionResponse,
-                            SectionApproveRequest)
-from .draft_store import (BoardNotFoundError, DraftStore, LockedContentError,
-                          RevisionMismatchError, SectionNotFoundError,
-                          SlideNotFoundError)
+from .audit_log import AuditLogCursorError, cursor_position
+from .change_feed import stream_changes
+from .draft_schemas import (AppendixUpdateRequest, BulkSlideRequest,
+                            BulkSlideResponse, BulkSlideResult,
+                            DraftBoardResponse, DraftLogEntriesResponse,
+                            LayoutHintUpdateRequest, MoveSlideRequest,
+                            RevisionResponse, SectionApproveRequest)
+from .draft_store import (BoardNotFoundError, BoardOperation,
+                          BoardOperationResult, BulkOperationError, DraftStore,
+                          LockedContentError, RevisionMismatchError,
+                          SectionNotFoundError, SlideNotFoundError)
+from .executor import StoreExecutor, get_default_executor
+from .response_cache import ResponseBodyCache, etag_matches, not_modified
 
 
 def _create_store() -> DraftStore:
@@ -24,12 +31,17 @@ def _get_auth_token() -> str | None:
     return os.environ.get("DRAFT_API_TOKEN")
 
 
-def create_draft_app(store: DraftStore | None = None) -> FastAPI:
-    """Create FastAPI application instance."""
+def create_draft_app(store: DraftStore | None = None, *, executor: StoreExecutor | None = None) -> FastAPI:
+    """Create FastAPI application instance.
+
+    ハンドラーはイベントループ上で動き、ストア I/O は ``executor``（省略時はプロセス共有）で実行する。
+    """
 
     app = FastAPI(title="Draft Structuring API", version="1.0.0")
     draft_store = store or _create_store()
     api_token = _get_auth_token()
+    board_bodies = ResponseBodyCache()
+    store_executor = executor or get_default_executor()
 
     async def verify_token(authorization: Annotated[str | None, Header(alias="Authorization")] = None) -> None:
         if api_token is None:
@@ -40,10 +52,10 @@ def create_draft_app(store: DraftStore | None = None) -> FastAPI:
         if token != api_token:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid token")
 
-    def get_actor(x_actor: Annotated[str | None, Header(alias="X-Actor")] = None) -> str | None:
+    async def get_actor(x_actor: Annotated[str | None, Header(alias="X-Actor")] = None) -> str | None:
         return x_actor
 
-    def require_etag(if_match: Annotated[str | None, Header(alias="If-Match")] = None) -> str:
+    async def require_etag(if_match: Annotated[str | None, Header(alias="If-Match")] = None) -> str:
         if not if_match:
             raise HTTPException(
                 status_code=status.HTTP_428_PRECONDITION_REQUIRED,
@@ -57,18 +69,29 @@ def create_draft_app(store: DraftStore | None = None) -> FastAPI:
         responses={404: {"description": "Board not found"}},
         dependencies=[Depends(verify_token)],
     )
-    def get_board(spec_id: str = Query(..., min_length=1)) -> Response:
+    async def get_board(
+        spec_id: str = Query(..., min_length=1),
+        if_none_match: Annotated[str | None, Header(alias="If-None-Match")] = None,
+    ) -> Response:
+        def load() -> tuple[str, bytes | None]:
+            etag = draft_store.get_board_etag(spec_id)
+            if etag_matches(if_none_match, etag):
+                return etag, None
+            content = board_bodies.get(spec_id, etag)
+            if content is None:
+                board, etag = draft_store.get_board(spec_id)
+                content = DraftBoardResponse(spec_id=spec_id, revision=etag, board=board).model_dump_json().encode("utf-8")
+                board_bodies.put(spec_id, etag, content)
+            return etag, content
+
         try:
-            board, etag = draft_store.get_board(spec_id)
+            etag, content = await store_executor.run(load)
         except BoardNotFoundError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
-        body = DraftBoardResponse(spec_id=spec_id, revision=etag, board=board)
-        return Response(
-            content=body.model_dump_json(),
-            media_type="application/json",
-            headers={"ETag": etag},
-        )
+        if content is None:
+            return not_modified(etag)
+        return Response(content=content, media_type="application/json", headers={"ETag": etag})
 
     @app.patch(
         "/v1/draft/slides/{slide_id}/hint",
@@ -80,7 +103,7 @@ def create_draft_app(store: DraftStore | None = None) -> FastAPI:
         },
         dependencies=[Depends(verify_token)],
     )
-    def update_layout_hint(
+    async def update_layout_hint(
         slide_id: str,
         payload: LayoutHintUpdateRequest,
         request: Request,
@@ -89,7 +112,8 @@ def create_draft_app(store: DraftStore | None = None) -> FastAPI:
         spec_id: str = Query(..., min_length=1),
     ) -> Response:
         try:
-            new_etag = draft_store.update_layout_hint(
+            new_etag = await store_executor.run(
+                draft_store.update_layout_hint,
                 spec_id=spec_id,
                 slide_id=slide_id,
                 layout_hint=payload.layout_hint,
@@ -123,7 +147,7 @@ def create_draft_app(store: DraftStore | None = None) -> FastAPI:
         },
         dependencies=[Depends(verify_token)],
     )
-    def move_slide(
+    async def move_slide(
         slide_id: str,
         payload: MoveSlideRequest,
         actor: str | None = Depends(get_actor),
@@ -131,7 +155,8 @@ def create_draft_app(store: DraftStore | None = None) -> FastAPI:
         spec_id: str = Query(..., min_length=1),
     ) -> Response:
         try:
-            new_etag = draft_store.move_slide(
+            new_etag = await store_executor.run(
+                draft_store.move_slide,
                 spec_id=spec_id,
                 slide_id=slide_id,
                 target_section=payload.target_section,
@@ -157,6 +182,59 @@ def create_draft_app(store: DraftStore | None = None) -> FastAPI:
             headers={"ETag": new_etag},
         )
 
+    @app.post(
+        "/v1/draft/slides/bulk",
+        response_model=BulkSlideResponse,
+        responses={
+            404: {"description": "Board not found"},
+            409: {"description": "One or more operations failed; nothing was applied"},
+            412: {"description": "Revision mismatch"},
+        },
+        dependencies=[Depends(verify_token)],
+    )
+    async def apply_bulk(
+        payload: BulkSlideRequest,
+        actor: str | None = Depends(get_actor),
+        etag: str = Depends(require_etag),
+        spec_id: str = Query(..., min_length=1),
+    ) -> Response:
+        operations = [
+            BoardOperation(
+                slide_id=item.slide_id,
+                action=item.action,
+                target_section=item.target_section,
+                position=item.position,
+                layout_hint=item.layout_hint,
+                notes=item.notes,
+            )
+            for item in payload.operations
+        ]
+        try:
+            new_etag, results = await store_executor.run(
+                draft_store.apply_board_operations,
+                spec_id,
+                operations,
+                expected_etag=etag,
+                actor=actor,
+            )
+        except BoardNotFoundError as exc:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+        except RevisionMismatchError as exc:
+            raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail=str(exc)) from exc
+        except BulkOperationError as exc:
+            detail = {
+                "message": str(exc),
+                "results": [_bulk_result(result).model_dump(mode="json") for result in exc.results],
+            }
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail) from exc
+
+        body = BulkSlideResponse(revision=new_etag, results=[_bulk_result(result) for result in results])
+        return Response(
+            content=body.model_dump_json(),
+            media_type="application/json",
+            headers={"ETag": new_etag},
+        )
+
     @app.post(
         "/v1/draft/sections/{section_name}/approve",
         response_model=RevisionResponse,
@@ -166,7 +244,7 @@ def create_draft_app(store: DraftStore | None = None) -> FastAPI:
         },
         dependencies=[Depends(verify_token)],
     )
-    def approve_section(
+    async def approve_section(
         section_name: str,
         payload: SectionApproveRequest,
         actor: str | None = Depends(get_actor),
@@ -174,7 +252,8 @@ def create_draft_app(store: DraftStore | None = None) -> FastAPI:
         spec_id: str = Query(..., min_length=1),
     ) -> Response:
         try:
-            new_etag = draft_store.approve_section(
+            new_etag = await store_executor.run(
+                draft_store.approve_section,
                 spec_id=spec_id,
                 section_name=section_name,
                 expected_etag=etag,
@@ -207,7 +286,7 @@ def create_draft_app(store: DraftStore | None = None) -> FastAPI:
         },
         dependencies=[Depends(verify_token)],
     )
-    def update_appendix(
+    async def update_appendix(
         slide_id: str,
         payload: AppendixUpdateRequest,
         actor: str | None = Depends(get_actor),
@@ -215,7 +294,8 @@ def create_draft_app(store: DraftStore | None = None) -> FastAPI:
         spec_id: str = Query(..., min_length=1),
     ) -> Response:
         try:
-            new_etag = draft_store.set_appendix(
+            new_etag = await store_executor.run(
+                draft_store.set_appendix,
                 spec_id=spec_id,
                 slide_id=slide_id,
                 appendix=payload.appendix,
@@ -239,26 +319,75 @@ def create_draft_app(store: DraftStore | None = None) -> FastAPI:
             headers={"ETag": new_etag},
         )
 
+    @app.get(
+        "/v1/draft/changes",
+        response_class=StreamingResponse,
+        responses={400: {"description": "Invalid cursor"}},
+        dependencies=[Depends(verify_token)],
+    )
+    async def stream_board_changes(
+        spec_id: str | None = Query(default=None),
+        cursor: str | None = Query(default=None),
+        follow: bool = Query(default=True),
+        last_event_id: Annotated[str | None, Header(alias="Last-Event-ID")] = None,
+    ) -> StreamingResponse:
+        resume_from = cursor or last_event_id
+        if resume_from:
+            try:
+                cursor_position(resume_from)
+            except AuditLogCursorError as exc:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+        events = stream_changes(
+            draft_store.changes,
+            lambda after: draft_store.list_changes(spec_id, after),
+            spec_id=spec_id,
+            head=lambda: draft_store.head_change_cursor(spec_id),
+            cursor=resume_from,
+            follow=follow,
+            executor=store_executor,
+        )
+        return StreamingResponse(
+            events,
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     @app.get(
         "/v1/draft/logs",
         response_model=DraftLogEntriesResponse,
         responses={404: {"description": "Board not found"}},
         dependencies=[Depends(verify_token)],
     )
-    def list_logs(
+    async def list_logs(
         spec_id: str = Query(..., min_length=1),
         limit: int = Query(default=100, ge=1, le=500),
         offset: int = Query(default=0, ge=0),
+        cursor: str | None = Query(default=None),
     ) -> DraftLogEntriesResponse:
         try:
-            entries, next_offset = draft_store.list_logs(
+            entries, next_cursor = await store_executor.run(
+                draft_store.list_logs,
                 spec_id=spec_id,
                 limit=limit,
                 offset=offset,
+                cursor=cursor,
             )
         except BoardNotFoundError as exc:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+        except AuditLogCursorError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
-        return DraftLogEntriesResponse(items=entries, next_offset=next_offset)
+        # next_offset は既存クライアント向けに残す（カーソル指定時は next_cursor のみ）
+        next_offset = offset + len(entries) if next_cursor and cursor is None else None
+        return DraftLogEntriesResponse(items=entries, next_offset=next_offset, next_cursor=next_cursor)
 
     return app
+
+
+def _bulk_result(result: BoardOperationResult) -> BulkSlideResult:
+    return BulkSlideResult(
+        slide_id=result.slide_id,
+        action=result.action,
+        changes=result.changes,
+        error=result.error,
+    )
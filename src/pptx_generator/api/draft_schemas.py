@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 from ..models import DraftDocument, DraftLogEntry
@@ -29,6 +31,39 @@ class MoveSlideRequest(BaseModel):
     position: int | None = Field(default=None, ge=1)
 
 
+class BulkSlideOperation(BaseModel):
+    """一括操作の 1 件。``move`` は target_section/position、``hint`` は layout_hint を使う。"""
+
+    slide_id: str = Field(..., min_length=1)
+    action: Literal["move", "hint"]
+    target_section: str | None = Field(default=None, min_length=1)
+    position: int | None = Field(default=None, ge=1)
+    layout_hint: str | None = None
+    notes: str | None = None
+
+
+class BulkSlideRequest(BaseModel):
+    """スライド一括操作リクエスト。"""
+
+    operations: list[BulkSlideOperation] = Field(..., min_length=1, max_length=500)
+
+
+class BulkSlideResult(BaseModel):
+    """一括操作 1 件分の結果。"""
+
+    slide_id: str
+    action: str
+    changes: dict[str, object] | None = None
+    error: str | None = None
+
+
+class BulkSlideResponse(BaseModel):
+    """スライド一括操作レスポンス。"""
+
+    revision: str
+    results: list[BulkSlideResult] = Field(default_factory=list)
+
+
 class SectionApproveRequest(BaseModel):
     """セクション承認リクエスト。"""
 
@@ -47,6 +82,7 @@ class DraftLogEntriesResponse(BaseModel):
 
     items: list[DraftLogEntry] = Field(default_factory=list)
     next_offset: int | None = None
+    next_cursor: str | None = None
 
 
 class RevisionResponse(BaseModel):
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-import json
+import copy
 import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterator, Tuple
+from typing import Any, Literal, Tuple
 
 from ..models import DraftDocument, DraftLogEntry
+from .audit_log import AuditLogStore, cursor_position, iter_legacy_entries
+from .change_feed import ChangeEvent, ChangeFeed
+from .state_cache import SpecStateCache
 
 
 class BoardNotFoundError(KeyError):
@@ -36,6 +39,36 @@ class LockedContentError(RuntimeError):
     """ロックされたスライドを変更しようとした。"""
 
 
+class BulkOperationError(RuntimeError):
+    """一括操作の一部が失敗した。状態は変更されていない。"""
+
+    def __init__(self, message: str, results: list[BoardOperationResult]) -> None:
+        super().__init__(message)
+        self.results = results
+
+
+@dataclass(slots=True)
+class BoardOperation:
+    """一括操作の 1 件。``move`` は target_section/position、``hint`` は layout_hint を使う。"""
+
+    slide_id: str
+    action: Literal["move", "hint"]
+    target_section: str | None = None
+    position: int | None = None
+    layout_hint: str | None = None
+    notes: str | None = None
+
+
+@dataclass(slots=True)
+class BoardOperationResult:
+    """一括操作 1 件分の結果。失敗した場合は ``error`` に理由が入る。"""
+
+    slide_id: str
+    action: str
+    changes: dict[str, Any] | None = None
+    error: str | None = None
+
+
 def _etag_from_revision(revision: int) -> str:
     return f'W/"draft-{revision}"'
 
@@ -54,21 +87,50 @@ def _parse_etag(etag: str) -> int:
         raise RevisionMismatchError(msg) from exc
 
 
+def _slide_log_entry(
+    slide_id: str,
+    action: str,
+    actor: str | None,
+    notes: str | None,
+    changes: dict[str, Any],
+) -> dict[str, Any]:
+    return DraftLogEntry(
+        target_type="slide",
+        target_id=slide_id,
+        action=action,
+        actor=actor,
+        timestamp=datetime.now(timezone.utc),
+        notes=notes,
+        changes=changes,
+    ).model_dump(mode="json")
+
+
+def _change_event(entry: dict[str, Any], cursor: str) -> ChangeEvent:
+    # ドラフトのログ項目は spec_id を持たないためカーソルから取り出す
+    spec_id, _ = cursor_position(cursor)
+    revision = entry.get("revision")
+    return ChangeEvent(
+        spec_id=spec_id,
+        target=entry["target_id"],
+        action=entry["action"],
+        revision=_etag_from_revision(revision) if revision is not None else None,
+        cursor=cursor,
+    )
+
+
 @dataclass(slots=True)
 class DraftState:
-    """ファイルに保存するドラフト構成の状態。"""
+    """ファイルに保存するドラフト構成の状態。監査ログは ``AuditLogStore`` 側に保存する。"""
 
     spec_id: str
     revision: int
     board: dict[str, Any]
-    logs: list[dict[str, Any]]
 
     def to_dict(self) -> dict[str, Any]:
         return {
             "spec_id": self.spec_id,
             "revision": self.revision,
             "board": self.board,
-            "logs": self.logs,
         }
 
     @classmethod
@@ -77,7 +139,6 @@ class DraftState:
             spec_id=payload["spec_id"],
             revision=payload["revision"],
             board=payload["board"],
-            logs=payload.get("logs", []),
         )
 
 
@@ -89,38 +150,59 @@ class DraftStore:
         default_dir = Path(".pptx/draft/store")
         self._base_dir = base_dir or Path(env_dir or default_dir)
         self._base_dir.mkdir(parents=True, exist_ok=True)
+        self._states = SpecStateCache.from_env(self._base_dir)
+        self._audit = AuditLogStore(self._base_dir / "audit")
+        self._changes = ChangeFeed()
 
     # ------------------------------------------------------------------ #
     # 公開 API
     # ------------------------------------------------------------------ #
     def create_board(self, spec_id: str, board: DraftDocument) -> str:
-        state_path = self._spec_path(spec_id)
-        if state_path.exists():
-            raise BoardAlreadyExistsError(f"spec '{spec_id}' は既に存在します")
-
-        state = DraftState(
-            spec_id=spec_id,
-            revision=1,
-            board=board.model_dump(mode="json"),
-            logs=[],
-        )
-        self._write_state(state)
-        return _etag_from_revision(state.revision)
+        with self._states.transaction(spec_id):
+            if self._states.exists(spec_id):
+                raise BoardAlreadyExistsError(f"spec '{spec_id}' は既に存在します")
+
+            state = DraftState(
+                spec_id=spec_id,
+                revision=1,
+                board=board.model_dump(mode="json"),
+            )
+            self._write_state(state)
+            self._audit.reset(spec_id)
+            return _etag_from_revision(state.revision)
 
     def overwrite_board(self, spec_id: str, board: DraftDocument) -> str:
-        state = DraftState(
-            spec_id=spec_id,
-            revision=1,
-            board=board.model_dump(mode="json"),
-            logs=[],
-        )
-        self._write_state(state)
-        return _etag_from_revision(state.revision)
+        with self._states.transaction(spec_id):
+            # 上書き後も ETag が過去の値と衝突しないよう、リビジョンは既存の値から進める
+            previous = self._states.load(spec_id)
+            state = DraftState(
+                spec_id=spec_id,
+                revision=int(previous["revision"]) + 1 if previous else 1,
+                board=board.model_dump(mode="json"),
+            )
+            self._write_state(state)
+            self._audit.reset(spec_id)
+            return _etag_from_revision(state.revision)
 
     def get_board(self, spec_id: str) -> Tuple[DraftDocument, str]:
-        state = self._load_state(spec_id)
-        board = DraftDocument.model_validate(state.board)
-        return board, _etag_from_revision(state.revision)
+        with self._states.transaction(spec_id):
+            state = self._load_state(spec_id)
+            board = DraftDocument.model_validate(state.board)
+            return board, _etag_from_revision(state.revision)
+
+    def get_board_etag(self, spec_id: str) -> str:
+        """ボードを検証せずに現在の ETag だけを返す。"""
+
+        with self._states.lock(spec_id):
+            return _etag_from_revision(self._load_state(spec_id).revision)
+
+    def export_state(self, spec_id: str) -> str:
+        """管理用にボードの状態をインデント付き JSON で返す（保存形式はコンパクト）。"""
+
+        text = self._states.export(spec_id)
+        if text is None:
+            raise BoardNotFoundError(f"spec '{spec_id}' は存在しません")
+        return text
 
     def update_layout_hint(
         self,
@@ -132,34 +214,17 @@ class DraftStore:
         expected_etag: str,
         actor: str | None,
     ) -> str:
-        state = self._load_state(spec_id)
-        expected_revision = _parse_etag(expected_etag)
-        self._ensure_revision(state, expected_revision)
+        with self._states.transaction(spec_id):
+            state = self._load_state(spec_id)
+            expected_revision = _parse_etag(expected_etag)
+            self._ensure_revision(state, expected_revision)
 
-        section, slide = self._find_slide(state.board, slide_id)
-        if bool(slide.get("locked")):
-            raise LockedContentError(f"slide '{slide_id}' はロックされています")
-        slide["layout_hint"] = layout_hint
-
-        candidates = slide.setdefault("layout_candidates", [])
-        if not any(candidate.get("layout_id") == layout_hint for candidate in candidates):
-            candidates.append({"layout_id": layout_hint, "score": 1.0})
+            changes = self._apply_hint(state.board, slide_id, layout_hint)
 
-        state.revision += 1
-        self._append_log(
-            state,
-            DraftLogEntry(
-                target_type="slide",
-                target_id=slide_id,
-                action="hint",
-                actor=actor,
-                timestamp=datetime.now(timezone.utc),
-                notes=notes,
-                changes={"layout_hint": layout_hint},
-            ).model_dump(mode="json"),
-        )
-        self._write_state(state)
-        return _etag_from_revision(state.revision)
+            state.revision += 1
+            self._write_state(state)
+            self._append_logs(state, [_slide_log_entry(slide_id, "hint", actor, notes, changes)])
+            return _etag_from_revision(state.revision)
 
     def move_slide(
         self,
@@ -171,42 +236,69 @@ class DraftStore:
         expected_etag: str,
         actor: str | None,
     ) -> str:
-        state = self._load_state(spec_id)
-        expected_revision = _parse_etag(expected_etag)
-        self._ensure_revision(state, expected_revision)
-
-        source_section, slide = self._find_slide(state.board, slide_id)
-        if bool(slide.get("locked")):
-            raise LockedContentError(f"slide '{slide_id}' はロックされています")
-        source_section["slides"] = [item for item in source_section["slides"] if item["ref_id"] != slide_id]
+        with self._states.transaction(spec_id):
+            state = self._load_state(spec_id)
+            expected_revision = _parse_etag(expected_etag)
+            self._ensure_revision(state, expected_revision)
 
-        destination = self._find_section(state.board, target_section)
-        insert_at = len(destination["slides"]) if position is None else max(0, min(position - 1, len(destination["slides"])))
-        destination["slides"].insert(insert_at, slide)
+            changes = self._apply_move(state.board, slide_id, target_section, position)
 
-        self._reorder_slides(source_section["slides"])
-        if destination is not source_section:
-            self._reorder_slides(destination["slides"])
+            state.revision += 1
+            self._write_state(state)
+            self._append_logs(state, [_slide_log_entry(slide_id, "move", actor, None, changes)])
+            return _etag_from_revision(state.revision)
 
-        state.revision += 1
-        self._append_log(
-            state,
-            DraftLogEntry(
-                target_type="slide",
-                target_id=slide_id,
-                action="move",
-                actor=actor,
-                timestamp=datetime.now(timezone.utc),
-                notes=None,
-                changes={
-                    "from_section": source_section["name"],
-                    "to_section": destination["name"],
-                    "position": insert_at + 1,
-                },
-            ).model_dump(mode="json"),
-        )
-        self._write_state(state)
-        return _etag_from_revision(state.revision)
+    def apply_board_operations(
+        self,
+        spec_id: str,
+        operations: list[BoardOperation],
+        *,
+        expected_etag: str,
+        actor: str | None,
+    ) -> tuple[str, list[BoardOperationResult]]:
+        """スライドの移動・レイアウト指定をまとめて適用し、1 リビジョンとして保存する。
+
+        1 件でも失敗した場合は何も保存せず、各操作の結果を持つ ``BulkOperationError`` を送出する。
+        """
+
+        if not operations:
+            raise ValueError("operations には 1 件以上の操作を指定してください")
+        with self._states.transaction(spec_id):
+            state = self._load_state(spec_id)
+            expected_revision = _parse_etag(expected_etag)
+            self._ensure_revision(state, expected_revision)
+
+            board = copy.deepcopy(state.board)
+            results: list[BoardOperationResult] = []
+            entries: list[dict[str, Any]] = []
+            for operation in operations:
+                try:
+                    if operation.action == "hint":
+                        if not operation.layout_hint:
+                            raise ValueError("hint 操作には layout_hint が必要です")
+                        changes = self._apply_hint(board, operation.slide_id, operation.layout_hint)
+                    elif operation.action == "move":
+                        if not operation.target_section:
+                            raise ValueError("move 操作には target_section が必要です")
+                        changes = self._apply_move(board, operation.slide_id, operation.target_section, operation.position)
+                    else:
+                        raise ValueError(f"未対応の操作です: {operation.action}")
+                except (SlideNotFoundError, SectionNotFoundError, LockedContentError, ValueError) as exc:
+                    message = exc.args[0] if isinstance(exc, KeyError) and exc.args else str(exc)
+                    results.append(BoardOperationResult(slide_id=operation.slide_id, action=operation.action, error=message))
+                    continue
+                results.append(BoardOperationResult(slide_id=operation.slide_id, action=operation.action, changes=changes))
+                entries.append(_slide_log_entry(operation.slide_id, operation.action, actor, operation.notes, changes))
+
+            failures = sum(1 for result in results if result.error)
+            if failures:
+                raise BulkOperationError(f"{failures} 件の操作が失敗したため、いずれも適用していません", results)
+
+            state.board = board
+            state.revision += 1
+            self._write_state(state)
+            self._append_logs(state, entries)
+            return _etag_from_revision(state.revision), results
 
     def approve_section(
         self,
@@ -217,31 +309,32 @@ class DraftStore:
         actor: str | None,
         notes: str | None,
     ) -> str:
-        state = self._load_state(spec_id)
-        expected_revision = _parse_etag(expected_etag)
-        self._ensure_revision(state, expected_revision)
-
-        section = self._find_section(state.board, section_name)
-        section["status"] = "approved"
-        for slide in section.get("slides", []):
-            slide["status"] = "approved"
-            slide["locked"] = True
-
-        state.revision += 1
-        self._append_log(
-            state,
-            DraftLogEntry(
-                target_type="section",
-                target_id=section_name,
-                action="approve",
-                actor=actor,
-                timestamp=datetime.now(timezone.utc),
-                notes=notes,
-                changes=None,
-            ).model_dump(mode="json"),
-        )
-        self._write_state(state)
-        return _etag_from_revision(state.revision)
+        with self._states.transaction(spec_id):
+            state = self._load_state(spec_id)
+            expected_revision = _parse_etag(expected_etag)
+            self._ensure_revision(state, expected_revision)
+
+            section = self._find_section(state.board, section_name)
+            section["status"] = "approved"
+            for slide in section.get("slides", []):
+                slide["status"] = "approved"
+                slide["locked"] = True
+
+            state.revision += 1
+            self._write_state(state)
+            self._append_log(
+                state,
+                DraftLogEntry(
+                    target_type="section",
+                    target_id=section_name,
+                    action="approve",
+                    actor=actor,
+                    timestamp=datetime.now(timezone.utc),
+                    notes=notes,
+                    changes=None,
+                ).model_dump(mode="json"),
+            )
+            return _etag_from_revision(state.revision)
 
     def set_appendix(
         self,
@@ -253,30 +346,55 @@ class DraftStore:
         actor: str | None,
         notes: str | None,
     ) -> str:
-        state = self._load_state(spec_id)
-        expected_revision = _parse_etag(expected_etag)
-        self._ensure_revision(state, expected_revision)
+        with self._states.transaction(spec_id):
+            state = self._load_state(spec_id)
+            expected_revision = _parse_etag(expected_etag)
+            self._ensure_revision(state, expected_revision)
+
+            _, slide = self._find_slide(state.board, slide_id)
+            if bool(slide.get("locked")):
+                raise LockedContentError(f"slide '{slide_id}' はロックされています")
+            slide["appendix"] = appendix
+
+            state.revision += 1
+            self._write_state(state)
+            self._append_log(
+                state,
+                DraftLogEntry(
+                    target_type="slide",
+                    target_id=slide_id,
+                    action="appendix",
+                    actor=actor,
+                    timestamp=datetime.now(timezone.utc),
+                    notes=notes,
+                    changes={"appendix": appendix},
+                ).model_dump(mode="json"),
+            )
+            return _etag_from_revision(state.revision)
+
+    @property
+    def changes(self) -> ChangeFeed:
+        """監査ログへの追記を通知する変更フィード。"""
+
+        return self._changes
+
+    def list_changes(
+        self,
+        spec_id: str | None,
+        cursor: str | None,
+        *,
+        limit: int = 200,
+    ) -> tuple[list[ChangeEvent], str | None]:
+        """``cursor`` 以降の変更イベントを監査ログから読み直す。"""
 
-        _, slide = self._find_slide(state.board, slide_id)
-        if bool(slide.get("locked")):
-            raise LockedContentError(f"slide '{slide_id}' はロックされています")
-        slide["appendix"] = appendix
-
-        state.revision += 1
-        self._append_log(
-            state,
-            DraftLogEntry(
-                target_type="slide",
-                target_id=slide_id,
-                action="appendix",
-                actor=actor,
-                timestamp=datetime.now(timezone.utc),
-                notes=notes,
-                changes={"appendix": appendix},
-            ).model_dump(mode="json"),
-        )
-        self._write_state(state)
-        return _etag_from_revision(state.revision)
+        page = self._audit.query([spec_id] if spec_id else None, limit=limit, cursor=cursor)
+        events = [_change_event(entry, entry_cursor) for entry, entry_cursor in zip(page.items, page.cursors)]
+        return events, page.next_cursor
+
+    def head_change_cursor(self, spec_id: str | None) -> str | None:
+        """現在の最新の変更を指すカーソルを返す（購読開始位置の記録用）。"""
+
+        return self._audit.head_cursor([spec_id] if spec_id else None)
 
     def list_logs(
         self,
@@ -284,34 +402,33 @@ class DraftStore:
         *,
         limit: int = 100,
         offset: int = 0,
-    ) -> tuple[list[DraftLogEntry], int | None]:
-        state = self._load_state(spec_id)
-        entries = [
-            DraftLogEntry.model_validate(item) for item in state.logs
-        ]
-        sliced = entries[offset : offset + limit]
-        next_offset = offset + len(sliced)
-        if next_offset >= len(entries):
-            next_offset = None
-        return sliced, next_offset
+        cursor: str | None = None,
+    ) -> tuple[list[DraftLogEntry], str | None]:
+        """ログを追記順で返す。続きがある場合は次ページのカーソルも返す。"""
+
+        with self._states.transaction(spec_id):
+            self._load_state(spec_id)
+            page = self._audit.query([spec_id], limit=limit, offset=offset, cursor=cursor)
+            entries = [DraftLogEntry.model_validate(item) for item in page.items]
+            return entries, page.next_cursor
 
     # ------------------------------------------------------------------ #
     # 内部処理
     # ------------------------------------------------------------------ #
-    def _spec_path(self, spec_id: str) -> Path:
-        filename = f"{spec_id}.json"
-        return self._base_dir / filename
-
     def _write_state(self, state: DraftState) -> None:
-        path = self._spec_path(state.spec_id)
-        path.write_text(json.dumps(state.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        self._states.store(state.spec_id, state.to_dict())
 
     def _load_state(self, spec_id: str) -> DraftState:
-        path = self._spec_path(spec_id)
-        if not path.exists():
+        payload = self._states.load(spec_id)
+        if payload is None:
             raise BoardNotFoundError(f"spec '{spec_id}' は存在しません")
-        payload = json.loads(path.read_text(encoding="utf-8"))
-        return DraftState.from_dict(payload)
+        state = DraftState.from_dict(payload)
+        if "logs" in payload:
+            # 旧形式（状態 JSON にログを内包）のファイルは読み込み時に監査ログへ移す
+            if self._audit.count(spec_id) == 0:
+                self._audit.extend(spec_id, iter_legacy_entries(payload["logs"], "target_id"))
+            self._write_state(state)
+        return state
 
     @staticmethod
     def _ensure_revision(state: DraftState, expected_revision: int) -> None:
@@ -332,11 +449,53 @@ class DraftStore:
                     return section, slide
         raise SlideNotFoundError(f"slide '{slide_id}' が見つかりません")
 
+    def _apply_hint(self, board: dict[str, Any], slide_id: str, layout_hint: str) -> dict[str, Any]:
+        _, slide = self._find_slide(board, slide_id)
+        if bool(slide.get("locked")):
+            raise LockedContentError(f"slide '{slide_id}' はロックされています")
+        slide["layout_hint"] = layout_hint
+
+        candidates = slide.setdefault("layout_candidates", [])
+        if not any(candidate.get("layout_id") == layout_hint for candidate in candidates):
+            candidates.append({"layout_id": layout_hint, "score": 1.0})
+        return {"layout_hint": layout_hint}
+
+    def _apply_move(
+        self,
+        board: dict[str, Any],
+        slide_id: str,
+        target_section: str,
+        position: int | None,
+    ) -> dict[str, Any]:
+        source_section, slide = self._find_slide(board, slide_id)
+        if bool(slide.get("locked")):
+            raise LockedContentError(f"slide '{slide_id}' はロックされています")
+        destination = self._find_section(board, target_section)
+        source_section["slides"] = [item for item in source_section["slides"] if item["ref_id"] != slide_id]
+
+        insert_at = len(destination["slides"]) if position is None else max(0, min(position - 1, len(destination["slides"])))
+        destination["slides"].insert(insert_at, slide)
+
+        self._reorder_slides(source_section["slides"])
+        if destination is not source_section:
+            self._reorder_slides(destination["slides"])
+        return {
+            "from_section": source_section["name"],
+            "to_section": destination["name"],
+            "position": insert_at + 1,
+        }
+
     @staticmethod
     def _reorder_slides(slides: list[dict[str, Any]]) -> None:
         for index, slide in enumerate(slides, start=1):
             slide["order"] = index
 
-    @staticmethod
-    def _append_log(state: DraftState, entry: dict[str, Any]) -> None:
-        state.logs.append(entry)
+    def _append_log(self, state: DraftState, entry: dict[str, Any]) -> None:
+        self._append_logs(state, [entry])
+
+    def _append_logs(self, state: DraftState, entries: list[dict[str, Any]]) -> None:
+        for entry in entries:
+            entry["revision"] = state.revision
+        cursors = self._audit.extend(state.spec_id, [(entry, entry["target_id"]) for entry in entries])
+        for entry, cursor in zip(entries, cursors):
+            self._changes.publish(_change_event(entry, cursor))
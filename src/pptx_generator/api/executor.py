@@ -0,0 +1,71 @@
+"""API ハンドラーからストア I/O を逃がす専用スレッドプール。
+
+ハンドラーは ``async def`` で定義し、ファイル I/O を伴うストア操作だけを
+``StoreExecutor.run`` でワーカースレッドへ渡す。サーバー既定のスレッドプールとは
+独立しているため、ストア待ちが他の同期処理（依存関係の解決など）を詰まらせない。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_WORKERS = 8
+
+T = TypeVar("T")
+
+
+class StoreExecutor:
+    """ストア操作をイベントループ外で実行する。"""
+
+    def __init__(self, max_workers: int = DEFAULT_STORE_WORKERS) -> None:
+        self.max_workers = max(1, max_workers)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pptx-store")
+
+    @classmethod
+    def from_env(cls) -> StoreExecutor:
+        """環境変数 PPTX_STORE_WORKERS からワーカー数を決めて生成する。"""
+
+        raw = os.getenv("PPTX_STORE_WORKERS")
+        if raw is None or not raw.strip():
+            return cls()
+        try:
+            return cls(int(raw))
+        except ValueError:
+            logger.warning(
+                "PPTX_STORE_WORKERS の値が整数ではないため既定値 %d を使用します: %s",
+                DEFAULT_STORE_WORKERS,
+                raw,
+            )
+            return cls()
+
+    async def run(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, functools.partial(func, *args, **kwargs))
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=True)
+
+
+_default_executor: StoreExecutor | None = None
+_default_guard = threading.Lock()
+
+
+def get_default_executor() -> StoreExecutor:
+    """プロセス共有の ``StoreExecutor`` を返す（初回呼び出し時に生成）。"""
+
+    global _default_executor
+    with _default_guard:
+        if _default_executor is None:
+            _default_executor = StoreExecutor.from_env()
+        return _default_executor
+
+
+__all__ = ["DEFAULT_STORE_WORKERS", "StoreExecutor", "get_default_executor"]
@@ -0,0 +1,154 @@
+"""FastAPI application for resident job execution (`pptx serve`)."""
+
+from __future__ import annotations
+
+import os
+from contextlib import asynccontextmanager
+from typing import Annotated, AsyncIterator
+
+from fastapi import Depends, FastAPI, Header, HTTPException, Response, status
+from fastapi.responses import FileResponse
+
+from ..utils.file_cache import shared_file_cache
+from ..utils.llm_capabilities import shared_capability_registry
+from ..utils.llm_sdk import shared_sdk_clients
+from .job_runner import (ArtifactNotFoundError, JobManager, JobNotFoundError,
+                         JobQueueFullError, JobRecord, JobSubmissionError)
+from .job_schemas import (JobArtifact, JobArtifactsResponse, JobCreateRequest,
+                          JobListResponse, JobResponse, ServerStatsResponse)
+
+
+def _create_manager() -> JobManager:
+    return JobManager()
+
+
+def _get_auth_token() -> str | None:
+    return os.environ.get("JOB_API_TOKEN")
+
+
+def create_job_app(manager: JobManager | None = None) -> FastAPI:
+    """Create FastAPI application instance."""
+
+    job_manager = manager or _create_manager()
+    api_token = _get_auth_token()
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        yield
+        job_manager.shutdown(wait=True)
+        shared_sdk_clients.close()
+
+    app = FastAPI(title="PPTX Job API", version="1.0.0", lifespan=lifespan)
+
+    async def verify_token(authorization: Annotated[str | None, Header(alias="Authorization")] = None) -> None:
+        if api_token is None:
+            return
+        if not authorization or not authorization.startswith("Bearer "):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing bearer token")
+        token = authorization.split(" ", 1)[1]
+        if token != api_token:
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid token")
+
+    @app.post(
+        "/v1/jobs",
+        response_model=JobResponse,
+        status_code=status.HTTP_202_ACCEPTED,
+        responses={
+            400: {"description": "Invalid command arguments"},
+            429: {"description": "Job queue is full"},
+        },
+        dependencies=[Depends(verify_token)],
+    )
+    def submit_job(payload: JobCreateRequest) -> Response:
+        try:
+            record = job_manager.submit(payload.command, payload.args)
+        except JobSubmissionError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+        except JobQueueFullError as exc:
+            raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(exc)) from exc
+
+        return Response(
+            content=_job_payload(record).model_dump_json(),
+            media_type="application/json",
+            status_code=status.HTTP_202_ACCEPTED,
+            headers={"Location": f"/v1/jobs/{record.job_id}"},
+        )
+
+    @app.get(
+        "/v1/jobs",
+        response_model=JobListResponse,
+        dependencies=[Depends(verify_token)],
+    )
+    def list_jobs() -> JobListResponse:
+        return JobListResponse(items=[_job_payload(record) for record in job_manager.list_jobs()])
+
+    @app.get(
+        "/v1/jobs/{job_id}",
+        response_model=JobResponse,
+        responses={404: {"description": "Job not found"}},
+        dependencies=[Depends(verify_token)],
+    )
+    def get_job(job_id: str) -> JobResponse:
+        try:
+            record = job_manager.get(job_id)
+        except JobNotFoundError as exc:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+        return _job_payload(record)
+
+    @app.get(
+        "/v1/jobs/{job_id}/artifacts",
+        response_model=JobArtifactsResponse,
+        responses={404: {"description": "Job not found"}},
+        dependencies=[Depends(verify_token)],
+    )
+    def list_artifacts(job_id: str) -> JobArtifactsResponse:
+        try:
+            items = job_manager.list_artifacts(job_id)
+        except JobNotFoundError as exc:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+        return JobArtifactsResponse(
+            job_id=job_id,
+            items=[JobArtifact(name=name, size=size) for name, size in items],
+        )
+
+    @app.get(
+        "/v1/jobs/{job_id}/artifacts/{artifact:path}",
+        responses={404: {"description": "Job or artifact not found"}},
+        dependencies=[Depends(verify_token)],
+    )
+    def get_artifact(job_id: str, artifact: str) -> FileResponse:
+        try:
+            path = job_manager.resolve_artifact(job_id, artifact)
+        except (JobNotFoundError, ArtifactNotFoundError) as exc:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+        return FileResponse(path, filename=path.name)
+
+    @app.get(
+        "/v1/stats",
+        response_model=ServerStatsResponse,
+        dependencies=[Depends(verify_token)],
+    )
+    def get_stats() -> ServerStatsResponse:
+        return ServerStatsResponse(
+            jobs=job_manager.stats(),
+            cache=shared_file_cache.stats(),
+            llm_capabilities=shared_capability_registry().stats(),
+            llm_clients=shared_sdk_clients.stats(),
+        )
+
+    return app
+
+
+def _job_payload(record: JobRecord) -> JobResponse:
+    return JobResponse(
+        job_id=record.job_id,
+        command=record.command,
+        args=list(record.args),
+        status=record.status,
+        submitted_at=record.submitted_at,
+        started_at=record.started_at,
+        finished_at=record.finished_at,
+        exit_code=record.exit_code,
+        error=record.error,
+        output_dirs={name: str(path) for name, path in record.output_dirs.items()},
+    )
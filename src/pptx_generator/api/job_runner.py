@@ -0,0 +1,237 @@
+"""常駐ジョブサーバー向けのジョブ管理。"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Literal
+
+import click
+
+logger = logging.getLogger(__name__)
+
+JOB_COMMANDS: tuple[str, ...] = ("prepare", "compose", "gen", "run")
+# 成果物の配置先として扱う CLI オプション (click のパラメータ名)
+OUTPUT_PARAM_NAMES: tuple[str, ...] = ("output_dir", "draft_output", "compose_output")
+# 終了済みジョブの記録を保持する件数（超過分は古いものから破棄する。成果物ファイルは残る）
+DEFAULT_MAX_FINISHED_JOBS = 256
+
+JobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class JobSubmissionError(RuntimeError):
+    """ジョブ引数が不正な場合の例外。"""
+
+
+class JobQueueFullError(RuntimeError):
+    """待ち行列が上限に達した場合の例外。"""
+
+
+class JobNotFoundError(KeyError):
+    """ジョブが存在しない場合の例外。"""
+
+
+class ArtifactNotFoundError(KeyError):
+    """成果物が存在しない場合の例外。"""
+
+
+@dataclass(slots=True)
+class JobRecord:
+    """ジョブの状態。"""
+
+    job_id: str
+    command: str
+    args: tuple[str, ...]
+    output_dirs: dict[str, Path]
+    status: JobStatus = "queued"
+    submitted_at: str = field(default_factory=lambda: _now_iso())
+    started_at: str | None = None
+    finished_at: str | None = None
+    exit_code: int | None = None
+    error: str | None = None
+
+
+class JobManager:
+    """CLI コマンドを有界ワーカープールで実行する。
+
+    終了済みジョブの記録は ``max_finished`` 件まで保持し、超過分は終了順に破棄する。
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = 2,
+        max_queue: int = 16,
+        max_finished: int = DEFAULT_MAX_FINISHED_JOBS,
+        cli_group: click.Group | None = None,
+    ) -> None:
+        if max_workers < 1:
+            msg = "max_workers は 1 以上を指定してください"
+            raise ValueError(msg)
+        self._max_workers = max_workers
+        self._max_queue = max(0, max_queue)
+        self._max_finished = max(0, max_finished)
+        self._cli_group = cli_group
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pptx-job"
+        )
+        self._jobs: dict[str, JobRecord] = {}
+        self._finished: deque[str] = deque()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------ #
+    # 公開 API
+    # ------------------------------------------------------------------ #
+    def submit(self, command: str, args: list[str] | tuple[str, ...]) -> JobRecord:
+        """ジョブを登録し、ワーカープールへ投入する。"""
+
+        if command not in JOB_COMMANDS:
+            msg = f"未対応のコマンドです: {command}"
+            raise JobSubmissionError(msg)
+
+        cli_command = self._resolve_group().commands[command]
+        try:
+            ctx = cli_command.make_context(command, list(args))
+        except click.exceptions.Exit as exc:
+            msg = f"コマンド引数の解析が終了コード {exc.exit_code} で終了しました"
+            raise JobSubmissionError(msg) from exc
+        except click.ClickException as exc:
+            raise JobSubmissionError(exc.format_message()) from exc
+
+        output_dirs = {
+            name: Path(value)
+            for name in OUTPUT_PARAM_NAMES
+            if isinstance(value := ctx.params.get(name), Path)
+        }
+        record = JobRecord(
+            job_id=uuid.uuid4().hex,
+            command=command,
+            args=tuple(args),
+            output_dirs=output_dirs,
+        )
+
+        with self._lock:
+            if self._pending_count() >= self._max_workers + self._max_queue:
+                msg = "ジョブキューが上限に達しています"
+                raise JobQueueFullError(msg)
+            self._jobs[record.job_id] = record
+
+        self._executor.submit(self._run, record, cli_command, ctx)
+        return record
+
+    def get(self, job_id: str) -> JobRecord:
+        with self._lock:
+            record = self._jobs.get(job_id)
+        if record is None:
+            msg = f"job_id={job_id} が見つかりません"
+            raise JobNotFoundError(msg)
+        return record
+
+    def list_jobs(self) -> list[JobRecord]:
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda item: item.submitted_at)
+
+    def list_artifacts(self, job_id: str) -> list[tuple[str, int]]:
+        """ジョブ出力ディレクトリ配下のファイルを `<オプション名>/<相対パス>` で返す。"""
+
+        record = self.get(job_id)
+        items: list[tuple[str, int]] = []
+        for name, directory in record.output_dirs.items():
+            if not directory.is_dir():
+                continue
+            for path in sorted(directory.rglob("*")):
+                if path.is_file():
+                    relative = path.relative_to(directory).as_posix()
+                    items.append((f"{name}/{relative}", path.stat().st_size))
+        return items
+
+    def resolve_artifact(self, job_id: str, artifact: str) -> Path:
+        record = self.get(job_id)
+        name, _, relative = artifact.partition("/")
+        directory = record.output_dirs.get(name)
+        if directory is None or not relative:
+            msg = f"成果物が見つかりません: {artifact}"
+            raise ArtifactNotFoundError(msg)
+        base = directory.resolve()
+        candidate = (base / relative).resolve()
+        if not candidate.is_relative_to(base) or not candidate.is_file():
+            msg = f"成果物が見つかりません: {artifact}"
+            raise ArtifactNotFoundError(msg)
+        return candidate
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            counts = {"queued": 0, "running": 0, "succeeded": 0, "failed": 0}
+            for record in self._jobs.values():
+                counts[record.status] += 1
+        return {
+            **counts,
+            "max_workers": self._max_workers,
+            "max_queue": self._max_queue,
+            "max_finished": self._max_finished,
+        }
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    # ------------------------------------------------------------------ #
+    # 内部ユーティリティ
+    # ------------------------------------------------------------------ #
+    def _resolve_group(self) -> click.Group:
+        if self._cli_group is None:
+            from ..cli import app as cli_app
+
+            self._cli_group = cli_app
+        return self._cli_group
+
+    def _pending_count(self) -> int:
+        return sum(
+            1 for record in self._jobs.values() if record.status in {"queued", "running"}
+        )
+
+    def _run(self, record: JobRecord, command: click.Command, ctx: click.Context) -> None:
+        record.status = "running"
+        record.started_at = _now_iso()
+        logger.info("job started: id=%s command=%s", record.job_id, record.command)
+        exit_code = 0
+        error: str | None = None
+        try:
+            with ctx:
+                command.invoke(ctx)
+        except click.exceptions.Exit as exc:
+            exit_code = exc.exit_code
+        except click.ClickException as exc:
+            exit_code = exc.exit_code
+            error = exc.format_message()
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("job failed: id=%s", record.job_id)
+            exit_code = 1
+            error = str(exc)
+
+        record.exit_code = exit_code
+        record.error = error
+        record.finished_at = _now_iso()
+        record.status = "succeeded" if exit_code == 0 else "failed"
+        self._retire(record)
+        logger.info(
+            "job finished: id=%s status=%s exit_code=%s",
+            record.job_id,
+            record.status,
+            exit_code,
+        )
+
+    def _retire(self, record: JobRecord) -> None:
+        with self._lock:
+            self._finished.append(record.job_id)
+            while len(self._finished) > self._max_finished:
+                self._jobs.pop(self._finished.popleft(), None)
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
@@ -0,0 +1,58 @@
+"""Job API 用 Pydantic スキーマ。"""
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+
+class JobCreateRequest(BaseModel):
+    """ジョブ登録リクエスト。"""
+
+    command: Literal["prepare", "compose", "gen", "run"]
+    args: list[str] = Field(default_factory=list)
+
+
+class JobResponse(BaseModel):
+    """ジョブ状態レスポンス。"""
+
+    job_id: str
+    command: str
+    args: list[str]
+    status: Literal["queued", "running", "succeeded", "failed"]
+    submitted_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+    exit_code: int | None = None
+    error: str | None = None
+    output_dirs: dict[str, str] = Field(default_factory=dict)
+
+
+class JobListResponse(BaseModel):
+    """ジョブ一覧レスポンス。"""
+
+    items: list[JobResponse] = Field(default_factory=list)
+
+
+class JobArtifact(BaseModel):
+    """成果物ファイル。"""
+
+    name: str
+    size: int
+
+
+class JobArtifactsResponse(BaseModel):
+    """成果物一覧レスポンス。"""
+
+    job_id: str
+    items: list[JobArtifact] = Field(default_factory=list)
+
+
+class ServerStatsResponse(BaseModel):
+    """ワーカーとキャッシュの統計。"""
+
+    jobs: dict[str, int]
+    cache: dict[str, int | bool]
+    llm_capabilities: dict[str, int] = Field(default_factory=dict)
+    llm_clients: dict[str, int] = Field(default_factory=dict)
@@ -0,0 +1,42 @@
+"""API ストア用の JSON エンコード／デコード。
+
+orjson がインストールされていればそれを使い、無ければ標準ライブラリにフォールバックする。
+保存形式はインデント無しのコンパクトな JSON（UTF-8 のまま出力）。
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def dumps(value: Any, *, pretty: bool = False) -> str:
+    """JSON 文字列へ変換する。``pretty=True`` は管理用エクスポート向けのインデント付き出力。"""
+
+    if pretty:
+        return json.dumps(value, ensure_ascii=False, indent=2)
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_bytes(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+__all__ = ["BACKEND", "dumps", "dumps_bytes", "loads"]
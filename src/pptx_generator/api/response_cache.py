@@ -0,0 +1,62 @@
+"""条件付き GET とリビジョン単位のレスポンス本文キャッシュ。"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+from fastapi import Response, status
+
+DEFAULT_RESPONSE_CACHE_SIZE = 512
+
+
+class ResponseBodyCache:
+    """(リソースキー, ETag) ごとにシリアライズ済みの JSON 本文を保持する LRU。
+
+    ETag はストアのリビジョンから決まるため、同じキーと ETag の本文は不変とみなせる。
+    """
+
+    def __init__(self, capacity: int = DEFAULT_RESPONSE_CACHE_SIZE) -> None:
+        self._capacity = max(0, capacity)
+        self._bodies: OrderedDict[tuple[Hashable, str], bytes] = OrderedDict()
+        self._guard = threading.Lock()
+
+    def get(self, key: Hashable, etag: str) -> bytes | None:
+        with self._guard:
+            body = self._bodies.get((key, etag))
+            if body is not None:
+                self._bodies.move_to_end((key, etag))
+            return body
+
+    def put(self, key: Hashable, etag: str, body: bytes) -> None:
+        if self._capacity == 0:
+            return
+        with self._guard:
+            self._bodies[(key, etag)] = body
+            self._bodies.move_to_end((key, etag))
+            while len(self._bodies) > self._capacity:
+                self._bodies.popitem(last=False)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match ヘッダーが現在の ETag に一致するか（弱い比較）を判定する。"""
+
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    current = _opaque_tag(etag)
+    return any(_opaque_tag(candidate) == current for candidate in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+def _opaque_tag(value: str) -> str:
+    value = value.strip()
+    return value[2:] if value.startswith("W/") else value
+
+
+__all__ = ["DEFAULT_RESPONSE_CACHE_SIZE", "ResponseBodyCache", "etag_matches", "not_modified"]
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field, RootModel, field_validator
+from pydantic import (BaseModel, Field, RootModel, field_validator,
+                      model_validator)
 
 from ..models import ContentTableData
 
@@ -110,6 +111,59 @@ class CardReturnResponse(BaseModel):
     status: str
 
 
+class BulkCardOperation(BaseModel):
+    """一括操作の 1 件。``action`` に応じて使うフィールドが異なる。"""
+
+    slide_id: str = Field(..., min_length=1)
+    action: Literal["update", "approve", "return"]
+    # update
+    title: str | None = None
+    body: list[str] | None = None
+    table_data: TableDataPayload | None = None
+    note: str | None = None
+    intent: str | None = None
+    type_hint: str | None = None
+    story: StoryMetadata | None = None
+    autofix_applied: list[str] | None = None
+    # approve
+    notes: str | None = None
+    applied_autofix: list[str] | None = None
+    # return
+    reason: str | None = None
+    requested_by: str | None = None
+
+    @model_validator(mode="after")
+    def ensure_return_reason(self) -> BulkCardOperation:
+        if self.action == "return" and not self.reason:
+            msg = "return 操作には reason が必要です"
+            raise ValueError(msg)
+        return self
+
+
+class BulkCardRequest(BaseModel):
+    """カード一括操作リクエスト。"""
+
+    operations: list[BulkCardOperation] = Field(..., min_length=1, max_length=500)
+
+
+class BulkCardResult(BaseModel):
+    """一括操作 1 件分の結果。"""
+
+    slide_id: str
+    action: str
+    status: str | None = None
+    content_hash: str | None = None
+    locked_at: datetime | None = None
+    error: str | None = None
+
+
+class BulkCardResponse(BaseModel):
+    """カード一括操作レスポンス。"""
+
+    revision: str
+    results: list[BulkCardResult] = Field(default_factory=list)
+
+
 class CardHistoryEntry(BaseModel):
     """カード履歴エントリ。"""
 
@@ -156,6 +210,7 @@ class LogsResponse(BaseModel):
 
     items: list[LogEntry] = Field(default_factory=list)
     next_offset: str | None = None
+    next_cursor: str | None = None
 
 
 class ErrorDetail(BaseModel):
@@ -173,6 +228,12 @@ class ErrorResponse(BaseModel):
     details: list[ErrorDetail] | None = None
 
 
+class BulkErrorResponse(ErrorResponse):
+    """一括操作が失敗した場合のレスポンス。"""
+
+    results: list[BulkCardResult] = Field(default_factory=list)
+
+
 class RawJSON(RootModel[Any]):
     """任意の JSON を返したい場合のラッパー。"""
 
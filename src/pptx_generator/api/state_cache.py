@@ -0,0 +1,199 @@
+"""API ストア共通の spec 状態キャッシュ（書き込みスルー + spec 単位ロック）。"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator
+
+from . import json_codec
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_CACHE_SIZE = 128
+
+
+class SpecStateCache:
+    """``<base_dir>/<spec_id>.json`` の状態をメモリ上の LRU に保持する。
+
+    読み書きは spec ごとの再入可能ロックで直列化し、リビジョン比較から書き込みまでを
+    ``transaction`` の中で行う。書き込みは一時ファイル + ``os.replace`` で原子的に行い、
+    ``commit_interval`` が正の場合は同じ spec への連続更新をまとめて書き出す（グループコミット）。
+    ディレクトリは 1 プロセスが専有する前提で、外部からのファイル変更は検知しない。
+    """
+
+    def __init__(
+        self,
+        base_dir: Path,
+        *,
+        capacity: int = DEFAULT_STATE_CACHE_SIZE,
+        commit_interval: float = 0.0,
+    ) -> None:
+        self._base_dir = base_dir
+        self._capacity = max(0, capacity)
+        self._commit_interval = max(0.0, commit_interval)
+        self._states: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._states_guard = threading.Lock()
+        self._locks: dict[str, threading.RLock] = {}
+        self._locks_guard = threading.Lock()
+        self._pending: dict[str, str] = {}
+        self._pending_guard = threading.Lock()
+        self._timer: threading.Timer | None = None
+        if self._commit_interval > 0:
+            atexit.register(self.flush)
+
+    @classmethod
+    def from_env(cls, base_dir: Path) -> SpecStateCache:
+        """環境変数 PPTX_STORE_CACHE_SIZE / PPTX_STORE_COMMIT_INTERVAL_MS から生成する。"""
+
+        capacity = _env_int("PPTX_STORE_CACHE_SIZE", DEFAULT_STATE_CACHE_SIZE)
+        interval_ms = _env_int("PPTX_STORE_COMMIT_INTERVAL_MS", 0)
+        return cls(base_dir, capacity=capacity, commit_interval=interval_ms / 1000)
+
+    # ------------------------------------------------------------------ #
+    # ロック
+    # ------------------------------------------------------------------ #
+    def lock(self, spec_id: str) -> threading.RLock:
+        with self._locks_guard:
+            lock = self._locks.get(spec_id)
+            if lock is None:
+                lock = self._locks[spec_id] = threading.RLock()
+            return lock
+
+    @contextmanager
+    def transaction(self, spec_id: str) -> Iterator[None]:
+        """spec のロックを保持する。例外時は途中まで変更された可能性のあるキャッシュを破棄する。"""
+
+        with self.lock(spec_id):
+            try:
+                yield
+            except BaseException:
+                self.discard(spec_id)
+                raise
+
+    # ------------------------------------------------------------------ #
+    # 読み書き（呼び出し側で spec のロックを保持すること）
+    # ------------------------------------------------------------------ #
+    def load(self, spec_id: str) -> dict[str, Any] | None:
+        """状態を返す。存在しない場合は ``None``。返した dict はキャッシュと共有される。"""
+
+        with self._states_guard:
+            state = self._states.get(spec_id)
+            if state is not None:
+                self._states.move_to_end(spec_id)
+                return state
+        with self._pending_guard:
+            text = self._pending.get(spec_id)
+        if text is None:
+            try:
+                text = self.path(spec_id).read_text(encoding="utf-8")
+            except FileNotFoundError:
+                return None
+        state = json_codec.loads(text)
+        self._remember(spec_id, state)
+        return state
+
+    def exists(self, spec_id: str) -> bool:
+        with self._states_guard:
+            if spec_id in self._states:
+                return True
+        with self._pending_guard:
+            if spec_id in self._pending:
+                return True
+        return self.path(spec_id).exists()
+
+    def store(self, spec_id: str, state: dict[str, Any]) -> None:
+        """状態を保存する。グループコミット時は書き出しを遅延する。"""
+
+        text = json_codec.dumps(state)
+        self._remember(spec_id, state)
+        if self._commit_interval <= 0:
+            _atomic_write(self.path(spec_id), text)
+            return
+        with self._pending_guard:
+            self._pending[spec_id] = text
+            if self._timer is None:
+                self._timer = threading.Timer(self._commit_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def export(self, spec_id: str) -> str | None:
+        """管理用に状態をインデント付き JSON で返す。保存形式には影響しない。"""
+
+        with self.lock(spec_id):
+            state = self.load(spec_id)
+            return json_codec.dumps(state, pretty=True) if state is not None else None
+
+    def discard(self, spec_id: str) -> None:
+        with self._states_guard:
+            self._states.pop(spec_id, None)
+
+    def flush(self) -> None:
+        """未書き出しの状態をすべてディスクへ反映する。"""
+
+        with self._pending_guard:
+            self._timer = None
+            spec_ids = list(self._pending)
+        for spec_id in spec_ids:
+            with self.lock(spec_id):
+                with self._pending_guard:
+                    text = self._pending.pop(spec_id, None)
+                if text is not None:
+                    _atomic_write(self.path(spec_id), text)
+
+    def spec_ids(self) -> list[str]:
+        names = {path.stem for path in self._base_dir.glob("*.json")}
+        with self._pending_guard:
+            names.update(self._pending)
+        return sorted(names)
+
+    def path(self, spec_id: str) -> Path:
+        return self._base_dir / f"{spec_id}.json"
+
+    def _remember(self, spec_id: str, state: dict[str, Any]) -> None:
+        if self._capacity == 0:
+            return
+        with self._states_guard:
+            self._states[spec_id] = state
+            self._states.move_to_end(spec_id)
+            while len(self._states) > self._capacity:
+                self._states.popitem(last=False)
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w",
+        encoding="utf-8",
+        dir=path.parent,
+        prefix=f".{path.stem}-",
+        suffix=".tmp",
+        delete=False,
+    ) as handle:
+        handle.write(text)
+        temp_path = Path(handle.name)
+    try:
+        os.replace(temp_path, path)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning("%s の値が整数ではないため既定値 %d を使用します: %s", name, default, raw)
+        return default
+
+
+__all__ = ["DEFAULT_STATE_CACHE_SIZE", "SpecStateCache"]
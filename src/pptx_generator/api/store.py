@@ -4,12 +4,19 @@ from __future__ import annotations
 
 import json
 import os
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Literal
 
 from ..models import ContentElements, ContentSlide, ContentTableData
+from .audit_log import AuditLogStore, iter_legacy_entries
+from .change_feed import ChangeEvent, ChangeFeed
+from .state_cache import SpecStateCache
+
+_HISTORY_CACHE_SIZE = 256
 
 
 class SpecNotFoundError(KeyError):
@@ -74,13 +81,51 @@ class CardState:
         return cls(slide=slide, story=story)
 
 
+class BulkOperationError(RuntimeError):
+    """一括操作の一部が失敗した。状態は変更されていない。"""
+
+    def __init__(self, message: str, results: list[CardOperationResult]) -> None:
+        super().__init__(message)
+        self.results = results
+
+
+@dataclass(slots=True)
+class CardOperation:
+    """一括操作の 1 件。``params`` は操作ごとの引数（update: 更新フィールド, approve: notes など）。"""
+
+    slide_id: str
+    action: Literal["update", "approve", "return"]
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class CardOperationResult:
+    """一括操作 1 件分の結果。失敗した場合は ``error`` に理由が入る。"""
+
+    slide_id: str
+    action: str
+    status: str | None = None
+    content_hash: str | None = None
+    locked_at: datetime | None = None
+    error: str | None = None
+
+
 class ContentStore:
-    """シンプルなファイルベースのストア。"""
+    """シンプルなファイルベースのストア。
+
+    監査ログは状態 JSON から切り離し、``<base_dir>/audit`` 配下に追記専用で保存する。
+    """
 
     def __init__(self, base_dir: Path | None = None) -> None:
         env_dir = os.environ.get("CONTENT_STORE_DIR")
         self._base_dir = base_dir or Path(env_dir or ".pptx/content_store")
         self._base_dir.mkdir(parents=True, exist_ok=True)
+        self._states = SpecStateCache.from_env(self._base_dir)
+        self._audit = AuditLogStore(self._base_dir / "audit")
+        self._changes = ChangeFeed()
+        self._history: OrderedDict[tuple[str, str], list[dict[str, Any]]] = OrderedDict()
+        self._history_guard = threading.Lock()
+        self._migrate_legacy_logs()
 
     # ------------------------------------------------------------------ #
     # 公開 API
@@ -88,18 +133,17 @@ class ContentStore:
     def create_cards(self, spec_id: str, cards: list[CardState]) -> str:
         """新しい spec を登録する。"""
 
-        state_path = self._spec_path(spec_id)
-        if state_path.exists():
-            msg = f"spec '{spec_id}' は既に存在します"
-            raise SpecAlreadyExistsError(msg)
-        state = {
-            "spec_id": spec_id,
-            "revision": 1,
-            "cards": {card.slide.id: card.to_dict() for card in cards},
-            "logs": [],
-        }
-        self._write_state(spec_id, state)
-        return _etag_from_revision(state["revision"])
+        with self._states.transaction(spec_id):
+            if self._states.exists(spec_id):
+                msg = f"spec '{spec_id}' は既に存在します"
+                raise SpecAlreadyExistsError(msg)
+            state = {
+                "spec_id": spec_id,
+                "revision": 1,
+                "cards": {card.slide.id: card.to_dict() for card in cards},
+            }
+            self._write_state(spec_id, state)
+            return _etag_from_revision(state["revision"])
 
     def update_card(
         self,
@@ -119,57 +163,22 @@ class ContentStore:
     ) -> tuple[str, str]:
         """カード内容を更新する。"""
 
-        state = self._load_state(spec_id)
-        expected_revision = _parse_etag(expected_etag)
-        self._ensure_revision(state, expected_revision)
-
-        card_state = self._get_card_state(state, slide_id)
-        slide = card_state.slide
-
-        if slide.status == "approved":
-            msg = f"slide '{slide_id}' は既に承認済みのため更新できません"
-            raise RevisionMismatchError(msg)
-
-        elements = slide.elements
-        if title is not None:
-            elements.title = title
-        if body is not None:
-            elements.body = body
-        if table_data is not None:
-            elements.table_data = table_data
-        if note is not None:
-            elements.note = note
-        if intent is not None:
-            slide.intent = intent
-        if type_hint is not None:
-            slide.type_hint = type_hint
-        if story is not None:
-            card_state.story = story
-        if autofix_applied:
-            existing = set(slide.applied_autofix)
-            for patch_id in autofix_applied:
-                if patch_id not in existing:
-                    slide.applied_autofix.append(patch_id)
-                    existing.add(patch_id)
-
-        content_payload = slide.elements.model_dump(mode="json")
-        content_hash_raw = json.dumps(content_payload, ensure_ascii=False, sort_keys=True)
-        state["cards"][slide_id] = card_state.to_dict()
-        state["revision"] += 1
-        self._append_log(
-            state,
-            {
-                "spec_id": spec_id,
-                "slide_id": slide_id,
-                "action": "update",
-                "actor": actor,
-                "timestamp": _now_iso(),
-                "notes": None,
-                "applied_autofix": autofix_applied,
+        operation = CardOperation(
+            slide_id=slide_id,
+            action="update",
+            params={
+                "title": title,
+                "body": body,
+                "table_data": table_data,
+                "note": note,
+                "intent": intent,
+                "type_hint": type_hint,
+                "story": story,
+                "autofix_applied": autofix_applied,
             },
         )
-        self._write_state(spec_id, state)
-        return _etag_from_revision(state["revision"]), _hash_json(content_hash_raw)
+        etag, results = self._apply(spec_id, [operation], expected_etag=expected_etag, actor=actor, atomic=False)
+        return etag, results[0].content_hash or ""
 
     def approve_card(
         self,
@@ -183,42 +192,14 @@ class ContentStore:
     ) -> tuple[str, str, datetime]:
         """カードを承認状態へ遷移させる。"""
 
-        state = self._load_state(spec_id)
-        expected_revision = _parse_etag(expected_etag)
-        self._ensure_revision(state, expected_revision)
-
-        card_state = self._get_card_state(state, slide_id)
-        slide = card_state.slide
-
-        if slide.status != "approved":
-            slide.status = "approved"
-            locked_at = datetime.now(timezone.utc)
-        else:
-            locked_at = datetime.now(timezone.utc)
-
-        if applied_autofix:
-            existing = set(slide.applied_autofix)
-            for patch_id in applied_autofix:
-                if patch_id not in existing:
-                    slide.applied_autofix.append(patch_id)
-                    existing.add(patch_id)
-
-        state["cards"][slide_id] = card_state.to_dict()
-        state["revision"] += 1
-        self._append_log(
-            state,
-            {
-                "spec_id": spec_id,
-                "slide_id": slide_id,
-                "action": "approve",
-                "actor": actor,
-                "timestamp": locked_at.isoformat(),
-                "notes": notes,
-                "applied_autofix": applied_autofix,
-            },
+        operation = CardOperation(
+            slide_id=slide_id,
+            action="approve",
+            params={"notes": notes, "applied_autofix": applied_autofix},
         )
-        self._write_state(spec_id, state)
-        return _etag_from_revision(state["revision"]), slide.status, locked_at
+        etag, results = self._apply(spec_id, [operation], expected_etag=expected_etag, actor=actor, atomic=False)
+        result = results[0]
+        return etag, result.status, result.locked_at or datetime.now(timezone.utc)
 
     def return_card(
         self,
@@ -232,37 +213,58 @@ class ContentStore:
     ) -> tuple[str, str]:
         """カードを差戻し状態へ遷移させる。"""
 
-        state = self._load_state(spec_id)
-        expected_revision = _parse_etag(expected_etag)
-        self._ensure_revision(state, expected_revision)
+        operation = CardOperation(
+            slide_id=slide_id,
+            action="return",
+            params={"reason": reason, "requested_by": requested_by},
+        )
+        etag, results = self._apply(spec_id, [operation], expected_etag=expected_etag, actor=actor, atomic=False)
+        return etag, results[0].status
 
-        card_state = self._get_card_state(state, slide_id)
-        slide = card_state.slide
-        slide.status = "returned"
+    def apply_card_operations(
+        self,
+        spec_id: str,
+        operations: list[CardOperation],
+        *,
+        expected_etag: str,
+        actor: str | None,
+    ) -> tuple[str, list[CardOperationResult]]:
+        """複数カードへの操作をまとめて適用し、1 リビジョンとして保存する。
 
-        state["cards"][slide_id] = card_state.to_dict()
-        state["revision"] += 1
-        self._append_log(
-            state,
-            {
-                "spec_id": spec_id,
-                "slide_id": slide_id,
-                "action": "return",
-                "actor": actor or requested_by,
-                "timestamp": _now_iso(),
-                "notes": reason,
-                "applied_autofix": None,
-            },
-        )
-        self._write_state(spec_id, state)
-        return _etag_from_revision(state["revision"]), slide.status
+        1 件でも失敗した場合は何も保存せず、各操作の結果を持つ ``BulkOperationError`` を送出する。
+        """
+
+        if not operations:
+            msg = "operations には 1 件以上の操作を指定してください"
+            raise ValueError(msg)
+        return self._apply(spec_id, operations, expected_etag=expected_etag, actor=actor, atomic=True)
 
     def get_card(self, spec_id: str, slide_id: str) -> tuple[CardState, str]:
         """カード情報と現在の ETag を返す。"""
 
-        state = self._load_state(spec_id)
-        card_state = self._get_card_state(state, slide_id)
-        return card_state, _etag_from_revision(state["revision"])
+        with self._states.transaction(spec_id):
+            state = self._load_state(spec_id)
+            card_state = self._get_card_state(state, slide_id)
+            return card_state, _etag_from_revision(state["revision"])
+
+    def get_card_etag(self, spec_id: str, slide_id: str) -> str:
+        """カードの存在を確認して現在の ETag だけを返す（カード本体は検証しない）。"""
+
+        with self._states.lock(spec_id):
+            state = self._load_state(spec_id)
+            if slide_id not in state.get("cards", {}):
+                msg = f"slide '{slide_id}' は存在しません"
+                raise SlideNotFoundError(msg)
+            return _etag_from_revision(state["revision"])
+
+    def export_state(self, spec_id: str) -> str:
+        """管理用に spec の状態をインデント付き JSON で返す（保存形式はコンパクト）。"""
+
+        text = self._states.export(spec_id)
+        if text is None:
+            msg = f"spec '{spec_id}' は存在しません"
+            raise SpecNotFoundError(msg)
+        return text
 
     def list_logs(
         self,
@@ -272,54 +274,118 @@ class ContentStore:
         since: datetime | None = None,
         limit: int = 100,
         offset: int = 0,
-    ) -> tuple[list[dict[str, Any]], int | None]:
-        """監査ログ一覧を返す。"""
+        cursor: str | None = None,
+    ) -> tuple[list[dict[str, Any]], str | None]:
+        """監査ログ一覧と、続きがある場合は次ページのカーソルを返す。"""
+
+        page = self._audit.query(
+            [spec_id] if spec_id else None,
+            action=action,
+            since=since,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+        return page.items, page.next_cursor
 
-        logs = []
-        for state in self._iter_states(spec_id):
-            for entry in state.get("logs", []):
-                if spec_id and entry["spec_id"] != spec_id:
-                    continue
-                if action and entry["action"] != action:
-                    continue
-                if since and datetime.fromisoformat(entry["timestamp"]) < since:
-                    continue
-                logs.append(entry)
+    @property
+    def changes(self) -> ChangeFeed:
+        """監査ログへの追記を通知する変更フィード。"""
+
+        return self._changes
+
+    def list_changes(
+        self,
+        spec_id: str | None,
+        cursor: str | None,
+        *,
+        limit: int = 200,
+    ) -> tuple[list[ChangeEvent], str | None]:
+        """``cursor`` 以降の変更イベントを監査ログから読み直す。"""
+
+        page = self._audit.query([spec_id] if spec_id else None, limit=limit, cursor=cursor)
+        events = [_change_event(entry, entry_cursor) for entry, entry_cursor in zip(page.items, page.cursors)]
+        return events, page.next_cursor
 
-        logs.sort(key=lambda item: item["timestamp"])
-        sliced = logs[offset : offset + limit]
-        next_offset = offset + limit if offset + limit < len(logs) else None
-        return sliced, next_offset
+    def head_change_cursor(self, spec_id: str | None) -> str | None:
+        """現在の最新の変更を指すカーソルを返す（購読開始位置の記録用）。"""
+
+        return self._audit.head_cursor([spec_id] if spec_id else None)
+
+    def list_card_history(self, spec_id: str, slide_id: str) -> list[dict[str, Any]]:
+        """カード単位の監査ログを追記順で返す。前回の読み出し以降に追記された分だけを読み足す。"""
+
+        key = (spec_id, slide_id)
+        with self._states.lock(spec_id):
+            with self._history_guard:
+                history = self._history.pop(key, None) or []
+            history.extend(self._audit.by_target(spec_id, slide_id, start=len(history)))
+            with self._history_guard:
+                self._history[key] = history
+                while len(self._history) > _HISTORY_CACHE_SIZE:
+                    self._history.popitem(last=False)
+            return list(history)
 
     # ------------------------------------------------------------------ #
     # 内部ユーティリティ
     # ------------------------------------------------------------------ #
-    def _spec_path(self, spec_id: str) -> Path:
-        return self._base_dir / f"{spec_id}.json"
-
     def _write_state(self, spec_id: str, state: dict[str, Any]) -> None:
-        path = self._spec_path(spec_id)
-        path.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+        self._states.store(spec_id, state)
 
     def _load_state(self, spec_id: str) -> dict[str, Any]:
-        path = self._spec_path(spec_id)
-        if not path.exists():
+        state = self._states.load(spec_id)
+        if state is None:
             msg = f"spec '{spec_id}' は存在しません"
             raise SpecNotFoundError(msg)
-        return json.loads(path.read_text(encoding="utf-8"))
+        if "logs" in state:
+            # 起動後に配置された旧形式のファイルは読み込み時に移す
+            self._migrate_state(spec_id, state)
+        return state
 
-    def _iter_states(self, spec_id: str | None) -> Iterator[dict[str, Any]]:
-        if spec_id:
-            try:
-                yield self._load_state(spec_id)
-            except SpecNotFoundError:
-                return
-            return
-        for path in self._base_dir.glob("*.json"):
-            try:
-                yield json.loads(path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
-                continue
+    def _apply(
+        self,
+        spec_id: str,
+        operations: list[CardOperation],
+        *,
+        expected_etag: str,
+        actor: str | None,
+        atomic: bool,
+    ) -> tuple[str, list[CardOperationResult]]:
+        with self._states.transaction(spec_id):
+            state = self._load_state(spec_id)
+            expected_revision = _parse_etag(expected_etag)
+            self._ensure_revision(state, expected_revision)
+
+            # 同じカードへの連続した操作は作業用のコピーに順に適用し、全件成功した場合のみ状態へ反映する
+            working: dict[str, CardState] = {}
+            results: list[CardOperationResult] = []
+            entries: list[dict[str, Any]] = []
+            failed = False
+            for operation in operations:
+                try:
+                    card_state = working.get(operation.slide_id) or self._get_card_state(state, operation.slide_id)
+                    result, entry = _apply_operation(spec_id, card_state, operation, actor)
+                except (SlideNotFoundError, RevisionMismatchError, ValueError) as exc:
+                    if not atomic:
+                        raise
+                    failed = True
+                    results.append(
+                        CardOperationResult(slide_id=operation.slide_id, action=operation.action, error=str(exc))
+                    )
+                    continue
+                working[operation.slide_id] = card_state
+                results.append(result)
+                entries.append(entry)
+            if failed:
+                msg = f"{sum(1 for result in results if result.error)} 件の操作が失敗したため、いずれも適用していません"
+                raise BulkOperationError(msg, results)
+
+            for slide_id, card_state in working.items():
+                state["cards"][slide_id] = card_state.to_dict()
+            state["revision"] += 1
+            self._write_state(spec_id, state)
+            self._append_logs(state, entries)
+            return _etag_from_revision(state["revision"]), results
 
     @staticmethod
     def _get_card_state(state: dict[str, Any], slide_id: str) -> CardState:
@@ -337,9 +403,130 @@ class ContentStore:
             msg = f"期待したリビジョン {expected} と現在のリビジョン {current} が一致しません"
             raise RevisionMismatchError(msg)
 
-    @staticmethod
-    def _append_log(state: dict[str, Any], entry: dict[str, Any]) -> None:
-        state.setdefault("logs", []).append(entry)
+    def _append_logs(self, state: dict[str, Any], entries: list[dict[str, Any]]) -> None:
+        for entry in entries:
+            entry["revision"] = state["revision"]
+        cursors = self._audit.extend(state["spec_id"], [(entry, entry["slide_id"]) for entry in entries])
+        for entry, cursor in zip(entries, cursors):
+            self._changes.publish(_change_event(entry, cursor))
+
+    def _migrate_legacy_logs(self) -> None:
+        """状態 JSON に埋め込まれた旧形式のログを監査ログへ移す。
+
+        起動のたびに全ファイルを確認する（後から配置・復元された旧形式ファイルも移す）。
+        ``logs`` キーを含まないファイルは JSON として解析しない。
+        """
+
+        for path in self._base_dir.glob("*.json"):
+            try:
+                raw = path.read_bytes()
+            except OSError:
+                continue
+            if b'"logs"' not in raw:
+                continue
+            try:
+                state = json.loads(raw)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            if isinstance(state, dict) and "logs" in state:
+                self._migrate_state(state.get("spec_id") or path.stem, state)
+
+    def _migrate_state(self, spec_id: str, state: dict[str, Any]) -> None:
+        if self._audit.count(spec_id) == 0:
+            self._audit.extend(spec_id, iter_legacy_entries(state["logs"], "slide_id"))
+        state.pop("logs")
+        self._write_state(spec_id, state)
+
+
+def _apply_operation(
+    spec_id: str,
+    card_state: CardState,
+    operation: CardOperation,
+    actor: str | None,
+) -> tuple[CardOperationResult, dict[str, Any]]:
+    """1 件の操作をカードへ適用し、結果と監査ログ項目を返す。"""
+
+    slide = card_state.slide
+    params = operation.params
+    notes: str | None = None
+    applied_autofix: list[str] | None = None
+    content_hash: str | None = None
+    locked_at: datetime | None = None
+    if operation.action == "update":
+        if slide.status == "approved":
+            msg = f"slide '{operation.slide_id}' は既に承認済みのため更新できません"
+            raise RevisionMismatchError(msg)
+        elements = slide.elements
+        if params.get("title") is not None:
+            elements.title = params["title"]
+        if params.get("body") is not None:
+            elements.body = params["body"]
+        if params.get("table_data") is not None:
+            elements.table_data = params["table_data"]
+        if params.get("note") is not None:
+            elements.note = params["note"]
+        if params.get("intent") is not None:
+            slide.intent = params["intent"]
+        if params.get("type_hint") is not None:
+            slide.type_hint = params["type_hint"]
+        if params.get("story") is not None:
+            card_state.story = params["story"]
+        applied_autofix = params.get("autofix_applied")
+        _merge_autofix(slide, applied_autofix)
+        content_payload = slide.elements.model_dump(mode="json")
+        content_hash = _hash_json(json.dumps(content_payload, ensure_ascii=False, sort_keys=True))
+    elif operation.action == "approve":
+        slide.status = "approved"
+        locked_at = datetime.now(timezone.utc)
+        notes = params.get("notes")
+        applied_autofix = params.get("applied_autofix")
+        _merge_autofix(slide, applied_autofix)
+    elif operation.action == "return":
+        slide.status = "returned"
+        notes = params.get("reason")
+        actor = actor or params.get("requested_by")
+    else:
+        msg = f"未対応の操作です: {operation.action}"
+        raise ValueError(msg)
+
+    entry = {
+        "spec_id": spec_id,
+        "slide_id": operation.slide_id,
+        "action": operation.action,
+        "actor": actor,
+        "timestamp": (locked_at or datetime.now(timezone.utc)).isoformat(),
+        "notes": notes,
+        "applied_autofix": applied_autofix,
+    }
+    result = CardOperationResult(
+        slide_id=operation.slide_id,
+        action=operation.action,
+        status=slide.status,
+        content_hash=content_hash,
+        locked_at=locked_at,
+    )
+    return result, entry
+
+
+def _merge_autofix(slide: ContentSlide, patch_ids: list[str] | None) -> None:
+    if not patch_ids:
+        return
+    existing = set(slide.applied_autofix)
+    for patch_id in patch_ids:
+        if patch_id not in existing:
+            slide.applied_autofix.append(patch_id)
+            existing.add(patch_id)
+
+
+def _change_event(entry: dict[str, Any], cursor: str) -> ChangeEvent:
+    revision = entry.get("revision")
+    return ChangeEvent(
+        spec_id=entry["spec_id"],
+        target=entry["slide_id"],
+        action=entry["action"],
+        revision=_etag_from_revision(revision) if revision is not None else None,
+        cursor=cursor,
+    )
 
 
 def _hash_json(value: str) -> str:
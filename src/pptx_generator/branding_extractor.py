@@ -5,12 +5,15 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from zipfile import ZipFile
 from xml.etree import ElementTree as ET
 
 from .settings import BrandingConfig, BrandingFont, BoxSpec, ParagraphStyle
 
+if TYPE_CHECKING:
+    from .template_package import TemplatePackage
+
 NS = {
     "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
     "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
@@ -137,16 +140,25 @@ class BrandingExtractionResult:
         return payload
 
 
-def extract_branding_config(template_path: Path) -> BrandingExtractionResult:
-    """テンプレートからブランド設定相当の情報を抽出して返す。"""
+def extract_branding_config(
+    template_path: Path, *, package: TemplatePackage | None = None
+) -> BrandingExtractionResult:
+    """テンプレートからブランド設定相当の情報を抽出して返す。
+
+    ``package`` を渡した場合は読み込み済みのテンプレートパッケージからパーツを取得する。
+    """
 
-    if not template_path.exists():
+    if package is None and not template_path.exists():
         raise BrandingExtractionError(f"テンプレートが見つかりません: {template_path}")
 
     try:
-        with ZipFile(template_path) as archive:
-            theme_root = _load_xml(archive, "ppt/theme/theme1.xml")
-            master_root = _load_xml(archive, "ppt/slideMasters/slideMaster1.xml")
+        if package is not None:
+            theme_root = package.xml("ppt/theme/theme1.xml")
+            master_root = package.xml("ppt/slideMasters/slideMaster1.xml")
+        else:
+            with ZipFile(template_path) as archive:
+                theme_root = _load_xml(archive, "ppt/theme/theme1.xml")
+                master_root = _load_xml(archive, "ppt/slideMasters/slideMaster1.xml")
     except KeyError as exc:  # 指定パスが存在しない場合
         raise BrandingExtractionError("テンプレート内のテーマまたはスライドマスターを取得できませんでした") from exc
 
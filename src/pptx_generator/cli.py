@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import hashlib
 import json
 import logging
 import os
@@ -16,12 +15,15 @@ import click
 from dotenv import load_dotenv
 from pydantic import BaseModel, ValidationError
 
+from .api.job_runner import DEFAULT_MAX_FINISHED_JOBS
 from .branding_extractor import (BrandingExtractionError,
+                                 BrandingExtractionResult,
                                  extract_branding_config)
 from .brief import (BriefAIOrchestrationError, BriefAIOrchestrator,
                     BriefDocument, BriefPolicyError, BriefSourceDocument,
                     load_brief_policy_set)
 from .draft_intel import load_return_reasons
+from .extraction_cache import TemplateExtractionCache
 from .generate_ready import generate_ready_to_jobspec
 from .layout_validation import (LayoutValidationError, LayoutValidationOptions,
                                 LayoutValidationResult, LayoutValidationSuite)
@@ -30,7 +32,8 @@ from .models import (ContentApprovalDocument, DraftDocument,
                      SpecValidationError, TemplateRelease,
                      TemplateReleaseDiagnostics, TemplateReleaseGoldenRun,
                      TemplateReleaseReport, TemplateSpec)
-from .pipeline import (AnalyzerOptions, BriefNormalizationError,
+from .pipeline import (AnalyzerOptions, ArtifactWriteError, ArtifactWriter,
+                       BriefNormalizationError,
                        BriefNormalizationOptions, BriefNormalizationStep,
                        ContentApprovalOptions, ContentApprovalStep,
                        DraftStructuringOptions, DraftStructuringStep,
@@ -45,11 +48,16 @@ from .pipeline import (AnalyzerOptions, BriefNormalizationError,
                        SimpleRendererStep, SpecValidatorStep,
                        TemplateExtractor, TemplateExtractorOptions)
 from .spec_loader import load_jobspec_from_path
+from .template_package import TemplatePackage
+from .pipeline.artifact_hashing import ArtifactDigest, hash_files
+from .pipeline.artifact_writer import flush_artifacts, write_json_artifact
 from .pipeline.draft_structuring import DraftStructuringError
 from .review_engine import AnalyzerReviewEngineAdapter
 from .settings import BrandingConfig, RulesConfig
-from .template_audit import (build_release_report, build_template_release,
-                             load_template_release)
+from .template_audit import (GoldenRunInputs, build_release_report,
+                             build_template_release, load_template_release,
+                             run_golden_specs)
+from .utils.file_cache import shared_file_cache
 
 DEFAULT_RULES_PATH = Path("config/rules.json")
 DEFAULT_BRANDING_PATH = Path("config/branding.json")
@@ -161,12 +169,57 @@ def app(verbose: bool, debug: bool) -> None:
     _configure_file_logging()
 
 
+def _load_rules_config(path: Path) -> RulesConfig:
+    return shared_file_cache.get("rules_config", path, RulesConfig.load)
+
+
+def _load_branding_config(path: Path) -> BrandingConfig:
+    return shared_file_cache.get("branding_config", path, BrandingConfig.load)
+
+
+def _extraction_cache() -> TemplateExtractionCache:
+    return shared_file_cache.get_object(
+        "extraction_cache",
+        (os.getenv("PPTX_EXTRACTION_CACHE"), os.getenv("PPTX_EXTRACTION_CACHE_DIR")),
+        TemplateExtractionCache.from_env,
+    )
+
+
+def _extract_branding_from_cache(
+    template: Path, package: TemplatePackage | None = None
+) -> BrandingExtractionResult:
+    if not template.exists():
+        return extract_branding_config(template)
+    cache = _extraction_cache()
+    if package is None:
+        result, _ = cache.branding(
+            template, extract=lambda: extract_branding_config(template)
+        )
+        return result
+    cache.remember_digest(template, package.sha256)
+    result, _ = cache.branding(
+        template,
+        extract=lambda: extract_branding_config(template, package=package),
+    )
+    return result
+
+
+def _extract_branding_cached(
+    template: Path, *, package: TemplatePackage | None = None
+) -> BrandingExtractionResult:
+    return shared_file_cache.get(
+        "branding_extraction",
+        template,
+        lambda path: _extract_branding_from_cache(path, package),
+    )
+
+
 def _prepare_branding(
     template: Optional[Path], branding: Optional[Path]
 ) -> tuple[BrandingConfig, dict[str, object]]:
     def _load_default_branding() -> tuple[BrandingConfig, dict[str, object]]:
         try:
-            config = BrandingConfig.load(DEFAULT_BRANDING_PATH)
+            config = _load_branding_config(DEFAULT_BRANDING_PATH)
             return config, {"type": "default", "path": str(DEFAULT_BRANDING_PATH)}
         except FileNotFoundError:
             click.echo(
@@ -177,11 +230,11 @@ def _prepare_branding(
 
     branding_payload: dict[str, object] | None = None
     if branding is not None:
-        branding_config = BrandingConfig.load(branding)
+        branding_config = _load_branding_config(branding)
         branding_source = {"type": "file", "path": str(branding)}
     elif template is not None:
         try:
-            extraction = extract_branding_config(template)
+            extraction = _extract_branding_cached(template)
         except BrandingExtractionError as exc:
             click.echo(f"ブランド設定の抽出に失敗しました: {exc}", err=True)
             branding_config, branding_source = _load_default_branding()
@@ -343,76 +396,82 @@ def _run_template_extraction(
         format=fmt,
     )
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    extractor = TemplateExtractor(extractor_options)
-    template_spec = extractor.extract()
-    jobspec_scaffold = extractor.build_jobspec_scaffold(template_spec)
-    branding_result = extract_branding_config(template_path)
+    with TemplatePackage.open(template_path) as package:
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-    if fmt == "yaml":
-        import yaml
-
-        spec_path = output_dir / "template_spec.yaml"
-        spec_content = yaml.dump(
-            template_spec.model_dump(),
-            allow_unicode=True,
-            default_flow_style=False,
-            indent=2,
-        )
-    else:
-        spec_path = output_dir / "template_spec.json"
-        spec_content = json.dumps(
-            template_spec.model_dump(),
-            indent=2,
-            ensure_ascii=False,
+        extraction_cache = _extraction_cache()
+        extractor = TemplateExtractor(
+            extractor_options, cache=extraction_cache, package=package
         )
+        template_spec = extractor.extract()
+        jobspec_scaffold = extractor.build_jobspec_scaffold(template_spec)
+        branding_result = _extract_branding_cached(template_path, package=package)
+
+        if fmt == "yaml":
+            import yaml
+
+            spec_path = output_dir / "template_spec.yaml"
+            spec_content = yaml.dump(
+                template_spec.model_dump(),
+                allow_unicode=True,
+                default_flow_style=False,
+                indent=2,
+            )
+        else:
+            spec_path = output_dir / "template_spec.json"
+            spec_content = json.dumps(
+                template_spec.model_dump(),
+                indent=2,
+                ensure_ascii=False,
+            )
 
-    spec_path.write_text(spec_content, encoding="utf-8")
-    logger.info("Saved template spec to %s", spec_path.resolve())
+        spec_path.write_text(spec_content, encoding="utf-8")
+        logger.info("Saved template spec to %s", spec_path.resolve())
 
-    branding_path = output_dir / "branding.json"
-    branding_payload = branding_result.to_branding_payload()
-    branding_text = json.dumps(branding_payload, ensure_ascii=False, indent=2)
-    branding_path.write_text(branding_text, encoding="utf-8")
-    logger.info("Saved branding payload to %s", branding_path.resolve())
+        branding_path = output_dir / "branding.json"
+        branding_payload = branding_result.to_branding_payload()
+        branding_text = json.dumps(branding_payload, ensure_ascii=False, indent=2)
+        branding_path.write_text(branding_text, encoding="utf-8")
+        logger.info("Saved branding payload to %s", branding_path.resolve())
 
-    logger.info("Starting layout validation for %s", template_path)
-    validation_options = LayoutValidationOptions(
-        template_path=template_path,
-        output_dir=output_dir,
-    )
-    validation_suite = LayoutValidationSuite(validation_options)
-    validation_result = validation_suite.run()
-    logger.info(
-        "Layout validation finished: warnings=%d errors=%d",
-        validation_result.warnings_count,
-        validation_result.errors_count,
-    )
+        logger.info("Starting layout validation for %s", template_path)
+        validation_options = LayoutValidationOptions(
+            template_path=template_path,
+            output_dir=output_dir,
+            extraction_cache=extraction_cache,
+            package=package,
+        )
+        validation_suite = LayoutValidationSuite(validation_options)
+        validation_result = validation_suite.run()
+        logger.info(
+            "Layout validation finished: warnings=%d errors=%d",
+            validation_result.warnings_count,
+            validation_result.errors_count,
+        )
 
-    layouts_relative: str | None = None
-    try:
-        layouts_relative = str(validation_result.layouts_path.relative_to(output_dir))
-    except ValueError:
-        layouts_relative = str(validation_result.layouts_path)
+        layouts_relative: str | None = None
+        try:
+            layouts_relative = str(validation_result.layouts_path.relative_to(output_dir))
+        except ValueError:
+            layouts_relative = str(validation_result.layouts_path)
 
-    jobspec_scaffold.meta = jobspec_scaffold.meta.model_copy(
-        update={"layouts_path": layouts_relative}
-    )
+        jobspec_scaffold.meta = jobspec_scaffold.meta.model_copy(
+            update={"layouts_path": layouts_relative}
+        )
 
-    jobspec_path = output_dir / "jobspec.json"
-    extractor.save_jobspec_scaffold(jobspec_scaffold, jobspec_path)
-    logger.info("Saved jobspec scaffold to %s", jobspec_path.resolve())
-
-    return TemplateExtractionResult(
-        template_spec=template_spec,
-        jobspec_scaffold=jobspec_scaffold,
-        template_spec_path=spec_path,
-        branding_path=branding_path,
-        jobspec_path=jobspec_path,
-        validation_result=validation_result,
-        output_dir=output_dir,
-    )
+        jobspec_path = output_dir / "jobspec.json"
+        extractor.save_jobspec_scaffold(jobspec_scaffold, jobspec_path)
+        logger.info("Saved jobspec scaffold to %s", jobspec_path.resolve())
+
+        return TemplateExtractionResult(
+            template_spec=template_spec,
+            jobspec_scaffold=jobspec_scaffold,
+            template_spec_path=spec_path,
+            branding_path=branding_path,
+            jobspec_path=jobspec_path,
+            validation_result=validation_result,
+            output_dir=output_dir,
+        )
 
 
 def _echo_template_extraction_result(result: TemplateExtractionResult) -> None:
@@ -461,85 +520,93 @@ def _run_template_release(
     reviewed_by: str | None,
     baseline_release: Path | None,
     golden_specs: tuple[Path, ...],
+    golden_workers: int = 1,
 ) -> TemplateReleaseExecutionResult:
     resolved_template_id = _resolve_template_id(template_id, brand, version)
 
-    extractor = TemplateExtractor(
-        TemplateExtractorOptions(template_path=template_path))
-    spec = extractor.extract()
+    with TemplatePackage.open(template_path) as package:
+        extractor = TemplateExtractor(
+            TemplateExtractorOptions(template_path=template_path),
+            cache=_extraction_cache(),
+            package=package,
+        )
+        spec = extractor.extract()
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-    baseline = load_template_release(
-        baseline_release) if baseline_release else None
+        baseline = load_template_release(
+            baseline_release) if baseline_release else None
 
-    resolved_golden_specs, auto_golden_warnings = _resolve_golden_specs(
-        user_specs=list(golden_specs),
-        baseline=baseline,
-        baseline_release=baseline_release,
-    )
+        resolved_golden_specs, auto_golden_warnings = _resolve_golden_specs(
+            user_specs=list(golden_specs),
+            baseline=baseline,
+            baseline_release=baseline_release,
+        )
+
+        golden_runs: list[TemplateReleaseGoldenRun] = []
+        golden_warnings: list[str] = []
+        golden_errors: list[str] = []
+        if resolved_golden_specs:
+            golden_runs, golden_warnings, golden_errors = _run_golden_specs(
+                template_path=template_path,
+                golden_specs=resolved_golden_specs,
+                output_dir=output_dir,
+                package=package,
+                workers=golden_workers,
+            )
+
+        combined_warnings = golden_warnings + auto_golden_warnings
 
-    golden_runs: list[TemplateReleaseGoldenRun] = []
-    golden_warnings: list[str] = []
-    golden_errors: list[str] = []
-    if resolved_golden_specs:
-        golden_runs, golden_warnings, golden_errors = _run_golden_specs(
+        release = build_template_release(
             template_path=template_path,
-            golden_specs=resolved_golden_specs,
-            output_dir=output_dir,
+            spec=spec,
+            template_id=resolved_template_id,
+            brand=brand,
+            version=version,
+            generated_by=generated_by,
+            reviewed_by=reviewed_by,
+            golden_runs=golden_runs,
+            extra_warnings=combined_warnings,
+            extra_errors=golden_errors,
+            package=package,
         )
+        release_path = output_dir / "template_release.json"
+        release_path.write_text(
+            json.dumps(release.model_dump(), ensure_ascii=False, indent=2),
+            encoding="utf-8",
+        )
+        logger.info("Saved template release to %s", release_path.resolve())
+
+        golden_runs_path: Path | None = None
+        if golden_runs:
+            golden_runs_path = output_dir / "golden_runs.json"
+            golden_runs_path.write_text(
+                json.dumps(
+                    [run.model_dump() for run in golden_runs],
+                    ensure_ascii=False,
+                    indent=2,
+                ),
+                encoding="utf-8",
+            )
+            logger.info("Saved golden run log to %s", golden_runs_path.resolve())
 
-    combined_warnings = golden_warnings + auto_golden_warnings
-
-    release = build_template_release(
-        template_path=template_path,
-        spec=spec,
-        template_id=resolved_template_id,
-        brand=brand,
-        version=version,
-        generated_by=generated_by,
-        reviewed_by=reviewed_by,
-        golden_runs=golden_runs,
-        extra_warnings=combined_warnings,
-        extra_errors=golden_errors,
-    )
-    release_path = output_dir / "template_release.json"
-    release_path.write_text(
-        json.dumps(release.model_dump(), ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
-    logger.info("Saved template release to %s", release_path.resolve())
-
-    golden_runs_path: Path | None = None
-    if golden_runs:
-        golden_runs_path = output_dir / "golden_runs.json"
-        golden_runs_path.write_text(
-            json.dumps(
-                [run.model_dump() for run in golden_runs],
-                ensure_ascii=False,
-                indent=2,
-            ),
+        baseline_model = baseline
+        report = build_release_report(current=release, baseline=baseline_model)
+        report_path = output_dir / "release_report.json"
+        report_path.write_text(
+            json.dumps(report.model_dump(), ensure_ascii=False, indent=2),
             encoding="utf-8",
         )
-        logger.info("Saved golden run log to %s", golden_runs_path.resolve())
-
-    baseline_model = baseline
-    report = build_release_report(current=release, baseline=baseline_model)
-    report_path = output_dir / "release_report.json"
-    report_path.write_text(
-        json.dumps(report.model_dump(), ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
-    logger.info("Saved release report to %s", report_path.resolve())
-
-    return TemplateReleaseExecutionResult(
-        release=release,
-        report=report,
-        release_path=release_path,
-        report_path=report_path,
-        golden_runs_path=golden_runs_path,
-        baseline_release=baseline_release,
-    )
+        logger.info("Saved release report to %s", report_path.resolve())
+
+        return TemplateReleaseExecutionResult(
+            release=release,
+            report=report,
+            release_path=release_path,
+            report_path=report_path,
+            golden_runs_path=golden_runs_path,
+            baseline_release=baseline_release,
+        )
 
 
 def _echo_template_release_result(result: TemplateReleaseExecutionResult) -> None:
@@ -808,6 +875,7 @@ def _run_draft_pipeline(
     brief_meta: Path | None,
     require_brief: bool,
     draft_options: DraftStructuringOptions,
+    artifact_writer: ArtifactWriter | None = None,
 ) -> PipelineContext:
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -824,7 +892,8 @@ def _run_draft_pipeline(
     )
     steps.append(DraftStructuringStep(draft_options))
 
-    context = PipelineContext(spec=spec, workdir=output_dir)
+    context = PipelineContext(
+        spec=spec, workdir=output_dir, artifact_writer=artifact_writer)
     PipelineRunner(steps).execute(context)
     return context
 
@@ -908,8 +977,7 @@ def _write_draft_meta(
     }
 
     meta_path = output_dir / meta_filename
-    _dump_json(meta_path, meta_payload)
-    return meta_path
+    return write_json_artifact(context, meta_path, meta_payload)
 
 
 def _execute_outline(
@@ -928,6 +996,7 @@ def _execute_outline(
     brief_log: Path | None,
     brief_meta: Path | None,
     require_brief: bool,
+    artifact_writer: ArtifactWriter | None = None,
 ) -> OutlineResult:
     draft_options = DraftStructuringOptions(
         layouts_path=layouts,
@@ -949,6 +1018,7 @@ def _execute_outline(
         brief_meta=brief_meta,
         require_brief=require_brief,
         draft_options=draft_options,
+        artifact_writer=artifact_writer,
     )
 
     meta_path = _write_draft_meta(
@@ -1063,7 +1133,12 @@ def _run_mapping_pipeline(
             )
 
     context = PipelineContext(
-        spec=spec, workdir=output_dir, artifacts=dict(draft_context.artifacts))
+        spec=spec,
+        workdir=output_dir,
+        artifacts=dict(draft_context.artifacts),
+        artifact_writer=draft_context.artifact_writer,
+        artifact_hashes=draft_context.artifact_hashes,
+    )
     context.add_artifact("branding", branding_artifact)
 
     spec_validator = SpecValidatorStep(
@@ -1087,8 +1162,14 @@ def _run_mapping_pipeline(
     if isinstance(meta_source, str):
         source_path = Path(meta_source)
         destination = output_dir / DEFAULT_GENERATE_READY_META_FILENAME
+        ready_meta = context.artifacts.get("generate_ready_meta")
         try:
-            if source_path.exists():
+            if context.artifact_writer is not None and isinstance(ready_meta, dict):
+                # 書き出し待ちのファイルはコピーせず、保持している内容をそのまま書き出す
+                if destination.resolve() != source_path.resolve():
+                    write_json_artifact(context, destination, ready_meta)
+                context.add_artifact("generate_ready_meta_path", str(destination))
+            elif source_path.exists():
                 if destination.resolve() != source_path.resolve():
                     destination.parent.mkdir(parents=True, exist_ok=True)
                     shutil.copy2(source_path, destination)
@@ -1114,6 +1195,8 @@ def _run_render_pipeline(
     pdf_options: PdfExportOptions,
     polisher_options: PolisherOptions | None = None,
     base_artifacts: dict[str, object] | None = None,
+    artifact_writer: ArtifactWriter | None = None,
+    artifact_hashes: dict[str, ArtifactDigest] | None = None,
 ) -> PipelineContext:
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -1124,6 +1207,9 @@ def _run_render_pipeline(
         spec=render_spec,
         workdir=output_dir,
         artifacts=artifacts,
+        artifact_writer=artifact_writer,
+        # 前工程で書き出した generate_ready.json などのハッシュを引き継ぐ
+        artifact_hashes=artifact_hashes if artifact_hashes is not None else {},
     )
     context.add_artifact("branding", branding_artifact)
     context.add_artifact("generate_ready", generate_ready)
@@ -1423,7 +1509,7 @@ def gen(  # noqa: PLR0913
         click.echo(f"テンプレートファイルが見つかりません: {template_path}", err=True)
         raise click.exceptions.Exit(code=4)
 
-    rules_config = RulesConfig.load(rules)
+    rules_config = _load_rules_config(rules)
     branding_config, branding_artifact = _prepare_branding(
         template_path, branding)
     analyzer_options = _build_analyzer_options(
@@ -1477,36 +1563,39 @@ def gen(  # noqa: PLR0913
     if fallback_path.exists():
         base_artifacts["mapping_fallback_report_path"] = str(fallback_path)
 
-    try:
-        render_context = _run_render_pipeline(
-            generate_ready=generate_ready,
-            generate_ready_path=generate_ready_path,
-            output_dir=output_dir,
-            template=template_path,
-            pptx_name=pptx_name,
-            branding_config=branding_config,
-            branding_artifact=branding_artifact,
-            analyzer_options=analyzer_options,
-            pdf_options=pdf_options,
-            polisher_options=polisher_options,
-            base_artifacts=base_artifacts,
-        )
-    except PdfExportError as exc:
-        click.echo(f"PDF 出力に失敗しました: {exc}", err=True)
-        raise click.exceptions.Exit(code=5) from exc
-    except PolisherError as exc:
-        click.echo(f"Polisher の実行に失敗しました: {exc}", err=True)
-        raise click.exceptions.Exit(code=6) from exc
-    except FileNotFoundError as exc:
-        click.echo(f"ファイルが見つかりません: {exc}", err=True)
-        raise click.exceptions.Exit(code=4) from exc
-    except Exception as exc:  # noqa: BLE001
-        logging.exception("パイプライン実行中にエラーが発生しました")
-        raise click.exceptions.Exit(code=1) from exc
+    with ArtifactWriter.from_env() as writer:
+        try:
+            render_context = _run_render_pipeline(
+                generate_ready=generate_ready,
+                generate_ready_path=generate_ready_path,
+                output_dir=output_dir,
+                template=template_path,
+                pptx_name=pptx_name,
+                branding_config=branding_config,
+                branding_artifact=branding_artifact,
+                analyzer_options=analyzer_options,
+                pdf_options=pdf_options,
+                polisher_options=polisher_options,
+                base_artifacts=base_artifacts,
+                artifact_writer=writer,
+            )
+        except PdfExportError as exc:
+            click.echo(f"PDF 出力に失敗しました: {exc}", err=True)
+            raise click.exceptions.Exit(code=5) from exc
+        except PolisherError as exc:
+            click.echo(f"Polisher の実行に失敗しました: {exc}", err=True)
+            raise click.exceptions.Exit(code=6) from exc
+        except FileNotFoundError as exc:
+            click.echo(f"ファイルが見つかりません: {exc}", err=True)
+            raise click.exceptions.Exit(code=4) from exc
+        except Exception as exc:  # noqa: BLE001
+            logging.exception("パイプライン実行中にエラーが発生しました")
+            raise click.exceptions.Exit(code=1) from exc
+
+        analysis_path = render_context.artifacts.get("analysis_path")
+        _emit_review_engine_analysis(render_context, analysis_path)
+        audit_path = _write_audit_log_or_exit(render_context)
 
-    analysis_path = render_context.artifacts.get("analysis_path")
-    _emit_review_engine_analysis(render_context, analysis_path)
-    audit_path = _write_audit_log(render_context)
     _echo_render_outputs(render_context, audit_path)
 
 
@@ -1558,7 +1647,9 @@ def prepare(
 
     policy_path = DEFAULT_BRIEF_POLICY_PATH
     try:
-        policy_set = load_brief_policy_set(policy_path)
+        policy_set = shared_file_cache.get(
+            "brief_policy_set", policy_path, load_brief_policy_set
+        )
     except BriefPolicyError as exc:
         click.echo(f"ブリーフポリシーの読み込みに失敗しました: {exc}", err=True)
         raise click.exceptions.Exit(code=4) from exc
@@ -1962,95 +2053,120 @@ def compose(  # noqa: PLR0913
 
     templates_dir = chapter_templates_dir if chapter_templates_dir.exists() else None
 
-    try:
-        outline_result = _execute_outline(
-            spec=spec,
-            layouts=resolved_layouts,
-            output_dir=draft_output,
-            spec_source_path=spec_path,
-            target_length=target_length,
-            structure_pattern=structure_pattern,
-            appendix_limit=appendix_limit,
-            chapter_templates_dir=templates_dir,
-            chapter_template=chapter_template,
-            analysis_summary_path=analysis_summary_path,
-            brief_cards=brief_cards,
-            brief_log=brief_log if brief_log.exists() else None,
-            brief_meta=brief_meta if brief_meta.exists() else None,
-            require_brief=True,
-        )
-    except BriefNormalizationError as exc:
-        click.echo(f"ブリーフ成果物の読み込みに失敗しました: {exc}", err=True)
-        raise click.exceptions.Exit(code=4) from exc
-    except DraftStructuringError as exc:
-        click.echo(f"ドラフト構成の生成に失敗しました: {exc}", err=True)
-        raise click.exceptions.Exit(code=4) from exc
-    except FileNotFoundError as exc:
-        click.echo(f"ファイルが見つかりません: {exc}", err=True)
-        raise click.exceptions.Exit(code=4) from exc
-    except Exception as exc:  # noqa: BLE001
-        logging.exception("compose 実行中にアウトライン工程でエラーが発生しました")
-        raise click.exceptions.Exit(code=1) from exc
-
-    _print_outline_result(
-        outline_result, show_layout_reasons=show_layout_reasons)
-
-    rules_config = RulesConfig.load(rules)
-    branding_config, branding_artifact = _prepare_branding(
-        resolved_template, branding
-    )
-    refiner_options = _build_refiner_options(rules_config, branding_config)
-
-    try:
-        mapping_context = _run_mapping_pipeline(
-            spec=spec,
-            output_dir=output_dir,
-            spec_source_path=spec_path,
-            rules_config=rules_config,
-            refiner_options=refiner_options,
-            branding_artifact=branding_artifact,
-            brief_cards=brief_cards,
-            brief_log=brief_log if brief_log.exists() else None,
-            brief_meta=brief_meta if brief_meta.exists() else None,
-            require_brief=True,
-            layouts=resolved_layouts,
-            draft_output=draft_output,
-            template=resolved_template,
-            draft_context=outline_result.context,
-            draft_options=DraftStructuringOptions(
-                layouts_path=resolved_layouts,
+    with ArtifactWriter.from_env() as writer:
+        try:
+            outline_result = _execute_outline(
+                spec=spec,
+                layouts=resolved_layouts,
                 output_dir=draft_output,
                 spec_source_path=spec_path,
                 target_length=target_length,
                 structure_pattern=structure_pattern,
                 appendix_limit=appendix_limit,
-                chapter_templates_dir=chapter_templates_dir,
-                chapter_template_id=chapter_template,
+                chapter_templates_dir=templates_dir,
+                chapter_template=chapter_template,
                 analysis_summary_path=analysis_summary_path,
-            ),
+                brief_cards=brief_cards,
+                brief_log=brief_log if brief_log.exists() else None,
+                brief_meta=brief_meta if brief_meta.exists() else None,
+                require_brief=True,
+                artifact_writer=writer,
+            )
+        except BriefNormalizationError as exc:
+            click.echo(f"ブリーフ成果物の読み込みに失敗しました: {exc}", err=True)
+            raise click.exceptions.Exit(code=4) from exc
+        except DraftStructuringError as exc:
+            click.echo(f"ドラフト構成の生成に失敗しました: {exc}", err=True)
+            raise click.exceptions.Exit(code=4) from exc
+        except FileNotFoundError as exc:
+            click.echo(f"ファイルが見つかりません: {exc}", err=True)
+            raise click.exceptions.Exit(code=4) from exc
+        except Exception as exc:  # noqa: BLE001
+            logging.exception("compose 実行中にアウトライン工程でエラーが発生しました")
+            raise click.exceptions.Exit(code=1) from exc
+
+        _print_outline_result(
+            outline_result, show_layout_reasons=show_layout_reasons)
+
+        rules_config = _load_rules_config(rules)
+        branding_config, branding_artifact = _prepare_branding(
+            resolved_template, branding
         )
-    except ValueError as exc:
-        click.echo(str(exc), err=True)
-        raise click.exceptions.Exit(code=2) from exc
-    except SpecValidationError as exc:
-        _echo_errors("業務ルール検証に失敗しました", exc.errors)
-        raise click.exceptions.Exit(code=3) from exc
-    except BriefNormalizationError as exc:
-        click.echo(f"ブリーフ成果物の読み込みに失敗しました: {exc}", err=True)
-        raise click.exceptions.Exit(code=4) from exc
-    except Exception as exc:  # noqa: BLE001
-        logging.exception("compose 実行中にマッピング工程でエラーが発生しました")
-        raise click.exceptions.Exit(code=1) from exc
+        refiner_options = _build_refiner_options(rules_config, branding_config)
+
+        try:
+            mapping_context = _run_mapping_pipeline(
+                spec=spec,
+                output_dir=output_dir,
+                spec_source_path=spec_path,
+                rules_config=rules_config,
+                refiner_options=refiner_options,
+                branding_artifact=branding_artifact,
+                brief_cards=brief_cards,
+                brief_log=brief_log if brief_log.exists() else None,
+                brief_meta=brief_meta if brief_meta.exists() else None,
+                require_brief=True,
+                layouts=resolved_layouts,
+                draft_output=draft_output,
+                template=resolved_template,
+                draft_context=outline_result.context,
+                draft_options=DraftStructuringOptions(
+                    layouts_path=resolved_layouts,
+                    output_dir=draft_output,
+                    spec_source_path=spec_path,
+                    target_length=target_length,
+                    structure_pattern=structure_pattern,
+                    appendix_limit=appendix_limit,
+                    chapter_templates_dir=chapter_templates_dir,
+                    chapter_template_id=chapter_template,
+                    analysis_summary_path=analysis_summary_path,
+                ),
+            )
+        except ValueError as exc:
+            click.echo(str(exc), err=True)
+            raise click.exceptions.Exit(code=2) from exc
+        except SpecValidationError as exc:
+            _echo_errors("業務ルール検証に失敗しました", exc.errors)
+            raise click.exceptions.Exit(code=3) from exc
+        except BriefNormalizationError as exc:
+            click.echo(f"ブリーフ成果物の読み込みに失敗しました: {exc}", err=True)
+            raise click.exceptions.Exit(code=4) from exc
+        except Exception as exc:  # noqa: BLE001
+            logging.exception("compose 実行中にマッピング工程でエラーが発生しました")
+            raise click.exceptions.Exit(code=1) from exc
+
+        _flush_artifacts_or_exit(mapping_context)
 
     _echo_mapping_outputs(mapping_context)
 
 
-@app.command("mapping")
+@app.command("run")
 @click.argument(
     "spec_path",
     type=click.Path(exists=True, dir_okay=False,
                     readable=True, path_type=Path),
 )
+@click.option(
+    "--layouts",
+    type=click.Path(exists=True, dir_okay=False,
+                    readable=True, path_type=Path),
+    default=None,
+    help="工程2で生成した layouts.jsonl のパス",
+)
+@click.option(
+    "--draft-output",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    default=Path(".pptx/draft"),
+    show_default=True,
+    help="ドラフト成果物を保存するディレクトリ",
+)
+@click.option(
+    "--compose-output",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    default=Path(".pptx/compose"),
+    show_default=True,
+    help="generate_ready.json 等の出力ディレクトリ",
+)
 @click.option(
     "--output",
     "-o",
@@ -2058,29 +2174,55 @@ def compose(  # noqa: PLR0913
     type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
     default=Path(".pptx/gen"),
     show_default=True,
-    help="generate_ready.json 等の出力ディレクトリ",
+    help="PPTX / PDF / 監査ログを保存するディレクトリ",
 )
 @click.option(
-    "--rules",
-    type=click.Path(exists=True, dir_okay=False,
-                    readable=True, path_type=Path),
-    default=DEFAULT_RULES_PATH,
+    "--target-length",
+    type=int,
+    default=None,
+    help="目標スライド枚数",
+)
+@click.option(
+    "--structure-pattern",
+    type=str,
+    default=None,
+    help="章構成パターン名",
+)
+@click.option(
+    "--appendix-limit",
+    type=int,
+    default=5,
     show_default=True,
-    help="検証ルール設定ファイル",
+    help="付録枚数の上限",
 )
 @click.option(
-    "--layouts",
+    "--chapter-templates-dir",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    default=DEFAULT_CHAPTER_TEMPLATES_DIR,
+    show_default=True,
+    help="章テンプレート辞書ディレクトリ",
+)
+@click.option(
+    "--chapter-template",
+    type=str,
+    default=None,
+    help="適用する章テンプレート ID",
+)
+@click.option(
+    "--import-analysis",
+    "analysis_summary_path",
     type=click.Path(exists=True, dir_okay=False,
                     readable=True, path_type=Path),
     default=None,
-    help="layouts.jsonl のパス",
+    help="analysis_summary.json のパス",
 )
 @click.option(
-    "--draft-output",
-    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
-    default=Path(".pptx/draft"),
+    "--rules",
+    type=click.Path(exists=True, dir_okay=False,
+                    readable=True, path_type=Path),
+    default=DEFAULT_RULES_PATH,
     show_default=True,
-    help="draft_draft.json / draft_approved.json の出力先",
+    help="検証ルール設定ファイル",
 )
 @click.option(
     "--template",
@@ -2088,7 +2230,7 @@ def compose(  # noqa: PLR0913
     type=click.Path(exists=True, dir_okay=False,
                     readable=True, path_type=Path),
     default=None,
-    help="generate_ready.json に埋め込むテンプレートファイル（未指定時は jobspec.meta.template_path を利用）",
+    help="利用するテンプレートファイル（未指定時は jobspec.meta.template_path を利用）",
 )
 @click.option(
     "--branding",
@@ -2120,24 +2262,384 @@ def compose(  # noqa: PLR0913
     show_default=True,
     help="工程2の ai_generation_meta.json（任意）",
 )
-def mapping(  # noqa: PLR0913
-    spec_path: Path,
-    output_dir: Path,
-    rules: Path,
-    layouts: Optional[Path],
-    draft_output: Path,
-    template: Optional[Path],
-    branding: Optional[Path],
-    brief_cards: Path,
-    brief_log: Path,
-    brief_meta: Path,
-) -> None:
-    """工程5 マッピングを実行し generate_ready.json を生成する。"""
-    try:
-        spec = _load_jobspec(spec_path)
-    except SpecValidationError as exc:
-        _echo_errors("スキーマ検証に失敗しました", exc.errors)
-        raise click.exceptions.Exit(code=2) from exc
+@click.option(
+    "--pptx-name",
+    default="proposal.pptx",
+    show_default=True,
+    help="出力 PPTX のファイル名",
+)
+@click.option(
+    "--export-pdf",
+    is_flag=True,
+    help="LibreOffice を利用して PDF を追加出力する",
+)
+@click.option(
+    "--pdf-mode",
+    type=click.Choice(["both", "only"], case_sensitive=False),
+    default="both",
+    show_default=True,
+    help="PDF 出力時の挙動。only では PPTX を保存しない",
+)
+@click.option(
+    "--pdf-output",
+    type=str,
+    default="proposal.pdf",
+    show_default=True,
+    help="出力 PDF ファイル名",
+)
+@click.option(
+    "--libreoffice-path",
+    type=click.Path(exists=True, dir_okay=False,
+                    readable=True, path_type=Path),
+    default=None,
+    help="LibreOffice (soffice) 実行ファイルのパス",
+)
+@click.option(
+    "--pdf-timeout",
+    type=int,
+    default=120,
+    show_default=True,
+    help="LibreOffice 変換のタイムアウト秒",
+)
+@click.option(
+    "--pdf-retries",
+    type=int,
+    default=2,
+    show_default=True,
+    help="LibreOffice 変換の最大リトライ回数",
+)
+@click.option(
+    "--polisher/--no-polisher",
+    "polisher_toggle",
+    default=None,
+    help="Open XML Polisher を実行するかを明示的に指定する（設定ファイル値を上書き）",
+)
+@click.option(
+    "--polisher-path",
+    type=click.Path(exists=True, dir_okay=False,
+                    readable=True, path_type=Path),
+    default=None,
+    help="Open XML Polisher (.exe / .dll) もしくはラッパースクリプトのパス",
+)
+@click.option(
+    "--polisher-rules",
+    type=click.Path(exists=True, dir_okay=False,
+                    readable=True, path_type=Path),
+    default=None,
+    help="Polisher へ渡すルール設定ファイル",
+)
+@click.option(
+    "--polisher-timeout",
+    type=int,
+    default=None,
+    help="Polisher 実行のタイムアウト秒（設定ファイル値を上書き）",
+)
+@click.option(
+    "--polisher-arg",
+    "polisher_args",
+    multiple=True,
+    help="Polisher へ渡す追加引数（{pptx}, {rules} をプレースホルダーとして利用可能）",
+)
+@click.option(
+    "--polisher-cwd",
+    type=click.Path(exists=True, file_okay=False,
+                    dir_okay=True, path_type=Path),
+    default=None,
+    help="Polisher 実行時のカレントディレクトリ",
+)
+@click.option(
+    "--emit-structure-snapshot",
+    is_flag=True,
+    help="Analyzer の構造スナップショット (analysis_snapshot.json) を出力する",
+)
+def run(  # noqa: PLR0913
+    spec_path: Path,
+    layouts: Path | None,
+    draft_output: Path,
+    compose_output: Path,
+    output_dir: Path,
+    target_length: int | None,
+    structure_pattern: str | None,
+    appendix_limit: int,
+    chapter_templates_dir: Path,
+    chapter_template: str | None,
+    analysis_summary_path: Path | None,
+    rules: Path,
+    template: Optional[Path],
+    branding: Optional[Path],
+    brief_cards: Path,
+    brief_log: Path,
+    brief_meta: Path,
+    pptx_name: str,
+    export_pdf: bool,
+    pdf_mode: str,
+    pdf_output: str,
+    libreoffice_path: Optional[Path],
+    pdf_timeout: int,
+    pdf_retries: int,
+    polisher_toggle: bool | None,
+    polisher_path: Optional[Path],
+    polisher_rules: Optional[Path],
+    polisher_timeout: Optional[int],
+    polisher_args: tuple[str, ...],
+    polisher_cwd: Optional[Path],
+    emit_structure_snapshot: bool,
+) -> None:
+    """工程4〜6（compose + gen）を 1 プロセスで連続実行する。
+
+    ドラフト・generate_ready・ブランド設定はメモリ上で次工程へ渡し、JSON 成果物は
+    バックグラウンドで書き出す。出力ファイルは compose と gen を順に実行した場合と同じ。
+    """
+
+    if not export_pdf and pdf_mode != "both":
+        click.echo("--pdf-mode は --export-pdf と併用してください", err=True)
+        raise click.exceptions.Exit(code=2)
+
+    try:
+        spec = _load_jobspec(spec_path)
+    except SpecValidationError as exc:
+        _echo_errors("スキーマ検証に失敗しました", exc.errors)
+        raise click.exceptions.Exit(code=2) from exc
+
+    try:
+        resolved_template = _resolve_template_path(
+            spec=spec,
+            spec_source=spec_path,
+            template_option=template,
+        )
+        resolved_layouts = _resolve_layouts_path(
+            spec=spec,
+            spec_source=spec_path,
+            layouts_option=layouts,
+        )
+    except ValueError as exc:
+        click.echo(str(exc), err=True)
+        raise click.exceptions.Exit(code=2) from exc
+
+    templates_dir = chapter_templates_dir if chapter_templates_dir.exists() else None
+    brief_log_path = brief_log if brief_log.exists() else None
+    brief_meta_path = brief_meta if brief_meta.exists() else None
+
+    rules_config = _load_rules_config(rules)
+    branding_config, branding_artifact = _prepare_branding(
+        resolved_template, branding
+    )
+    refiner_options = _build_refiner_options(rules_config, branding_config)
+    analyzer_options = _build_analyzer_options(
+        rules_config, branding_config, emit_structure_snapshot
+    )
+    pdf_options = PdfExportOptions(
+        enabled=export_pdf,
+        mode=pdf_mode,
+        output_filename=pdf_output,
+        soffice_path=libreoffice_path,
+        timeout_sec=pdf_timeout,
+        max_retries=pdf_retries,
+    )
+    polisher_options = _build_polisher_options(
+        rules_config,
+        polisher_toggle=polisher_toggle,
+        polisher_path=polisher_path,
+        polisher_rules=polisher_rules,
+        polisher_timeout=polisher_timeout,
+        polisher_args=polisher_args,
+        polisher_cwd=polisher_cwd,
+        rules_path=rules,
+    )
+
+    with ArtifactWriter.from_env() as writer:
+        try:
+            outline_result = _execute_outline(
+                spec=spec,
+                layouts=resolved_layouts,
+                output_dir=draft_output,
+                spec_source_path=spec_path,
+                target_length=target_length,
+                structure_pattern=structure_pattern,
+                appendix_limit=appendix_limit,
+                chapter_templates_dir=templates_dir,
+                chapter_template=chapter_template,
+                analysis_summary_path=analysis_summary_path,
+                brief_cards=brief_cards,
+                brief_log=brief_log_path,
+                brief_meta=brief_meta_path,
+                require_brief=True,
+                artifact_writer=writer,
+            )
+        except BriefNormalizationError as exc:
+            click.echo(f"ブリーフ成果物の読み込みに失敗しました: {exc}", err=True)
+            raise click.exceptions.Exit(code=4) from exc
+        except DraftStructuringError as exc:
+            click.echo(f"ドラフト構成の生成に失敗しました: {exc}", err=True)
+            raise click.exceptions.Exit(code=4) from exc
+        except FileNotFoundError as exc:
+            click.echo(f"ファイルが見つかりません: {exc}", err=True)
+            raise click.exceptions.Exit(code=4) from exc
+        except Exception as exc:  # noqa: BLE001
+            logging.exception("run 実行中にアウトライン工程でエラーが発生しました")
+            raise click.exceptions.Exit(code=1) from exc
+
+        try:
+            mapping_context = _run_mapping_pipeline(
+                spec=spec,
+                output_dir=compose_output,
+                spec_source_path=spec_path,
+                rules_config=rules_config,
+                refiner_options=refiner_options,
+                branding_artifact=branding_artifact,
+                brief_cards=brief_cards,
+                brief_log=brief_log_path,
+                brief_meta=brief_meta_path,
+                require_brief=True,
+                layouts=resolved_layouts,
+                draft_output=draft_output,
+                template=resolved_template,
+                draft_context=outline_result.context,
+            )
+        except ValueError as exc:
+            click.echo(str(exc), err=True)
+            raise click.exceptions.Exit(code=2) from exc
+        except SpecValidationError as exc:
+            _echo_errors("業務ルール検証に失敗しました", exc.errors)
+            raise click.exceptions.Exit(code=3) from exc
+        except Exception as exc:  # noqa: BLE001
+            logging.exception("run 実行中にマッピング工程でエラーが発生しました")
+            raise click.exceptions.Exit(code=1) from exc
+
+        generate_ready = mapping_context.artifacts["generate_ready"]
+        generate_ready_path = Path(str(mapping_context.artifacts["generate_ready_path"]))
+
+        try:
+            render_context = _run_render_pipeline(
+                generate_ready=generate_ready,
+                generate_ready_path=generate_ready_path,
+                output_dir=output_dir,
+                template=resolved_template,
+                pptx_name=pptx_name,
+                branding_config=branding_config,
+                branding_artifact=branding_artifact,
+                analyzer_options=analyzer_options,
+                pdf_options=pdf_options,
+                polisher_options=polisher_options,
+                base_artifacts=mapping_context.artifacts,
+                artifact_writer=writer,
+                artifact_hashes=mapping_context.artifact_hashes,
+            )
+        except PdfExportError as exc:
+            click.echo(f"PDF 出力に失敗しました: {exc}", err=True)
+            raise click.exceptions.Exit(code=5) from exc
+        except PolisherError as exc:
+            click.echo(f"Polisher の実行に失敗しました: {exc}", err=True)
+            raise click.exceptions.Exit(code=6) from exc
+        except FileNotFoundError as exc:
+            click.echo(f"ファイルが見つかりません: {exc}", err=True)
+            raise click.exceptions.Exit(code=4) from exc
+        except Exception as exc:  # noqa: BLE001
+            logging.exception("run 実行中にレンダリング工程でエラーが発生しました")
+            raise click.exceptions.Exit(code=1) from exc
+
+        analysis_path = render_context.artifacts.get("analysis_path")
+        _emit_review_engine_analysis(render_context, analysis_path)
+        audit_path = _write_audit_log_or_exit(render_context)
+
+    _print_outline_result(outline_result, show_layout_reasons=False)
+    _echo_mapping_outputs(mapping_context)
+    _echo_render_outputs(render_context, audit_path)
+
+
+@app.command("mapping")
+@click.argument(
+    "spec_path",
+    type=click.Path(exists=True, dir_okay=False,
+                    readable=True, path_type=Path),
+)
+@click.option(
+    "--output",
+    "-o",
+    "output_dir",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    default=Path(".pptx/gen"),
+    show_default=True,
+    help="generate_ready.json 等の出力ディレクトリ",
+)
+@click.option(
+    "--rules",
+    type=click.Path(exists=True, dir_okay=False,
+                    readable=True, path_type=Path),
+    default=DEFAULT_RULES_PATH,
+    show_default=True,
+    help="検証ルール設定ファイル",
+)
+@click.option(
+    "--layouts",
+    type=click.Path(exists=True, dir_okay=False,
+                    readable=True, path_type=Path),
+    default=None,
+    help="layouts.jsonl のパス",
+)
+@click.option(
+    "--draft-output",
+    type=click.Path(file_okay=False, dir_okay=True, path_type=Path),
+    default=Path(".pptx/draft"),
+    show_default=True,
+    help="draft_draft.json / draft_approved.json の出力先",
+)
+@click.option(
+    "--template",
+    "-t",
+    type=click.Path(exists=True, dir_okay=False,
+                    readable=True, path_type=Path),
+    default=None,
+    help="generate_ready.json に埋め込むテンプレートファイル（未指定時は jobspec.meta.template_path を利用）",
+)
+@click.option(
+    "--branding",
+    type=click.Path(exists=True, dir_okay=False,
+                    readable=True, path_type=Path),
+    default=None,
+    show_default=str(DEFAULT_BRANDING_PATH),
+    help="ブランド設定ファイル（任意）",
+)
+@click.option(
+    "--brief-cards",
+    type=click.Path(exists=True, dir_okay=False,
+                    readable=True, path_type=Path),
+    default=DEFAULT_PREPARE_OUTPUT_DIR / "prepare_card.json",
+    show_default=True,
+    help="工程2の prepare_card.json",
+)
+@click.option(
+    "--brief-log",
+    type=click.Path(exists=False, dir_okay=False, path_type=Path),
+    default=DEFAULT_PREPARE_OUTPUT_DIR / "brief_log.json",
+    show_default=True,
+    help="工程2の brief_log.json（任意）",
+)
+@click.option(
+    "--brief-meta",
+    type=click.Path(exists=False, dir_okay=False, path_type=Path),
+    default=DEFAULT_PREPARE_OUTPUT_DIR / "ai_generation_meta.json",
+    show_default=True,
+    help="工程2の ai_generation_meta.json（任意）",
+)
+def mapping(  # noqa: PLR0913
+    spec_path: Path,
+    output_dir: Path,
+    rules: Path,
+    layouts: Optional[Path],
+    draft_output: Path,
+    template: Optional[Path],
+    branding: Optional[Path],
+    brief_cards: Path,
+    brief_log: Path,
+    brief_meta: Path,
+) -> None:
+    """工程5 マッピングを実行し generate_ready.json を生成する。"""
+    try:
+        spec = _load_jobspec(spec_path)
+    except SpecValidationError as exc:
+        _echo_errors("スキーマ検証に失敗しました", exc.errors)
+        raise click.exceptions.Exit(code=2) from exc
 
     try:
         resolved_template = _resolve_template_path(
@@ -2159,7 +2661,7 @@ def mapping(  # noqa: PLR0913
         click.echo(str(exc), err=True)
         raise click.exceptions.Exit(code=2) from exc
 
-    rules_config = RulesConfig.load(rules)
+    rules_config = _load_rules_config(rules)
     branding_config, branding_artifact = _prepare_branding(
         resolved_template, branding
     )
@@ -2286,6 +2788,14 @@ def mapping(  # noqa: PLR0913
     multiple=True,
     help="テンプレ互換性検証に使用する spec ファイル（複数指定可）",
 )
+@click.option(
+    "--golden-workers",
+    type=click.IntRange(1, None),
+    default=1,
+    show_default=True,
+    envvar="PPTX_GOLDEN_WORKERS",
+    help="ゴールデンサンプル検証を並列実行するプロセス数",
+)
 def template(  # noqa: PLR0913
     template_path: Path,
     output: Path,
@@ -2301,6 +2811,7 @@ def template(  # noqa: PLR0913
     reviewed_by: str | None,
     baseline_release: Path | None,
     golden_specs: tuple[Path, ...],
+    golden_workers: int,
 ) -> None:
     """テンプレ工程（抽出・検証・必要に応じてリリース）を実行する。"""
     _log_current_llm_provider("template")
@@ -2359,6 +2870,7 @@ def template(  # noqa: PLR0913
             reviewed_by=reviewed_by,
             baseline_release=baseline_release,
             golden_specs=golden_specs,
+            golden_workers=golden_workers,
         )
     except FileNotFoundError as exc:
         click.echo(f"ファイルが見つかりません: {exc}", err=True)
@@ -2513,6 +3025,7 @@ def layout_validate(
         template_id=template_id,
         baseline_path=baseline,
         analyzer_snapshot_path=analyzer_snapshot,
+        extraction_cache=_extraction_cache(),
     )
     suite = LayoutValidationSuite(options)
 
@@ -2585,6 +3098,14 @@ def layout_validate(
     multiple=True,
     help="テンプレ互換性検証に使用する spec ファイル（複数指定可）",
 )
+@click.option(
+    "--golden-workers",
+    type=click.IntRange(1, None),
+    default=1,
+    show_default=True,
+    envvar="PPTX_GOLDEN_WORKERS",
+    help="ゴールデンサンプル検証を並列実行するプロセス数",
+)
 def tpl_release(
     template_path: Path,
     brand: str,
@@ -2595,6 +3116,7 @@ def tpl_release(
     reviewed_by: Optional[str],
     baseline_release: Optional[Path],
     golden_specs: tuple[Path, ...],
+    golden_workers: int,
 ) -> None:
     """テンプレート受け渡しメタと差分レポートを生成する。"""
 
@@ -2609,6 +3131,7 @@ def tpl_release(
             reviewed_by=reviewed_by,
             baseline_release=baseline_release,
             golden_specs=golden_specs,
+            golden_workers=golden_workers,
         )
     except click.exceptions.Exit:
         raise
@@ -2625,127 +3148,97 @@ def tpl_release(
             raise click.exceptions.Exit(code=6)
 
 
-def _run_golden_specs(
-    *, template_path: Path, golden_specs: list[Path], output_dir: Path
-) -> tuple[list[TemplateReleaseGoldenRun], list[str], list[str]]:
-    results: list[TemplateReleaseGoldenRun] = []
-    warnings: list[str] = []
-    errors: list[str] = []
-
-    if not golden_specs:
-        return results, warnings, errors
+@app.command("serve")
+@click.option("--host", type=str, default="127.0.0.1", show_default=True, help="待ち受けホスト")
+@click.option("--port", type=int, default=8765, show_default=True, help="待ち受けポート")
+@click.option(
+    "--workers",
+    type=click.IntRange(1, None),
+    default=2,
+    show_default=True,
+    help="ジョブを同時実行するワーカー数",
+)
+@click.option(
+    "--max-queue",
+    type=click.IntRange(0, None),
+    default=16,
+    show_default=True,
+    help="実行待ちジョブの上限 (超過時は 429 を返す)",
+)
+@click.option(
+    "--max-finished",
+    type=click.IntRange(0, None),
+    default=DEFAULT_MAX_FINISHED_JOBS,
+    show_default=True,
+    help="状態を保持する終了済みジョブの件数 (超過分は古いものから破棄する)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="設定・テンプレート・AI クライアントのキャッシュを無効化する",
+)
+def serve(
+    host: str,
+    port: int,
+    workers: int,
+    max_queue: int,
+    max_finished: int,
+    no_cache: bool,
+) -> None:
+    """prepare / compose / gen を HTTP 経由で受け付ける常駐ジョブサーバーを起動する。"""
 
-    rules_config = RulesConfig.load(DEFAULT_RULES_PATH)
-    branding_config = _load_branding_for_template(template_path, warnings)
+    try:
+        import uvicorn
+    except ImportError as exc:  # pragma: no cover - 依存欠如時のみ
+        click.echo("uvicorn がインストールされていません", err=True)
+        raise click.exceptions.Exit(code=1) from exc
 
-    golden_root = output_dir / "golden_runs"
+    from .api.job_app import create_job_app
+    from .api.job_runner import JobManager
 
-    for spec_path in golden_specs:
-        run_dir = golden_root / spec_path.stem
-        result = TemplateReleaseGoldenRun(
-            spec_path=str(spec_path),
-            status="passed",
-            output_dir=str(run_dir),
-        )
+    if not no_cache:
+        shared_file_cache.enable()
+    _log_current_llm_provider("serve")
 
-        try:
-            spec = _load_jobspec(spec_path)
-        except SpecValidationError as exc:
-            detail = json.dumps(exc.errors, ensure_ascii=False)
-            message = (
-                f"golden spec {spec_path} のスキーマ検証に失敗しました"
-            )
-            result.status = "failed"
-            result.errors.extend([message, detail])
-            errors.append(message)
-            results.append(result)
-            continue
-        except Exception as exc:  # noqa: BLE001
-            message = f"golden spec {spec_path} の読み込みに失敗しました: {exc}"
-            result.status = "failed"
-            result.errors.append(message)
-            errors.append(message)
-            results.append(result)
-            continue
+    manager = JobManager(
+        max_workers=workers,
+        max_queue=max_queue,
+        max_finished=max_finished,
+        cli_group=app,
+    )
+    uvicorn.run(create_job_app(manager), host=host, port=port)
 
-        run_dir.mkdir(parents=True, exist_ok=True)
-        context = PipelineContext(spec=spec, workdir=run_dir)
 
-        renderer = SimpleRendererStep(
-            RenderingOptions(
-                template_path=template_path,
-                output_filename=f"{spec_path.stem}.pptx",
-                branding=branding_config,
-            )
-        )
-        refiner = SimpleRefinerStep(
-            RefinerOptions(
-                max_bullet_level=rules_config.max_bullet_level,
-            )
-        )
-        analyzer = SimpleAnalyzerStep(
-            AnalyzerOptions(
-                min_font_size=branding_config.body_font.size_pt,
-                default_font_size=branding_config.body_font.size_pt,
-                default_font_color=branding_config.body_font.color_hex,
-                preferred_text_color=branding_config.primary_color,
-                background_color=branding_config.background_color,
-                max_bullet_level=rules_config.max_bullet_level,
-                large_text_threshold_pt=branding_config.body_font.size_pt,
-            )
-        )
+def _run_golden_specs(
+    *,
+    template_path: Path,
+    golden_specs: list[Path],
+    output_dir: Path,
+    package: TemplatePackage | None = None,
+    workers: int = 1,
+) -> tuple[list[TemplateReleaseGoldenRun], list[str], list[str]]:
+    warnings: list[str] = []
 
-        steps = [
-            SpecValidatorStep(
-                max_title_length=rules_config.max_title_length,
-                max_bullet_length=rules_config.max_bullet_length,
-                max_bullet_level=rules_config.max_bullet_level,
-                forbidden_words=rules_config.forbidden_words,
-            ),
-            refiner,
-            renderer,
-            analyzer,
-        ]
-        runner = PipelineRunner(steps)
+    if not golden_specs:
+        return [], warnings, []
 
-        try:
-            runner.execute(context)
-        except SpecValidationError as exc:
-            detail = json.dumps(exc.errors, ensure_ascii=False)
-            message = (
-                f"golden spec {spec_path} の業務ルール検証に失敗しました"
-            )
-            result.status = "failed"
-            result.errors.extend([message, detail])
-            errors.append(message)
-        except Exception as exc:  # noqa: BLE001
-            logging.exception(
-                "ゴールデンサンプル実行中にエラーが発生しました: %s", spec_path
-            )
-            message = f"golden spec {spec_path} の実行に失敗しました: {exc}"
-            result.status = "failed"
-            result.errors.append(message)
-            errors.append(message)
-        else:
-            pptx_path = context.artifacts.get("pptx_path")
-            if pptx_path is not None:
-                result.pptx_path = str(pptx_path)
-            analysis_path = context.artifacts.get("analysis_path")
-            if analysis_path is not None:
-                result.analysis_path = str(analysis_path)
-            pdf_path = context.artifacts.get("pdf_path")
-            if pdf_path is not None:
-                result.pdf_path = str(pdf_path)
-
-            analyzer_warnings = context.artifacts.get("analyzer_warnings")
-            if isinstance(analyzer_warnings, list):
-                new_warnings = [str(item) for item in analyzer_warnings]
-                result.warnings.extend(new_warnings)
-                for warning in new_warnings:
-                    warnings.append(f"golden spec {spec_path}: {warning}")
-
-        results.append(result)
+    rules_config = _load_rules_config(DEFAULT_RULES_PATH)
+    branding_config = _load_branding_for_template(
+        template_path, warnings, package=package
+    )
 
+    results, run_warnings, errors = run_golden_specs(
+        golden_specs,
+        inputs=GoldenRunInputs(
+            template_path=template_path,
+            rules_config=rules_config,
+            branding_config=branding_config,
+        ),
+        golden_root=output_dir / "golden_runs",
+        workers=workers,
+    )
+    warnings.extend(run_warnings)
     return results, warnings, errors
 
 
@@ -2808,16 +3301,19 @@ def _resolve_golden_spec_path(spec_path: str, base_dir: Path) -> Path | None:
 
 
 def _load_branding_for_template(
-    template_path: Path, warnings: list[str]
+    template_path: Path,
+    warnings: list[str],
+    *,
+    package: TemplatePackage | None = None,
 ) -> BrandingConfig:
     try:
-        extraction = extract_branding_config(template_path)
+        extraction = _extract_branding_cached(template_path, package=package)
     except BrandingExtractionError as exc:
         warnings.append(
             f"テンプレートからブランド設定を抽出できなかったためデフォルト設定を使用します: {exc}"
         )
         try:
-            return BrandingConfig.load(DEFAULT_BRANDING_PATH)
+            return _load_branding_config(DEFAULT_BRANDING_PATH)
         except FileNotFoundError:
             warnings.append(
                 f"デフォルトのブランド設定が見つからないため内蔵設定を使用します: {DEFAULT_BRANDING_PATH}"
@@ -2862,22 +3358,23 @@ def _emit_review_engine_analysis(
         return None
 
     path = Path(str(analysis_path))
-    if not path.exists():
-        logger.warning(
-            "Review Engine 連携ファイル生成のため analysis.json が見つかりません: %s", path
-        )
-        return None
-
     adapter = AnalyzerReviewEngineAdapter()
-    try:
-        logger.info("Loading analysis payload from %s", path.resolve())
-        analysis_payload = json.loads(path.read_text(encoding="utf-8"))
-    except Exception as exc:  # noqa: BLE001
-        logger.warning(
-            "analysis.json の読み込みに失敗したため Review Engine 連携ファイルを生成しません: %s",
-            exc,
-        )
-        return None
+    analysis_payload = context.artifacts.get("analysis")
+    if not isinstance(analysis_payload, dict):
+        if not path.exists():
+            logger.warning(
+                "Review Engine 連携ファイル生成のため analysis.json が見つかりません: %s", path
+            )
+            return None
+        try:
+            logger.info("Loading analysis payload from %s", path.resolve())
+            analysis_payload = json.loads(path.read_text(encoding="utf-8"))
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(
+                "analysis.json の読み込みに失敗したため Review Engine 連携ファイルを生成しません: %s",
+                exc,
+            )
+            return None
 
     try:
         payload = adapter.build_payload(analysis_payload, context.spec)
@@ -2888,10 +3385,8 @@ def _emit_review_engine_analysis(
         )
         return None
 
-    output_path = path.with_name("review_engine_analyzer.json")
-    output_path.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2),
-        encoding="utf-8",
+    output_path = write_json_artifact(
+        context, path.with_name("review_engine_analyzer.json"), payload
     )
     logger.info("Saved review engine payload to %s", output_path.resolve())
     context.add_artifact("review_engine_analysis_path", output_path)
@@ -2952,21 +3447,22 @@ def _write_audit_log(context: PipelineContext) -> Path:
     else:
         polisher_payload = None
 
-    hashes: dict[str, str] = {}
-    for label, key in (
-        ("generate_ready", "generate_ready_path"),
-        ("pptx", "pptx_path"),
-        ("analysis", "analysis_path"),
-        ("analysis_pre_polisher", "analysis_pre_polisher_path"),
-        ("pdf", "pdf_path"),
-        ("rendering_log", "rendering_log_path"),
-        ("monitoring_report", "monitoring_report_path"),
-        ("mapping_log", "mapping_log_path"),
-        ("mapping_fallback_report", "mapping_fallback_report_path"),
-    ):
-        digest = _sha256_of(context.artifacts.get(key))
-        if digest:
-            hashes[label] = digest
+    # ハッシュはバックグラウンド書き出しの完了後に計算する
+    flush_artifacts(context)
+    hashes = _collect_artifact_hashes(
+        context,
+        (
+            ("generate_ready", "generate_ready_path"),
+            ("pptx", "pptx_path"),
+            ("analysis", "analysis_path"),
+            ("analysis_pre_polisher", "analysis_pre_polisher_path"),
+            ("pdf", "pdf_path"),
+            ("rendering_log", "rendering_log_path"),
+            ("monitoring_report", "monitoring_report_path"),
+            ("mapping_log", "mapping_log_path"),
+            ("mapping_fallback_report", "mapping_fallback_report_path"),
+        ),
+    )
 
     audit_payload = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -2993,33 +3489,61 @@ def _write_audit_log(context: PipelineContext) -> Path:
     mapping_meta = context.artifacts.get("mapping_meta")
     if mapping_meta is not None:
         audit_payload["mapping"] = mapping_meta
-    audit_path = outputs_dir / "audit_log.json"
-    audit_path.write_text(json.dumps(
-        audit_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    audit_path = write_json_artifact(
+        context, outputs_dir / "audit_log.json", audit_payload)
     logger.info("Saved audit log to %s", audit_path.resolve())
     context.add_artifact("audit_path", audit_path)
     return audit_path
 
 
+def _flush_artifacts_or_exit(context: PipelineContext) -> None:
+    try:
+        flush_artifacts(context)
+    except ArtifactWriteError as exc:
+        click.echo(str(exc), err=True)
+        raise click.exceptions.Exit(code=1) from exc
+
+
+def _write_audit_log_or_exit(context: PipelineContext) -> Path:
+    try:
+        audit_path = _write_audit_log(context)
+    except ArtifactWriteError as exc:
+        click.echo(str(exc), err=True)
+        raise click.exceptions.Exit(code=1) from exc
+    _flush_artifacts_or_exit(context)
+    return audit_path
+
+
 def _artifact_str(value: object | None) -> str | None:
     if value is None:
         return None
     return str(value)
 
 
-def _sha256_of(value: object | None) -> str | None:
-    if value is None:
-        return None
-    path = Path(str(value))
-    if not path.exists():
-        return None
-    digest = hashlib.sha256()
-    with path.open("rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            if not chunk:
-                break
-            digest.update(chunk)
-    return f"sha256:{digest.hexdigest()}"
+def _collect_artifact_hashes(
+    context: PipelineContext, targets: tuple[tuple[str, str], ...]
+) -> dict[str, str]:
+    """書き出し時に登録済みのハッシュを集め、未登録（外部生成物など）のみ並列に計算する。"""
+
+    hashes: dict[str, str] = {}
+    pending: dict[str, Path] = {}
+    for label, key in targets:
+        value = context.artifacts.get(key)
+        if value is None:
+            continue
+        path = Path(str(value))
+        if not path.exists():
+            continue
+        recorded = context.artifact_hash(path)
+        if recorded is not None:
+            hashes[label] = recorded.label()
+        else:
+            pending[label] = path
+    computed = hash_files(pending.values())
+    for label, path in pending.items():
+        hashes[label] = f"sha256:{computed[path]}"
+    # 出力順は従来どおり targets の順にそろえる
+    return {label: hashes[label] for label, _key in targets if label in hashes}
 
 
 if __name__ == "__main__":
@@ -1,9 +1,11 @@
 """生成AI オーケストレーション関連の公開 API。"""
 
-from .client import (AIGenerationRequest, AIGenerationResponse, LLMClient,
+from .client import (AIGenerationRequest, AIGenerationResponse,
+                     BatchLLMClient, LLMClient,
                      LLMClientConfigurationError, MockLLMClient,
                      SlideMatchCandidate, SlideMatchRequest,
-                     SlideMatchResponse, create_llm_client)
+                     SlideMatchResponse, create_llm_client,
+                     llm_client_config_key)
 from .orchestrator import ContentAIOrchestrator, ContentAIOrchestrationError
 from .policy import (
     ContentAIPolicy,
@@ -16,6 +18,7 @@ from .policy import (
 __all__ = [
     "AIGenerationRequest",
     "AIGenerationResponse",
+    "BatchLLMClient",
     "LLMClient",
     "MockLLMClient",
     "LLMClientConfigurationError",
@@ -23,6 +26,7 @@ __all__ = [
     "SlideMatchRequest",
     "SlideMatchResponse",
     "create_llm_client",
+    "llm_client_config_key",
     "ContentAIOrchestrator",
     "ContentAIOrchestrationError",
     "ContentAIPolicy",
@@ -7,21 +7,33 @@ import logging
 import os
 import re
 import textwrap
+import time
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
-from typing import Protocol
+from hashlib import sha256
+from typing import Callable, Iterable, Iterator, Protocol, TypeVar
 
 from ..models import JobSpec, Slide
+from ..utils.llm_capabilities import (ProviderCapabilityRegistry,
+                                      shared_capability_registry)
+from ..utils.llm_sdk import shared_sdk_clients
 from .policy import ContentAIPolicy
+from .streaming import StreamEvent, StreamOutcome, consume_stream
 
 logger = logging.getLogger(__name__)
 
 _LLM_LOGGER = logging.getLogger("pptx_generator.content_ai.llm")
 
+RequestT = TypeVar("RequestT")
+ResponseT = TypeVar("ResponseT")
+
 MAX_BODY_LINES = 6
 MAX_BODY_LENGTH = 40
 MAX_TITLE_LENGTH = 120
 DEFAULT_MAX_TOKENS = 1024
+# バッチ 1 リクエストあたりの出力トークン上限（claude-3-haiku など出力上限の小さいモデルに合わせる）
+DEFAULT_BATCH_MAX_TOKENS = 4096
+OPENAI_CHAT_CAPABILITY_PROVIDER = "openai-chat"
 
 
 class LLMClientConfigurationError(RuntimeError):
@@ -38,6 +50,7 @@ class AIGenerationRequest:
     slide: Slide
     intent: str
     reference_text: str | None = None
+    on_partial: Callable[[StreamEvent], None] | None = None
 
 
 @dataclass(slots=True)
@@ -51,6 +64,8 @@ class AIGenerationResponse:
     model: str = "mock-local"
     warnings: list[str] = field(default_factory=list)
     raw_text: str | None = None
+    first_token_ms: float | None = None
+    latency_ms: float | None = None
 
 
 @dataclass(slots=True)
@@ -77,6 +92,8 @@ class SlideMatchRequest:
     system_prompt: str
     candidates: list[SlideMatchCandidate]
     model: str | None = None
+    # 出力形式の指示を含まないカード・候補情報。バッチ問い合わせではこちらを埋め込む
+    context: str | None = None
 
 
 @dataclass(slots=True)
@@ -101,6 +118,20 @@ class LLMClient(Protocol):
         """カードと JobSpec スライドの対応付けを推論する。"""
 
 
+class BatchLLMClient(LLMClient, Protocol):
+    """複数スライドを 1 リクエストで生成できるクライアント。"""
+
+    def generate_batch(
+        self, requests: list[AIGenerationRequest]
+    ) -> list[AIGenerationResponse | None]:
+        """スライドごとの応答を入力順に返す。解析に失敗したスライドは None。"""
+
+    def match_slide_batch(
+        self, requests: list[SlideMatchRequest]
+    ) -> list[SlideMatchResponse | None]:
+        """複数カードの整合を 1 リクエストで推論する。解析に失敗したカードは None。"""
+
+
 def create_llm_client() -> LLMClient:
     """環境変数に基づき LLM クライアントを生成する。"""
 
@@ -120,6 +151,64 @@ def create_llm_client() -> LLMClient:
     raise LLMClientConfigurationError(msg)
 
 
+# create_llm_client と各クライアントの from_env が参照する環境変数の接頭辞
+_LLM_CONFIG_ENV_PREFIXES = ("PPTX_LLM_", "OPENAI_", "AZURE_OPENAI_", "ANTHROPIC_", "AWS_")
+
+
+def llm_client_config_key() -> str:
+    """LLM クライアントの生成に使う環境変数全体から、キャッシュ用のキーを求める。
+
+    API キーなどの値をそのまま保持しないよう sha256 に要約する。
+    """
+
+    items = sorted(
+        (name, value) for name, value in os.environ.items() if name.startswith(_LLM_CONFIG_ENV_PREFIXES)
+    )
+    return sha256(json.dumps(items).encode("utf-8")).hexdigest()
+
+
+def _stream_enabled() -> bool:
+    return os.getenv("PPTX_LLM_STREAM", "0").strip().lower() in {"1", "true", "on", "yes"}
+
+
+def _consume_generation_stream(
+    chunks: Iterable[str],
+    request: AIGenerationRequest,
+    *,
+    started_at: float,
+    close: Callable[[], object] | None = None,
+) -> StreamOutcome:
+    """ストリームを読み進め、本文上限を超えた時点で接続を閉じる。"""
+
+    try:
+        return consume_stream(
+            chunks,
+            max_body_lines=MAX_BODY_LINES,
+            started_at=started_at,
+            on_event=request.on_partial,
+        )
+    finally:
+        if callable(close):
+            close()
+
+
+def _finalize_response(
+    response: AIGenerationResponse,
+    *,
+    started_at: float,
+    outcome: StreamOutcome | None = None,
+) -> AIGenerationResponse:
+    """応答へレイテンシ情報（ストリーミング時は初回トークンまでの時間も）を付与する。"""
+
+    if outcome is None:
+        response.latency_ms = (time.perf_counter() - started_at) * 1000
+        return response
+    response.first_token_ms = outcome.first_token_ms
+    response.latency_ms = outcome.latency_ms
+    response.warnings.extend(outcome.warnings)
+    return response
+
+
 def _truncate(value: str, max_length: int) -> str:
     normalized = value.strip()
     if len(normalized) <= max_length:
@@ -159,7 +248,7 @@ def _build_user_prompt(request: AIGenerationRequest) -> str:
     guidance = instructions or textwrap.dedent(
         """
         以下の要件を必ず守って JSON 形式で回答してください。
-        - JSON オブジェクトのキーは title, body, note。
+        - JSON オブジェクトのキーは title, note, body の順に出力する。
         - body は文字列の配列で最大6行、各行40文字以内。
         - note が不要な場合は null を指定。
         - 日本語で回答する。
@@ -263,6 +352,123 @@ def _build_response_from_text(
     )
 
 
+def _batch_max_tokens() -> int:
+    raw = os.getenv("PPTX_LLM_BATCH_MAX_TOKENS", "").strip()
+    if not raw:
+        return DEFAULT_BATCH_MAX_TOKENS
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        logger.warning("PPTX_LLM_BATCH_MAX_TOKENS の値が不正なため既定値 %s を使用します: %s", DEFAULT_BATCH_MAX_TOKENS, raw)
+        return DEFAULT_BATCH_MAX_TOKENS
+    return value
+
+
+def _run_in_token_budget(
+    requests: list[RequestT],
+    tokens_per_request: int,
+    call: Callable[[list[RequestT], int], list[ResponseT]],
+) -> list[ResponseT]:
+    """出力トークン上限に収まる件数ずつに分けてバッチ問い合わせを行い、入力順に結果を返す。
+
+    1 件あたりの上限がバッチ上限を超える場合は 1 件ずつ単発と同じ上限で問い合わせる。
+    """
+
+    limit = _batch_max_tokens()
+    size = max(1, limit // tokens_per_request) if tokens_per_request > 0 else len(requests)
+    results: list[ResponseT] = []
+    for start in range(0, len(requests), size):
+        chunk = requests[start : start + size]
+        results.extend(call(chunk, tokens_per_request * len(chunk)))
+    return results
+
+
+def _build_batch_user_prompt(requests: list[AIGenerationRequest]) -> str:
+    """複数スライド分の生成指示を 1 つのプロンプトにまとめる。
+
+    参考テキストと共通指示は 1 回だけ含め、スライドごとの情報は slide_id で区別する。
+    """
+
+    first = requests[0]
+    instructions = first.policy.safeguards.get("user_instructions") if isinstance(first.policy.safeguards, dict) else None
+    guidance = textwrap.dedent(
+        """
+        以下の複数スライドについて、必ず次の JSON 形式で回答してください。
+        {"slides": [{"slide_id": "...", "title": "...", "body": ["..."], "note": null}]}
+        - slides 配列には入力されたすべての slide_id を 1 件ずつ含める。
+        - body は文字列の配列で最大6行、各行40文字以内。
+        - note が不要な場合は null を指定。
+        - 日本語で回答する。
+        """
+    ).strip()
+    if instructions:
+        guidance = f"{guidance}\n\n# 各スライド共通の要件\n{instructions}"
+    slide_sections = "\n\n".join(
+        f"## slide_id: {request.slide.id}\n{request.prompt}" for request in requests
+    )
+    reference_section = ""
+    if first.reference_text:
+        reference_section = f"\n\n# 参考テキスト\n{first.reference_text}"
+    return f"{guidance}\n\n# スライド情報\n{slide_sections}{reference_section}"
+
+
+def _split_batch_response(
+    text: str,
+    requests: list[AIGenerationRequest],
+    *,
+    model: str,
+    finish_reason: str | None = None,
+    refusal: str | None = None,
+) -> list[AIGenerationResponse | None]:
+    """バッチ応答をスライド単位に分割する。
+
+    解析できなかったスライドは ``None`` を返し、呼び出し側で単発リクエストへ切り替える。
+    """
+
+    if not text:
+        _LLM_LOGGER.warning(
+            "LLM batch response is empty",
+            extra={"model": model, "finish_reason": finish_reason or "", "refusal": refusal or ""},
+        )
+        return [None] * len(requests)
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        match = re.search(r"[\[{].*[\]}]", text, re.DOTALL)
+        try:
+            data = json.loads(match.group(0)) if match else None
+        except json.JSONDecodeError:
+            data = None
+    items = data.get("slides") if isinstance(data, dict) else data
+    if not isinstance(items, list):
+        _LLM_LOGGER.warning("LLM batch response is not a slide array", extra={"model": model})
+        return [None] * len(requests)
+
+    by_id: dict[str, dict[str, object]] = {}
+    for item in items:
+        if isinstance(item, dict) and item.get("slide_id") is not None:
+            by_id.setdefault(str(item["slide_id"]), item)
+    positional = len(by_id) == 0 and len(items) == len(requests)
+
+    results: list[AIGenerationResponse | None] = []
+    for index, request in enumerate(requests):
+        item = items[index] if positional else by_id.get(request.slide.id)
+        if not isinstance(item, dict) or not (item.get("title") or item.get("body")):
+            results.append(None)
+            continue
+        results.append(
+            _build_response_from_text(
+                json.dumps(item, ensure_ascii=False),
+                request,
+                model=model,
+                finish_reason=finish_reason,
+            )
+        )
+    return results
+
+
 def _normalize_confidence(value: object) -> float:
     try:
         confidence = float(value)
@@ -348,6 +554,70 @@ def _build_slide_match_response(
     )
 
 
+def _build_match_batch_prompt(requests: list[SlideMatchRequest]) -> str:
+    """複数カード分の整合指示を 1 つのプロンプトにまとめる。"""
+
+    guidance = textwrap.dedent(
+        """
+        以下の複数カードについて、それぞれ候補スライドから最も適切な slide_id を 1 つ選び、必ず次の JSON 形式で回答してください。
+        {"matches": [{"card_id": "...", "recommended_slide_id": "...", "confidence": 0.0, "reason": "..."}]}
+        - matches 配列には入力されたすべての card_id を 1 件ずつ含める。
+        - confidence は 0.0～1.0 の数値とする。
+        """
+    ).strip()
+    sections = "\n\n".join(
+        f"## card_id: {request.card_id}\n{request.context if request.context is not None else request.prompt}"
+        for request in requests
+    )
+    return f"{guidance}\n\n{sections}"
+
+
+def _split_match_batch_response(
+    text: str,
+    requests: list[SlideMatchRequest],
+    *,
+    model: str,
+    finish_reason: str | None = None,
+    refusal: str | None = None,
+) -> list[SlideMatchResponse | None]:
+    """バッチ応答をカード単位に分割する。含まれなかったカードは None。"""
+
+    if not text:
+        _LLM_LOGGER.warning(
+            "LLM slide match batch response is empty",
+            extra={"model": model, "finish_reason": finish_reason or "", "refusal": refusal or ""},
+        )
+        return [None] * len(requests)
+    try:
+        data = _extract_json_from_text(text)
+    except json.JSONDecodeError:
+        data = None
+    items = data.get("matches") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        _LLM_LOGGER.warning("LLM slide match batch response is not a match array", extra={"model": model})
+        return [None] * len(requests)
+
+    by_id: dict[str, dict[str, object]] = {}
+    for item in items:
+        if isinstance(item, dict) and item.get("card_id") is not None:
+            by_id.setdefault(str(item["card_id"]), item)
+    results: list[SlideMatchResponse | None] = []
+    for request in requests:
+        item = by_id.get(request.card_id)
+        if item is None:
+            results.append(None)
+            continue
+        results.append(
+            _build_slide_match_response(
+                json.dumps(item, ensure_ascii=False),
+                request,
+                model=model,
+                finish_reason=finish_reason,
+            )
+        )
+    return results
+
+
 class MockLLMClient:
     """開発用のモック LLM クライアント。"""
 
@@ -391,6 +661,24 @@ class MockLLMClient:
             raw_text=json.dumps(raw_payload, ensure_ascii=False),
         )
 
+    def generate_batch(
+        self, requests: list[AIGenerationRequest]
+    ) -> list[AIGenerationResponse | None]:
+        slides_payload = []
+        for request in requests:
+            response = self.generate(request)
+            slides_payload.append(
+                {
+                    "slide_id": request.slide.id,
+                    "title": response.title,
+                    "body": response.body,
+                    "note": response.note,
+                    "intent": response.intent,
+                }
+            )
+        text = json.dumps({"slides": slides_payload}, ensure_ascii=False)
+        return _split_batch_response(text, requests, model=requests[0].policy.model)
+
     def match_slide(self, request: SlideMatchRequest) -> SlideMatchResponse:
         if not request.candidates:
             return SlideMatchResponse(
@@ -441,20 +729,36 @@ class MockLLMClient:
             model="mock-local",
         )
 
+    def match_slide_batch(
+        self, requests: list[SlideMatchRequest]
+    ) -> list[SlideMatchResponse | None]:
+        return [self.match_slide(request) for request in requests]
+
 
 class OpenAIChatClient:
     """OpenAI Chat Completions API クライアント。"""
 
-    def __init__(self, client, *, model: str, temperature: float, max_tokens: int) -> None:
+    def __init__(
+        self,
+        client,
+        *,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        capabilities: ProviderCapabilityRegistry | None = None,
+        stream: bool = False,
+    ) -> None:
         self._client = client
         self._model = model
         self._temperature = temperature
         self._max_tokens = max_tokens
+        self._capabilities = capabilities
+        self._stream = stream
 
     @classmethod
     def from_env(cls) -> "OpenAIChatClient":
         try:
-            from openai import OpenAI
+            import openai  # noqa: F401
         except ImportError as exc:  # pragma: no cover - missing optional dependency
             msg = "openai パッケージが必要です。`pip install openai` を実行してください。"
             raise LLMClientConfigurationError(msg) from exc
@@ -467,68 +771,107 @@ class OpenAIChatClient:
         model = os.getenv("OPENAI_MODEL", "gpt-5-mini")
         temperature = float(os.getenv("OPENAI_TEMPERATURE", "0.3"))
         max_tokens = int(os.getenv("OPENAI_MAX_TOKENS", str(DEFAULT_MAX_TOKENS)))
-        client = OpenAI(api_key=api_key, base_url=base_url) if base_url else OpenAI(api_key=api_key)
-        return cls(client, model=model, temperature=temperature, max_tokens=max_tokens)
+        client = shared_sdk_clients.openai(api_key=api_key, base_url=base_url)
+        return cls(
+            client,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=_stream_enabled(),
+        )
 
     def generate(self, request: AIGenerationRequest) -> AIGenerationResponse:
+        model_name = self._resolve_model(request)
         messages = [
             {"role": "system", "content": _build_system_prompt(request)},
             {"role": "user", "content": _build_user_prompt(request)},
         ]
+        log_extra = {"slide_id": request.slide.id}
+        started_at = time.perf_counter()
+        if self._stream:
+            stream = self._create_completion(
+                messages,
+                model_name=model_name,
+                max_tokens=self._max_tokens,
+                log_extra=log_extra,
+                stream=True,
+            )
+            state: dict[str, str | None] = {"finish_reason": None, "refusal": None}
+            outcome = _consume_generation_stream(
+                _iter_openai_chat_stream(stream, state),
+                request,
+                started_at=started_at,
+                close=getattr(stream, "close", None),
+            )
+            response = _build_response_from_text(
+                outcome.text,
+                request,
+                model=model_name,
+                finish_reason=state["finish_reason"],
+                refusal=state["refusal"],
+            )
+            return _finalize_response(response, started_at=started_at, outcome=outcome)
+        text, finish_reason, refusal = self._complete(
+            messages,
+            model_name=model_name,
+            max_tokens=self._max_tokens,
+            log_extra=log_extra,
+        )
+        response = _build_response_from_text(
+            text,
+            request,
+            model=model_name,
+            finish_reason=finish_reason,
+            refusal=refusal,
+        )
+        return _finalize_response(response, started_at=started_at)
+
+    def generate_batch(
+        self, requests: list[AIGenerationRequest]
+    ) -> list[AIGenerationResponse | None]:
+        return _run_in_token_budget(requests, self._max_tokens, self._generate_batch_chunk)
+
+    def _generate_batch_chunk(
+        self, requests: list[AIGenerationRequest], max_tokens: int
+    ) -> list[AIGenerationResponse | None]:
+        model_name = self._resolve_model(requests[0])
+        text, finish_reason, refusal = self._complete(
+            [
+                {"role": "system", "content": _build_system_prompt(requests[0])},
+                {"role": "user", "content": _build_batch_user_prompt(requests)},
+            ],
+            model_name=model_name,
+            max_tokens=max_tokens,
+            log_extra={"slide_id": ",".join(request.slide.id for request in requests)},
+        )
+        return _split_batch_response(
+            text,
+            requests,
+            model=model_name,
+            finish_reason=finish_reason,
+            refusal=refusal,
+        )
+
+    def _resolve_model(self, request: AIGenerationRequest) -> str:
         model_name = request.policy.model or self._model
         if model_name == "mock-local":
             model_name = self._model
-        kwargs: dict[str, object] = {
-            "model": model_name,
-            "messages": messages,
-            "temperature": self._temperature,
-            "response_format": {"type": "json_object"},
-        }
-        if self._max_tokens > 0:
-            kwargs["max_completion_tokens"] = self._max_tokens
-        for _ in range(3):
-            try:
-                response = self._client.chat.completions.create(  # type: ignore[attr-defined]
-                    **kwargs,
-                )
-                break
-            except Exception as exc:  # noqa: BLE001
-                _LLM_LOGGER.warning(
-                    "OpenAI chat completion error: %s",
-                    exc,
-                    extra={
-                        "model": model_name,
-                        "slide_id": request.slide.id,
-                    },
-                )
-                message = str(exc).lower()
-                if (
-                    "max_completion_tokens" in message
-                    and "max_tokens" in message
-                    and "max_completion_tokens" in kwargs
-                ):
-                    kwargs.pop("max_completion_tokens", None)
-                    if self._max_tokens > 0:
-                        kwargs["max_tokens"] = self._max_tokens
-                    continue
-                if (
-                    "max_tokens" in message
-                    and "max_completion_tokens" in message
-                    and "max_tokens" in kwargs
-                ):
-                    kwargs.pop("max_tokens", None)
-                    if self._max_tokens > 0:
-                        kwargs["max_completion_tokens"] = self._max_tokens
-                    continue
-                if "temperature" in message and "unsupported" in message:
-                    kwargs["temperature"] = 1.0
-                    continue
-                if "response_format" in message and "not" in message and "support" in message:
-                    kwargs.pop("response_format", None)
-                    continue
-                raise
-        else:  # pragma: no cover - safeguard
-            raise RuntimeError("OpenAI API call failed after applying compatibility fallbacks")
+        return model_name
+
+    def _complete(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model_name: str,
+        max_tokens: int,
+        log_extra: dict[str, str],
+    ) -> tuple[str, str | None, str | None]:
+        response = self._create_completion(
+            messages,
+            model_name=model_name,
+            max_tokens=max_tokens,
+            log_extra=log_extra,
+        )
         choice = response.choices[0]  # type: ignore[index]
         message = choice.message
         content = getattr(message, "content", None)
@@ -538,30 +881,33 @@ class OpenAIChatClient:
             text = ""
         else:
             text = "".join(str(part) for part in content)
-        return _build_response_from_text(
-            text,
-            request,
-            model=model_name,
-            finish_reason=getattr(choice, "finish_reason", None),
-            refusal=getattr(message, "refusal", None),
-        )
+        return text, getattr(choice, "finish_reason", None), getattr(message, "refusal", None)
+
+    def _create_completion(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        model_name: str,
+        max_tokens: int,
+        log_extra: dict[str, str],
+        stream: bool = False,
+    ):
+        """互換性フォールバックを適用しながら Chat Completions を呼び出す。"""
 
-    def match_slide(self, request: SlideMatchRequest) -> SlideMatchResponse:
-        messages = [
-            {"role": "system", "content": request.system_prompt},
-            {"role": "user", "content": request.prompt},
-        ]
-        model_name = request.model or self._model
-        if model_name == "mock-local":
-            model_name = self._model
         kwargs: dict[str, object] = {
             "model": model_name,
             "messages": messages,
             "temperature": self._temperature,
             "response_format": {"type": "json_object"},
         }
-        if self._max_tokens > 0:
-            kwargs["max_completion_tokens"] = self._max_tokens
+        if max_tokens > 0:
+            kwargs["max_completion_tokens"] = max_tokens
+        if stream:
+            kwargs["stream"] = True
+        capabilities = self._capabilities or shared_capability_registry()
+        known = capabilities.lookup(OPENAI_CHAT_CAPABILITY_PROVIDER, model_name)
+        if known is not None:
+            capabilities.note_avoided(_apply_chat_variant(kwargs, known.variant, max_tokens))
         for _ in range(3):
             try:
                 response = self._client.chat.completions.create(  # type: ignore[attr-defined]
@@ -574,7 +920,7 @@ class OpenAIChatClient:
                     exc,
                     extra={
                         "model": model_name,
-                        "card_id": request.card_id,
+                        **log_extra,
                     },
                 )
                 message = str(exc).lower()
@@ -584,8 +930,8 @@ class OpenAIChatClient:
                     and "max_completion_tokens" in kwargs
                 ):
                     kwargs.pop("max_completion_tokens", None)
-                    if self._max_tokens > 0:
-                        kwargs["max_tokens"] = self._max_tokens
+                    if max_tokens > 0:
+                        kwargs["max_tokens"] = max_tokens
                     continue
                 if (
                     "max_tokens" in message
@@ -593,33 +939,123 @@ class OpenAIChatClient:
                     and "max_tokens" in kwargs
                 ):
                     kwargs.pop("max_tokens", None)
-                    if self._max_tokens > 0:
-                        kwargs["max_completion_tokens"] = self._max_tokens
+                    if max_tokens > 0:
+                        kwargs["max_completion_tokens"] = max_tokens
+                    continue
+                if "temperature" in message and "unsupported" in message:
+                    kwargs["temperature"] = 1.0
                     continue
                 if "response_format" in message and "not" in message and "support" in message:
                     kwargs.pop("response_format", None)
                     continue
                 raise
         else:  # pragma: no cover - safeguard
-            raise RuntimeError("OpenAI API match call failed after applying compatibility fallbacks")
-        choice = response.choices[0]  # type: ignore[index]
-        message = choice.message
-        content = getattr(message, "content", None)
-        if isinstance(content, str):
-            text = content
-        elif content is None:
-            text = ""
-        else:
-            text = "".join(str(part) for part in content)
+            raise RuntimeError("OpenAI API call failed after applying compatibility fallbacks")
+        variant = _chat_variant(kwargs, default_temperature=self._temperature)
+        if variant or known is not None:
+            capabilities.record(OPENAI_CHAT_CAPABILITY_PROVIDER, model_name, variant=variant)
+        return response
+
+    def match_slide(self, request: SlideMatchRequest) -> SlideMatchResponse:
+        model_name = request.model or self._model
+        if model_name == "mock-local":
+            model_name = self._model
+        text, finish_reason, refusal = self._complete(
+            [
+                {"role": "system", "content": request.system_prompt},
+                {"role": "user", "content": request.prompt},
+            ],
+            model_name=model_name,
+            max_tokens=self._max_tokens,
+            log_extra={"card_id": request.card_id},
+        )
         return _build_slide_match_response(
             text,
             request,
             model=model_name,
-            finish_reason=getattr(choice, "finish_reason", None),
-            refusal=getattr(message, "refusal", None),
+            finish_reason=finish_reason,
+            refusal=refusal,
+        )
+
+    def match_slide_batch(
+        self, requests: list[SlideMatchRequest]
+    ) -> list[SlideMatchResponse | None]:
+        return _run_in_token_budget(requests, self._max_tokens, self._match_slide_batch_chunk)
+
+    def _match_slide_batch_chunk(
+        self, requests: list[SlideMatchRequest], max_tokens: int
+    ) -> list[SlideMatchResponse | None]:
+        model_name = requests[0].model or self._model
+        if model_name == "mock-local":
+            model_name = self._model
+        text, finish_reason, refusal = self._complete(
+            [
+                {"role": "system", "content": requests[0].system_prompt},
+                {"role": "user", "content": _build_match_batch_prompt(requests)},
+            ],
+            model_name=model_name,
+            max_tokens=max_tokens,
+            log_extra={"card_id": ",".join(request.card_id for request in requests)},
+        )
+        return _split_match_batch_response(
+            text,
+            requests,
+            model=model_name,
+            finish_reason=finish_reason,
+            refusal=refusal,
         )
 
 
+def _iter_openai_chat_stream(stream, state: dict[str, str | None]) -> Iterator[str]:
+    """Chat Completions のストリームから本文の差分を取り出す。"""
+
+    for chunk in stream:
+        choices = getattr(chunk, "choices", None) or []
+        if not choices:
+            continue
+        choice = choices[0]
+        if getattr(choice, "finish_reason", None):
+            state["finish_reason"] = choice.finish_reason
+        delta = getattr(choice, "delta", None)
+        refusal = getattr(delta, "refusal", None)
+        if refusal:
+            state["refusal"] = (state["refusal"] or "") + refusal
+        content = getattr(delta, "content", None)
+        if content:
+            yield content
+
+
+def _apply_chat_variant(kwargs: dict[str, object], variant: dict[str, object], max_tokens: int) -> int:
+    """記録済みのパラメータ構成を適用し、省略できたリトライ回数を返す。"""
+
+    avoided = 0
+    if variant.get("token_param") == "max_tokens" and "max_completion_tokens" in kwargs:
+        kwargs.pop("max_completion_tokens", None)
+        if max_tokens > 0:
+            kwargs["max_tokens"] = max_tokens
+        avoided += 1
+    if "temperature" in variant:
+        kwargs["temperature"] = variant["temperature"]
+        avoided += 1
+    if variant.get("response_format") is False and "response_format" in kwargs:
+        kwargs.pop("response_format", None)
+        avoided += 1
+    return avoided
+
+
+def _chat_variant(kwargs: dict[str, object], *, default_temperature: float) -> dict[str, object]:
+    """成功したリクエストのうち既定値から変更したパラメータを抽出する。"""
+
+    variant: dict[str, object] = {}
+    if "max_tokens" in kwargs:
+        variant["token_param"] = "max_tokens"
+    if kwargs.get("temperature") != default_temperature:
+        variant["temperature"] = kwargs.get("temperature")
+    if "response_format" not in kwargs:
+        variant["response_format"] = False
+    return variant
+
+
 class AzureOpenAIChatClient:
     """Azure OpenAI Chat Completions API クライアント。"""
 
@@ -631,17 +1067,19 @@ class AzureOpenAIChatClient:
         api_version: str,
         temperature: float,
         max_tokens: int,
+        stream: bool = False,
     ) -> None:
         self._client = client
         self._deployment = deployment
         self._api_version = api_version
         self._temperature = temperature
         self._max_tokens = max_tokens
+        self._stream = stream
 
     @classmethod
     def from_env(cls) -> "AzureOpenAIChatClient":
         try:
-            from openai import AzureOpenAI
+            import openai  # noqa: F401
         except ImportError as exc:  # pragma: no cover - missing optional dependency
             msg = "openai パッケージが必要です。`pip install openai` を実行してください。"
             raise LLMClientConfigurationError(msg) from exc
@@ -662,30 +1100,101 @@ class AzureOpenAIChatClient:
             if lowered.endswith(suffix):
                 endpoint = endpoint[: -len(suffix)]
                 lowered = endpoint.lower()
-        client = AzureOpenAI(api_key=api_key, api_version=api_version, azure_endpoint=endpoint)
-        return cls(client, deployment=deployment, api_version=api_version, temperature=temperature, max_tokens=max_tokens)
+        client = shared_sdk_clients.azure_openai(api_key=api_key, endpoint=endpoint, api_version=api_version)
+        return cls(
+            client,
+            deployment=deployment,
+            api_version=api_version,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            stream=_stream_enabled(),
+        )
 
     def generate(self, request: AIGenerationRequest) -> AIGenerationResponse:
+        deployment = self._resolve_deployment(request)
         messages = [
             {"role": "system", "content": _build_system_prompt(request)},
             {"role": "user", "content": _build_user_prompt(request)},
         ]
+        started_at = time.perf_counter()
+        if self._stream:
+            stream = self._client.responses.create(  # type: ignore[attr-defined]
+                **self._response_kwargs(messages, deployment=deployment, max_tokens=self._max_tokens),
+                stream=True,
+            )
+            state: dict[str, str | None] = {"finish_reason": None, "refusal": None}
+            outcome = _consume_generation_stream(
+                _iter_azure_response_stream(stream, state),
+                request,
+                started_at=started_at,
+                close=getattr(stream, "close", None),
+            )
+            response = _build_response_from_text(
+                outcome.text,
+                request,
+                model=deployment,
+                finish_reason=state["finish_reason"],
+                refusal=state["refusal"],
+            )
+            return _finalize_response(response, started_at=started_at, outcome=outcome)
+        raw_text, finish_reason, refusal_text = self._respond(
+            messages,
+            deployment=deployment,
+            max_tokens=self._max_tokens,
+        )
+        response = _build_response_from_text(
+            raw_text,
+            request,
+            model=deployment,
+            finish_reason=finish_reason,
+            refusal=refusal_text,
+        )
+        return _finalize_response(response, started_at=started_at)
+
+    def generate_batch(
+        self, requests: list[AIGenerationRequest]
+    ) -> list[AIGenerationResponse | None]:
+        return _run_in_token_budget(requests, self._max_tokens, self._generate_batch_chunk)
+
+    def _generate_batch_chunk(
+        self, requests: list[AIGenerationRequest], max_tokens: int
+    ) -> list[AIGenerationResponse | None]:
+        deployment = self._resolve_deployment(requests[0])
+        raw_text, finish_reason, refusal_text = self._respond(
+            [
+                {"role": "system", "content": _build_system_prompt(requests[0])},
+                {"role": "user", "content": _build_batch_user_prompt(requests)},
+            ],
+            deployment=deployment,
+            max_tokens=max_tokens,
+        )
+        return _split_batch_response(
+            raw_text,
+            requests,
+            model=deployment,
+            finish_reason=finish_reason,
+            refusal=refusal_text,
+        )
+
+    def _resolve_deployment(self, request: AIGenerationRequest) -> str:
         deployment = request.policy.model or self._deployment
         if deployment == "mock-local":
             deployment = self._deployment
+        return deployment
+
+    def _respond(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        deployment: str,
+        max_tokens: int,
+    ) -> tuple[str, str | None, str | None]:
         from openai.types.responses import ResponseOutputMessage
         from openai.types.responses.response_output_text import ResponseOutputText
         from openai.types.responses.response_output_refusal import ResponseOutputRefusal
 
-        kwargs: dict[str, object] = {
-            "model": deployment,
-            "input": messages,
-            "temperature": self._temperature,
-        }
-        if self._max_tokens > 0:
-            kwargs["max_output_tokens"] = self._max_tokens
         response = self._client.responses.create(  # type: ignore[attr-defined]
-            **kwargs,
+            **self._response_kwargs(messages, deployment=deployment, max_tokens=max_tokens),
         )
 
         text_segments: list[str] = []
@@ -700,32 +1209,89 @@ class AzureOpenAIChatClient:
 
         raw_text = "\n".join(segment.strip() for segment in text_segments if segment.strip())
         refusal_text = "\n".join(segment.strip() for segment in refusal_segments if segment.strip()) or None
-        return _build_response_from_text(
+        finish_reason = (
+            response.incomplete_details.reason if getattr(response, "incomplete_details", None) else None
+        )
+        return raw_text, finish_reason, refusal_text
+
+    def _response_kwargs(
+        self,
+        messages: list[dict[str, str]],
+        *,
+        deployment: str,
+        max_tokens: int,
+    ) -> dict[str, object]:
+        kwargs: dict[str, object] = {
+            "model": deployment,
+            "input": messages,
+            "temperature": self._temperature,
+        }
+        if max_tokens > 0:
+            kwargs["max_output_tokens"] = max_tokens
+        return kwargs
+
+    def match_slide(self, request: SlideMatchRequest) -> SlideMatchResponse:
+        deployment = request.model or self._deployment
+        if deployment == "mock-local":
+            deployment = self._deployment
+        raw_text, finish_reason, refusal_text = self._match_text(
+            request.system_prompt, request.prompt, deployment=deployment, max_tokens=self._max_tokens
+        )
+        return _build_slide_match_response(
             raw_text,
             request,
             model=deployment,
-            finish_reason=(response.incomplete_details.reason if getattr(response, "incomplete_details", None) else None),
+            finish_reason=finish_reason,
             refusal=refusal_text,
         )
 
-    def match_slide(self, request: SlideMatchRequest) -> SlideMatchResponse:
+    def match_slide_batch(
+        self, requests: list[SlideMatchRequest]
+    ) -> list[SlideMatchResponse | None]:
+        return _run_in_token_budget(requests, self._max_tokens, self._match_slide_batch_chunk)
+
+    def _match_slide_batch_chunk(
+        self, requests: list[SlideMatchRequest], max_tokens: int
+    ) -> list[SlideMatchResponse | None]:
+        deployment = requests[0].model or self._deployment
+        if deployment == "mock-local":
+            deployment = self._deployment
+        raw_text, finish_reason, refusal_text = self._match_text(
+            requests[0].system_prompt,
+            _build_match_batch_prompt(requests),
+            deployment=deployment,
+            max_tokens=max_tokens,
+        )
+        return _split_match_batch_response(
+            raw_text,
+            requests,
+            model=deployment,
+            finish_reason=finish_reason,
+            refusal=refusal_text,
+        )
+
+    def _match_text(
+        self,
+        system_prompt: str,
+        prompt: str,
+        *,
+        deployment: str,
+        max_tokens: int,
+    ) -> tuple[str, str | None, str | None]:
         from openai.types.responses import ResponseOutputMessage
         from openai.types.responses.response_output_text import ResponseOutputText
         from openai.types.responses.response_output_refusal import ResponseOutputRefusal
 
-        deployment = request.model or self._deployment
-        if deployment == "mock-local":
-            deployment = self._deployment
         kwargs: dict[str, object] = {
             "model": deployment,
             "input": [
-                {"role": "system", "content": request.system_prompt},
-                {"role": "user", "content": request.prompt},
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
             ],
             "temperature": self._temperature,
         }
-        if self._max_tokens > 0:
-            kwargs["max_output_tokens"] = self._max_tokens
+        if max_tokens > 0:
+            kwargs["max_output_tokens"] = max_tokens
         response = self._client.responses.create(  # type: ignore[attr-defined]
             **kwargs,
         )
@@ -742,27 +1308,39 @@ class AzureOpenAIChatClient:
 
         raw_text = "\n".join(segment.strip() for segment in text_segments if segment.strip())
         refusal_text = "\n".join(segment.strip() for segment in refusal_segments if segment.strip()) or None
-        return _build_slide_match_response(
-            raw_text,
-            request,
-            model=deployment,
-            finish_reason=(response.incomplete_details.reason if getattr(response, "incomplete_details", None) else None),
-            refusal=refusal_text,
+        finish_reason = (
+            response.incomplete_details.reason if getattr(response, "incomplete_details", None) else None
         )
+        return raw_text, finish_reason, refusal_text
+
+
+def _iter_azure_response_stream(stream, state: dict[str, str | None]) -> Iterator[str]:
+    """Responses API のストリームイベントから本文の差分を取り出す。"""
+
+    for event in stream:
+        event_type = getattr(event, "type", "")
+        if event_type == "response.output_text.delta":
+            yield getattr(event, "delta", "")
+        elif event_type == "response.refusal.delta":
+            state["refusal"] = (state["refusal"] or "") + getattr(event, "delta", "")
+        elif event_type == "response.incomplete":
+            details = getattr(getattr(event, "response", None), "incomplete_details", None)
+            state["finish_reason"] = getattr(details, "reason", None)
 
 
 class AnthropicClaudeClient:
     """Anthropic Claude API クライアント。"""
 
-    def __init__(self, client, *, model: str, max_tokens: int) -> None:
+    def __init__(self, client, *, model: str, max_tokens: int, stream: bool = False) -> None:
         self._client = client
         self._model = model
         self._max_tokens = max_tokens
+        self._stream = stream
 
     @classmethod
     def from_env(cls) -> "AnthropicClaudeClient":
         try:
-            from anthropic import Anthropic
+            import anthropic  # noqa: F401
         except ImportError as exc:  # pragma: no cover - missing optional dependency
             msg = "anthropic パッケージが必要です。`pip install anthropic` を実行してください。"
             raise LLMClientConfigurationError(msg) from exc
@@ -772,43 +1350,128 @@ class AnthropicClaudeClient:
             raise LLMClientConfigurationError("ANTHROPIC_API_KEY が設定されていません")
         model = os.getenv("ANTHROPIC_MODEL", "claude-3-haiku-20240307")
         max_tokens = int(os.getenv("ANTHROPIC_MAX_TOKENS", str(DEFAULT_MAX_TOKENS)))
-        client = Anthropic(api_key=api_key)
-        return cls(client, model=model, max_tokens=max_tokens)
+        client = shared_sdk_clients.anthropic(api_key=api_key)
+        return cls(client, model=model, max_tokens=max_tokens, stream=_stream_enabled())
 
     def generate(self, request: AIGenerationRequest) -> AIGenerationResponse:
-        messages = [
-            {
-                "role": "user",
-                "content": [
-                    {
-                        "type": "text",
-                        "text": _build_user_prompt(request),
-                    }
-                ],
-            }
-        ]
+        model_name = self._resolve_model(request)
+        system = _build_system_prompt(request)
+        user_text = _build_user_prompt(request)
+        started_at = time.perf_counter()
+        if self._stream:
+            stream = self._client.messages.create(  # type: ignore[attr-defined]
+                **self._message_kwargs(
+                    system=system,
+                    user_text=user_text,
+                    model_name=model_name,
+                    max_tokens=self._max_tokens,
+                ),
+                stream=True,
+            )
+            outcome = _consume_generation_stream(
+                _iter_anthropic_stream(stream),
+                request,
+                started_at=started_at,
+                close=getattr(stream, "close", None),
+            )
+            response = _build_response_from_text(outcome.text, request, model=model_name)
+            return _finalize_response(response, started_at=started_at, outcome=outcome)
+        text = self._create_message(
+            system=system,
+            user_text=user_text,
+            model_name=model_name,
+            max_tokens=self._max_tokens,
+        )
+        return _finalize_response(
+            _build_response_from_text(text, request, model=model_name),
+            started_at=started_at,
+        )
+
+    def generate_batch(
+        self, requests: list[AIGenerationRequest]
+    ) -> list[AIGenerationResponse | None]:
+        return _run_in_token_budget(requests, self._max_tokens, self._generate_batch_chunk)
+
+    def _generate_batch_chunk(
+        self, requests: list[AIGenerationRequest], max_tokens: int
+    ) -> list[AIGenerationResponse | None]:
+        model_name = self._resolve_model(requests[0])
+        text = self._create_message(
+            system=_build_system_prompt(requests[0]),
+            user_text=_build_batch_user_prompt(requests),
+            model_name=model_name,
+            max_tokens=max_tokens,
+        )
+        return _split_batch_response(text, requests, model=model_name)
+
+    def _resolve_model(self, request: AIGenerationRequest) -> str:
         model_name = request.policy.model or self._model
         if model_name == "mock-local":
             model_name = self._model
+        return model_name
+
+    def _create_message(self, *, system: str, user_text: str, model_name: str, max_tokens: int) -> str:
         response = self._client.messages.create(  # type: ignore[attr-defined]
-            model=model_name,
-            system=_build_system_prompt(request),
-            max_tokens=self._max_tokens,
-            temperature=float(os.getenv("ANTHROPIC_TEMPERATURE", "0.3")),
-            messages=messages,
+            **self._message_kwargs(
+                system=system,
+                user_text=user_text,
+                model_name=model_name,
+                max_tokens=max_tokens,
+            )
         )
         text_parts = [block.text for block in response.content if getattr(block, "type", None) == "text"]
-        text = "\n".join(text_parts)
-        return _build_response_from_text(text, request, model=model_name)
+        return "\n".join(text_parts)
+
+    def _message_kwargs(self, *, system: str, user_text: str, model_name: str, max_tokens: int) -> dict[str, object]:
+        return {
+            "model": model_name,
+            "system": system,
+            "max_tokens": max_tokens,
+            "temperature": float(os.getenv("ANTHROPIC_TEMPERATURE", "0.3")),
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": user_text,
+                        }
+                    ],
+                }
+            ],
+        }
 
     def match_slide(self, request: SlideMatchRequest) -> SlideMatchResponse:
         model_name = request.model or self._model
         if model_name == "mock-local":
             model_name = self._model
+        text = self._match_text(request.system_prompt, request.prompt, model_name=model_name, max_tokens=self._max_tokens)
+        return _build_slide_match_response(text, request, model=model_name)
+
+    def match_slide_batch(
+        self, requests: list[SlideMatchRequest]
+    ) -> list[SlideMatchResponse | None]:
+        return _run_in_token_budget(requests, self._max_tokens, self._match_slide_batch_chunk)
+
+    def _match_slide_batch_chunk(
+        self, requests: list[SlideMatchRequest], max_tokens: int
+    ) -> list[SlideMatchResponse | None]:
+        model_name = requests[0].model or self._model
+        if model_name == "mock-local":
+            model_name = self._model
+        text = self._match_text(
+            requests[0].system_prompt,
+            _build_match_batch_prompt(requests),
+            model_name=model_name,
+            max_tokens=max_tokens,
+        )
+        return _split_match_batch_response(text, requests, model=model_name)
+
+    def _match_text(self, system_prompt: str, prompt: str, *, model_name: str, max_tokens: int) -> str:
         response = self._client.messages.create(  # type: ignore[attr-defined]
             model=model_name,
-            system=request.system_prompt,
-            max_tokens=self._max_tokens,
+            system=system_prompt,
+            max_tokens=max_tokens,
             temperature=float(os.getenv("ANTHROPIC_TEMPERATURE", "0.3")),
             messages=[
                 {
@@ -816,15 +1479,39 @@ class AnthropicClaudeClient:
                     "content": [
                         {
                             "type": "text",
-                            "text": request.prompt,
+                            "text": prompt,
                         }
                     ],
                 }
             ],
         )
         text_parts = [block.text for block in response.content if getattr(block, "type", None) == "text"]
-        text = "\n".join(text_parts)
-        return _build_slide_match_response(text, request, model=model_name)
+        return "\n".join(text_parts)
+
+
+def _iter_anthropic_stream(stream) -> Iterator[str]:
+    """Messages API のストリームイベントから本文の差分を取り出す。"""
+
+    for event in stream:
+        if getattr(event, "type", None) != "content_block_delta":
+            continue
+        text = getattr(getattr(event, "delta", None), "text", None)
+        if text:
+            yield text
+
+
+def _iter_bedrock_stream(body) -> Iterator[str]:
+    """InvokeModelWithResponseStream のイベントから本文の差分を取り出す。"""
+
+    for item in body or []:
+        chunk = item.get("chunk") if isinstance(item, dict) else None
+        if not chunk:
+            continue
+        event = json.loads(chunk.get("bytes", b"{}"))
+        if event.get("type") == "content_block_delta":
+            text = event.get("delta", {}).get("text")
+            if text:
+                yield text
 
 
 class AwsClaudeClient:
@@ -837,16 +1524,18 @@ class AwsClaudeClient:
         model_id: str,
         max_tokens: int,
         inference_profile_arn: str | None,
+        stream: bool = False,
     ) -> None:
         self._client = runtime_client
         self._model_id = model_id
         self._max_tokens = max_tokens
         self._inference_profile_arn = inference_profile_arn
+        self._stream = stream
 
     @classmethod
     def from_env(cls) -> "AwsClaudeClient":
         try:
-            import boto3
+            import boto3  # noqa: F401
             from botocore.exceptions import NoCredentialsError
         except ImportError as exc:  # pragma: no cover - missing optional dependency
             msg = "boto3 パッケージが必要です。`pip install boto3` を実行してください。"
@@ -857,65 +1546,88 @@ class AwsClaudeClient:
         region = os.getenv("AWS_REGION")
         profile = os.getenv("AWS_PROFILE")
 
-        session_kwargs: dict[str, object] = {}
-        if profile:
-            session_kwargs["profile_name"] = profile
-        if region:
-            session_kwargs["region_name"] = region
-        session = boto3.Session(**session_kwargs)
-        credentials = session.get_credentials()
-        if credentials is None:
-            raise LLMClientConfigurationError(
-                "AWS 認証情報が見つかりません。AWS_ACCESS_KEY_ID/AWS_SECRET_ACCESS_KEY を設定するか、`aws configure` で設定してください。"
-            )
-
-        client_kwargs: dict[str, object] = {}
-        if region:
-            client_kwargs["region_name"] = region
         try:
-            runtime_client = session.client("bedrock-runtime", **client_kwargs)
+            runtime_client = shared_sdk_clients.bedrock_runtime(profile=profile, region=region)
         except NoCredentialsError as exc:
             raise LLMClientConfigurationError(
                 "AWS 認証情報を利用できません。環境変数または共有クレデンシャルで設定してください。"
             ) from exc
+        if runtime_client is None:
+            raise LLMClientConfigurationError(
+                "AWS 認証情報が見つかりません。AWS_ACCESS_KEY_ID/AWS_SECRET_ACCESS_KEY を設定するか、`aws configure` で設定してください。"
+            )
         max_tokens = int(os.getenv("AWS_CLAUDE_MAX_TOKENS", str(DEFAULT_MAX_TOKENS)))
         return cls(
             runtime_client,
             model_id=model_id,
             max_tokens=max_tokens,
             inference_profile_arn=inference_profile_arn,
+            stream=_stream_enabled(),
         )
 
     def generate(self, request: AIGenerationRequest) -> AIGenerationResponse:
-        payload = {
-            "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": self._max_tokens,
-            "temperature": float(os.getenv("AWS_CLAUDE_TEMPERATURE", "0.3")),
-            "system": _build_system_prompt(request),
-            "messages": [
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": _build_user_prompt(request),
-                        }
-                    ],
-                }
-            ],
-        }
+        model_id = self._resolve_model(request)
+        system = _build_system_prompt(request)
+        user_text = _build_user_prompt(request)
+        started_at = time.perf_counter()
+        if self._stream:
+            invoke_kwargs = self._invoke_kwargs(
+                system=system,
+                user_text=user_text,
+                model_id=model_id,
+                max_tokens=self._max_tokens,
+            )
+            response = self._client.invoke_model_with_response_stream(**invoke_kwargs)
+            body = response.get("body")
+            outcome = _consume_generation_stream(
+                _iter_bedrock_stream(body),
+                request,
+                started_at=started_at,
+                close=getattr(body, "close", None),
+            )
+            generated = _build_response_from_text(outcome.text, request, model=model_id)
+            return _finalize_response(generated, started_at=started_at, outcome=outcome)
+        text = self._invoke(
+            system=system,
+            user_text=user_text,
+            model_id=model_id,
+            max_tokens=self._max_tokens,
+        )
+        return _finalize_response(
+            _build_response_from_text(text, request, model=model_id),
+            started_at=started_at,
+        )
+
+    def generate_batch(
+        self, requests: list[AIGenerationRequest]
+    ) -> list[AIGenerationResponse | None]:
+        return _run_in_token_budget(requests, self._max_tokens, self._generate_batch_chunk)
+
+    def _generate_batch_chunk(
+        self, requests: list[AIGenerationRequest], max_tokens: int
+    ) -> list[AIGenerationResponse | None]:
+        model_id = self._resolve_model(requests[0])
+        text = self._invoke(
+            system=_build_system_prompt(requests[0]),
+            user_text=_build_batch_user_prompt(requests),
+            model_id=model_id,
+            max_tokens=max_tokens,
+        )
+        return _split_batch_response(text, requests, model=model_id)
+
+    def _resolve_model(self, request: AIGenerationRequest) -> str:
         model_id = request.policy.model or self._model_id
         if model_id == "mock-local":
             model_id = self._model_id
-        invoke_kwargs = {
-            "modelId": model_id,
-            "body": json.dumps(payload),
-            "contentType": "application/json",
-            "accept": "application/json",
-        }
-        if self._inference_profile_arn:
-            invoke_kwargs["inferenceProfileArn"] = self._inference_profile_arn
+        return model_id
 
+    def _invoke(self, *, system: str, user_text: str, model_id: str, max_tokens: int) -> str:
+        invoke_kwargs = self._invoke_kwargs(
+            system=system,
+            user_text=user_text,
+            model_id=model_id,
+            max_tokens=max_tokens,
+        )
         try:
             response = self._client.invoke_model(**invoke_kwargs)
         except Exception as exc:  # pragma: no cover - AWS runtime errors
@@ -934,30 +1646,80 @@ class AwsClaudeClient:
         data = json.loads(body_text)
         contents = data.get("content", [])
         text_parts = [item.get("text", "") for item in contents if isinstance(item, dict)]
-        text = "\n".join(text_parts)
-        return _build_response_from_text(text, request, model=model_id)
+        return "\n".join(text_parts)
 
-    def match_slide(self, request: SlideMatchRequest) -> SlideMatchResponse:
+    def _invoke_kwargs(self, *, system: str, user_text: str, model_id: str, max_tokens: int) -> dict[str, object]:
         payload = {
             "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": self._max_tokens,
+            "max_tokens": max_tokens,
             "temperature": float(os.getenv("AWS_CLAUDE_TEMPERATURE", "0.3")),
-            "system": request.system_prompt,
+            "system": system,
             "messages": [
                 {
                     "role": "user",
                     "content": [
                         {
                             "type": "text",
-                            "text": request.prompt,
+                            "text": user_text,
                         }
                     ],
                 }
             ],
         }
+        invoke_kwargs = {
+            "modelId": model_id,
+            "body": json.dumps(payload),
+            "contentType": "application/json",
+            "accept": "application/json",
+        }
+        if self._inference_profile_arn:
+            invoke_kwargs["inferenceProfileArn"] = self._inference_profile_arn
+        return invoke_kwargs
+
+    def match_slide(self, request: SlideMatchRequest) -> SlideMatchResponse:
         model_id = request.model or self._model_id
         if model_id == "mock-local":
             model_id = self._model_id
+        text = self._match_text(request.system_prompt, request.prompt, model_id=model_id, max_tokens=self._max_tokens)
+        return _build_slide_match_response(text, request, model=model_id)
+
+    def match_slide_batch(
+        self, requests: list[SlideMatchRequest]
+    ) -> list[SlideMatchResponse | None]:
+        return _run_in_token_budget(requests, self._max_tokens, self._match_slide_batch_chunk)
+
+    def _match_slide_batch_chunk(
+        self, requests: list[SlideMatchRequest], max_tokens: int
+    ) -> list[SlideMatchResponse | None]:
+        model_id = requests[0].model or self._model_id
+        if model_id == "mock-local":
+            model_id = self._model_id
+        text = self._match_text(
+            requests[0].system_prompt,
+            _build_match_batch_prompt(requests),
+            model_id=model_id,
+            max_tokens=max_tokens,
+        )
+        return _split_match_batch_response(text, requests, model=model_id)
+
+    def _match_text(self, system_prompt: str, prompt: str, *, model_id: str, max_tokens: int) -> str:
+        payload = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": max_tokens,
+            "temperature": float(os.getenv("AWS_CLAUDE_TEMPERATURE", "0.3")),
+            "system": system_prompt,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": prompt,
+                        }
+                    ],
+                }
+            ],
+        }
         invoke_kwargs = {
             "modelId": model_id,
             "body": json.dumps(payload),
@@ -976,13 +1738,13 @@ class AwsClaudeClient:
         data = json.loads(body_text)
         contents = data.get("content", [])
         text_parts = [item.get("text", "") for item in contents if isinstance(item, dict)]
-        text = "\n".join(text_parts)
-        return _build_slide_match_response(text, request, model=model_id)
+        return "\n".join(text_parts)
 
 
 __all__ = [
     "AIGenerationRequest",
     "AIGenerationResponse",
+    "BatchLLMClient",
     "SlideMatchCandidate",
     "SlideMatchRequest",
     "SlideMatchResponse",
@@ -990,4 +1752,5 @@ __all__ = [
     "LLMClientConfigurationError",
     "MockLLMClient",
     "create_llm_client",
+    "llm_client_config_key",
 ]
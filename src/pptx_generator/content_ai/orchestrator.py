@@ -5,14 +5,16 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime, timezone
+from functools import partial
 from hashlib import sha256
-from typing import Any
+from typing import Any, Callable
 
 from ..models import (ContentApprovalDocument, ContentDocumentMeta,
                       ContentElements, ContentSlide, JobSpec)
 from .client import (AIGenerationRequest, AIGenerationResponse, LLMClient,
                      create_llm_client)
 from .policy import ContentAIPolicy, ContentAIPolicyError, ContentAIPolicySet
+from .streaming import StreamEvent
 
 
 logger = logging.getLogger(__name__)
@@ -29,9 +31,19 @@ class ContentAIOrchestrator:
         self,
         policy_set: ContentAIPolicySet,
         llm_client: LLMClient | None = None,
+        *,
+        batch_size: int = 1,
+        on_progress: Callable[[str, StreamEvent], None] | None = None,
     ) -> None:
+        """``on_progress`` はストリーミング応答でフィールドが確定するたびに (slide_id, event) で呼ばれる。"""
+
+        if batch_size < 1:
+            msg = "batch_size は 1 以上を指定してください"
+            raise ContentAIOrchestrationError(msg)
         self._policy_set = policy_set
         self._llm_client = llm_client or create_llm_client()
+        self._batch_size = batch_size
+        self._on_progress = on_progress
 
     def generate_document(
         self,
@@ -55,6 +67,7 @@ class ContentAIOrchestrator:
         if slide_limit is not None:
             target_slides = spec.slides[:slide_limit]
 
+        requests: list[AIGenerationRequest] = []
         for spec_slide in target_slides:
             prompt = _render_prompt(
                 template=policy.resolve_prompt(spec_slide.layout),
@@ -62,13 +75,20 @@ class ContentAIOrchestrator:
                 slide=spec_slide,
             )
             intent = policy.resolve_intent(spec_slide.layout)
-            request = AIGenerationRequest(
-                prompt=prompt,
-                policy=policy,
-                spec=spec,
-                slide=spec_slide,
-                intent=intent,
-                reference_text=reference_text,
+            requests.append(
+                AIGenerationRequest(
+                    prompt=prompt,
+                    policy=policy,
+                    spec=spec,
+                    slide=spec_slide,
+                    intent=intent,
+                    reference_text=reference_text,
+                    on_partial=(
+                        partial(self._on_progress, spec_slide.id)
+                        if self._on_progress is not None
+                        else None
+                    ),
+                )
             )
 
             if logger.isEnabledFor(logging.INFO):
@@ -80,7 +100,12 @@ class ContentAIOrchestrator:
                     prompt,
                 )
 
-            response = self._llm_client.generate(request)
+        responses = self._generate_responses(requests)
+
+        for request, (response, batched) in zip(requests, responses, strict=True):
+            spec_slide = request.slide
+            prompt = request.prompt
+            intent = request.intent
             content_slide = _build_content_slide(spec_slide.id, response, intent)
             slides.append(content_slide)
             if logger.isEnabledFor(logging.INFO):
@@ -109,6 +134,9 @@ class ContentAIOrchestrator:
                 "warnings": response.warnings,
                 "response_text": raw_text,
                 "response_text_truncated": truncated,
+                "batched": batched,
+                "first_token_ms": response.first_token_ms,
+                "latency_ms": response.latency_ms,
             }
             logs.append(log_entry)
             logging.getLogger("pptx_generator.content_ai.llm").info(
@@ -128,6 +156,48 @@ class ContentAIOrchestrator:
         meta_payload = _build_generation_meta(spec, policy, document, logs)
         return document, meta_payload, logs
 
+    def _generate_responses(
+        self, requests: list[AIGenerationRequest]
+    ) -> list[tuple[AIGenerationResponse, bool]]:
+        """リクエストを batch_size 件ずつまとめて生成し、入力順の応答を返す。
+
+        バッチ応答のうち解析できなかったスライドだけを単発リクエストで再生成する。
+        バッチ呼び出し自体が失敗した場合は、そのバッチの全スライドを単発リクエストで生成する。
+        """
+
+        generate_batch = getattr(self._llm_client, "generate_batch", None)
+        if self._batch_size == 1 or not callable(generate_batch):
+            return [(self._llm_client.generate(request), False) for request in requests]
+
+        results: list[tuple[AIGenerationResponse, bool]] = []
+        for offset in range(0, len(requests), self._batch_size):
+            chunk = requests[offset : offset + self._batch_size]
+            if len(chunk) == 1:
+                results.append((self._llm_client.generate(chunk[0]), False))
+                continue
+            try:
+                batch_responses = list(generate_batch(chunk))
+                if len(batch_responses) != len(chunk):
+                    msg = f"バッチ応答の件数が一致しません: expected={len(chunk)} actual={len(batch_responses)}"
+                    raise ValueError(msg)
+            except Exception:  # noqa: BLE001 - 単発生成で継続する
+                logger.warning(
+                    "バッチ生成に失敗したため単発生成に切り替えます: slide_ids=%s",
+                    ",".join(request.slide.id for request in chunk),
+                    exc_info=True,
+                )
+                batch_responses = [None] * len(chunk)
+            for request, response in zip(chunk, batch_responses, strict=True):
+                if response is None:
+                    logger.warning(
+                        "バッチ応答を解析できなかったため単発生成に切り替えます: slide_id=%s",
+                        request.slide.id,
+                    )
+                    results.append((self._llm_client.generate(request), False))
+                else:
+                    results.append((response, True))
+        return results
+
 
 def _render_prompt(*, template: str, spec: JobSpec, slide) -> str:
     """テンプレートへ Spec 情報を埋め込み、プロンプトを生成する。"""
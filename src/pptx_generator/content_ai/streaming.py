@@ -0,0 +1,192 @@
+"""LLM ストリーミング応答の逐次解析。"""
+
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Iterable
+
+STREAM_STOPPED_EARLY_WARNING = "stream_stopped_early"
+
+
+@dataclass(slots=True)
+class StreamEvent:
+    """確定したフィールド値。``kind`` は title / body / note のいずれか。"""
+
+    kind: str
+    value: str | None
+    index: int = 0
+
+
+class IncrementalSlideParser:
+    """``{"title", "body", "note"}`` 形式の JSON をチャンク単位で走査する。
+
+    文字列値が閉じた時点で ``StreamEvent`` を返す。JSON 開始前の前置きテキストは読み飛ばす。
+    """
+
+    def __init__(self, *, max_body_lines: int) -> None:
+        self._max_body_lines = max_body_lines
+        self._stack: list[str] = []
+        self._started = False
+        self._in_string = False
+        self._escape = False
+        self._buffer: list[str] = []
+        self._expect_key = False
+        self._key: str | None = None
+        self._literal: list[str] = []
+        self.title: str | None = None
+        self.note: str | None = None
+        self.body: list[str] = []
+        self._kept_body = 0
+        self.completed = False
+        self._done_keys: set[str] = set()
+
+    @property
+    def body_overflow(self) -> bool:
+        # クライアントの本文正規化と同じく、空・空白のみの項目は行数に数えない
+        return self._kept_body > self._max_body_lines
+
+    def should_stop(self) -> bool:
+        """以降のトークンが応答に反映されない状態なら True。"""
+
+        if self.completed:
+            return True
+        return self.body_overflow and {"title", "note"} <= self._done_keys
+
+    def snapshot(self) -> str:
+        """解析済みフィールドから JSON テキストを再構成する。"""
+
+        payload: dict[str, object] = {"body": list(self.body)}
+        if self.title is not None:
+            payload["title"] = self.title
+        payload["note"] = self.note
+        return json.dumps(payload, ensure_ascii=False)
+
+    def feed(self, chunk: str) -> list[StreamEvent]:
+        events: list[StreamEvent] = []
+        for char in chunk:
+            if self.completed:
+                break
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    self._stack.append("{")
+                    self._expect_key = True
+                continue
+            if self._in_string:
+                self._consume_string_char(char, events)
+                continue
+            if char == '"':
+                self._in_string = True
+                self._buffer = []
+            elif char in "{[":
+                self._stack.append(char)
+            elif char in "}]":
+                if len(self._stack) == 1:
+                    self._finish_value()
+                self._stack.pop()
+                if not self._stack:
+                    self.completed = True
+            elif char == ":" and len(self._stack) == 1:
+                self._expect_key = False
+                self._literal = []
+            elif char == "," and len(self._stack) == 1:
+                self._finish_value()
+                self._expect_key = True
+            elif len(self._stack) == 1 and not self._expect_key and not char.isspace():
+                self._literal.append(char)
+        return events
+
+    def _consume_string_char(self, char: str, events: list[StreamEvent]) -> None:
+        if self._escape:
+            self._buffer.append(char)
+            self._escape = False
+            return
+        if char == "\\":
+            self._buffer.append(char)
+            self._escape = True
+            return
+        if char != '"':
+            self._buffer.append(char)
+            return
+        self._in_string = False
+        raw = "".join(self._buffer)
+        try:
+            value = json.loads(f'"{raw}"')
+        except json.JSONDecodeError:
+            value = raw
+        depth = len(self._stack)
+        if depth == 1 and self._expect_key:
+            self._key = value
+        elif depth == 1 and self._key == "title":
+            self.title = value
+            events.append(StreamEvent(kind="title", value=value))
+        elif depth == 1 and self._key == "note":
+            self.note = value
+            events.append(StreamEvent(kind="note", value=value))
+        elif depth == 2 and self._key == "body" and self._stack[-1] == "[":
+            self.body.append(value)
+            if str(value).strip():
+                self._kept_body += 1
+            events.append(StreamEvent(kind="body", value=value, index=len(self.body) - 1))
+
+    def _finish_value(self) -> None:
+        if self._key is None:
+            return
+        if self._key == "note" and self.note is None and "".join(self._literal) not in {"", "null"}:
+            self.note = "".join(self._literal)
+        self._done_keys.add(self._key)
+        self._key = None
+        self._literal = []
+
+
+@dataclass(slots=True)
+class StreamOutcome:
+    """ストリーミング応答の集約結果。"""
+
+    text: str
+    first_token_ms: float | None
+    latency_ms: float
+    stopped_early: bool = False
+    warnings: list[str] = field(default_factory=list)
+
+
+def consume_stream(
+    chunks: Iterable[str],
+    *,
+    max_body_lines: int,
+    started_at: float,
+    on_event: Callable[[StreamEvent], None] | None = None,
+    clock: Callable[[], float] = time.perf_counter,
+) -> StreamOutcome:
+    """テキストチャンクを読み進め、応答が確定した時点で打ち切る。
+
+    打ち切った場合は解析済みフィールドから JSON を再構成して返す。
+    """
+
+    parser = IncrementalSlideParser(max_body_lines=max_body_lines)
+    parts: list[str] = []
+    first_token_at: float | None = None
+    stopped_early = False
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if first_token_at is None:
+            first_token_at = clock()
+        parts.append(chunk)
+        for event in parser.feed(chunk):
+            if on_event is not None:
+                on_event(event)
+        if parser.should_stop():
+            stopped_early = not parser.completed
+            break
+    finished_at = clock()
+    text = parser.snapshot() if stopped_early else "".join(parts)
+    return StreamOutcome(
+        text=text,
+        first_token_ms=(first_token_at - started_at) * 1000 if first_token_at is not None else None,
+        latency_ms=(finished_at - started_at) * 1000,
+        stopped_early=stopped_early,
+        warnings=[STREAM_STOPPED_EARLY_WARNING] if stopped_early else [],
+    )
@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
-from .service import ContentImportError, ContentImportResult, ContentImportService
+from .cache import ConversionCache
+from .pdf_text import (NativePdfTextExtractor, PdfPageRangeError, PdfPageText,
+                       PdfTextExtractionError, PdfTextExtractor, PdfTextResult,
+                       parse_page_range)
+from .service import (ContentImportError, ContentImportResult,
+                      ContentImportService, LibreOfficeWorkerPool)
 
 __all__ = [
     "ContentImportError",
     "ContentImportResult",
     "ContentImportService",
+    "ConversionCache",
+    "LibreOfficeWorkerPool",
+    "NativePdfTextExtractor",
+    "PdfPageRangeError",
+    "PdfPageText",
+    "PdfTextExtractionError",
+    "PdfTextExtractor",
+    "PdfTextResult",
+    "parse_page_range",
 ]
-
@@ -0,0 +1,86 @@
+"""入力ソースの変換結果を sha256 単位で保存するキャッシュ。"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Literal
+
+logger = logging.getLogger(__name__)
+
+# 出力ディレクトリ配下の既定の保存先
+IMPORT_CACHE_SUBDIR = Path(".cache/import")
+
+CacheStatus = Literal["hit", "miss", "disabled"]
+
+
+class ConversionCache:
+    """ソース本体の sha256 と変換種別をキーに、抽出済みテキストを保存する。
+
+    ディレクトリ構成は ``<base_dir>/<sha256[:2]>/<sha256>/<kind>.txt``。
+    ``base_dir`` が無い場合は無効になる。
+    """
+
+    def __init__(self, base_dir: Path | None = None, *, enabled: bool = True) -> None:
+        self.base_dir = base_dir
+        self.enabled = enabled and base_dir is not None
+
+    @classmethod
+    def from_env(cls, output_dir: Path | None = None) -> ConversionCache:
+        """環境変数 PPTX_IMPORT_CACHE / PPTX_IMPORT_CACHE_DIR から生成する。
+
+        PPTX_IMPORT_CACHE_DIR が未設定の場合は ``<output_dir>/.cache/import`` に保存する
+        （``output_dir`` も無ければキャッシュしない）。
+        """
+
+        flag = os.getenv("PPTX_IMPORT_CACHE", "1").strip().lower()
+        enabled = flag not in {"0", "false", "off", "no"}
+        base_dir = os.getenv("PPTX_IMPORT_CACHE_DIR")
+        if base_dir:
+            return cls(Path(base_dir), enabled=enabled)
+        return cls(output_dir / IMPORT_CACHE_SUBDIR if output_dir is not None else None, enabled=enabled)
+
+    def get_or_convert(
+        self,
+        digest: str,
+        kind: str,
+        convert: Callable[[], str],
+    ) -> tuple[str, CacheStatus]:
+        """変換済みテキストを返す。キャッシュに無ければ ``convert`` を実行して保存する。"""
+
+        if not self.enabled or self.base_dir is None:
+            return convert(), "disabled"
+        entry = self.base_dir / digest[:2] / digest / f"{kind}.txt"
+        try:
+            return entry.read_text(encoding="utf-8"), "hit"
+        except FileNotFoundError:
+            pass
+        except (OSError, UnicodeDecodeError) as exc:
+            logger.warning("変換キャッシュの読み込みに失敗したため再変換します: %s (%s)", entry, exc)
+
+        text = convert()
+        self._write(entry, text)
+        return text, "miss"
+
+    @staticmethod
+    def _write(path: Path, text: str) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=path.parent,
+                prefix=f".{path.stem}-",
+                suffix=".tmp",
+                delete=False,
+            ) as handle:
+                handle.write(text)
+                temp_path = Path(handle.name)
+            os.replace(temp_path, path)
+        except OSError as exc:
+            logger.warning("変換キャッシュの保存に失敗しました: %s (%s)", path, exc)
+
+
+__all__ = ["CacheStatus", "ConversionCache", "IMPORT_CACHE_SUBDIR"]
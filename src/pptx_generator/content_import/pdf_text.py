@@ -0,0 +1,1456 @@
+"""PDF からプレーンテキストを取り出すバックエンド。
+
+``NativePdfTextExtractor`` は外部ツールに依存しない純 Python 実装で、
+xref を辿ってページ単位にコンテンツストリームを解釈し、文字の座標から行を組み立てる。
+ファイルは mmap で参照し、ページごとに必要なストリームだけを展開する。
+"""
+
+from __future__ import annotations
+
+import base64
+import math
+import mmap
+import multiprocessing
+import os
+import re
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, NamedTuple, Protocol, Sequence
+
+DEFAULT_PARALLEL_MIN_PAGES = 64
+DEFAULT_PDF_WORKERS = 4
+
+_MAX_FORM_DEPTH = 8
+_OBJSTM_CACHE_SIZE = 16
+# 文字間の隙間がフォントサイズのこの割合を超えたら単語の区切りとみなす
+_WORD_GAP_RATIO = 0.15
+
+
+class PdfTextExtractionError(RuntimeError):
+    """PDF からテキストを抽出できないことを表す。"""
+
+
+class PdfPageRangeError(PdfTextExtractionError):
+    """ページ範囲の指定が不正、または PDF のページ数を超えていることを表す。"""
+
+
+@dataclass(slots=True)
+class PdfPageText:
+    """ページ単位の抽出結果。``offset`` は結合後テキスト中の開始位置。"""
+
+    page_number: int
+    text: str
+    offset: int
+    chars: int
+    elapsed_ms: float
+
+
+@dataclass(slots=True)
+class PdfTextResult:
+    """PDF 全体（または指定ページ範囲）の抽出結果。"""
+
+    backend: str
+    text: str
+    pages: list[PdfPageText] = field(default_factory=list)
+    page_count: int | None = None
+    warnings: list[str] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+    unmapped_chars: int = 0
+    cached: bool = False
+
+    def unmapped_ratio(self) -> float:
+        """Unicode へ変換できなかった文字の割合（空白を除く抽出文字数に対する比）を返す。"""
+
+        if not self.unmapped_chars:
+            return 0.0
+        mapped = sum(1 for char in self.text if not char.isspace())
+        return self.unmapped_chars / (mapped + self.unmapped_chars)
+
+    def mark_cached(self, *, elapsed_ms: float) -> None:
+        """キャッシュから復元した結果として、今回の所要時間に置き換える（ページ単位の時間は 0）。"""
+
+        self.cached = True
+        self.elapsed_ms = elapsed_ms
+        for page in self.pages:
+            page.elapsed_ms = 0.0
+
+    def to_meta(self) -> dict[str, object]:
+        """インポートメタ向けにページ本文を除いた要約を返す。"""
+
+        return {
+            "backend": self.backend,
+            "page_count": self.page_count,
+            "chars": len(self.text),
+            "unmapped_chars": self.unmapped_chars,
+            "cached": self.cached,
+            "elapsed_ms": self.elapsed_ms,
+            "pages": [
+                {
+                    "page": page.page_number,
+                    "offset": page.offset,
+                    "chars": page.chars,
+                    "elapsed_ms": page.elapsed_ms,
+                }
+                for page in self.pages
+            ],
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "text": self.text,
+            "page_count": self.page_count,
+            "warnings": list(self.warnings),
+            "elapsed_ms": self.elapsed_ms,
+            "unmapped_chars": self.unmapped_chars,
+            "pages": [
+                {
+                    "page": page.page_number,
+                    "offset": page.offset,
+                    "chars": page.chars,
+                    "elapsed_ms": page.elapsed_ms,
+                }
+                for page in self.pages
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PdfTextResult:
+        text = str(data.get("text", ""))
+        pages = [
+            PdfPageText(
+                page_number=int(entry["page"]),
+                text=text[int(entry["offset"]) : int(entry["offset"]) + int(entry["chars"])],
+                offset=int(entry["offset"]),
+                chars=int(entry["chars"]),
+                elapsed_ms=float(entry["elapsed_ms"]),
+            )
+            for entry in data.get("pages", [])
+        ]
+        page_count = data.get("page_count")
+        return cls(
+            backend=str(data.get("backend", "")),
+            text=text,
+            pages=pages,
+            page_count=int(page_count) if page_count is not None else None,
+            warnings=[str(item) for item in data.get("warnings", [])],
+            elapsed_ms=float(data.get("elapsed_ms", 0.0)),
+            unmapped_chars=int(data.get("unmapped_chars", 0)),
+        )
+
+
+class PdfTextExtractor(Protocol):
+    """PDF テキスト抽出バックエンドのインターフェース。"""
+
+    name: str
+
+    def extract(self, path: Path, *, page_range: str | None = None) -> PdfTextResult:
+        ...
+
+
+def parse_page_range(spec: str | None, page_count: int) -> list[int]:
+    """``"1-3,7,10-"`` 形式のページ指定を 1 始まりのページ番号へ展開する。
+
+    終端が最終ページを超える部分は切り捨て、重複は除いて昇順で返す。``None`` や空文字は全ページ。
+    開始ページが最終ページを超える指定は ``ValueError`` とする。
+    """
+
+    if spec is None or not spec.strip():
+        return list(range(1, page_count + 1))
+    selected: set[int] = set()
+    for part in spec.split(","):
+        token = part.strip()
+        if not token:
+            continue
+        start_text, sep, end_text = token.partition("-")
+        try:
+            start = int(start_text) if start_text.strip() else 1
+            end = (int(end_text) if end_text.strip() else page_count) if sep else start
+        except ValueError as exc:
+            msg = f"ページ範囲の形式が不正です: {spec}"
+            raise ValueError(msg) from exc
+        if start < 1 or end < start:
+            msg = f"ページ範囲の形式が不正です: {spec}"
+            raise ValueError(msg)
+        if start > page_count:
+            msg = f"ページ範囲が最終ページ ({page_count}) を超えています: {spec}"
+            raise ValueError(msg)
+        selected.update(range(start, min(end, page_count) + 1))
+    return sorted(selected)
+
+
+class NativePdfTextExtractor:
+    """外部ツールを使わずに PDF のテキストを抽出する。
+
+    対象ページ数が ``parallel_min_pages`` 以上の場合は、ページをまとめて
+    ``max_workers`` 個のプロセスへ振り分ける。各プロセスは自分の担当ページだけを展開する。
+    """
+
+    name = "native"
+
+    def __init__(
+        self,
+        *,
+        max_workers: int | None = None,
+        parallel_min_pages: int = DEFAULT_PARALLEL_MIN_PAGES,
+    ) -> None:
+        if max_workers is None:
+            max_workers = min(DEFAULT_PDF_WORKERS, os.cpu_count() or 1)
+        self.max_workers = max(1, max_workers)
+        self.parallel_min_pages = max(1, parallel_min_pages)
+
+    def extract(self, path: Path, *, page_range: str | None = None) -> PdfTextResult:
+        started = time.perf_counter()
+        with _PdfDocument(path) as document:
+            page_count = len(document.pages)
+            try:
+                numbers = parse_page_range(page_range, page_count)
+            except ValueError as exc:
+                raise PdfPageRangeError(str(exc)) from exc
+
+            extracted: list[_ExtractedPage] | None = None
+            if self.max_workers > 1 and len(numbers) >= self.parallel_min_pages:
+                extracted = self._extract_parallel(path, numbers)
+            if extracted is None:
+                extracted = [_extract_page(document, number) for number in numbers]
+
+        pages: list[PdfPageText] = []
+        texts: list[str] = []
+        warnings: list[str] = []
+        unmapped = 0
+        offset = 0
+        for item in extracted:
+            pages.append(
+                PdfPageText(
+                    page_number=item.page_number,
+                    text=item.text,
+                    offset=offset,
+                    chars=len(item.text),
+                    elapsed_ms=item.elapsed_ms,
+                )
+            )
+            texts.append(item.text)
+            warnings.extend(item.warnings)
+            unmapped += item.unmapped
+            offset += len(item.text) + 1
+        return PdfTextResult(
+            backend=self.name,
+            text="\n".join(texts),
+            pages=pages,
+            page_count=page_count,
+            warnings=warnings,
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 3),
+            unmapped_chars=unmapped,
+        )
+
+    def _extract_parallel(self, path: Path, numbers: list[int]) -> list[_ExtractedPage] | None:
+        workers = min(self.max_workers, len(numbers))
+        # ワーカー数の 2 倍に分割し、重いページが偏っても待ち時間を均す
+        batch_size = max(1, math.ceil(len(numbers) / (workers * 2)))
+        batches = [numbers[start : start + batch_size] for start in range(0, len(numbers), batch_size)]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as executor:
+                results = executor.map(_extract_page_batch, [str(path)] * len(batches), batches)
+                return [page for batch in results for page in batch]
+        except (BrokenProcessPool, OSError, NotImplementedError):
+            # プロセスを起動できない環境では逐次処理に切り替える
+            return None
+
+
+class _ExtractedPage(NamedTuple):
+    page_number: int
+    text: str
+    elapsed_ms: float
+    warnings: list[str]
+    unmapped: int = 0
+
+
+def _extract_page_batch(path: str, numbers: Sequence[int]) -> list[_ExtractedPage]:
+    with _PdfDocument(Path(path)) as document:
+        return [_extract_page(document, number) for number in numbers]
+
+
+def _extract_page(document: _PdfDocument, number: int) -> _ExtractedPage:
+    started = time.perf_counter()
+    warnings: list[str] = []
+    unmapped = 0
+    try:
+        text, unmapped = document.page_text(number - 1)
+        if unmapped:
+            warnings.append(f"PDF {number} ページ目: ToUnicode のないフォントの {unmapped} 文字を変換できませんでした")
+    except (_PdfSyntaxError, _UnsupportedFilterError, ValueError, IndexError, KeyError, TypeError) as exc:
+        text = ""
+        warnings.append(f"PDF {number} ページ目のテキストを抽出できませんでした: {exc}")
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+    return _ExtractedPage(number, text, elapsed_ms, warnings, unmapped)
+
+
+# ---------------------------------------------------------------------------
+# 字句解析・オブジェクト
+
+
+class _PdfSyntaxError(Exception):
+    """PDF の構文を解釈できない。"""
+
+
+class _UnsupportedFilterError(Exception):
+    """未対応のストリームフィルタ。"""
+
+
+class _Keyword(str):
+    """演算子やキーワード（名前オブジェクトと区別するための型）。"""
+
+
+class _Ref(NamedTuple):
+    num: int
+    gen: int
+
+
+@dataclass(slots=True)
+class _Stream:
+    attrs: dict[str, Any]
+    start: int
+    end: int
+
+
+_EOF = _Keyword("")
+_DICT_OPEN = _Keyword("<<")
+_DICT_CLOSE = _Keyword(">>")
+_ARRAY_OPEN = _Keyword("[")
+_ARRAY_CLOSE = _Keyword("]")
+_DELIMITERS = {
+    b"<<": _DICT_OPEN,
+    b">>": _DICT_CLOSE,
+    b"[": _ARRAY_OPEN,
+    b"]": _ARRAY_CLOSE,
+    b"{": _Keyword("{"),
+    b"}": _Keyword("}"),
+}
+_CONSTANTS: dict[str, Any] = {"true": True, "false": False, "null": None}
+
+_REGULAR = rb"[^ \t\r\n\x0c\x00()<>\[\]{}/%]"
+_SKIP_RE = re.compile(rb"(?:[ \t\r\n\x0c\x00]+|%[^\r\n]*)*")
+_TOKEN_RE = re.compile(
+    rb"(?:[ \t\r\n\x0c\x00]+|%[^\r\n]*)*"
+    rb"(?:"
+    rb"(?P<num>[+-]?(?:\d+\.?\d*|\.\d+))(?!" + _REGULAR + rb")"
+    rb"|/(?P<name>" + _REGULAR + rb"*)"
+    rb"|(?P<hex><[0-9A-Fa-f \t\r\n\x0c]*>)"
+    rb"|(?P<lit>\()"
+    rb"|(?P<delim><<|>>|\[|\]|\{|\})"
+    rb"|(?P<kw>" + _REGULAR + rb"+)"
+    rb")"
+)
+_NAME_ESCAPE_RE = re.compile(rb"#([0-9A-Fa-f]{2})")
+_LITERAL_SPECIAL_RE = re.compile(rb"[()\\]")
+_WHITESPACE_RE = re.compile(rb"[ \t\r\n\x0c\x00]+")
+_ESCAPES = {
+    ord("n"): b"\n",
+    ord("r"): b"\r",
+    ord("t"): b"\t",
+    ord("b"): b"\b",
+    ord("f"): b"\f",
+}
+
+
+class _Lexer:
+    """バイト列から PDF のトークンを順に取り出す。"""
+
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data: Any, pos: int = 0) -> None:
+        self.data = data
+        self.pos = pos
+
+    def next(self) -> Any:
+        data = self.data
+        while True:
+            match = _TOKEN_RE.match(data, self.pos)
+            if match is None:
+                skipped = _SKIP_RE.match(data, self.pos)
+                position = skipped.end() if skipped else self.pos
+                if position >= len(data):
+                    self.pos = position
+                    return _EOF
+                # 解釈できない 1 バイト（孤立した ')' など）は読み飛ばす
+                self.pos = position + 1
+                continue
+            self.pos = match.end()
+            kind = match.lastgroup
+            value = match.group(kind)
+            if kind == "num":
+                if b"." in value:
+                    return float(value)
+                return int(value)
+            if kind == "name":
+                if b"#" in value:
+                    value = _NAME_ESCAPE_RE.sub(lambda m: bytes([int(m.group(1), 16)]), value)
+                return value.decode("latin-1")
+            if kind == "kw":
+                return _Keyword(value.decode("latin-1"))
+            if kind == "delim":
+                return _DELIMITERS[value]
+            if kind == "hex":
+                digits = _WHITESPACE_RE.sub(b"", value[1:-1])
+                if len(digits) % 2:
+                    digits += b"0"
+                return bytes.fromhex(digits.decode("ascii"))
+            return self._read_literal()
+
+    def _read_literal(self) -> bytes:
+        data = self.data
+        pos = self.pos
+        size = len(data)
+        out = bytearray()
+        depth = 1
+        while pos < size:
+            match = _LITERAL_SPECIAL_RE.search(data, pos)
+            if match is None:
+                out += data[pos:size]
+                pos = size
+                break
+            index = match.start()
+            out += data[pos:index]
+            char = data[index]
+            if char == 0x5C:  # バックスラッシュ
+                pos = index + 1
+                if pos >= size:
+                    break
+                escaped = data[pos]
+                if escaped in _ESCAPES:
+                    out += _ESCAPES[escaped]
+                    pos += 1
+                elif 0x30 <= escaped <= 0x37:
+                    end = pos
+                    while end < size and end - pos < 3 and 0x30 <= data[end] <= 0x37:
+                        end += 1
+                    out.append(int(data[pos:end], 8) & 0xFF)
+                    pos = end
+                elif escaped == 0x0D:
+                    pos += 2 if data[pos + 1 : pos + 2] == b"\n" else 1
+                elif escaped == 0x0A:
+                    pos += 1
+                else:
+                    out.append(escaped)
+                    pos += 1
+            elif char == 0x28:
+                depth += 1
+                out.append(char)
+                pos = index + 1
+            else:
+                depth -= 1
+                pos = index + 1
+                if depth == 0:
+                    break
+                out.append(char)
+        self.pos = pos
+        return bytes(out)
+
+    def parse_object(self, token: Any = None, *, refs: bool = True) -> Any:
+        """トークンを 1 つのオブジェクト（辞書・配列・参照を含む）へ組み立てる。"""
+
+        if token is None:
+            token = self.next()
+        if token is _DICT_OPEN:
+            result: dict[str, Any] = {}
+            while True:
+                key = self.next()
+                if key is _DICT_CLOSE or key is _EOF:
+                    return result
+                if type(key) is not str:
+                    continue
+                value_token = self.next()
+                if value_token is _DICT_CLOSE or value_token is _EOF:
+                    result[key] = None
+                    return result
+                result[key] = self.parse_object(value_token, refs=refs)
+        if token is _ARRAY_OPEN:
+            items: list[Any] = []
+            while True:
+                item = self.next()
+                if item is _ARRAY_CLOSE or item is _EOF:
+                    return items
+                items.append(self.parse_object(item, refs=refs))
+        if refs and type(token) is int:
+            saved = self.pos
+            second = self.next()
+            if type(second) is int:
+                third = self.next()
+                if third == "R" and type(third) is _Keyword:
+                    return _Ref(token, second)
+            self.pos = saved
+            return token
+        if type(token) is _Keyword and token in _CONSTANTS:
+            return _CONSTANTS[token]
+        return token
+
+
+# ---------------------------------------------------------------------------
+# フィルタ
+
+
+def _inflate(data: bytes) -> bytes:
+    decompressor = zlib.decompressobj()
+    try:
+        return decompressor.decompress(data) + decompressor.flush()
+    except zlib.error:
+        # 末尾が壊れたストリームは読めた範囲だけを使う
+        decompressor = zlib.decompressobj()
+        out = bytearray()
+        for start in range(0, len(data), 4096):
+            try:
+                out += decompressor.decompress(data[start : start + 4096])
+            except zlib.error:
+                break
+        return bytes(out)
+
+
+def _png_unpredict(data: bytes, columns: int, colors: int, bits: int) -> bytes:
+    bpp = max(1, colors * bits // 8)
+    row_size = (columns * colors * bits + 7) // 8
+    out = bytearray()
+    previous = bytearray(row_size)
+    stride = row_size + 1
+    for start in range(0, len(data) - row_size, stride):
+        kind = data[start]
+        row = bytearray(data[start + 1 : start + stride])
+        if kind == 1:
+            for index in range(bpp, row_size):
+                row[index] = (row[index] + row[index - bpp]) & 0xFF
+        elif kind == 2:
+            for index in range(row_size):
+                row[index] = (row[index] + previous[index]) & 0xFF
+        elif kind == 3:
+            for index in range(row_size):
+                left = row[index - bpp] if index >= bpp else 0
+                row[index] = (row[index] + ((left + previous[index]) >> 1)) & 0xFF
+        elif kind == 4:
+            for index in range(row_size):
+                left = row[index - bpp] if index >= bpp else 0
+                up = previous[index]
+                upper_left = previous[index - bpp] if index >= bpp else 0
+                estimate = left + up - upper_left
+                pa, pb, pc = abs(estimate - left), abs(estimate - up), abs(estimate - upper_left)
+                predictor = left if pa <= pb and pa <= pc else (up if pb <= pc else upper_left)
+                row[index] = (row[index] + predictor) & 0xFF
+        out += row
+        previous = row
+    return bytes(out)
+
+
+def _lzw_decode(data: bytes, early_change: int = 1) -> bytes:
+    out = bytearray()
+    table: list[bytes] = [bytes([index]) for index in range(256)] + [b"", b""]
+    code_size = 9
+    buffer = 0
+    bit_count = 0
+    previous: bytes | None = None
+    for byte in data:
+        buffer = (buffer << 8) | byte
+        bit_count += 8
+        while bit_count >= code_size:
+            bit_count -= code_size
+            code = (buffer >> bit_count) & ((1 << code_size) - 1)
+            if code == 256:
+                table = table[:258]
+                code_size = 9
+                previous = None
+                continue
+            if code == 257:
+                return bytes(out)
+            if code < len(table):
+                entry = table[code]
+                if previous is not None:
+                    table.append(previous + entry[:1])
+            elif previous is not None:
+                entry = previous + previous[:1]
+                table.append(entry)
+            else:
+                return bytes(out)
+            out += entry
+            previous = entry
+            if len(table) + early_change >= (1 << code_size) and code_size < 12:
+                code_size += 1
+    return bytes(out)
+
+
+def _as_list(value: Any) -> list[Any]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    return [value]
+
+
+# ---------------------------------------------------------------------------
+# 文書
+
+
+class _PdfDocument:
+    """mmap 上の PDF を遅延的に解釈する。オブジェクトは参照されたものだけを読む。"""
+
+    def __init__(self, path: Path) -> None:
+        try:
+            self._file = path.open("rb")
+        except OSError as exc:
+            msg = f"PDF を開けません: {path} ({exc})"
+            raise PdfTextExtractionError(msg) from exc
+        try:
+            if os.fstat(self._file.fileno()).st_size == 0:
+                msg = f"PDF が空です: {path}"
+                raise PdfTextExtractionError(msg)
+            self._data: Any = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._file.close()
+            raise
+        self._objects: dict[int, Any] = {}
+        self._object_streams: OrderedDict[int, tuple[bytes, int, list[tuple[int, int]]]] = OrderedDict()
+        self._fonts: dict[Any, _Font] = {}
+        self._xref: dict[int, tuple[int, int, int]] = {}
+        try:
+            if self._data.find(b"%PDF-", 0, 1024) < 0:
+                msg = f"PDF ヘッダーが見つかりません: {path}"
+                raise PdfTextExtractionError(msg)
+            self.trailer = self._load_xref()
+            if self.trailer.get("Encrypt") is not None:
+                msg = f"暗号化された PDF には対応していません: {path}"
+                raise PdfTextExtractionError(msg)
+            self.pages = self._collect_pages()
+        except (_PdfSyntaxError, ValueError, IndexError, KeyError, TypeError) as exc:
+            self.close()
+            msg = f"PDF の構造を解釈できません: {path} ({exc})"
+            raise PdfTextExtractionError(msg) from exc
+        except BaseException:
+            self.close()
+            raise
+
+    def __enter__(self) -> _PdfDocument:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        data = getattr(self, "_data", None)
+        if data is not None:
+            data.close()
+            self._data = None
+        self._file.close()
+
+    # xref ---------------------------------------------------------------
+    def _load_xref(self) -> dict[str, Any]:
+        try:
+            return self._read_xref_chain()
+        except (_PdfSyntaxError, _UnsupportedFilterError, ValueError, IndexError, KeyError, TypeError):
+            self._xref.clear()
+            return self._rebuild_xref()
+
+    def _read_xref_chain(self) -> dict[str, Any]:
+        data = self._data
+        marker = data.rfind(b"startxref", max(0, len(data) - 4096))
+        if marker < 0:
+            msg = "startxref が見つかりません"
+            raise _PdfSyntaxError(msg)
+        offset = _Lexer(data, marker + 9).next()
+        trailer: dict[str, Any] = {}
+        seen: set[int] = set()
+        while type(offset) is int and offset not in seen:
+            seen.add(offset)
+            section = self._read_xref_section(offset)
+            xref_stream_offset = section.get("XRefStm")
+            if type(xref_stream_offset) is int and xref_stream_offset not in seen:
+                seen.add(xref_stream_offset)
+                self._read_xref_section(xref_stream_offset)
+            for key, value in section.items():
+                trailer.setdefault(key, value)
+            offset = section.get("Prev")
+        if "Root" not in trailer:
+            msg = "trailer に Root がありません"
+            raise _PdfSyntaxError(msg)
+        return trailer
+
+    def _read_xref_section(self, offset: int) -> dict[str, Any]:
+        lexer = _Lexer(self._data, offset)
+        token = lexer.next()
+        if token == "xref" and type(token) is _Keyword:
+            return self._read_xref_table(lexer)
+        if type(token) is int:
+            stream = self._read_indirect_at(offset)
+            if isinstance(stream, _Stream) and stream.attrs.get("Type") == "XRef":
+                return self._read_xref_stream(stream)
+        msg = f"xref を解釈できません (offset={offset})"
+        raise _PdfSyntaxError(msg)
+
+    def _read_xref_table(self, lexer: _Lexer) -> dict[str, Any]:
+        while True:
+            token = lexer.next()
+            if token == "trailer" and type(token) is _Keyword:
+                trailer = lexer.parse_object()
+                if not isinstance(trailer, dict):
+                    msg = "trailer が辞書ではありません"
+                    raise _PdfSyntaxError(msg)
+                return trailer
+            count = lexer.next()
+            if type(token) is not int or type(count) is not int:
+                msg = "xref テーブルの形式が不正です"
+                raise _PdfSyntaxError(msg)
+            for number in range(token, token + count):
+                offset = lexer.next()
+                generation = lexer.next()
+                kind = lexer.next()
+                if kind == "n" and type(offset) is int:
+                    self._xref.setdefault(number, (1, offset, generation))
+                elif kind != "f":
+                    msg = "xref エントリの形式が不正です"
+                    raise _PdfSyntaxError(msg)
+
+    def _read_xref_stream(self, stream: _Stream) -> dict[str, Any]:
+        attrs = stream.attrs
+        widths = [int(value) for value in self.resolve(attrs["W"])]
+        index = self.resolve(attrs.get("Index")) or [0, int(self.resolve(attrs["Size"]))]
+        content = self.decode_stream(stream)
+        entry_size = sum(widths)
+        position = 0
+        for first, count in zip(index[0::2], index[1::2]):
+            for number in range(int(first), int(first) + int(count)):
+                if position + entry_size > len(content):
+                    break
+                fields = []
+                for width in widths:
+                    fields.append(int.from_bytes(content[position : position + width], "big") if width else None)
+                    position += width
+                kind = fields[0] if fields[0] is not None else 1
+                if kind == 1:
+                    self._xref.setdefault(number, (1, fields[1] or 0, fields[2] or 0))
+                elif kind == 2:
+                    self._xref.setdefault(number, (2, fields[1] or 0, fields[2] or 0))
+        return attrs
+
+    def _rebuild_xref(self) -> dict[str, Any]:
+        """xref が壊れている場合に、ファイル全体を走査してオブジェクト位置を復元する。"""
+
+        data = self._data
+        pattern = re.compile(rb"(?<![0-9])(\d{1,10})[ \t\r\n\x0c]+(\d{1,5})[ \t\r\n\x0c]+obj(?!" + _REGULAR + rb")")
+        for match in pattern.finditer(data):
+            self._xref[int(match.group(1))] = (1, match.start(), int(match.group(2)))
+
+        trailer: dict[str, Any] = {}
+        for match in re.finditer(rb"trailer", data):
+            candidate = _Lexer(data, match.end()).parse_object()
+            if isinstance(candidate, dict):
+                trailer.update(candidate)
+        for number, (_, offset, _) in list(self._xref.items()):
+            head = data[offset : offset + 256]
+            if b"/ObjStm" not in head and b"/XRef" not in head:
+                continue
+            try:
+                stream = self._read_indirect_at(offset)
+            except _PdfSyntaxError:
+                continue
+            if not isinstance(stream, _Stream):
+                continue
+            kind = stream.attrs.get("Type")
+            if kind == "XRef":
+                for key, value in stream.attrs.items():
+                    trailer.setdefault(key, value)
+            elif kind == "ObjStm":
+                try:
+                    _, _, pairs = self._load_object_stream(number)
+                except (_PdfSyntaxError, _UnsupportedFilterError):
+                    continue
+                for position, (object_number, _) in enumerate(pairs):
+                    self._xref.setdefault(object_number, (2, number, position))
+        if "Root" not in trailer:
+            catalog = re.search(rb"/Type\s*/Catalog", data)
+            if catalog is None:
+                msg = "Catalog が見つかりません"
+                raise _PdfSyntaxError(msg)
+            owner = max(
+                (item for item in self._xref.items() if item[1][0] == 1 and item[1][1] < catalog.start()),
+                key=lambda item: item[1][1],
+                default=None,
+            )
+            if owner is None:
+                msg = "Catalog が見つかりません"
+                raise _PdfSyntaxError(msg)
+            trailer["Root"] = _Ref(owner[0], 0)
+        return trailer
+
+    # オブジェクト -----------------------------------------------------------
+    def resolve(self, value: Any) -> Any:
+        depth = 0
+        while type(value) is _Ref and depth < 32:
+            value = self._get_object(value.num)
+            depth += 1
+        return value
+
+    def _get_object(self, number: int) -> Any:
+        if number in self._objects:
+            return self._objects[number]
+        entry = self._xref.get(number)
+        if entry is None:
+            value = None
+        elif entry[0] == 1:
+            value = self._read_indirect_at(entry[1])
+        else:
+            content, first, pairs = self._load_object_stream(entry[1])
+            value = _Lexer(content, first + pairs[entry[2]][1]).parse_object()
+        self._objects[number] = value
+        return value
+
+    def _read_indirect_at(self, offset: int) -> Any:
+        data = self._data
+        lexer = _Lexer(data, offset)
+        number = lexer.next()
+        generation = lexer.next()
+        keyword = lexer.next()
+        if type(number) is not int or type(generation) is not int or keyword != "obj":
+            msg = f"間接オブジェクトではありません (offset={offset})"
+            raise _PdfSyntaxError(msg)
+        value = lexer.parse_object()
+        if not isinstance(value, dict):
+            return value
+        saved = lexer.pos
+        token = lexer.next()
+        if token != "stream" or type(token) is not _Keyword:
+            lexer.pos = saved
+            return value
+        start = lexer.pos
+        if data[start : start + 2] == b"\r\n":
+            start += 2
+        elif data[start : start + 1] in (b"\n", b"\r"):
+            start += 1
+        length = value.get("Length")
+        if type(length) is _Ref:
+            length = self.resolve(length) if length.num != number else None
+        end = -1
+        if type(length) is int and length >= 0:
+            tail = data[start + length : start + length + 32]
+            if tail.lstrip().startswith(b"endstream"):
+                end = start + length
+        if end < 0:
+            end = data.find(b"endstream", start)
+            if end < 0:
+                end = len(data)
+            while end > start and data[end - 1] in (0x0A, 0x0D):
+                end -= 1
+        return _Stream(value, start, end)
+
+    def _load_object_stream(self, number: int) -> tuple[bytes, int, list[tuple[int, int]]]:
+        cached = self._object_streams.get(number)
+        if cached is not None:
+            self._object_streams.move_to_end(number)
+            return cached
+        stream = self.resolve(_Ref(number, 0))
+        if not isinstance(stream, _Stream):
+            msg = f"オブジェクトストリームではありません: {number}"
+            raise _PdfSyntaxError(msg)
+        content = self.decode_stream(stream)
+        count = int(self.resolve(stream.attrs.get("N", 0)))
+        first = int(self.resolve(stream.attrs.get("First", 0)))
+        lexer = _Lexer(content)
+        pairs = [(lexer.next(), lexer.next()) for _ in range(count)]
+        loaded = (content, first, pairs)
+        self._object_streams[number] = loaded
+        if len(self._object_streams) > _OBJSTM_CACHE_SIZE:
+            self._object_streams.popitem(last=False)
+        return loaded
+
+    def decode_stream(self, stream: _Stream) -> bytes:
+        data = self._data[stream.start : stream.end]
+        filters = _as_list(self.resolve(stream.attrs.get("Filter", stream.attrs.get("F"))))
+        params = _as_list(self.resolve(stream.attrs.get("DecodeParms", stream.attrs.get("DP"))))
+        for index, name in enumerate(filters):
+            name = self.resolve(name)
+            param = self.resolve(params[index]) if index < len(params) else None
+            param = param if isinstance(param, dict) else {}
+            if name in ("FlateDecode", "Fl"):
+                data = _inflate(data)
+            elif name in ("LZWDecode", "LZW"):
+                data = _lzw_decode(data, int(param.get("EarlyChange", 1)))
+            elif name in ("ASCIIHexDecode", "AHx"):
+                digits = _WHITESPACE_RE.sub(b"", data).split(b">", 1)[0]
+                if len(digits) % 2:
+                    digits += b"0"
+                data = bytes.fromhex(digits.decode("ascii"))
+            elif name in ("ASCII85Decode", "A85"):
+                body = _WHITESPACE_RE.sub(b"", data)
+                if body.startswith(b"<~"):
+                    body = body[2:]
+                body = body.split(b"~>", 1)[0]
+                data = base64.a85decode(body)
+            else:
+                msg = f"未対応のフィルタです: {name}"
+                raise _UnsupportedFilterError(msg)
+            predictor = int(param.get("Predictor", 1))
+            if predictor >= 10:
+                data = _png_unpredict(
+                    data,
+                    int(param.get("Columns", 1)),
+                    int(param.get("Colors", 1)),
+                    int(param.get("BitsPerComponent", 8)),
+                )
+        return data
+
+    # ページ -------------------------------------------------------------
+    def _collect_pages(self) -> list[tuple[dict[str, Any], dict[str, Any]]]:
+        root = self.resolve(self.trailer["Root"])
+        pages: list[tuple[dict[str, Any], dict[str, Any]]] = []
+        visited: set[int] = set()
+
+        def walk(reference: Any, resources: Any, depth: int) -> None:
+            if type(reference) is _Ref:
+                if reference.num in visited:
+                    return
+                visited.add(reference.num)
+            node = self.resolve(reference)
+            if not isinstance(node, dict) or depth > 64:
+                return
+            resources = node.get("Resources", resources)
+            kids = self.resolve(node.get("Kids"))
+            if node.get("Type") == "Pages" or (node.get("Type") is None and kids is not None):
+                for kid in kids or []:
+                    walk(kid, resources, depth + 1)
+                return
+            resolved = self.resolve(resources)
+            pages.append((node, resolved if isinstance(resolved, dict) else {}))
+
+        walk(root.get("Pages"), None, 0)
+        return pages
+
+    def page_text(self, index: int) -> tuple[str, int]:
+        """ページのテキストと、Unicode へ変換できなかった文字数を返す。"""
+
+        page, resources = self.pages[index]
+        parts = []
+        for item in _as_list(self.resolve(page.get("Contents"))):
+            stream = self.resolve(item)
+            if isinstance(stream, _Stream):
+                parts.append(self.decode_stream(stream))
+        interpreter = _ContentInterpreter(self)
+        interpreter.run(b"\n".join(parts), resources, _IDENTITY, 0)
+        return "\n".join(_layout_lines(interpreter.runs)), interpreter.unmapped
+
+    def font(self, reference: Any) -> _Font | None:
+        key = reference if type(reference) is _Ref else id(reference)
+        cached = self._fonts.get(key)
+        if cached is None:
+            spec = self.resolve(reference)
+            if not isinstance(spec, dict):
+                return None
+            cached = _Font.load(self, spec)
+            self._fonts[key] = cached
+        return cached
+
+
+# ---------------------------------------------------------------------------
+# フォント
+
+
+_GLYPH_NAMES = {
+    "space": " ", "exclam": "!", "quotedbl": '"', "numbersign": "#", "dollar": "$",
+    "percent": "%", "ampersand": "&", "quotesingle": "'", "quoteright": "’",
+    "quoteleft": "‘", "parenleft": "(", "parenright": ")", "asterisk": "*",
+    "plus": "+", "comma": ",", "hyphen": "-", "period": ".", "slash": "/",
+    "zero": "0", "one": "1", "two": "2", "three": "3", "four": "4", "five": "5",
+    "six": "6", "seven": "7", "eight": "8", "nine": "9", "colon": ":",
+    "semicolon": ";", "less": "<", "equal": "=", "greater": ">", "question": "?",
+    "at": "@", "bracketleft": "[", "backslash": "\\", "bracketright": "]",
+    "asciicircum": "^", "underscore": "_", "grave": "`", "braceleft": "{", "bar": "|",
+    "braceright": "}", "asciitilde": "~", "bullet": "•", "endash": "–",
+    "emdash": "—", "quotedblleft": "“", "quotedblright": "”",
+    "fi": "fi", "fl": "fl", "ellipsis": "…",
+}
+_UNI_GLYPH_RE = re.compile(r"^(?:uni([0-9A-Fa-f]{4})|u([0-9A-Fa-f]{4,6}))$")
+
+
+def _glyph_to_text(name: str) -> str | None:
+    if len(name) == 1:
+        return name
+    mapped = _GLYPH_NAMES.get(name)
+    if mapped is not None:
+        return mapped
+    match = _UNI_GLYPH_RE.match(name)
+    if match:
+        return chr(int(match.group(1) or match.group(2), 16))
+    return None
+
+
+def _utf16(data: bytes) -> str:
+    if len(data) % 2 == 0:
+        return data.decode("utf-16-be", errors="ignore")
+    return data.decode("latin-1")
+
+
+def _parse_cmap(data: bytes) -> tuple[dict[bytes, str], set[int]]:
+    """ToUnicode CMap の bfchar / bfrange を辞書へ展開する。"""
+
+    lexer = _Lexer(data)
+    mapping: dict[bytes, str] = {}
+    lengths: set[int] = set()
+
+    def read_until(end: str) -> list[Any]:
+        items: list[Any] = []
+        while True:
+            token = lexer.next()
+            if token is _EOF or (type(token) is _Keyword and token == end):
+                return items
+            items.append(lexer.parse_object(token, refs=False))
+
+    while True:
+        token = lexer.next()
+        if token is _EOF:
+            break
+        if type(token) is not _Keyword:
+            continue
+        if token == "begincodespacerange":
+            items = read_until("endcodespacerange")
+            for low in items[0::2]:
+                if isinstance(low, bytes) and low:
+                    lengths.add(len(low))
+        elif token == "beginbfchar":
+            items = read_until("endbfchar")
+            for source, target in zip(items[0::2], items[1::2]):
+                if isinstance(source, bytes) and isinstance(target, bytes):
+                    mapping[source] = _utf16(target)
+        elif token == "beginbfrange":
+            items = read_until("endbfrange")
+            for low, high, target in zip(items[0::3], items[1::3], items[2::3]):
+                if not isinstance(low, bytes) or not isinstance(high, bytes):
+                    continue
+                size = len(low)
+                first = int.from_bytes(low, "big")
+                last = min(int.from_bytes(high, "big"), first + 0xFFFF)
+                if isinstance(target, bytes):
+                    base = int.from_bytes(target, "big")
+                    for step in range(last - first + 1):
+                        code = (first + step).to_bytes(size, "big")
+                        mapping[code] = _utf16((base + step).to_bytes(len(target) or 2, "big"))
+                elif isinstance(target, list):
+                    for step, item in enumerate(target[: last - first + 1]):
+                        if isinstance(item, bytes):
+                            mapping[(first + step).to_bytes(size, "big")] = _utf16(item)
+    return mapping, lengths
+
+
+class _Font:
+    """文字コード → Unicode と送り幅の対応。"""
+
+    __slots__ = ("code_lengths", "to_unicode", "simple_map", "codec", "widths", "default_width", "width_scale")
+
+    def __init__(self) -> None:
+        self.code_lengths: tuple[int, ...] = (1,)
+        self.to_unicode: dict[bytes, str] = {}
+        self.simple_map: list[str] | None = None
+        self.codec: str | None = None
+        self.widths: dict[int, float] = {}
+        self.default_width = 500.0
+        self.width_scale = 1.0
+
+    @classmethod
+    def load(cls, document: _PdfDocument, spec: dict[str, Any]) -> _Font:
+        font = cls()
+        resolve = document.resolve
+        subtype = resolve(spec.get("Subtype"))
+        encoding = resolve(spec.get("Encoding"))
+
+        if subtype == "Type0":
+            font.code_lengths = (2,)
+            font.default_width = 1000.0
+            descendants = _as_list(resolve(spec.get("DescendantFonts")))
+            descendant = resolve(descendants[0]) if descendants else None
+            if isinstance(descendant, dict):
+                font.default_width = float(resolve(descendant.get("DW", 1000)))
+                font.widths = _cid_widths(resolve, resolve(descendant.get("W")))
+            if isinstance(encoding, str):
+                if "UCS2" in encoding or "UTF16" in encoding:
+                    font.codec = "utf-16-be"
+                elif "RKSJ" in encoding:
+                    font.codec = "cp932"
+                elif "EUC" in encoding:
+                    font.codec = "euc_jp"
+        else:
+            font.simple_map = _simple_encoding(resolve, encoding, spec)
+            first_char = resolve(spec.get("FirstChar", 0))
+            widths = resolve(spec.get("Widths"))
+            if isinstance(widths, list) and type(first_char) is int:
+                font.widths = {
+                    first_char + index: float(resolve(width))
+                    for index, width in enumerate(widths)
+                    if isinstance(resolve(width), (int, float))
+                }
+            descriptor = resolve(spec.get("FontDescriptor"))
+            if isinstance(descriptor, dict) and isinstance(resolve(descriptor.get("MissingWidth")), (int, float)):
+                font.default_width = float(resolve(descriptor["MissingWidth"])) or 500.0
+            if subtype == "Type3":
+                matrix = resolve(spec.get("FontMatrix"))
+                if isinstance(matrix, list) and matrix:
+                    font.width_scale = float(resolve(matrix[0])) * 1000
+
+        to_unicode = resolve(spec.get("ToUnicode"))
+        if isinstance(to_unicode, _Stream):
+            try:
+                mapping, lengths = _parse_cmap(document.decode_stream(to_unicode))
+            except (_UnsupportedFilterError, ValueError):
+                mapping, lengths = {}, set()
+            font.to_unicode = mapping
+            if subtype == "Type0":
+                lengths = lengths or {len(key) for key in mapping}
+                if lengths:
+                    font.code_lengths = tuple(sorted(lengths, reverse=True))
+        return font
+
+    def decode(self, data: bytes) -> tuple[str, float, int, int, int]:
+        """文字列を (テキスト, 送り幅の合計 / 1000, 文字コード数, 1 バイト空白の数, 未変換の文字数) へ変換する。"""
+
+        if self.codec is not None and not self.to_unicode:
+            text = data.decode(self.codec, errors="ignore")
+            return text, len(text) * self.default_width / 1000, len(text), text.count(" "), 0
+
+        parts: list[str] = []
+        width = 0.0
+        codes = 0
+        spaces = 0
+        unmapped = 0
+        to_unicode = self.to_unicode
+        simple_map = self.simple_map
+        widths = self.widths
+        default_width = self.default_width
+        lengths = self.code_lengths
+        size = len(data)
+        position = 0
+        while position < size:
+            length = lengths[-1]
+            if len(lengths) > 1:
+                for candidate in lengths:
+                    if data[position : position + candidate] in to_unicode:
+                        length = candidate
+                        break
+            chunk = data[position : position + length]
+            position += length
+            code = int.from_bytes(chunk, "big")
+            text = to_unicode.get(chunk)
+            if text is None:
+                if simple_map is not None and length == 1:
+                    text = simple_map[code]
+                elif self.codec is not None:
+                    text = chunk.decode(self.codec, errors="ignore")
+                else:
+                    text = ""
+                    unmapped += 1
+            parts.append(text)
+            width += widths.get(code, default_width)
+            codes += 1
+            if length == 1 and code == 32:
+                spaces += 1
+        return "".join(parts), width * self.width_scale / 1000, codes, spaces, unmapped
+
+
+def _cid_widths(resolve: Any, spec: Any) -> dict[int, float]:
+    widths: dict[int, float] = {}
+    if not isinstance(spec, list):
+        return widths
+    items = [resolve(item) for item in spec]
+    index = 0
+    while index + 1 < len(items):
+        first = items[index]
+        second = items[index + 1]
+        if type(first) is not int:
+            index += 1
+            continue
+        if isinstance(second, list):
+            for offset, width in enumerate(second):
+                width = resolve(width)
+                if isinstance(width, (int, float)):
+                    widths[first + offset] = float(width)
+            index += 2
+        elif index + 2 < len(items) and isinstance(items[index + 2], (int, float)):
+            last = int(second)
+            for code in range(first, min(last, first + 0xFFFF) + 1):
+                widths[code] = float(items[index + 2])
+            index += 3
+        else:
+            index += 1
+    return widths
+
+
+def _simple_encoding(resolve: Any, encoding: Any, spec: dict[str, Any]) -> list[str]:
+    base_name: Any = encoding
+    differences: list[Any] = []
+    if isinstance(encoding, dict):
+        base_name = resolve(encoding.get("BaseEncoding"))
+        differences = resolve(encoding.get("Differences")) or []
+    codec = "mac_roman" if base_name == "MacRomanEncoding" else "cp1252"
+    table = [bytes([code]).decode(codec, errors="ignore") for code in range(256)]
+    if resolve(spec.get("Subtype")) == "Type3" and not differences:
+        return table
+    code = 0
+    for item in differences:
+        item = resolve(item)
+        if type(item) is int:
+            code = item
+        elif isinstance(item, str) and not isinstance(item, _Keyword):
+            if 0 <= code < 256:
+                mapped = _glyph_to_text(item)
+                if mapped is not None:
+                    table[code] = mapped
+            code += 1
+    return table
+
+
+# ---------------------------------------------------------------------------
+# コンテンツストリーム
+
+
+_Matrix = tuple[float, float, float, float, float, float]
+_IDENTITY: _Matrix = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+_INLINE_IMAGE_END_RE = re.compile(rb"[ \t\r\n\x0c\x00]EI(?=[ \t\r\n\x0c\x00]|$)")
+
+
+def _multiply(m: Sequence[float], n: Sequence[float]) -> _Matrix:
+    a, b, c, d, e, f = m
+    a2, b2, c2, d2, e2, f2 = n
+    return (
+        a * a2 + b * c2,
+        a * b2 + b * d2,
+        c * a2 + d * c2,
+        c * b2 + d * d2,
+        e * a2 + f * c2 + e2,
+        e * b2 + f * d2 + f2,
+    )
+
+
+class _Run:
+    """同じベースライン上で連続して描画された文字列。"""
+
+    __slots__ = ("x0", "x1", "y", "size", "text")
+
+    def __init__(self, x0: float, x1: float, y: float, size: float, text: str) -> None:
+        self.x0 = x0
+        self.x1 = x1
+        self.y = y
+        self.size = size
+        self.text = text
+
+
+class _ContentInterpreter:
+    """テキスト関連の演算子だけを解釈して文字列の位置を集める。"""
+
+    def __init__(self, document: _PdfDocument) -> None:
+        self._document = document
+        self.runs: list[_Run] = []
+        self.unmapped = 0
+        self._active_forms: set[int] = set()
+
+    def run(self, content: bytes, resources: dict[str, Any], ctm: _Matrix, depth: int) -> None:
+        resolve = self._document.resolve
+        fonts = resolve(resources.get("Font")) or {}
+        xobjects = resolve(resources.get("XObject")) or {}
+
+        stack: list[tuple[Any, ...]] = []
+        font: _Font | None = None
+        font_size = 0.0
+        char_spacing = 0.0
+        word_spacing = 0.0
+        horizontal_scale = 1.0
+        leading = 0.0
+        rise = 0.0
+        tm: _Matrix = _IDENTITY
+        tlm: _Matrix = _IDENTITY
+
+        lexer = _Lexer(content)
+        operands: list[Any] = []
+
+        def show(data: bytes) -> None:
+            nonlocal tm
+            if font is None:
+                return
+            text, width, codes, spaces, unmapped = font.decode(data)
+            self.unmapped += unmapped
+            advance = (width * font_size + char_spacing * codes + word_spacing * spaces) * horizontal_scale
+            matrix = _multiply(tm, ctm)
+            x0 = matrix[4] + rise * matrix[2]
+            y0 = matrix[5] + rise * matrix[3]
+            x1 = advance * matrix[0] + x0
+            size = abs(font_size) * math.hypot(matrix[2], matrix[3]) or abs(font_size)
+            if text:
+                self._emit(x0, x1, y0, size, text)
+            tm = (tm[0], tm[1], tm[2], tm[3], advance * tm[0] + tm[4], advance * tm[1] + tm[5])
+
+        def next_line(tx: float, ty: float) -> None:
+            nonlocal tm, tlm
+            tlm = (tlm[0], tlm[1], tlm[2], tlm[3], tx * tlm[0] + ty * tlm[2] + tlm[4], tx * tlm[1] + ty * tlm[3] + tlm[5])
+            tm = tlm
+
+        while True:
+            token = lexer.next()
+            if token is _EOF:
+                break
+            if type(token) is not _Keyword or token is _ARRAY_OPEN or token is _DICT_OPEN or token in _CONSTANTS:
+                operands.append(lexer.parse_object(token, refs=False))
+                continue
+            op = str(token)
+            try:
+                if op == "Tj":
+                    if operands and isinstance(operands[-1], bytes):
+                        show(operands[-1])
+                elif op == "TJ":
+                    if operands and isinstance(operands[-1], list):
+                        for item in operands[-1]:
+                            if isinstance(item, bytes):
+                                show(item)
+                            elif isinstance(item, (int, float)):
+                                shift = -item / 1000 * font_size * horizontal_scale
+                                tm = (tm[0], tm[1], tm[2], tm[3], shift * tm[0] + tm[4], shift * tm[1] + tm[5])
+                elif op == "Td":
+                    next_line(float(operands[-2]), float(operands[-1]))
+                elif op == "TD":
+                    leading = -float(operands[-1])
+                    next_line(float(operands[-2]), float(operands[-1]))
+                elif op == "T*":
+                    next_line(0.0, -leading)
+                elif op == "'":
+                    next_line(0.0, -leading)
+                    if operands and isinstance(operands[-1], bytes):
+                        show(operands[-1])
+                elif op == '"':
+                    word_spacing = float(operands[-3])
+                    char_spacing = float(operands[-2])
+                    next_line(0.0, -leading)
+                    if isinstance(operands[-1], bytes):
+                        show(operands[-1])
+                elif op == "Tm":
+                    tm = tlm = tuple(float(value) for value in operands[-6:])  # type: ignore[assignment]
+                elif op == "Tf":
+                    font_size = float(operands[-1])
+                    reference = fonts.get(operands[-2]) if isinstance(fonts, dict) else None
+                    font = self._document.font(reference) if reference is not None else None
+                elif op == "BT":
+                    tm = tlm = _IDENTITY
+                elif op == "TL":
+                    leading = float(operands[-1])
+                elif op == "Tc":
+                    char_spacing = float(operands[-1])
+                elif op == "Tw":
+                    word_spacing = float(operands[-1])
+                elif op == "Tz":
+                    horizontal_scale = float(operands[-1]) / 100
+                elif op == "Ts":
+                    rise = float(operands[-1])
+                elif op == "cm":
+                    ctm = _multiply([float(value) for value in operands[-6:]], ctm)
+                elif op == "q":
+                    stack.append((ctm, font, font_size, char_spacing, word_spacing, horizontal_scale, leading, rise))
+                elif op == "Q":
+                    if stack:
+                        ctm, font, font_size, char_spacing, word_spacing, horizontal_scale, leading, rise = stack.pop()
+                elif op == "Do":
+                    if isinstance(xobjects, dict) and operands:
+                        self._run_form(xobjects.get(operands[-1]), resources, ctm, depth)
+                elif op == "ID":
+                    match = _INLINE_IMAGE_END_RE.search(content, lexer.pos + 1)
+                    lexer.pos = match.end() if match else len(content)
+            except (IndexError, TypeError, ValueError):
+                # オペランドが欠けた演算子は無視して続行する
+                pass
+            operands.clear()
+
+    def _run_form(self, reference: Any, resources: dict[str, Any], ctm: _Matrix, depth: int) -> None:
+        if depth >= _MAX_FORM_DEPTH or reference is None:
+            return
+        resolve = self._document.resolve
+        key = reference.num if type(reference) is _Ref else id(reference)
+        stream = resolve(reference)
+        if not isinstance(stream, _Stream) or stream.attrs.get("Subtype") != "Form":
+            return
+        if key in self._active_forms:
+            return
+        matrix = resolve(stream.attrs.get("Matrix"))
+        if isinstance(matrix, list) and len(matrix) == 6:
+            ctm = _multiply([float(resolve(value)) for value in matrix], ctm)
+        form_resources = resolve(stream.attrs.get("Resources"))
+        self._active_forms.add(key)
+        try:
+            self.run(
+                self._document.decode_stream(stream),
+                form_resources if isinstance(form_resources, dict) else resources,
+                ctm,
+                depth + 1,
+            )
+        finally:
+            self._active_forms.discard(key)
+
+    def _emit(self, x0: float, x1: float, y: float, size: float, text: str) -> None:
+        runs = self.runs
+        if runs:
+            last = runs[-1]
+            # 直前の文字列に連続する場合は 1 つの run にまとめる
+            if abs(last.y - y) < 0.01 and abs(x0 - last.x1) < max(size, last.size) * _WORD_GAP_RATIO:
+                last.text += text
+                last.x1 = x1
+                last.size = max(last.size, size)
+                return
+        runs.append(_Run(x0, x1, y, size, text))
+
+
+def _layout_lines(runs: list[_Run]) -> list[str]:
+    """run を上から順に行へまとめ、行内は x 座標順に連結する。
+
+    ベースラインの差がフォントサイズの半分以内なら同じ行とみなし、
+    文字間の隙間が大きい箇所には空白を補う。
+    """
+
+    if not runs:
+        return []
+    ordered = sorted(runs, key=lambda run: (-run.y, run.x0))
+    lines: list[list[_Run]] = []
+    current: list[_Run] = []
+    line_y = 0.0
+    line_size = 0.0
+    for run in ordered:
+        if current and abs(line_y - run.y) <= max(line_size, run.size) * 0.5:
+            current.append(run)
+            line_size = max(line_size, run.size)
+            continue
+        if current:
+            lines.append(current)
+        current = [run]
+        line_y = run.y
+        line_size = run.size
+    lines.append(current)
+
+    output: list[str] = []
+    for line in lines:
+        line.sort(key=lambda run: run.x0)
+        pieces = [line[0].text]
+        right = line[0].x1
+        for run in line[1:]:
+            gap = run.x0 - right
+            if gap > run.size * _WORD_GAP_RATIO and not pieces[-1].endswith(" ") and not run.text.startswith(" "):
+                pieces.append(" ")
+            pieces.append(run.text)
+            right = max(right, run.x1)
+        text = "".join(pieces).strip()
+        if text:
+            output.append(text)
+    return output
+
+
+__all__ = [
+    "DEFAULT_PARALLEL_MIN_PAGES",
+    "NativePdfTextExtractor",
+    "PdfPageRangeError",
+    "PdfPageText",
+    "PdfTextExtractionError",
+    "PdfTextExtractor",
+    "PdfTextResult",
+    "parse_page_range",
+]
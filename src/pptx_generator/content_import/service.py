@@ -3,21 +3,43 @@
 from __future__ import annotations
 
 import base64
+import codecs
 import json
+import os
+import queue
 import shutil
 import subprocess
 import textwrap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from hashlib import sha256
 from html.parser import HTMLParser
 from pathlib import Path
 from tempfile import NamedTemporaryFile, TemporaryDirectory
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
 from urllib.parse import unquote_to_bytes, urlparse
 from urllib.request import Request, urlopen
 
 from ..models import ContentApprovalDocument, ContentDocumentMeta, ContentElements, ContentSlide
+from .cache import ConversionCache
+from .pdf_text import (NativePdfTextExtractor, PdfPageRangeError,
+                       PdfTextExtractionError, PdfTextExtractor, PdfTextResult)
+
+DEFAULT_IMPORT_WORKERS = 8
+DEFAULT_SOFFICE_WORKERS = 2
+DEFAULT_SOFFICE_PROFILE_DIR = Path(".pptx/cache/soffice")
+DEFAULT_PDF_BACKEND = "auto"
+PDF_BACKENDS = ("auto", "native", "libreoffice")
+# auto で Unicode へ変換できなかった文字がこの割合以上なら LibreOffice へフォールバックする
+DEFAULT_PDF_UNMAPPED_RATIO = 0.2
+MAX_BODY_LINES = 6
+
+_STREAM_CHUNK_SIZE = 64 * 1024
+
+_Block = tuple[str, list[str]]
 
 
 class ContentImportError(RuntimeError):
@@ -35,15 +57,17 @@ class ContentImportResult:
 
 @dataclass(slots=True)
 class _SourcePayload:
-    """入力ソースを読み込んだ結果。"""
+    """入力ソースを読み込んだ結果。本文は見出し単位のブロックへ分割済み。"""
 
     source: str
     kind: str
-    text: str
+    blocks: list[_Block]
     hash_value: str
     retrieved_at: datetime
     content_type: str | None
     warnings: list[str]
+    conversion_cache: str | None = None
+    pdf: PdfTextResult | None = None
 
 
 @dataclass(slots=True)
@@ -56,11 +80,16 @@ class _SourceProcessingResult:
 
 
 class _HTMLTextExtractor(HTMLParser):
-    """シンプルな HTML → テキスト変換器。"""
+    """シンプルな HTML → テキスト変換器。
+
+    ``feed_partial`` でチャンク単位に投入し、``pop_lines`` で確定した行から順に取り出せる。
+    """
 
     def __init__(self) -> None:  # noqa: D401 - HTMLParser 初期化
         super().__init__()
         self._chunks: list[str] = []
+        self._line = ""
+        self._pending = ""
 
     def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:  # noqa: D401
         if tag in {"p", "div", "br", "li", "h1", "h2", "h3", "h4", "h5", "h6"}:
@@ -75,23 +104,225 @@ class _HTMLTextExtractor(HTMLParser):
         if stripped:
             self._chunks.append(stripped)
 
-    def get_text(self) -> str:
-        lines = []
-        buffer = ""
+    def feed_partial(self, text: str, *, final: bool = False) -> None:
+        """テキストノードを分断しないよう、最後のタグ終端までを解析に回す。"""
+
+        data = self._pending + text
+        if final:
+            self._pending = ""
+            self.feed(data)
+            self.close()
+            return
+        cut = data.rfind(">") + 1
+        self._pending = data[cut:]
+        if cut:
+            self.feed(data[:cut])
+
+    def pop_lines(self) -> list[str]:
+        lines: list[str] = []
         for chunk in self._chunks:
             if chunk == "\n":
-                if buffer:
-                    lines.append(buffer)
-                    buffer = ""
+                if self._line.strip():
+                    lines.append(self._line.strip())
+                self._line = ""
                 continue
-            buffer = f"{buffer} {chunk}".strip()
-        if buffer:
-            lines.append(buffer)
-        return "\n".join(line.strip() for line in lines if line.strip())
+            self._line = f"{self._line} {chunk}".strip()
+        self._chunks.clear()
+        return lines
+
+    def get_text(self) -> str:
+        lines = self.pop_lines()
+        if self._line.strip():
+            lines.append(self._line.strip())
+            self._line = ""
+        return "\n".join(lines)
+
+
+class _BlockSplitter:
+    """行を逐次受け取り、見出し単位のブロックへまとめる。
+
+    本文は 1 ブロックあたり ``MAX_BODY_LINES`` 行を超えて使われないため、それ以上は保持しない。
+    """
+
+    def __init__(self) -> None:
+        self.blocks: list[_Block] = []
+        self._title: str | None = None
+        self._buffer: list[str] = []
+
+    def feed_line(self, raw_line: str) -> None:
+        line = raw_line.strip()
+        if not line:
+            return
+        if line.startswith("#"):
+            new_title = line.lstrip("#").strip()
+            if self._title:
+                self.blocks.append((self._title, self._buffer))
+            self._title = new_title or self._title or "Untitled"
+            self._buffer = []
+            return
+        if self._title is None:
+            self._title = _truncate(line, 120)
+            return
+        if len(self._buffer) < MAX_BODY_LINES:
+            self._buffer.append(_strip_bullet_marker(line))
+
+    def feed_text(self, text: str) -> None:
+        for line in text.splitlines():
+            self.feed_line(line)
+
+    def close(self) -> list[_Block]:
+        if self._title:
+            self.blocks.append((self._title, self._buffer))
+            self._title = None
+            self._buffer = []
+        return self.blocks
+
+
+class _StreamDecoder:
+    """バイト列を逐次デコードする。不正なバイトを検出した以降は無視して続行する。"""
+
+    def __init__(self, encoding: str) -> None:
+        self._encoding = encoding
+        self._decoder = codecs.getincrementaldecoder(encoding)()
+        self.lossy = False
+
+    def decode(self, data: bytes, *, final: bool = False) -> str:
+        try:
+            return self._decoder.decode(data, final)
+        except UnicodeDecodeError:
+            self._decoder = codecs.getincrementaldecoder(self._encoding)(errors="ignore")
+            self.lossy = True
+            return self._decoder.decode(data, final)
+
+
+class _LineBuffer:
+    """デコード済みテキストを ``str.splitlines`` と同じ境界で行に分ける。"""
+
+    def __init__(self) -> None:
+        self._pending = ""
+
+    def feed(self, text: str, *, final: bool = False) -> list[str]:
+        data = self._pending + text
+        lines = data.splitlines()
+        if not final and lines and len((data[-1] + "x").splitlines()) == 1:
+            self._pending = lines.pop()
+        else:
+            self._pending = ""
+        return lines
+
+
+class LibreOfficeWorkerPool:
+    """soffice による PDF → テキスト変換を同時実行数を絞って行う。
+
+    ワーカーごとに専用のユーザープロファイルを ``profile_root`` 配下に常設し、
+    2 回目以降の起動でプロファイル初期化を省く。同じ設定のプールは ``shared`` で共有する。
+    """
+
+    _shared: dict[tuple[str, str, int, int], LibreOfficeWorkerPool] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        *,
+        soffice_path: Path | None = None,
+        timeout_sec: int = 120,
+        workers: int = DEFAULT_SOFFICE_WORKERS,
+        profile_root: Path | None = None,
+    ) -> None:
+        self._soffice_path = soffice_path
+        self._timeout_sec = timeout_sec
+        self._profile_root = (profile_root or DEFAULT_SOFFICE_PROFILE_DIR).expanduser().resolve()
+        self._profiles: queue.Queue[Path] = queue.Queue()
+        for index in range(max(1, workers)):
+            self._profiles.put(self._profile_root / f"worker-{index}")
+
+    @classmethod
+    def shared(
+        cls,
+        *,
+        soffice_path: Path | None = None,
+        timeout_sec: int = 120,
+        workers: int | None = None,
+        profile_root: Path | None = None,
+    ) -> LibreOfficeWorkerPool:
+        """PPTX_SOFFICE_WORKERS / PPTX_SOFFICE_PROFILE_DIR を既定値としてプールを返す。"""
+
+        if workers is None:
+            workers = _int_env("PPTX_SOFFICE_WORKERS", DEFAULT_SOFFICE_WORKERS)
+        if profile_root is None:
+            env_dir = os.getenv("PPTX_SOFFICE_PROFILE_DIR")
+            profile_root = Path(env_dir) if env_dir else DEFAULT_SOFFICE_PROFILE_DIR
+        key = (str(soffice_path or ""), str(profile_root), workers, timeout_sec)
+        with cls._shared_lock:
+            pool = cls._shared.get(key)
+            if pool is None:
+                pool = cls(
+                    soffice_path=soffice_path,
+                    timeout_sec=timeout_sec,
+                    workers=workers,
+                    profile_root=profile_root,
+                )
+                cls._shared[key] = pool
+            return pool
+
+    def convert(self, path: Path) -> str:
+        soffice = self._soffice_path or shutil.which("soffice")
+        if soffice is None:
+            msg = "LibreOffice (soffice) が見つかりません。--libreoffice-path で指定してください"
+            raise ContentImportError(msg)
+
+        profile = self._profiles.get()
+        try:
+            with TemporaryDirectory() as tmp_dir:
+                output_dir = Path(tmp_dir)
+                cmd = [
+                    str(soffice),
+                    f"-env:UserInstallation={profile.as_uri()}",
+                    "--headless",
+                    "--convert-to",
+                    "txt:Text (encoded):UTF8",
+                    str(path),
+                    "--outdir",
+                    str(output_dir),
+                ]
+                try:
+                    completed = subprocess.run(  # noqa: S603
+                        cmd,
+                        check=False,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        text=True,
+                        timeout=self._timeout_sec,
+                    )
+                except subprocess.TimeoutExpired as exc:
+                    msg = f"LibreOffice による PDF 変換がタイムアウトしました: {path}"
+                    raise ContentImportError(msg) from exc
+
+                if completed.returncode != 0:
+                    msg = (
+                        "LibreOffice による PDF 変換に失敗しました: "
+                        f"{path}\nstdout: {completed.stdout}\nstderr: {completed.stderr}"
+                    )
+                    raise ContentImportError(msg)
+
+                txt_path = output_dir / f"{path.stem}.txt"
+                if not txt_path.exists():
+                    msg = f"LibreOffice 変換結果が見つかりません: {txt_path}"
+                    raise ContentImportError(msg)
+                return txt_path.read_text(encoding="utf-8")
+        finally:
+            self._profiles.put(profile)
 
 
 class ContentImportService:
-    """プレーンテキスト・PDF・URL を工程3向けドラフトへ正規化する。"""
+    """プレーンテキスト・PDF・URL を工程3向けドラフトへ正規化する。
+
+    ソースの取得は ``max_workers`` 並列で行い、本文はチャンク単位でデコード・分割する。
+    PDF は ``pdf_backend`` に従って ``pdf_extractor``（既定は純 Python 実装）または
+    LibreOffice でテキスト化し、結果は sha256 をキーに ``ConversionCache``（既定は ``output_dir`` 配下）へ保存する。
+    ``auto`` ではネイティブ抽出に失敗した場合、テキストが空の場合、ToUnicode のないフォントなどで
+    変換できなかった文字の割合が ``pdf_unmapped_ratio`` 以上の場合に LibreOffice へフォールバックする。
+    """
 
     def __init__(
         self,
@@ -99,10 +330,31 @@ class ContentImportService:
         libreoffice_path: Path | None = None,
         soffice_timeout_sec: int = 120,
         http_timeout_sec: int = 20,
+        max_workers: int = DEFAULT_IMPORT_WORKERS,
+        cache: ConversionCache | None = None,
+        libreoffice_pool: LibreOfficeWorkerPool | None = None,
+        pdf_extractor: PdfTextExtractor | None = None,
+        pdf_backend: str | None = None,
+        pdf_page_range: str | None = None,
+        pdf_unmapped_ratio: float | None = None,
+        output_dir: Path | None = None,
     ) -> None:
+        backend = (pdf_backend or os.getenv("PPTX_PDF_BACKEND") or DEFAULT_PDF_BACKEND).strip().lower()
+        if backend not in PDF_BACKENDS:
+            msg = f"未対応の PDF バックエンドです: {backend}"
+            raise ContentImportError(msg)
         self._libreoffice_path = libreoffice_path
         self._soffice_timeout = soffice_timeout_sec
         self._http_timeout = http_timeout_sec
+        self._max_workers = max(1, max_workers)
+        self._cache = cache or ConversionCache.from_env(output_dir)
+        self._libreoffice_pool = libreoffice_pool
+        self._pdf_extractor = pdf_extractor or NativePdfTextExtractor()
+        self._pdf_backend = backend
+        self._pdf_page_range = pdf_page_range
+        if pdf_unmapped_ratio is None:
+            pdf_unmapped_ratio = _float_env("PPTX_PDF_UNMAPPED_RATIO", DEFAULT_PDF_UNMAPPED_RATIO)
+        self._pdf_unmapped_ratio = pdf_unmapped_ratio
 
     # 公開 API ------------------------------------------------------------
     def import_sources(self, sources: Sequence[str]) -> ContentImportResult:
@@ -116,8 +368,7 @@ class ContentImportService:
         meta_entries: list[dict[str, object]] = []
         warnings: list[str] = []
 
-        for source in sources:
-            payload = self._load_source(source)
+        for payload in self._load_sources(sources):
             processed = self._convert_source(payload, start_index=len(slides))
             slides.extend(processed.slides)
             meta_entries.append(processed.meta)
@@ -135,6 +386,19 @@ class ContentImportService:
         return ContentImportResult(document=document, meta=meta, warnings=warnings)
 
     # 内部処理 ------------------------------------------------------------
+    def _load_sources(self, sources: Sequence[str]) -> list[_SourcePayload]:
+        """ソースを並列に読み込み、入力順で返す。失敗したソースがあれば最初のものを送出する。"""
+
+        workers = min(self._max_workers, len(sources))
+        if workers <= 1:
+            return [self._load_source(source) for source in sources]
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="content-import")
+        try:
+            futures = [executor.submit(self._load_source, source) for source in sources]
+            return [future.result() for future in futures]
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def _load_source(self, source: str) -> _SourcePayload:
         parsed = urlparse(source)
         if parsed.scheme in {"http", "https"}:
@@ -150,87 +414,97 @@ class ContentImportService:
             raise ContentImportError(msg)
 
         suffix = path.suffix.lower()
-        raw = path.read_bytes()
-        hash_value = sha256(raw).hexdigest()
         retrieved_at = datetime.now(timezone.utc)
         warnings: list[str] = []
+        conversion_cache: str | None = None
+        pdf: PdfTextResult | None = None
 
         if suffix == ".pdf":
-            text = self._convert_pdf(path)
+            digest = sha256()
+            with path.open("rb") as stream:
+                for chunk in _iter_chunks(stream):
+                    digest.update(chunk)
+            hash_value = digest.hexdigest()
+            blocks, conversion_cache, pdf = self._convert_pdf_cached(path, hash_value)
+            warnings.extend(pdf.warnings)
             content_type = "application/pdf"
         else:
-            try:
-                text = raw.decode("utf-8")
-            except UnicodeDecodeError:
-                text = raw.decode("utf-8", errors="ignore")
-                warnings.append("UTF-8 で解釈できない文字を無視しました")
+            with path.open("rb") as stream:
+                blocks, hash_value = self._read_text_stream(
+                    _iter_chunks(stream),
+                    encoding="utf-8",
+                    markup=None,
+                    warnings=warnings,
+                    decode_warning="UTF-8 で解釈できない文字を無視しました",
+                )
             content_type = "text/plain"
 
         return _SourcePayload(
             source=str(path),
             kind="file",
-            text=text,
+            blocks=blocks,
             hash_value=hash_value,
             retrieved_at=retrieved_at,
             content_type=content_type,
             warnings=warnings,
+            conversion_cache=conversion_cache,
+            pdf=pdf,
         )
 
     def _load_http_source(self, source: str) -> _SourcePayload:
         headers = {"User-Agent": "pptx-generator/0.1"}
         request = Request(source, headers=headers)
+        warnings: list[str] = []
         try:
             with urlopen(request, timeout=self._http_timeout) as response:  # noqa: S310
-                raw = response.read()
                 content_type = response.headers.get("Content-Type")
+                if content_type and "pdf" in content_type:
+                    return self._load_http_pdf(source, _iter_chunks(response))
+                blocks, hash_value = self._read_text_stream(
+                    _iter_chunks(response),
+                    encoding=_extract_charset(content_type) or "utf-8",
+                    markup=_markup_kind(content_type),
+                    warnings=warnings,
+                    decode_warning="レスポンスのデコード時に無効なバイトを無視しました",
+                )
         except OSError as exc:  # noqa: PERF203
             msg = f"URL からの取得に失敗しました: {source}"
             raise ContentImportError(msg) from exc
 
-        hash_value = sha256(raw).hexdigest()
-        retrieved_at = datetime.now(timezone.utc)
-        warnings: list[str] = []
-
-        if content_type and "pdf" in content_type:
-            with NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_file:
-                tmp_file.write(raw)
-                tmp_path = Path(tmp_file.name)
-            try:
-                text = self._convert_pdf(tmp_path)
-            finally:
-                tmp_path.unlink(missing_ok=True)
-            return _SourcePayload(
-                source=source,
-                kind="url",
-                text=text,
-                hash_value=hash_value,
-                retrieved_at=retrieved_at,
-                content_type="application/pdf",
-                warnings=warnings,
-            )
-
-        encoding = _extract_charset(content_type) or "utf-8"
-        try:
-            text = raw.decode(encoding)
-        except UnicodeDecodeError:
-            text = raw.decode(encoding, errors="ignore")
-            warnings.append("レスポンスのデコード時に無効なバイトを無視しました")
-
-        if content_type and "html" in content_type:
-            text = self._html_to_text(text)
-        elif content_type and "json" in content_type:
-            text = self._json_to_text(text, warnings)
-
         return _SourcePayload(
             source=source,
             kind="url",
-            text=text,
+            blocks=blocks,
             hash_value=hash_value,
-            retrieved_at=retrieved_at,
+            retrieved_at=datetime.now(timezone.utc),
             content_type=content_type,
             warnings=warnings,
         )
 
+    def _load_http_pdf(self, source: str, chunks: Iterable[bytes]) -> _SourcePayload:
+        digest = sha256()
+        with NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_file:
+            for chunk in chunks:
+                digest.update(chunk)
+                tmp_file.write(chunk)
+            tmp_path = Path(tmp_file.name)
+        hash_value = digest.hexdigest()
+        try:
+            blocks, conversion_cache, pdf = self._convert_pdf_cached(tmp_path, hash_value)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return _SourcePayload(
+            source=source,
+            kind="url",
+            blocks=blocks,
+            hash_value=hash_value,
+            retrieved_at=datetime.now(timezone.utc),
+            content_type="application/pdf",
+            warnings=list(pdf.warnings),
+            conversion_cache=conversion_cache,
+            pdf=pdf,
+        )
+
     def _load_data_uri(self, source: str) -> _SourcePayload:
         parsed = urlparse(source)
         if not parsed.path:
@@ -251,85 +525,160 @@ class ContentImportService:
         else:
             raw = unquote_to_bytes(data_part)
 
-        hash_value = sha256(raw).hexdigest()
         retrieved_at = datetime.now(timezone.utc)
         warnings: list[str] = []
+        conversion_cache: str | None = None
+        pdf: PdfTextResult | None = None
 
         if "pdf" in mime_type:
+            hash_value = sha256(raw).hexdigest()
             with NamedTemporaryFile(suffix=".pdf", delete=False) as tmp_file:
                 tmp_file.write(raw)
                 tmp_path = Path(tmp_file.name)
             try:
-                text = self._convert_pdf(tmp_path)
+                blocks, conversion_cache, pdf = self._convert_pdf_cached(tmp_path, hash_value)
             finally:
                 tmp_path.unlink(missing_ok=True)
+            warnings.extend(pdf.warnings)
         else:
-            encoding = _extract_charset(mime_part) or "utf-8"
-            try:
-                text = raw.decode(encoding)
-            except UnicodeDecodeError:
-                text = raw.decode(encoding, errors="ignore")
-                warnings.append("data URI のデコード時に無効なバイトを無視しました")
-            if "html" in mime_type:
-                text = self._html_to_text(text)
-            elif "json" in mime_type:
-                text = self._json_to_text(text, warnings)
+            blocks, hash_value = self._read_text_stream(
+                [raw],
+                encoding=_extract_charset(mime_part) or "utf-8",
+                markup=_markup_kind(mime_type),
+                warnings=warnings,
+                decode_warning="data URI のデコード時に無効なバイトを無視しました",
+            )
 
         return _SourcePayload(
             source=source,
             kind="data",
-            text=text,
+            blocks=blocks,
             hash_value=hash_value,
             retrieved_at=retrieved_at,
             content_type=mime_type or None,
             warnings=warnings,
+            conversion_cache=conversion_cache,
+            pdf=pdf,
         )
 
-    def _convert_pdf(self, path: Path) -> str:
-        soffice = self._libreoffice_path or shutil.which("soffice")
-        if soffice is None:
-            msg = "LibreOffice (soffice) が見つかりません。--libreoffice-path で指定してください"
-            raise ContentImportError(msg)
-
-        with TemporaryDirectory() as tmp_dir:
-            output_dir = Path(tmp_dir)
-            cmd = [
-                str(soffice),
-                "--headless",
-                "--convert-to",
-                "txt:Text (encoded):UTF8",
-                str(path),
-                "--outdir",
-                str(output_dir),
-            ]
+    def _read_text_stream(
+        self,
+        chunks: Iterable[bytes],
+        *,
+        encoding: str,
+        markup: str | None,
+        warnings: list[str],
+        decode_warning: str,
+    ) -> tuple[list[_Block], str]:
+        """バイト列をチャンク単位でデコードしながらブロックへ分割し、sha256 とともに返す。
+
+        ``markup`` が ``html`` の場合は ``_HTMLTextExtractor`` を逐次適用する。
+        JSON は整形に全体が必要なため、デコード後にまとめて処理する。
+        """
+
+        digest = sha256()
+        decoder = _StreamDecoder(encoding)
+        splitter = _BlockSplitter()
+        html = _HTMLTextExtractor() if markup == "html" else None
+        json_parts: list[str] | None = [] if markup == "json" else None
+        lines = _LineBuffer()
+
+        def consume(text: str, *, final: bool) -> None:
+            if html is not None:
+                html.feed_partial(text, final=final)
+                emitted = html.pop_lines()
+                if final:
+                    emitted.append(html.get_text())
+                for line in emitted:
+                    splitter.feed_text(line)
+            elif json_parts is not None:
+                json_parts.append(text)
+            else:
+                for line in lines.feed(text, final=final):
+                    splitter.feed_line(line)
+
+        for chunk in chunks:
+            digest.update(chunk)
+            consume(decoder.decode(chunk), final=False)
+        consume(decoder.decode(b"", final=True), final=True)
+
+        if decoder.lossy:
+            warnings.append(decode_warning)
+        if json_parts is not None:
+            splitter.feed_text(self._json_to_text("".join(json_parts), warnings))
+        return splitter.close(), digest.hexdigest()
+
+    def _convert_pdf_cached(self, path: Path, hash_value: str) -> tuple[list[_Block], str, PdfTextResult]:
+        kind = f"pdf-{self._pdf_backend}"
+        if self._pdf_page_range:
+            kind += "-" + sha256(self._pdf_page_range.encode("utf-8")).hexdigest()[:12]
+        started = time.perf_counter()
+        cached, status = self._cache.get_or_convert(
+            hash_value,
+            kind,
+            lambda: json.dumps(self._convert_pdf(path).to_dict(), ensure_ascii=False),
+        )
+        try:
+            result = PdfTextResult.from_dict(json.loads(cached))
+        except (ValueError, KeyError, TypeError):
+            result, status = self._convert_pdf(path), "miss"
+        if status == "hit":
+            result.mark_cached(elapsed_ms=round((time.perf_counter() - started) * 1000, 3))
+        return _split_into_blocks(result.text), status, result
+
+    def _convert_pdf(self, path: Path) -> PdfTextResult:
+        """``pdf_backend`` に従って PDF をテキスト化する。"""
+
+        fallback_reason: str | None = None
+        native_result: PdfTextResult | None = None
+        if self._pdf_backend != "libreoffice":
             try:
-                completed = subprocess.run(  # noqa: S603
-                    cmd,
-                    check=False,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    timeout=self._soffice_timeout,
-                )
-            except subprocess.TimeoutExpired as exc:
-                msg = f"LibreOffice による PDF 変換がタイムアウトしました: {path}"
-                raise ContentImportError(msg) from exc
-
-            if completed.returncode != 0:
-                msg = (
-                    "LibreOffice による PDF 変換に失敗しました: "
-                    f"{path}\nstdout: {completed.stdout}\nstderr: {completed.stderr}"
-                )
-                raise ContentImportError(msg)
+                native_result = self._pdf_extractor.extract(path, page_range=self._pdf_page_range)
+            except PdfTextExtractionError as exc:
+                # ページ範囲の誤りは LibreOffice（範囲指定なし）で変換しても解消しない
+                if self._pdf_backend == "native" or isinstance(exc, PdfPageRangeError):
+                    msg = f"PDF のテキスト抽出に失敗しました: {exc}"
+                    raise ContentImportError(msg) from exc
+                fallback_reason = str(exc)
+            else:
+                fallback_reason = self._native_fallback_reason(native_result)
+                if self._pdf_backend == "native" or fallback_reason is None:
+                    return native_result
+
+        pool = self._libreoffice_pool or LibreOfficeWorkerPool.shared(
+            soffice_path=self._libreoffice_path,
+            timeout_sec=self._soffice_timeout,
+        )
+        started = time.perf_counter()
+        try:
+            text = pool.convert(path)
+        except ContentImportError as exc:
+            if native_result is None:
+                raise
+            native_result.warnings.append(f"LibreOffice へのフォールバックにも失敗しました: {exc}")
+            return native_result
+        warnings: list[str] = []
+        if fallback_reason is not None:
+            warnings.append(f"ネイティブ抽出を利用できないため LibreOffice で変換しました: {fallback_reason}")
+        if self._pdf_page_range:
+            warnings.append("LibreOffice 変換ではページ範囲指定を無視しました")
+        return PdfTextResult(
+            backend="libreoffice",
+            text=text,
+            warnings=warnings,
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 3),
+        )
 
-            txt_path = output_dir / f"{path.stem}.txt"
-            if not txt_path.exists():
-                msg = f"LibreOffice 変換結果が見つかりません: {txt_path}"
-                raise ContentImportError(msg)
-            return txt_path.read_text(encoding="utf-8")
+    def _native_fallback_reason(self, result: PdfTextResult) -> str | None:
+        if not result.text.strip():
+            return "テキストを抽出できませんでした"
+        ratio = result.unmapped_ratio()
+        if ratio >= self._pdf_unmapped_ratio:
+            return f"ToUnicode のないフォントの文字が多いため ({ratio:.0%})"
+        return None
 
     def _convert_source(self, payload: _SourcePayload, *, start_index: int) -> _SourceProcessingResult:
-        blocks = list(_split_into_blocks(payload.text))
+        blocks = payload.blocks
         slides: list[ContentSlide] = []
         warnings = list(payload.warnings)
 
@@ -358,7 +707,7 @@ class ContentImportService:
             )
             slides.append(slide)
 
-        meta = {
+        meta: dict[str, object] = {
             "source": payload.source,
             "kind": payload.kind,
             "retrieved_at": payload.retrieved_at.isoformat(),
@@ -366,6 +715,10 @@ class ContentImportService:
             "content_type": payload.content_type,
             "slides": len(slides),
         }
+        if payload.conversion_cache is not None:
+            meta["conversion_cache"] = payload.conversion_cache
+        if payload.pdf is not None:
+            meta["pdf"] = payload.pdf.to_meta()
 
         return _SourceProcessingResult(slides=slides, meta=meta, warnings=warnings)
 
@@ -379,13 +732,6 @@ class ContentImportService:
             summary = f"{summary}: {first_title}"[:120]
         return ContentDocumentMeta(summary=summary)
 
-    @staticmethod
-    def _html_to_text(html: str) -> str:
-        parser = _HTMLTextExtractor()
-        parser.feed(html)
-        parser.close()
-        return parser.get_text()
-
     @staticmethod
     def _json_to_text(text: str, warnings: list[str]) -> str:
         try:
@@ -409,27 +755,48 @@ def _extract_charset(content_type: str | None) -> str | None:
     return None
 
 
-def _split_into_blocks(text: str) -> Iterable[tuple[str, list[str]]]:
-    current_title: str | None = None
-    buffer: list[str] = []
-    for raw_line in text.splitlines():
-        line = raw_line.strip()
-        if not line:
-            continue
-        if line.startswith("#"):
-            new_title = line.lstrip("#").strip()
-            if current_title:
-                yield current_title, buffer
-            current_title = new_title or current_title or "Untitled"
-            buffer = []
-            continue
-        if current_title is None:
-            current_title = _truncate(line, 120)
-            continue
-        buffer.append(_strip_bullet_marker(line))
+def _split_into_blocks(text: str) -> list[_Block]:
+    splitter = _BlockSplitter()
+    splitter.feed_text(text)
+    return splitter.close()
+
+
+def _iter_chunks(stream) -> Iterator[bytes]:
+    while True:
+        chunk = stream.read(_STREAM_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _markup_kind(content_type: str | None) -> str | None:
+    if not content_type:
+        return None
+    if "html" in content_type:
+        return "html"
+    if "json" in content_type:
+        return "json"
+    return None
+
+
+def _int_env(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
 
-    if current_title:
-        yield current_title, buffer
+def _float_env(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
 
 
 def _strip_bullet_marker(line: str) -> str:
@@ -451,7 +818,7 @@ def _build_body_lines(lines: Sequence[str]) -> tuple[list[str], bool]:
             continue
         for chunk in wrapped:
             body.append(chunk)
-            if len(body) >= 6:
+            if len(body) >= MAX_BODY_LINES:
                 truncated = True
                 break
         if truncated:
@@ -459,7 +826,7 @@ def _build_body_lines(lines: Sequence[str]) -> tuple[list[str], bool]:
 
     if not body:
         body = ["(本文未設定)"]
-    return body[:6], truncated
+    return body[:MAX_BODY_LINES], truncated
 
 
 def _truncate(text: str, limit: int) -> str:
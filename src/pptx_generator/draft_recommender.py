@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Sequence
 
+from .content_ai import llm_client_config_key
 from .draft_intel import clamp_score_detail, compute_analyzer_support
 from .layout_ai import (
     LayoutAIPolicy,
@@ -23,6 +25,8 @@ from .models import (
     DraftLayoutCandidate,
     DraftLayoutScoreDetail,
 )
+from .utils.file_cache import shared_file_cache
+from .utils.layout_catalog import LayoutCatalogIndex, LayoutFeatures
 from .utils.usage_tags import normalize_usage_tag_value
 
 logger = logging.getLogger(__name__)
@@ -62,6 +66,8 @@ class CardLayoutRecommenderConfig:
     policy_path: Path | None = None
     policy_id: str | None = None
     enable_simulated_ai: bool = True
+    ai_batch_size: int = 1
+    ai_concurrency: int = 1
 
 
 @dataclass(slots=True)
@@ -73,6 +79,16 @@ class RecommendationResult:
     ai_response: LayoutAIResponse | None
 
 
+@dataclass(slots=True)
+class RecommendationInput:
+    """一括推薦の入力 1 件。``group`` が異なるカードは同じ AI リクエストにまとめない。"""
+
+    slide: ContentSlide
+    preferred_layout: str
+    analyzer_summary: DraftAnalyzerSummary | None = None
+    group: str | None = None
+
+
 class CardLayoutRecommender:
     """Brief カードとテンプレ情報からレイアウト候補を算出する。"""
 
@@ -90,24 +106,74 @@ class CardLayoutRecommender:
         *,
         slide: ContentSlide,
         preferred_layout: str,
-        layouts: Sequence[LayoutProfile],
+        layouts: Sequence[LayoutProfile] | LayoutCatalogIndex[LayoutProfile],
         analyzer_summary: DraftAnalyzerSummary | None = None,
     ) -> RecommendationResult:
-        if not layouts:
+        index = _as_catalog_index(layouts)
+        if not index:
             return RecommendationResult([], {}, None)
 
-        tags = self._extract_slide_tags(slide)
-        evaluated: list[tuple[LayoutProfile, float, DraftLayoutScoreDetail]] = []
+        ai_scores, ai_response = self._apply_layout_ai(slide, index, analyzer_summary)
+        return self._finalize(slide, preferred_layout, index, analyzer_summary, ai_scores, ai_response)
 
-        for profile in layouts:
-            score, detail = self._heuristic_score(profile, slide, tags, analyzer_summary)
-            evaluated.append((profile, score, detail))
+    def recommend_batch(
+        self,
+        items: Sequence[RecommendationInput],
+        *,
+        layouts: Sequence[LayoutProfile] | LayoutCatalogIndex[LayoutProfile],
+    ) -> list[RecommendationResult]:
+        """複数カードをまとめて推薦する。
+
+        レイアウト AI は ``ai_batch_size`` 件ずつ（グループ内に限り）1 リクエストにまとめ、
+        チャンクを ``ai_concurrency`` 並列で実行する。応答を得られなかったカードはヒューリスティックのみで評価する。
+        """
+
+        index = _as_catalog_index(layouts)
+        if not index:
+            return [RecommendationResult([], {}, None) for _ in items]
+
+        ai_results = self._apply_layout_ai_batch(items, index)
+        return [
+            self._finalize(
+                item.slide, item.preferred_layout, index, item.analyzer_summary, ai_scores, ai_response
+            )
+            for item, (ai_scores, ai_response) in zip(items, ai_results, strict=True)
+        ]
 
-        ai_scores, ai_response = self._apply_layout_ai(slide, evaluated, analyzer_summary)
-        results: list[tuple[DraftLayoutCandidate, DraftLayoutScoreDetail]] = []
+    # ------------------------------------------------------------------ #
+    # internal helpers
+    # ------------------------------------------------------------------ #
+    def _finalize(
+        self,
+        slide: ContentSlide,
+        preferred_layout: str,
+        index: LayoutCatalogIndex[LayoutProfile],
+        analyzer_summary: DraftAnalyzerSummary | None,
+        ai_scores: dict[str, float],
+        ai_response: LayoutAIResponse | None,
+    ) -> RecommendationResult:
+        tags = self._extract_slide_tags(slide)
+        analyzer_support = compute_analyzer_support(analyzer_summary)
 
-        for profile, score, detail in evaluated:
-            layout_id = profile.layout_id
+        # タグを共有するレイアウト・優先レイアウト・AI 評価済みレイアウトは個別に評価する。
+        # 残りはタグ由来の加点がなく容量特徴だけで同点になるため、特徴ごとに上位件数分だけ評価する。
+        lookup_tags = set(tags)
+        if slide.intent:
+            lookup_tags.add(slide.intent.casefold())
+        if slide.type_hint:
+            lookup_tags.add(slide.type_hint.casefold())
+        targeted = index.matching(lookup_tags)
+        for layout_id in (preferred_layout, *ai_scores):
+            position = index.position(layout_id)
+            if position is not None:
+                targeted.add(position)
+        positions = sorted(targeted | set(index.representatives(targeted, self._config.max_candidates)))
+
+        results: list[tuple[int, DraftLayoutCandidate, DraftLayoutScoreDetail]] = []
+        for position in positions:
+            features = index.features[position]
+            layout_id = features.layout_id
+            score, detail = self._heuristic_score(features, slide, tags, analyzer_support)
             ai_value = ai_scores.get(layout_id)
             if ai_value is not None:
                 detail.ai_recommendation = round(ai_value, 3)
@@ -117,7 +183,7 @@ class CardLayoutRecommender:
                 and self._config.enable_simulated_ai
                 and self._config.ai_weight > 0
             ):
-                simulated = self._simulate_ai_score(profile, slide, preferred_layout, tags)
+                simulated = self._simulate_ai_score(features, slide, preferred_layout, tags)
                 detail.ai_recommendation = round(simulated, 3)
                 score += simulated
 
@@ -127,25 +193,26 @@ class CardLayoutRecommender:
                 continue
 
             candidate = DraftLayoutCandidate(layout_id=layout_id, score=round(score, 3))
-            results.append((candidate, detail))
+            results.append((position, candidate, detail))
 
-        results.sort(key=lambda item: item[0].score, reverse=True)
-        return RecommendationResult(results[: self._config.max_candidates], ai_scores, ai_response)
+        results.sort(key=lambda item: (-item[1].score, item[0]))
+        return RecommendationResult(
+            [(candidate, detail) for _, candidate, detail in results[: self._config.max_candidates]],
+            ai_scores,
+            ai_response,
+        )
 
-    # ------------------------------------------------------------------ #
-    # internal helpers
-    # ------------------------------------------------------------------ #
     def _heuristic_score(
         self,
-        profile: LayoutProfile,
+        features: LayoutFeatures,
         slide: ContentSlide,
         tags: set[str],
-        analyzer_summary: DraftAnalyzerSummary | None,
+        analyzer_support: float,
     ) -> tuple[float, DraftLayoutScoreDetail]:
         score = 0.1
         detail = DraftLayoutScoreDetail(content_capacity=0.1)
 
-        usage_tags = set(profile.usage_tags)
+        usage_tags = features.usage_tags
 
         intent_tag = normalize_usage_tag_value(slide.intent)
         if intent_tag and intent_tag in usage_tags:
@@ -170,7 +237,7 @@ class CardLayoutRecommender:
             detail.uses_tag += round(bonus, 3)
 
         body_length = len(slide.elements.body)
-        max_lines = profile.max_lines()
+        max_lines = features.max_lines
         if max_lines is not None:
             if body_length <= max_lines:
                 score += 0.1
@@ -181,10 +248,10 @@ class CardLayoutRecommender:
                 detail.content_capacity -= penalty
 
         has_table = slide.elements.table_data is not None
-        if has_table and profile.allows_table():
+        if has_table and features.allows_table:
             score += 0.1
             detail.content_capacity += 0.1
-        elif has_table and not profile.allows_table():
+        elif has_table and not features.allows_table:
             score -= 0.3
             detail.content_capacity -= 0.3
 
@@ -193,7 +260,6 @@ class CardLayoutRecommender:
             detail.diversity += round(diversity_bonus, 3)
             score += diversity_bonus
 
-        analyzer_support = compute_analyzer_support(analyzer_summary)
         detail.analyzer_support = round(analyzer_support, 3)
         score += analyzer_support
 
@@ -202,7 +268,7 @@ class CardLayoutRecommender:
     def _apply_layout_ai(
         self,
         slide: ContentSlide,
-        evaluated: Sequence[tuple[LayoutProfile, float, DraftLayoutScoreDetail]],
+        index: LayoutCatalogIndex[LayoutProfile],
         analyzer_summary: DraftAnalyzerSummary | None,
     ) -> tuple[dict[str, float], LayoutAIResponse | None]:
         if not self._config.enable_ai or self._config.ai_weight <= 0:
@@ -213,15 +279,119 @@ class CardLayoutRecommender:
             return {}, None
         policy, client = bundle
 
-        candidate_ids = [profile.layout_id for profile, _, _ in evaluated]
-        if not candidate_ids:
+        request = self._build_layout_ai_request(policy, slide, index, analyzer_summary)
+        if request is None:
             return {}, None
 
+        try:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "layout AI request: slide_id=%s candidates=%s",
+                    slide.id,
+                    request.layout_candidates,
+                )
+            response = client.recommend(request)
+        except LayoutAIClientConfigurationError as exc:
+            logger.info("layout AI recommend skipped: %s", exc)
+            return {}, None
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("layout AI recommend failed: %s", exc)
+            return {}, None
+
+        return self._scores_from_response(slide, request, response), response
+
+    def _apply_layout_ai_batch(
+        self,
+        entries: Sequence[RecommendationInput],
+        index: LayoutCatalogIndex[LayoutProfile],
+    ) -> list[tuple[dict[str, float], LayoutAIResponse | None]]:
+        empty: list[tuple[dict[str, float], LayoutAIResponse | None]] = [({}, None) for _ in entries]
+        if not self._config.enable_ai or self._config.ai_weight <= 0 or not entries:
+            return empty
+
+        bundle = self._ensure_layout_ai()
+        if bundle is None:
+            return empty
+        policy, client = bundle
+
+        recommend_batch = getattr(client, "recommend_batch", None)
+        if self._config.ai_batch_size <= 1 or not callable(recommend_batch):
+            return [
+                self._apply_layout_ai(item.slide, index, item.analyzer_summary) for item in entries
+            ]
+
+        requests = [
+            self._build_layout_ai_request(policy, item.slide, index, item.analyzer_summary)
+            for item in entries
+        ]
+        chunks: list[list[int]] = []
+        for position, item in enumerate(entries):
+            if requests[position] is None:
+                continue
+            current = chunks[-1] if chunks else None
+            if (
+                current is not None
+                and len(current) < self._config.ai_batch_size
+                and entries[current[0]].group == item.group
+            ):
+                current.append(position)
+            else:
+                chunks.append([position])
+
+        def run_chunk(indices: list[int]) -> list[LayoutAIResponse | None]:
+            chunk_requests = [requests[position] for position in indices]
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "layout AI batch request: slide_ids=%s",
+                    [entries[position].slide.id for position in indices],
+                )
+            try:
+                if len(chunk_requests) == 1:
+                    return [client.recommend(chunk_requests[0])]
+                return list(recommend_batch(chunk_requests))
+            except LayoutAIClientConfigurationError as exc:
+                logger.info("layout AI recommend skipped: %s", exc)
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("layout AI batch recommend failed: %s", exc)
+            return [None] * len(indices)
+
+        workers = max(1, min(self._config.ai_concurrency, len(chunks)))
+        if workers == 1:
+            chunk_responses = [run_chunk(indices) for indices in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="layout-ai") as executor:
+                chunk_responses = list(executor.map(run_chunk, chunks))
+
+        results = list(empty)
+        for indices, responses in zip(chunks, chunk_responses, strict=True):
+            for position, response in zip(indices, responses, strict=True):
+                item = entries[position]
+                request = requests[position]
+                if response is None or request is None:
+                    logger.info(
+                        "layout AI response missing; falling back to heuristic: slide_id=%s",
+                        item.slide.id,
+                    )
+                    continue
+                results[position] = (self._scores_from_response(item.slide, request, response), response)
+        return results
+
+    def _build_layout_ai_request(
+        self,
+        policy: LayoutAIPolicy,
+        slide: ContentSlide,
+        index: LayoutCatalogIndex[LayoutProfile],
+        analyzer_summary: DraftAnalyzerSummary | None,
+    ) -> LayoutAIRequest | None:
+        candidate_ids = list(index.layout_ids)
+        if not candidate_ids:
+            return None
+
         try:
             prompt = policy.resolve_prompt()
         except LayoutAIPolicyError as exc:
             logger.warning("layout AI prompt resolution failed: %s", exc)
-            return {}, None
+            return None
 
         card_payload = {
             "slide_id": slide.id,
@@ -232,31 +402,22 @@ class CardLayoutRecommender:
             "note": slide.elements.note,
             "analyzer": analyzer_summary.model_dump(mode="json") if analyzer_summary else None,
         }
-
-        request = LayoutAIRequest(
+        return LayoutAIRequest(
             prompt=prompt,
             policy=policy,
             card_payload=card_payload,
             layout_candidates=candidate_ids,
         )
 
-        try:
-            if logger.isEnabledFor(logging.INFO):
-                logger.info(
-                    "layout AI request: slide_id=%s candidates=%s",
-                    slide.id,
-                    candidate_ids,
-                )
-            response = client.recommend(request)
-        except LayoutAIClientConfigurationError as exc:
-            logger.info("layout AI recommend skipped: %s", exc)
-            return {}, None
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("layout AI recommend failed: %s", exc)
-            return {}, None
-
+    def _scores_from_response(
+        self,
+        slide: ContentSlide,
+        request: LayoutAIRequest,
+        response: LayoutAIResponse,
+    ) -> dict[str, float]:
         scores: dict[str, float] = {}
         weight = max(0.0, min(1.0, self._config.ai_weight))
+        candidate_ids = set(request.layout_candidates)
         for layout_id, raw_score in response.recommended:
             if layout_id not in candidate_ids:
                 continue
@@ -271,7 +432,7 @@ class CardLayoutRecommender:
                 response.model,
                 list(scores.keys()),
             )
-        return scores, response
+        return scores
 
     def _ensure_layout_ai(self) -> tuple[LayoutAIPolicy, LayoutAIClient] | None:
         path = self._config.policy_path
@@ -280,9 +441,17 @@ class CardLayoutRecommender:
         if self._policy is not None and self._client is not None:
             return self._policy, self._client
         try:
-            policy_set = load_layout_policy_set(Path(path))
+            policy_set = shared_file_cache.get(
+                "layout_ai_policy_set", Path(path), load_layout_policy_set
+            )
             policy = policy_set.get_policy(self._config.policy_id)
-            client = create_layout_ai_client(policy)
+            client = shared_file_cache.get(
+                "layout_ai_client",
+                Path(path),
+                lambda _: create_layout_ai_client(policy),
+                # プロバイダー設定の環境変数が変わったらクライアントを作り直す
+                variant=f"{policy.id}:{llm_client_config_key()}",
+            )
         except LayoutAIPolicyError as exc:
             logger.warning("layout AI policy error: %s", exc)
             return None
@@ -296,7 +465,7 @@ class CardLayoutRecommender:
 
     def _simulate_ai_score(
         self,
-        profile: LayoutProfile,
+        features: LayoutFeatures,
         slide: ContentSlide,
         preferred_layout: str,
         tags: set[str],
@@ -304,7 +473,7 @@ class CardLayoutRecommender:
         """LLM連携前提のスコアを簡易シミュレーションする。"""
         boost = 0.0
 
-        if profile.layout_id == preferred_layout:
+        if features.layout_id == preferred_layout:
             boost += self._config.ai_weight * 0.6
 
         if slide.ai_review and slide.ai_review.grade == "A":
@@ -312,7 +481,7 @@ class CardLayoutRecommender:
         elif slide.ai_review and slide.ai_review.grade == "B":
             boost += self._config.ai_weight * 0.1
 
-        usage_tags = set(profile.usage_tags)
+        usage_tags = features.usage_tags
         if tags and usage_tags:
             overlap = tags & usage_tags
             if overlap:
@@ -356,3 +525,11 @@ class CardLayoutRecommender:
             token.append(ch)
         if token:
             yield "".join(token)
+
+
+def _as_catalog_index(
+    layouts: Sequence[LayoutProfile] | LayoutCatalogIndex[LayoutProfile],
+) -> LayoutCatalogIndex[LayoutProfile]:
+    if isinstance(layouts, LayoutCatalogIndex):
+        return layouts
+    return LayoutCatalogIndex(layouts)
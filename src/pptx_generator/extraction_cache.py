@@ -0,0 +1,202 @@
+"""テンプレート抽出結果を sha256 単位で保存するキャッシュ。"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Literal, Mapping
+
+from .branding_extractor import BrandingExtractionResult
+from .models import TemplateSpec
+
+logger = logging.getLogger(__name__)
+
+BRANDING_EXTRACTOR_VERSION = "1"
+
+CacheStatus = Literal["hit", "miss", "disabled"]
+
+LayoutRecordsPayload = tuple[
+    list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]
+]
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def default_extraction_cache_dir() -> Path:
+    """ユーザーキャッシュディレクトリ配下の保存先を返す。
+
+    ``XDG_CACHE_HOME``（Windows は ``LOCALAPPDATA``）があればその下、無ければ ``~/.cache`` を使う。
+    """
+
+    root = os.getenv("XDG_CACHE_HOME") or (os.getenv("LOCALAPPDATA") if os.name == "nt" else None)
+    base = Path(root) if root else Path.home() / ".cache"
+    return base / "pptx-generator" / "extract"
+
+
+class TemplateExtractionCache:
+    """テンプレート sha256 + 抽出条件をキーに抽出成果物を保存する。
+
+    ディレクトリ構成は ``<base_dir>/<sha256[:2]>/<sha256>/<kind>-<variant>.json`` で、
+    抽出器のバージョンやフィルタは ``variant`` のダイジェストに含める。
+    """
+
+    def __init__(self, base_dir: Path | None = None, *, enabled: bool = True) -> None:
+        self.base_dir = base_dir or default_extraction_cache_dir()
+        self.enabled = enabled
+        self._digest_memo: dict[tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> TemplateExtractionCache:
+        """環境変数 PPTX_EXTRACTION_CACHE / PPTX_EXTRACTION_CACHE_DIR から生成する。
+
+        保存先の既定はユーザーキャッシュディレクトリ（作業ディレクトリには書き込まない）。
+        """
+
+        flag = os.getenv("PPTX_EXTRACTION_CACHE", "1").strip().lower()
+        enabled = flag not in {"0", "false", "off", "no"}
+        base_dir = os.getenv("PPTX_EXTRACTION_CACHE_DIR")
+        return cls(Path(base_dir) if base_dir else None, enabled=enabled)
+
+    # ------------------------------------------------------------------ #
+    # 公開 API
+    # ------------------------------------------------------------------ #
+    def template_spec(
+        self,
+        template_path: Path,
+        *,
+        variant: Mapping[str, Any],
+        extract: Callable[[], TemplateSpec],
+    ) -> tuple[TemplateSpec, CacheStatus]:
+        """TemplateSpec をキャッシュから取得し、無ければ抽出して保存する。"""
+
+        if not self.enabled:
+            return extract(), "disabled"
+        entry = self._entry_path(template_path, "template_spec", variant)
+        payload = self._read(entry)
+        if payload is not None:
+            spec = TemplateSpec.model_validate(payload)
+            return spec.model_copy(update={"template_path": str(template_path)}), "hit"
+
+        spec = extract()
+        self._write(entry, spec.model_dump(mode="json"))
+        return spec, "miss"
+
+    def branding(
+        self,
+        template_path: Path,
+        *,
+        extract: Callable[[], BrandingExtractionResult],
+    ) -> tuple[BrandingExtractionResult, CacheStatus]:
+        """ブランド抽出結果をキャッシュから取得し、無ければ抽出して保存する。"""
+
+        if not self.enabled:
+            return extract(), "disabled"
+        variant = {"version": BRANDING_EXTRACTOR_VERSION}
+        entry = self._entry_path(template_path, "branding", variant)
+        payload = self._read(entry)
+        if payload is not None:
+            return BrandingExtractionResult(**payload), "hit"
+
+        result = extract()
+        self._write(entry, result.as_dict())
+        return result, "miss"
+
+    def layout_records(
+        self,
+        template_path: Path,
+        *,
+        variant: Mapping[str, Any],
+        build: Callable[[], LayoutRecordsPayload],
+    ) -> tuple[LayoutRecordsPayload, CacheStatus]:
+        """layouts.jsonl レコードと診断結果をキャッシュから取得する。"""
+
+        if not self.enabled:
+            return build(), "disabled"
+        entry = self._entry_path(template_path, "layouts", variant)
+        payload = self._read(entry)
+        if payload is not None:
+            return (payload["records"], payload["warnings"], payload["errors"]), "hit"
+
+        records, warnings, errors = build()
+        self._write(
+            entry,
+            {"records": records, "warnings": warnings, "errors": errors},
+        )
+        return (records, warnings, errors), "miss"
+
+    def template_digest(self, template_path: Path) -> str:
+        """テンプレートの sha256 を返す。mtime とサイズが同じ間は再計算しない。"""
+
+        stat = template_path.stat()
+        memo_key = (str(template_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._digest_memo.get(memo_key)
+        if cached is not None:
+            return cached
+
+        digest = hashlib.sha256()
+        with template_path.open("rb") as stream:
+            for chunk in iter(lambda: stream.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        value = digest.hexdigest()
+        with self._lock:
+            self._digest_memo[memo_key] = value
+        return value
+
+    def remember_digest(self, template_path: Path, digest: str) -> None:
+        """読み込み済みテンプレートの sha256 を登録し、再計算を省く。"""
+
+        stat = template_path.stat()
+        memo_key = (str(template_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            self._digest_memo[memo_key] = digest
+
+    # ------------------------------------------------------------------ #
+    # 内部ユーティリティ
+    # ------------------------------------------------------------------ #
+    def _entry_path(
+        self, template_path: Path, kind: str, variant: Mapping[str, Any]
+    ) -> Path:
+        template_digest = self.template_digest(template_path)
+        variant_text = json.dumps(dict(variant), sort_keys=True, ensure_ascii=False)
+        variant_digest = hashlib.sha256(variant_text.encode("utf-8")).hexdigest()[:16]
+        return (
+            self.base_dir
+            / template_digest[:2]
+            / template_digest
+            / f"{kind}-{variant_digest}.json"
+        )
+
+    @staticmethod
+    def _read(path: Path) -> Any | None:
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("抽出キャッシュの読み込みに失敗したため再抽出します: %s (%s)", path, exc)
+            return None
+
+    @staticmethod
+    def _write(path: Path, payload: object) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=path.parent,
+                prefix=f".{path.stem}-",
+                suffix=".tmp",
+                delete=False,
+            ) as handle:
+                handle.write(json.dumps(payload, ensure_ascii=False))
+                temp_path = Path(handle.name)
+            os.replace(temp_path, path)
+        except OSError as exc:
+            logger.warning("抽出キャッシュの保存に失敗しました: %s (%s)", path, exc)
@@ -1,7 +1,9 @@
-from .client import LayoutAIClient, LayoutAIRequest, LayoutAIResponse, create_layout_ai_client
+from .client import (BatchLayoutAIClient, LayoutAIClient, LayoutAIRequest,
+                     LayoutAIResponse, create_layout_ai_client)
 from .policy import LayoutAIPolicy, LayoutAIPolicySet, load_layout_policy_set
 
 __all__ = [
+    "BatchLayoutAIClient",
     "LayoutAIClient",
     "LayoutAIRequest",
     "LayoutAIResponse",
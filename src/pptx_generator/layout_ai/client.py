@@ -7,14 +7,21 @@ import logging
 import os
 from dataclasses import dataclass, field
 import re
-from typing import Iterable, Protocol
+from typing import Callable, Iterable, Protocol, TypeVar
 
+from ..utils.llm_capabilities import (ProviderCapabilityRegistry,
+                                      shared_capability_registry)
+from ..utils.llm_sdk import shared_sdk_clients
 from .policy import LayoutAIPolicy, LayoutAIPolicyError
 
 logger = logging.getLogger(__name__)
 
 _LAYOUT_LLM_LOGGER = logging.getLogger("pptx_generator.layout_ai.llm")
 DEFAULT_MAX_TOKENS = 512
+OPENAI_LAYOUT_CAPABILITY_PROVIDER = "openai-responses"
+AZURE_LAYOUT_CAPABILITY_PROVIDER = "azure-responses"
+
+_Parsed = TypeVar("_Parsed")
 
 
 @dataclass(slots=True)
@@ -44,6 +51,13 @@ class LayoutAIClient(Protocol):
         """カード情報からレイアウト候補を評価する。"""
 
 
+class BatchLayoutAIClient(LayoutAIClient, Protocol):
+    """複数カードを 1 リクエストで評価できるクライアント。"""
+
+    def recommend_batch(self, requests: list[LayoutAIRequest]) -> list[LayoutAIResponse | None]:
+        """カードごとの応答を入力順に返す。解析できなかったカードは None。"""
+
+
 class LayoutAIClientConfigurationError(RuntimeError):
     """クライアント設定のエラー。"""
 
@@ -99,20 +113,45 @@ class MockLayoutAIClient:
             raw_text=raw_text,
         )
 
+    def recommend_batch(self, requests: list[LayoutAIRequest]) -> list[LayoutAIResponse | None]:
+        cards = []
+        for index, request in enumerate(requests):
+            response = self.recommend(request)
+            cards.append(
+                {
+                    "slide_id": _card_key(request, index),
+                    "recommended": [
+                        {"layout_id": layout, "score": score} for layout, score in response.recommended
+                    ],
+                    "reasons": response.reasons,
+                }
+            )
+        text = json.dumps({"cards": cards}, ensure_ascii=False)
+        return _split_layout_batch_response(text, requests, model=requests[0].policy.model)
+
 
 class OpenAIChatLayoutClient:
     """OpenAI Chat completions を利用したレイアウト推薦。"""
 
-    def __init__(self, client, *, model: str, temperature: float, max_tokens: int) -> None:
+    def __init__(
+        self,
+        client,
+        *,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        capabilities: ProviderCapabilityRegistry | None = None,
+    ) -> None:
         self._client = client
         self._model = model
         self._temperature = temperature
         self._max_tokens = max_tokens
+        self._capabilities = capabilities
 
     @classmethod
     def from_env(cls, policy: LayoutAIPolicy) -> "OpenAIChatLayoutClient":
         try:
-            from openai import OpenAI
+            import openai  # noqa: F401
         except ImportError as exc:  # pragma: no cover
             msg = "openai パッケージをインストールしてください (`pip install openai`)."
             raise LayoutAIClientConfigurationError(msg) from exc
@@ -124,30 +163,61 @@ class OpenAIChatLayoutClient:
         base_url = os.getenv("OPENAI_BASE_URL")
         temperature = float(os.getenv("OPENAI_TEMPERATURE", str(policy.temperature or 0.0)))
         max_tokens = int(os.getenv("OPENAI_MAX_TOKENS", str(policy.max_tokens or DEFAULT_MAX_TOKENS)))
-        client = OpenAI(api_key=api_key, base_url=base_url) if base_url else OpenAI(api_key=api_key)
+        client = shared_sdk_clients.openai(api_key=api_key, base_url=base_url)
         model_name = policy.model or os.getenv("OPENAI_MODEL", "gpt-5-mini")
         if model_name in {"mock", "mock-local", "mock-layout"}:
             model_name = os.getenv("OPENAI_MODEL", "gpt-5-mini")
         return cls(client, model=model_name, temperature=temperature, max_tokens=max_tokens)
 
     def recommend(self, request: LayoutAIRequest) -> LayoutAIResponse:
+        return self._respond(
+            system_prompt=_build_system_prompt(request),
+            user_prompt=_build_user_prompt(request),
+            policy_model=request.policy.model,
+            max_tokens=self._max_tokens,
+            parse=_parse_layout_response,
+            usable=lambda parsed: bool(parsed.recommended),
+        )
+
+    def recommend_batch(self, requests: list[LayoutAIRequest]) -> list[LayoutAIResponse | None]:
+        return self._respond(
+            system_prompt=_build_batch_system_prompt(requests),
+            user_prompt=_build_batch_user_prompt(requests),
+            policy_model=requests[0].policy.model,
+            max_tokens=self._max_tokens * len(requests),
+            parse=lambda text, model: _split_layout_batch_response(text, requests, model=model),
+            usable=lambda parsed: any(item is not None for item in parsed),
+        )
+
+    def _respond(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        policy_model: str | None,
+        max_tokens: int,
+        parse: Callable[[str, str], _Parsed],
+        usable: Callable[[_Parsed], bool],
+    ) -> _Parsed:
+        """候補モデルと互換性フォールバックを順に試し、``usable`` を満たす解析結果を返す。"""
+
         from openai.types.responses import ResponseOutputMessage, ResponseOutputRefusal, ResponseOutputText
 
         messages = [
-            {"role": "system", "content": _build_system_prompt(request)},
-            {"role": "user", "content": _build_user_prompt(request)},
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
         ]
         base_kwargs: dict[str, object] = {
             "input": messages,
             "temperature": self._temperature,
             "response_format": {"type": "json_object"},
         }
-        if self._max_tokens > 0:
-            base_kwargs["max_output_tokens"] = self._max_tokens
+        if max_tokens > 0:
+            base_kwargs["max_output_tokens"] = max_tokens
 
         candidate_models: list[str] = []
         for value in (
-            request.policy.model,
+            policy_model,
             os.getenv("OPENAI_MODEL"),
             self._model,
             os.getenv("OPENAI_FALLBACK_MODEL"),
@@ -164,11 +234,32 @@ class OpenAIChatLayoutClient:
         if not candidate_models:
             candidate_models.append(self._model)
 
+        # 前回成功したモデルとパラメータ構成を先に試し、既知の失敗を繰り返さない
+        primary_model = candidate_models[0]
+        capabilities = self._capabilities or shared_capability_registry()
+        known = capabilities.lookup(OPENAI_LAYOUT_CAPABILITY_PROVIDER, primary_model)
+        known_model = primary_model
+        if known is not None and known.fallback_model in candidate_models:
+            known_model = known.fallback_model
+            skipped = candidate_models.index(known_model)
+            candidate_models.insert(0, candidate_models.pop(skipped))
+            capabilities.note_avoided(skipped)
+
         for model_name in candidate_models:
             attempt_kwargs = dict(base_kwargs)
             attempt_kwargs["model"] = model_name
             expanded_tokens = False
             removed_response_format = False
+            if known is not None and model_name == known_model:
+                if known.variant.get("response_format") is False:
+                    attempt_kwargs.pop("response_format", None)
+                    removed_response_format = True
+                    capabilities.note_avoided()
+                known_tokens = known.variant.get("max_output_tokens")
+                if isinstance(known_tokens, int) and "max_output_tokens" in attempt_kwargs:
+                    attempt_kwargs["max_output_tokens"] = known_tokens
+                    expanded_tokens = True
+                    capabilities.note_avoided()
             while True:
                 try:
                     response = self._client.responses.create(**attempt_kwargs)  # type: ignore[attr-defined]
@@ -206,10 +297,10 @@ class OpenAIChatLayoutClient:
                 content = "\n".join(segment.strip() for segment in text_segments if segment.strip())
 
                 parse_failed = False
-                parsed_response: LayoutAIResponse | None = None
+                parsed_response: _Parsed | None = None
                 if content:
                     try:
-                        parsed_response = _parse_layout_response(content, model=model_name)
+                        parsed_response = parse(content, model_name)
                     except LayoutAIResponseFormatError as exc:
                         parse_failed = True
                         logger.debug(
@@ -225,16 +316,32 @@ class OpenAIChatLayoutClient:
                         attempt_kwargs,
                     )
 
-                if parsed_response and parsed_response.recommended:
+                if parsed_response is not None and usable(parsed_response):
+                    variant: dict[str, object] = {}
+                    if removed_response_format:
+                        variant["response_format"] = False
+                    if expanded_tokens:
+                        variant["max_output_tokens"] = attempt_kwargs.get("max_output_tokens")
+                    fallback_model = model_name if model_name != primary_model else None
+                    if variant or fallback_model or known is not None:
+                        capabilities.record(
+                            OPENAI_LAYOUT_CAPABILITY_PROVIDER,
+                            primary_model,
+                            variant=variant,
+                            fallback_model=fallback_model,
+                        )
                     return parsed_response
 
                 if (incomplete or parse_failed) and not expanded_tokens and "max_output_tokens" in attempt_kwargs:
                     value = attempt_kwargs.get("max_output_tokens")
                     try:
-                        current = int(value) if value is not None else self._max_tokens
+                        current = int(value) if value is not None else max_tokens
                     except (TypeError, ValueError):
-                        current = self._max_tokens
-                    attempt_kwargs["max_output_tokens"] = min((current or self._max_tokens or DEFAULT_MAX_TOKENS) * 2, 4096)
+                        current = max_tokens
+                    attempt_kwargs["max_output_tokens"] = min(
+                        (current or max_tokens or DEFAULT_MAX_TOKENS) * 2,
+                        max(4096, max_tokens),
+                    )
                     expanded_tokens = True
                     logger.debug(
                         "retrying OpenAI layout completion with expanded max_output_tokens=%s (model=%s)",
@@ -252,7 +359,7 @@ class OpenAIChatLayoutClient:
                     )
                     continue
 
-                if parsed_response and not parsed_response.recommended:
+                if parsed_response is not None:
                     logger.debug("OpenAI layout model %s returned no recommendations", model_name)
                     break
 
@@ -273,16 +380,25 @@ class OpenAIChatLayoutClient:
 class AzureOpenAIChatLayoutClient:
     """Azure OpenAI Chat Completions API を利用したレイアウト推薦。"""
 
-    def __init__(self, client, *, deployment: str, temperature: float, max_tokens: int) -> None:
+    def __init__(
+        self,
+        client,
+        *,
+        deployment: str,
+        temperature: float,
+        max_tokens: int,
+        capabilities: ProviderCapabilityRegistry | None = None,
+    ) -> None:
         self._client = client
         self._deployment = deployment
         self._temperature = temperature
         self._max_tokens = max_tokens
+        self._capabilities = capabilities
 
     @classmethod
     def from_env(cls, policy: LayoutAIPolicy) -> "AzureOpenAIChatLayoutClient":
         try:
-            from openai import AzureOpenAI
+            import openai  # noqa: F401
         except ImportError as exc:  # pragma: no cover - optional dependency
             msg = "openai パッケージをインストールしてください (`pip install openai`)."
             raise LayoutAIClientConfigurationError(msg) from exc
@@ -305,19 +421,52 @@ class AzureOpenAIChatLayoutClient:
             if lowered.endswith(suffix):
                 endpoint = endpoint[: -len(suffix)]
                 lowered = endpoint.lower()
-        client = AzureOpenAI(api_key=api_key, azure_endpoint=endpoint, api_version=api_version)
+        client = shared_sdk_clients.azure_openai(api_key=api_key, endpoint=endpoint, api_version=api_version)
         return cls(client, deployment=deployment, temperature=temperature, max_tokens=max_tokens)
 
     def recommend(self, request: LayoutAIRequest) -> LayoutAIResponse:
+        content, request_model = self._respond_text(
+            system_prompt=_build_system_prompt(request),
+            user_prompt=_build_user_prompt(request),
+            policy_model=request.policy.model,
+            max_tokens=self._max_tokens,
+        )
+        try:
+            return _parse_layout_response(content, model=request_model)
+        except LayoutAIResponseFormatError as exc:
+            logger.debug("Azure OpenAI layout response parse failed: %s", exc)
+            return LayoutAIResponse(model=request_model, raw_text=content)
+
+    def recommend_batch(self, requests: list[LayoutAIRequest]) -> list[LayoutAIResponse | None]:
+        content, request_model = self._respond_text(
+            system_prompt=_build_batch_system_prompt(requests),
+            user_prompt=_build_batch_user_prompt(requests),
+            policy_model=requests[0].policy.model,
+            max_tokens=self._max_tokens * len(requests),
+        )
+        try:
+            return _split_layout_batch_response(content, requests, model=request_model)
+        except LayoutAIResponseFormatError as exc:
+            logger.debug("Azure OpenAI layout batch response parse failed: %s", exc)
+            return [None] * len(requests)
+
+    def _respond_text(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        policy_model: str | None,
+        max_tokens: int,
+    ) -> tuple[str, str]:
         from openai.types.responses import ResponseOutputMessage
         from openai.types.responses.response_output_text import ResponseOutputText
         from openai.types.responses.response_output_refusal import ResponseOutputRefusal
 
         messages = [
-            {"role": "system", "content": _build_system_prompt(request)},
-            {"role": "user", "content": _build_user_prompt(request)},
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
         ]
-        request_model = request.policy.model or self._deployment
+        request_model = policy_model or self._deployment
         if request_model in {"mock", "mock-local", "mock-layout"}:
             request_model = self._deployment
         kwargs: dict[str, object] = {
@@ -326,10 +475,15 @@ class AzureOpenAIChatLayoutClient:
             "temperature": self._temperature,
         }
         kwargs["response_format"] = {"type": "json_object"}
-        if self._max_tokens > 0:
-            kwargs["max_output_tokens"] = self._max_tokens
+        if max_tokens > 0:
+            kwargs["max_output_tokens"] = max_tokens
 
         attempt_kwargs = dict(kwargs)
+        capabilities = self._capabilities or shared_capability_registry()
+        known = capabilities.lookup(AZURE_LAYOUT_CAPABILITY_PROVIDER, request_model)
+        if known is not None and known.variant.get("response_format") is False:
+            attempt_kwargs.pop("response_format", None)
+            capabilities.note_avoided()
         for attempt in range(2):
             try:
                 response = self._client.responses.create(**attempt_kwargs)  # type: ignore[attr-defined]
@@ -342,6 +496,14 @@ class AzureOpenAIChatLayoutClient:
                 raise
         else:  # pragma: no cover - safeguard
             raise LayoutAIClientConfigurationError("Azure OpenAI 応答を取得できませんでした")
+        if "response_format" not in attempt_kwargs:
+            capabilities.record(
+                AZURE_LAYOUT_CAPABILITY_PROVIDER,
+                request_model,
+                variant={"response_format": False},
+            )
+        elif known is not None:
+            capabilities.record(AZURE_LAYOUT_CAPABILITY_PROVIDER, request_model, variant={})
         logger.debug("Azure OpenAI raw response: %s", response)
         text_segments: list[str] = []
         for item in getattr(response, "output", []) or []:
@@ -354,11 +516,7 @@ class AzureOpenAIChatLayoutClient:
         content = "\n".join(segment.strip() for segment in text_segments if segment.strip())
         if not content:
             raise LayoutAIClientConfigurationError("Azure OpenAI 応答が空でした")
-        try:
-            return _parse_layout_response(content, model=request_model)
-        except LayoutAIResponseFormatError as exc:
-            logger.debug("Azure OpenAI layout response parse failed: %s", exc)
-            return LayoutAIResponse(model=request_model, raw_text=content)
+        return content, request_model
 
 
 class AnthropicClaudeLayoutClient:
@@ -384,24 +542,57 @@ class AnthropicClaudeLayoutClient:
         if model_id in {"mock", "mock-local", "mock-layout"}:
             model_id = os.getenv("ANTHROPIC_MODEL", "claude-3-haiku-20240307")
         max_tokens = int(os.getenv("ANTHROPIC_MAX_TOKENS", str(policy.max_tokens or DEFAULT_MAX_TOKENS)))
-        client = anthropic.Anthropic(api_key=api_key)
+        client = shared_sdk_clients.anthropic(api_key=api_key)
         return cls(client, model=model_id, max_tokens=max_tokens)
 
     def recommend(self, request: LayoutAIRequest) -> LayoutAIResponse:
+        content, model_name = self._respond_text(
+            system_prompt=_build_system_prompt(request),
+            user_prompt=_build_user_prompt(request),
+            policy=request.policy,
+            max_tokens=self._max_tokens,
+        )
+        try:
+            return _parse_layout_response(content, model=model_name)
+        except LayoutAIResponseFormatError as exc:
+            logger.debug("Anthropic layout response parse failed: %s", exc)
+            return LayoutAIResponse(model=model_name, raw_text=content)
+
+    def recommend_batch(self, requests: list[LayoutAIRequest]) -> list[LayoutAIResponse | None]:
+        content, model_name = self._respond_text(
+            system_prompt=_build_batch_system_prompt(requests),
+            user_prompt=_build_batch_user_prompt(requests),
+            policy=requests[0].policy,
+            max_tokens=self._max_tokens * len(requests),
+        )
+        try:
+            return _split_layout_batch_response(content, requests, model=model_name)
+        except LayoutAIResponseFormatError as exc:
+            logger.debug("Anthropic layout batch response parse failed: %s", exc)
+            return [None] * len(requests)
+
+    def _respond_text(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        policy: LayoutAIPolicy,
+        max_tokens: int,
+    ) -> tuple[str, str]:
         messages = [
             {
                 "role": "user",
                 "content": [
                     {
                         "type": "text",
-                        "text": _build_user_prompt(request),
+                        "text": user_prompt,
                     }
                 ],
             }
         ]
         candidate_models: list[str] = []
         for value in (
-            request.policy.model,
+            policy.model,
             os.getenv("ANTHROPIC_MODEL"),
             self._model,
             os.getenv("ANTHROPIC_FALLBACK_MODEL"),
@@ -415,14 +606,14 @@ class AnthropicClaudeLayoutClient:
             if normalized not in candidate_models:
                 candidate_models.append(normalized)
 
-        temperature = float(os.getenv("ANTHROPIC_TEMPERATURE", str(request.policy.temperature or 0.0)))
+        temperature = float(os.getenv("ANTHROPIC_TEMPERATURE", str(policy.temperature or 0.0)))
         last_error: Exception | None = None
         for candidate in candidate_models:
             try:
                 response = self._client.messages.create(  # type: ignore[attr-defined]
                     model=candidate,
-                    system=_build_system_prompt(request),
-                    max_tokens=self._max_tokens,
+                    system=system_prompt,
+                    max_tokens=max_tokens,
                     temperature=temperature,
                     messages=messages,
                 )
@@ -448,11 +639,7 @@ class AnthropicClaudeLayoutClient:
         content = "\n".join(text_parts)
         if not content:
             raise LayoutAIClientConfigurationError("Anthropic 応答が空でした")
-        try:
-            return _parse_layout_response(content, model=model_name)
-        except LayoutAIResponseFormatError as exc:
-            logger.debug("Anthropic layout response parse failed: %s", exc)
-            return LayoutAIResponse(model=model_name, raw_text=content)
+        return content, model_name
 
 
 class AwsClaudeLayoutClient:
@@ -467,7 +654,7 @@ class AwsClaudeLayoutClient:
     @classmethod
     def from_env(cls, policy: LayoutAIPolicy) -> "AwsClaudeLayoutClient":
         try:
-            import boto3
+            import boto3  # noqa: F401
             from botocore.exceptions import NoCredentialsError
         except ImportError as exc:  # pragma: no cover - optional dependency
             msg = "boto3 パッケージが必要です。`pip install boto3` を実行してください。"
@@ -480,50 +667,72 @@ class AwsClaudeLayoutClient:
         region = os.getenv("AWS_REGION")
         profile = os.getenv("AWS_PROFILE")
 
-        session_kwargs: dict[str, object] = {}
-        if profile:
-            session_kwargs["profile_name"] = profile
-        if region:
-            session_kwargs["region_name"] = region
-        session = boto3.Session(**session_kwargs)
-        credentials = session.get_credentials()
-        if credentials is None:
-            raise LayoutAIClientConfigurationError(
-                "AWS 認証情報が見つかりません。環境変数や共有クレデンシャルで設定してください。"
-            )
-
-        client_kwargs: dict[str, object] = {}
-        if region:
-            client_kwargs["region_name"] = region
         try:
-            runtime_client = session.client("bedrock-runtime", **client_kwargs)
+            runtime_client = shared_sdk_clients.bedrock_runtime(profile=profile, region=region)
         except NoCredentialsError as exc:
             raise LayoutAIClientConfigurationError(
                 "AWS 認証情報を利用できません。AWS_ACCESS_KEY_ID/AWS_SECRET_ACCESS_KEY を設定してください。"
             ) from exc
+        if runtime_client is None:
+            raise LayoutAIClientConfigurationError(
+                "AWS 認証情報が見つかりません。環境変数や共有クレデンシャルで設定してください。"
+            )
 
         max_tokens = int(os.getenv("AWS_CLAUDE_MAX_TOKENS", str(policy.max_tokens or DEFAULT_MAX_TOKENS)))
         return cls(runtime_client, model_id=model_id, max_tokens=max_tokens, inference_profile_arn=inference_profile_arn)
 
     def recommend(self, request: LayoutAIRequest) -> LayoutAIResponse:
+        content, model_id = self._respond_text(
+            system_prompt=_build_system_prompt(request),
+            user_prompt=_build_user_prompt(request),
+            policy=request.policy,
+            max_tokens=self._max_tokens,
+        )
+        try:
+            return _parse_layout_response(content, model=model_id)
+        except LayoutAIResponseFormatError as exc:
+            logger.debug("AWS Claude layout response parse failed: %s", exc)
+            return LayoutAIResponse(model=model_id, raw_text=content)
+
+    def recommend_batch(self, requests: list[LayoutAIRequest]) -> list[LayoutAIResponse | None]:
+        content, model_id = self._respond_text(
+            system_prompt=_build_batch_system_prompt(requests),
+            user_prompt=_build_batch_user_prompt(requests),
+            policy=requests[0].policy,
+            max_tokens=self._max_tokens * len(requests),
+        )
+        try:
+            return _split_layout_batch_response(content, requests, model=model_id)
+        except LayoutAIResponseFormatError as exc:
+            logger.debug("AWS Claude layout batch response parse failed: %s", exc)
+            return [None] * len(requests)
+
+    def _respond_text(
+        self,
+        *,
+        system_prompt: str,
+        user_prompt: str,
+        policy: LayoutAIPolicy,
+        max_tokens: int,
+    ) -> tuple[str, str]:
         payload = {
             "anthropic_version": "bedrock-2023-05-31",
-            "max_tokens": self._max_tokens,
-            "temperature": float(os.getenv("AWS_CLAUDE_TEMPERATURE", str(request.policy.temperature or 0.0))),
-            "system": _build_system_prompt(request),
+            "max_tokens": max_tokens,
+            "temperature": float(os.getenv("AWS_CLAUDE_TEMPERATURE", str(policy.temperature or 0.0))),
+            "system": system_prompt,
             "messages": [
                 {
                     "role": "user",
                     "content": [
                         {
                             "type": "text",
-                            "text": _build_user_prompt(request),
+                            "text": user_prompt,
                         }
                     ],
                 }
             ],
         }
-        model_id = request.policy.model or self._model_id
+        model_id = policy.model or self._model_id
         if model_id in {"mock", "mock-local", "mock-layout"}:
             model_id = self._model_id
         invoke_kwargs: dict[str, object] = {
@@ -543,11 +752,7 @@ class AwsClaudeLayoutClient:
         content = "\n".join(text_parts)
         if not content:
             raise LayoutAIClientConfigurationError("AWS Claude 応答が空でした")
-        try:
-            return _parse_layout_response(content, model=model_id)
-        except LayoutAIResponseFormatError as exc:
-            logger.debug("AWS Claude layout response parse failed: %s", exc)
-            return LayoutAIResponse(model=model_id, raw_text=content)
+        return content, model_id
 
 
 def _parse_layout_response(text: str, *, model: str) -> LayoutAIResponse:
@@ -555,7 +760,12 @@ def _parse_layout_response(text: str, *, model: str) -> LayoutAIResponse:
         data = _extract_json_object(text)
     except json.JSONDecodeError as exc:
         raise LayoutAIResponseFormatError(text) from exc
+    if not isinstance(data, dict):
+        raise LayoutAIResponseFormatError(text)
+    return _parse_layout_payload(data, model=model, raw_text=text)
+
 
+def _parse_layout_payload(data: dict[str, object], *, model: str, raw_text: str) -> LayoutAIResponse:
     recommended_map: dict[str, float] = {}
     reasons_map: dict[str, str] = {}
     order: list[str] = []
@@ -595,10 +805,64 @@ def _parse_layout_response(text: str, *, model: str) -> LayoutAIResponse:
         model=model,
         recommended=entries,
         reasons=reasons_map,
-        raw_text=text,
+        raw_text=raw_text,
     )
 
 
+def _card_key(request: LayoutAIRequest, index: int) -> str:
+    slide_id = request.card_payload.get("slide_id")
+    return str(slide_id) if slide_id else f"card-{index + 1}"
+
+
+def _split_layout_batch_response(
+    text: str,
+    requests: list[LayoutAIRequest],
+    *,
+    model: str,
+) -> list[LayoutAIResponse | None]:
+    """``{"cards": [...]}`` 形式の応答をカードごとの ``LayoutAIResponse`` に分解する。
+
+    slide_id で対応付け、見つからない場合は件数が一致するときのみ位置で対応付ける。
+    応答全体が JSON でない場合は ``LayoutAIResponseFormatError`` を送出する。
+    """
+
+    try:
+        data = _extract_json_object(text)
+    except json.JSONDecodeError as exc:
+        raise LayoutAIResponseFormatError(text) from exc
+    items: list[dict[str, object]] = []
+    if isinstance(data, dict):
+        for key in ("cards", "results", "slides"):
+            value = data.get(key)
+            if isinstance(value, list):
+                items = [item for item in value if isinstance(item, dict)]
+                break
+    if not items:
+        raise LayoutAIResponseFormatError(text)
+
+    by_key: dict[str, dict[str, object]] = {}
+    for item in items:
+        key = item.get("slide_id") or item.get("card_id") or item.get("id")
+        if isinstance(key, str) and key not in by_key:
+            by_key[key] = item
+
+    results: list[LayoutAIResponse | None] = []
+    for index, request in enumerate(requests):
+        item = by_key.get(_card_key(request, index))
+        if item is None and len(items) == len(requests):
+            item = items[index]
+        if item is None:
+            results.append(None)
+            continue
+        response = _parse_layout_payload(
+            item,
+            model=model,
+            raw_text=json.dumps(item, ensure_ascii=False),
+        )
+        results.append(response if response.recommended else None)
+    return results
+
+
 def _extract_json_object(text: str) -> dict[str, object]:
     try:
         return json.loads(text)
@@ -708,3 +972,34 @@ def _build_user_prompt(request: LayoutAIRequest) -> str:
         "instruction": request.prompt,
     }
     return json.dumps(payload, ensure_ascii=False)
+
+
+def _build_batch_system_prompt(requests: list[LayoutAIRequest]) -> str:
+    return (
+        "あなたは B2B プレゼン資料のレイアウト推薦エージェントです。"
+        "入力される複数カードの JSON 情報を解析し、カードごとに最も適したレイアウトを高精度に提案してください。"
+        "応答は JSON オブジェクトのみで返し、次のスキーマを厳守してください: "
+        '{"cards":[{"slide_id":"<カードID>","recommended":[{"layout_id":"<候補ID>","score":0.0}],'
+        '"reasons":{"<候補ID>":"根拠"}}]}.'
+        "cards には入力された全カードを同じ slide_id で含め、コードフェンスや説明文は含めず、"
+        "score は 0〜1 の範囲で数値にしてください。"
+    )
+
+
+def _build_batch_user_prompt(requests: list[LayoutAIRequest]) -> str:
+    """共有のレイアウト候補は 1 度だけ記載し、カードごとの差分のみ個別に含める。"""
+
+    shared_candidates = requests[0].layout_candidates
+    cards: list[dict[str, object]] = []
+    for index, request in enumerate(requests):
+        card = dict(request.card_payload)
+        card["slide_id"] = _card_key(request, index)
+        if request.layout_candidates != shared_candidates:
+            card["candidate_layouts"] = request.layout_candidates
+        cards.append(card)
+    payload = {
+        "cards": cards,
+        "candidate_layouts": shared_candidates,
+        "instruction": requests[0].prompt,
+    }
+    return json.dumps(payload, ensure_ascii=False)
@@ -130,6 +130,14 @@ DIAGNOSTICS_SCHEMA: dict[str, object] = {
                 "layouts_total": {"type": "integer", "minimum": 0},
                 "placeholders_total": {"type": "integer", "minimum": 0},
                 "extraction_time_ms": {"type": "integer", "minimum": 0},
+                "extraction_cache": {
+                    "type": "object",
+                    "properties": {
+                        "layout_records": {"enum": ["hit", "miss", "disabled"]},
+                        "template_spec": {"enum": ["hit", "miss", "disabled"]},
+                    },
+                    "additionalProperties": False,
+                },
             },
             "additionalProperties": False,
         },
@@ -10,7 +10,7 @@ from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
 from time import perf_counter
-from typing import Any, Iterable
+from typing import TYPE_CHECKING, Any, Iterable
 
 from ..models import LayoutInfo, ShapeInfo, TemplateSpec
 from ..utils.usage_tags import normalize_usage_tags_with_unknown
@@ -21,6 +21,10 @@ from .schema import (
     LAYOUT_RECORD_VALIDATOR,
 )
 
+if TYPE_CHECKING:
+    from ..extraction_cache import TemplateExtractionCache
+    from ..template_package import TemplatePackage
+
 EMU_PER_INCH = 914400
 SUITE_VERSION = "1.0.0"
 
@@ -58,6 +62,8 @@ class LayoutValidationOptions:
     template_id: str | None = None
     baseline_path: Path | None = None
     analyzer_snapshot_path: Path | None = None
+    extraction_cache: TemplateExtractionCache | None = None
+    package: TemplatePackage | None = None
 
 
 @dataclass(slots=True)
@@ -90,15 +96,39 @@ class LayoutValidationSuite:
             raise LayoutValidationError(msg)
 
         start = perf_counter()
+        cache = self.options.extraction_cache
         extractor = TemplateExtractor(
-            TemplateExtractorOptions(template_path=self.options.template_path)
+            TemplateExtractorOptions(template_path=self.options.template_path),
+            cache=cache,
+            package=self.options.package,
         )
-        template_spec = extractor.extract()
         template_id = self.options.template_id or self._derive_template_id(
             self.options.template_path
         )
 
-        records, warnings, errors = self._build_layout_records(template_spec, template_id)
+        def _build_records() -> tuple[
+            list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]
+        ]:
+            template_spec = extractor.extract()
+            return self._build_layout_records(template_spec, template_id)
+
+        cache_stats: dict[str, str] | None = None
+        if cache is None:
+            records, warnings, errors = _build_records()
+        else:
+            (records, warnings, errors), records_status = cache.layout_records(
+                self.options.template_path,
+                variant={
+                    **extractor.cache_variant(),
+                    "suite_version": SUITE_VERSION,
+                    "template_id": template_id,
+                    "template_name": self.options.template_path.name,
+                },
+                build=_build_records,
+            )
+            cache_stats = {"layout_records": records_status}
+            if records_status == "miss":
+                cache_stats["template_spec"] = extractor.cache_status
 
         analyzer_snapshot_issues: list[dict[str, Any]] = []
         if self.options.analyzer_snapshot_path is not None:
@@ -122,6 +152,8 @@ class LayoutValidationSuite:
                 "extraction_time_ms": extraction_time_ms,
             },
         }
+        if cache_stats is not None:
+            diagnostics["stats"]["extraction_cache"] = cache_stats
 
         self._validate_records(records)
         self._validate_diagnostics(diagnostics)
@@ -1,6 +1,8 @@
 """パイプラインモジュール。"""
 
 from .analyzer import AnalyzerOptions, SimpleAnalyzerStep
+from .artifact_hashing import ArtifactDigest, HashingFile
+from .artifact_writer import ArtifactWriteError, ArtifactWriter
 from .base import PipelineContext, PipelineRunner, PipelineStep
 from .brief_normalization import (BriefNormalizationError,
                                   BriefNormalizationOptions,
@@ -24,6 +26,9 @@ from .validator import SpecValidatorStep
 
 __all__ = [
     "AnalyzerOptions",
+    "ArtifactDigest",
+    "ArtifactWriteError",
+    "ArtifactWriter",
     "BriefNormalizationError",
     "BriefNormalizationOptions",
     "BriefNormalizationStep",
@@ -33,6 +38,7 @@ __all__ = [
     "DraftStructuringOptions",
     "DraftStructuringStep",
     "DraftStructuringError",
+    "HashingFile",
     "RefinerOptions",
     "PipelineContext",
     "PipelineRunner",
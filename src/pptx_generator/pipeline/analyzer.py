@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from collections import Counter
 from dataclasses import dataclass, field
@@ -23,6 +22,7 @@ from ..models import (
     SlideImage,
     SlideTextbox,
 )
+from .artifact_writer import write_json_artifact
 from .base import PipelineContext
 
 logger = logging.getLogger(__name__)
@@ -274,19 +274,20 @@ class SimpleAnalyzerStep:
             "issues": issues,
             "fixes": fixes,
         }
-        output_path = self._save(analysis, context.workdir)
+        output_path = self._save(context, analysis)
         context.add_artifact(self._artifact_key, output_path)
+        # 後続工程がファイルを読み直さずに済むよう、解析結果もそのまま登録する
+        context.add_artifact(self._artifact_key.removesuffix("_path"), analysis)
         if self._register_default_artifact and self._artifact_key != "analysis_path":
             context.add_artifact("analysis_path", output_path)
+            context.add_artifact("analysis", analysis)
         elif self._register_default_artifact and self._artifact_key == "analysis_path":
             # 既定キーと同じ場合は追加登録不要
             pass
         self._sync_mapping_log(context, analysis)
         logger.info("%s を出力しました: %s", self.options.output_filename, output_path)
         if self.options.snapshot_output_filename:
-            snapshot_path = self._save_snapshot(
-                snapshot_slides, context.workdir
-            )
+            snapshot_path = self._save_snapshot(context, snapshot_slides)
             context.add_artifact("analyzer_snapshot_path", snapshot_path)
             logger.info(
                 "構造スナップショットを出力しました: %s", snapshot_path
@@ -467,7 +468,7 @@ class SimpleAnalyzerStep:
         }
 
     def _save_snapshot(
-        self, slides: list[dict[str, Any]], workdir: Path
+        self, context: PipelineContext, slides: list[dict[str, Any]]
     ) -> Path:
         if not self.options.snapshot_output_filename:
             raise ValueError("snapshot_output_filename が設定されていません")
@@ -475,12 +476,8 @@ class SimpleAnalyzerStep:
             "schema_version": "1.0.0",
             "slides": slides,
         }
-        path = workdir / self.options.snapshot_output_filename
-        path.write_text(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-        return path
+        path = context.workdir / self.options.snapshot_output_filename
+        return write_json_artifact(context, path, payload)
 
     @staticmethod
     def _shape_type_name(shape_type: int | None) -> str:
@@ -855,11 +852,9 @@ class SimpleAnalyzerStep:
             issue["fix"] = fix
         return issue
 
-    def _save(self, payload: dict[str, Any], workdir: Path) -> Path:
-        workdir.mkdir(parents=True, exist_ok=True)
-        output_path = workdir / self.options.output_filename
-        output_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-        return output_path
+    def _save(self, context: PipelineContext, payload: dict[str, Any]) -> Path:
+        output_path = context.workdir / self.options.output_filename
+        return write_json_artifact(context, output_path, payload)
 
     def _sync_mapping_log(self, context: PipelineContext, analysis: dict[str, Any]) -> None:
         mapping_log_ref = context.artifacts.get("mapping_log_path")
@@ -869,18 +864,23 @@ class SimpleAnalyzerStep:
             mapping_log_path = Path(str(mapping_log_ref))
         except Exception:  # noqa: BLE001
             return
-        if not mapping_log_path.exists():
-            return
-        try:
-            mapping_log = MappingLog.model_validate_json(
-                mapping_log_path.read_text(encoding="utf-8")
-            )
-        except Exception as exc:  # noqa: BLE001
-            logger.warning(
-                "mapping_log.json の読み込みに失敗したため Analyzer 連携をスキップします: %s",
-                exc,
-            )
-            return
+        in_memory = context.artifacts.get("mapping_log")
+        if isinstance(in_memory, MappingLog):
+            # 同一プロセスで生成済みの場合はファイルを読み直さない（書き出し待ちの元データは変更しない）
+            mapping_log = in_memory.model_copy(deep=True)
+        else:
+            if not mapping_log_path.exists():
+                return
+            try:
+                mapping_log = MappingLog.model_validate_json(
+                    mapping_log_path.read_text(encoding="utf-8")
+                )
+            except Exception as exc:  # noqa: BLE001
+                logger.warning(
+                    "mapping_log.json の読み込みに失敗したため Analyzer 連携をスキップします: %s",
+                    exc,
+                )
+                return
 
         issues_payload = analysis.get("issues")
         if not isinstance(issues_payload, list):
@@ -904,14 +904,7 @@ class SimpleAnalyzerStep:
         mapping_log.meta.analyzer_issue_counts_by_type = dict(overall_by_type)
         mapping_log.meta.analyzer_issue_counts_by_severity = dict(overall_by_severity)
 
-        mapping_log_path.write_text(
-            json.dumps(
-                mapping_log.model_dump(mode="json"),
-                ensure_ascii=False,
-                indent=2,
-            ),
-            encoding="utf-8",
-        )
+        write_json_artifact(context, mapping_log_path, mapping_log)
         context.add_artifact("mapping_log", mapping_log)
 
     @staticmethod
@@ -0,0 +1,126 @@
+"""成果物の書き出し時ハッシュと、外部生成物の並列ハッシュ計算。
+
+パイプライン内で書き出す JSON は ``HashingFile`` を通して書き込み、その場で求めた
+sha256 を ``PipelineContext`` に登録する。PPTX は保存直後に 1 度だけ読み直して登録する。
+監査ログは登録済みの値を集めるだけで済み、Polisher や LibreOffice が生成・更新したファイルだけを読み直す。
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterable
+
+HASH_CHUNK_SIZE = 1024 * 1024
+DEFAULT_HASH_WORKERS = 4
+
+
+@dataclass(slots=True, frozen=True)
+class ArtifactDigest:
+    """書き出し時に求めたハッシュと、その時点のファイルサイズ・更新時刻。"""
+
+    sha256: str
+    size: int
+    mtime_ns: int
+
+    def matches(self, path: Path) -> bool:
+        """ファイルが書き出し後に変更されていなければ真を返す。"""
+
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return stat.st_size == self.size and stat.st_mtime_ns == self.mtime_ns
+
+    def label(self) -> str:
+        return f"sha256:{self.sha256}"
+
+
+class HashingFile:
+    """書き込んだバイト列の sha256 を逐次計算するバイナリファイルラッパー。
+
+    先頭から順に書き込む用途に限る（シークしての上書きはハッシュに反映されない）。
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._handle: BinaryIO = path.open("wb")
+        self._hash = hashlib.sha256()
+
+    def write(self, data: bytes | bytearray | memoryview) -> int:
+        self._hash.update(data)
+        return self._handle.write(data)
+
+    def sync(self) -> None:
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+    def close(self) -> ArtifactDigest:
+        """ファイルを閉じ、書き込んだ内容のハッシュを返す。"""
+
+        self._handle.close()
+        stat = self.path.stat()
+        return ArtifactDigest(sha256=self._hash.hexdigest(), size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+    def __enter__(self) -> HashingFile:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        if not self._handle.closed:
+            self._handle.close()
+
+
+def write_bytes_hashed(path: Path, data: bytes | bytearray | memoryview, *, fsync: bool = False) -> ArtifactDigest:
+    """バイト列を書き出し、そのハッシュを返す。"""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with HashingFile(path) as handle:
+        handle.write(data)
+        if fsync:
+            handle.sync()
+        return handle.close()
+
+
+def hash_file(path: Path) -> str:
+    """ファイルを 1 MB 単位で読み込んで sha256 を求める。"""
+
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def digest_file(path: Path) -> ArtifactDigest:
+    """書き出し済みのファイルを 1 MB 単位で読み直してハッシュを求める（全体をメモリに載せない）。"""
+
+    sha256 = hash_file(path)
+    stat = path.stat()
+    return ArtifactDigest(sha256=sha256, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+
+def hash_files(paths: Iterable[Path], *, max_workers: int = DEFAULT_HASH_WORKERS) -> dict[Path, str]:
+    """複数ファイルのハッシュをスレッドプールで並列に求める（hashlib は計算中に GIL を解放する）。"""
+
+    targets = list(dict.fromkeys(paths))
+    if not targets:
+        return {}
+    if len(targets) == 1:
+        return {targets[0]: hash_file(targets[0])}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(targets)), thread_name_prefix="pptx-hash") as pool:
+        return dict(zip(targets, pool.map(hash_file, targets)))
+
+
+__all__ = [
+    "DEFAULT_HASH_WORKERS",
+    "HASH_CHUNK_SIZE",
+    "ArtifactDigest",
+    "HashingFile",
+    "digest_file",
+    "hash_file",
+    "hash_files",
+    "write_bytes_hashed",
+]
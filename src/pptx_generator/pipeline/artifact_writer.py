@@ -0,0 +1,214 @@
+"""デバッグ・監査用の成果物 JSON をバックグラウンドで書き出す。"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Literal, get_args
+
+from pydantic import BaseModel
+
+from .artifact_hashing import ArtifactDigest, write_bytes_hashed
+
+if TYPE_CHECKING:
+    from .base import PipelineContext
+
+logger = logging.getLogger(__name__)
+
+FsyncPolicy = Literal["none", "always", "flush"]
+DigestCallback = Callable[[Path, ArtifactDigest], None]
+DEFAULT_FSYNC_POLICY: FsyncPolicy = "none"
+
+
+class ArtifactWriteError(RuntimeError):
+    """バックグラウンドでの書き出しに失敗した場合の例外。"""
+
+
+@dataclass(slots=True)
+class _WriteJob:
+    path: Path
+    payload: object
+    sequence: int
+    on_written: DigestCallback | None = None
+
+
+class ArtifactWriter:
+    """成果物の直列化とファイル書き出しを専用スレッドで行う。
+
+    ``write_json`` は登録だけしてすぐに戻る。登録した payload は書き出しが終わるまで
+    変更しないこと。``context.artifacts`` にも登録して後続工程へ渡す payload（``analysis`` など）も同様で、
+    後続工程は ``flush`` までその内容を書き換えてはならない。書き出し結果に依存する処理（ハッシュ計算など）の前に
+    ``flush`` を呼ぶ。
+
+    - 同じパスへの書き出しが未処理のまま再登録された場合は最後の内容だけを書き出す。
+    - 直前に登録されたものと同一の payload オブジェクト（draft と approved など）は直列化結果を再利用する。
+      判定はオブジェクトの同一性のみで、別オブジェクトの同内容 payload は毎回直列化する。
+    - 書き出した内容の sha256 を ``on_written`` へ通知する（監査ログで読み直さないため）。
+    - ``fsync`` は ``none``（OS に任せる）/ ``always``（ファイルごと）/ ``flush``（``flush`` 時にまとめて）。
+    """
+
+    def __init__(self, *, fsync: FsyncPolicy = DEFAULT_FSYNC_POLICY) -> None:
+        if fsync not in get_args(FsyncPolicy):
+            msg = f"fsync ポリシーが不正です: {fsync}"
+            raise ValueError(msg)
+        self.fsync = fsync
+        self._queue: queue.Queue[_WriteJob | None] = queue.Queue()
+        self._guard = threading.Lock()
+        self._errors: list[tuple[Path, BaseException]] = []
+        self._latest: dict[Path, int] = {}
+        self._sequence = 0
+        self._unsynced: list[Path] = []
+        self._last_encoded: tuple[object, bytes] | None = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="pptx-artifact-writer", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def from_env(cls) -> ArtifactWriter:
+        """環境変数 PPTX_ARTIFACT_FSYNC から fsync ポリシーを決めて生成する。"""
+
+        raw = (os.getenv("PPTX_ARTIFACT_FSYNC") or "").strip().lower()
+        if not raw:
+            return cls()
+        if raw not in get_args(FsyncPolicy):
+            logger.warning(
+                "PPTX_ARTIFACT_FSYNC の値が不正なため既定値 %s を使用します: %s",
+                DEFAULT_FSYNC_POLICY,
+                raw,
+            )
+            return cls()
+        return cls(fsync=raw)  # type: ignore[arg-type]
+
+    def write_json(self, path: Path, payload: object, *, on_written: DigestCallback | None = None) -> Path:
+        if self._closed:
+            msg = "ArtifactWriter は既に閉じられています"
+            raise ArtifactWriteError(msg)
+        with self._guard:
+            self._sequence += 1
+            self._latest[path] = self._sequence
+            job = _WriteJob(path=path, payload=payload, sequence=self._sequence, on_written=on_written)
+        self._queue.put(job)
+        return path
+
+    def flush(self) -> None:
+        """登録済みの書き出しがすべて終わるまで待つ。失敗があれば例外を送出する。"""
+
+        self._queue.join()
+        with self._guard:
+            errors, self._errors = self._errors, []
+            unsynced, self._unsynced = self._unsynced, []
+            self._last_encoded = None
+        for path in unsynced:
+            try:
+                _fsync_path(path)
+            except OSError as exc:
+                errors.append((path, exc))
+        if errors:
+            path, error = errors[0]
+            msg = f"成果物の書き出しに失敗しました: {path} ({len(errors)} 件)"
+            raise ArtifactWriteError(msg) from error
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            self._queue.put(None)
+            self._thread.join()
+
+    def __enter__(self) -> ArtifactWriter:
+        return self
+
+    def __exit__(self, exc_type: type[BaseException] | None, *_exc: object) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # 既に例外が伝播している場合は書き出し失敗で上書きしない
+        try:
+            self.close()
+        except ArtifactWriteError:
+            logger.warning("例外発生後の成果物書き出しにも失敗しました", exc_info=True)
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                self._process(job)
+            except Exception as exc:  # noqa: BLE001 - flush で呼び出し側へ伝える
+                logger.warning("成果物の書き出しに失敗しました: %s", job.path, exc_info=True)
+                with self._guard:
+                    self._errors.append((job.path, exc))
+            finally:
+                self._queue.task_done()
+
+    def _process(self, job: _WriteJob) -> None:
+        with self._guard:
+            superseded = self._latest.get(job.path, job.sequence) > job.sequence
+            if not superseded:
+                self._latest.pop(job.path, None)
+        if superseded:
+            return
+        last = self._last_encoded
+        if last is not None and last[0] is job.payload:
+            data = last[1]
+        else:
+            data = encode_json(job.payload).encode("utf-8")
+            self._last_encoded = (job.payload, data)
+        digest = write_bytes_hashed(job.path, data, fsync=self.fsync == "always")
+        if job.on_written is not None:
+            job.on_written(job.path, digest)
+        if self.fsync == "flush":
+            with self._guard:
+                self._unsynced.append(job.path)
+
+
+def write_json_artifact(context: PipelineContext, path: Path, payload: object) -> Path:
+    """コンテキストに ArtifactWriter があれば非同期に、無ければその場で JSON を書き出す。"""
+
+    writer = context.artifact_writer
+    if writer is not None:
+        return writer.write_json(path, payload, on_written=context.record_artifact_hash)
+    digest = write_bytes_hashed(path, encode_json(payload).encode("utf-8"))
+    context.record_artifact_hash(path, digest)
+    return path
+
+
+def flush_artifacts(context: PipelineContext) -> None:
+    """コンテキストの ArtifactWriter に登録済みの書き出しを待つ（未設定なら何もしない）。"""
+
+    if context.artifact_writer is not None:
+        context.artifact_writer.flush()
+
+
+def encode_json(payload: object) -> str:
+    if isinstance(payload, BaseModel):
+        payload = payload.model_dump(mode="json")
+    return json.dumps(payload, ensure_ascii=False, indent=2)
+
+
+def _fsync_path(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+__all__ = [
+    "DEFAULT_FSYNC_POLICY",
+    "ArtifactWriteError",
+    "ArtifactWriter",
+    "FsyncPolicy",
+    "encode_json",
+    "flush_artifacts",
+    "write_json_artifact",
+]
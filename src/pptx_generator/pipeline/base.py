@@ -8,22 +8,46 @@ from pathlib import Path
 from typing import Protocol
 
 from ..models import JobSpec
+from .artifact_hashing import ArtifactDigest
+from .artifact_writer import ArtifactWriter
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass(slots=True)
 class PipelineContext:
-    """パイプライン全体で共有する情報。"""
+    """パイプライン全体で共有する情報。
+
+    ``artifact_writer`` を設定すると、対応するステップは成果物 JSON を非同期に書き出す。
+    ``artifact_hashes`` には書き出し時に求めたハッシュを絶対パスをキーに保持する。
+    """
 
     spec: JobSpec
     workdir: Path
     artifacts: dict[str, object] = field(default_factory=dict)
+    artifact_writer: ArtifactWriter | None = None
+    artifact_hashes: dict[str, ArtifactDigest] = field(default_factory=dict)
 
     def add_artifact(self, key: str, value: object) -> None:
         logger.debug("artifact 登録: %s", key)
         self.artifacts[key] = value
 
+    def record_artifact_hash(self, path: Path, digest: ArtifactDigest) -> None:
+        self.artifact_hashes[_hash_key(path)] = digest
+
+    def discard_artifact_hash(self, path: Path) -> None:
+        """外部ツールがファイルを更新した場合に登録済みハッシュを破棄する。"""
+
+        self.artifact_hashes.pop(_hash_key(path), None)
+
+    def artifact_hash(self, path: Path) -> ArtifactDigest | None:
+        """登録済みハッシュを返す。書き出し後にファイルが変わっていれば ``None``。"""
+
+        digest = self.artifact_hashes.get(_hash_key(path))
+        if digest is None or not digest.matches(path):
+            return None
+        return digest
+
     def require_artifact(self, key: str) -> object:
         if key not in self.artifacts:
             msg = f"artifact '{key}' が存在しません"
@@ -31,6 +55,10 @@ class PipelineContext:
         return self.artifacts[key]
 
 
+def _hash_key(path: Path) -> str:
+    return str(Path(path).absolute())
+
+
 class PipelineStep(Protocol):
     """各処理ステップに共通するインターフェース。"""
 
@@ -8,7 +8,7 @@ import logging
 from datetime import datetime, timezone
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Iterable, Sequence
+from typing import Any, Sequence
 
 from ..brief.models import BriefDocument
 from ..models import (
@@ -32,7 +32,12 @@ from ..draft_recommender import (
     CardLayoutRecommender,
     CardLayoutRecommenderConfig,
     LayoutProfile,
+    RecommendationInput,
+    RecommendationResult,
 )
+from ..content_ai import create_llm_client, llm_client_config_key
+from ..utils.file_cache import shared_file_cache
+from ..utils.layout_catalog import LayoutCatalogIndex
 from ..utils.usage_tags import normalize_usage_tags
 from ..api.draft_store import DraftStore, BoardAlreadyExistsError
 from ..draft_intel import (
@@ -44,6 +49,7 @@ from ..draft_intel import (
     load_chapter_template,
     summarize_analyzer_counts,
 )
+from .artifact_writer import write_json_artifact
 from .base import PipelineContext
 from .slide_alignment import SlideIdAligner, SlideIdAlignerOptions
 
@@ -73,6 +79,8 @@ class DraftStructuringOptions:
     ai_weight: float = 0.25
     diversity_weight: float = 0.05
     max_layout_candidates: int = 5
+    layout_ai_batch_size: int = 16
+    layout_ai_concurrency: int = 4
     layout_ai_policy_path: Path | None = Path("config/layout_ai_policies.json")
     layout_ai_policy_id: str | None = "layout-default"
     enable_ai_simulation: bool = True
@@ -119,7 +127,12 @@ class DraftStructuringStep:
                 SlideIdAlignerOptions(
                     confidence_threshold=self.options.slide_alignment_threshold,
                     max_candidates=self.options.slide_alignment_max_candidates,
-                )
+                ),
+                llm_client=shared_file_cache.get_object(
+                    "llm_client",
+                    llm_client_config_key(),
+                    create_llm_client,
+                ),
             )
             brief_document = context.artifacts.get("brief_document")
             alignment = aligner.align(
@@ -168,10 +181,10 @@ class DraftStructuringStep:
         log_path = output_dir / self.options.log_filename
         mapping_log_path = output_dir / self.options.mapping_log_filename
 
-        self._write_document(draft_path, draft)
-        self._write_document(approved_path, draft)
-        self._write_log(log_path, [])
-        self._write_json(mapping_log_path, mapping_logs)
+        write_json_artifact(context, draft_path, draft)
+        write_json_artifact(context, approved_path, draft)
+        write_json_artifact(context, log_path, [])
+        write_json_artifact(context, mapping_log_path, mapping_logs)
 
         generate_ready = self._build_generate_ready_document(
             spec=context.spec,
@@ -179,7 +192,7 @@ class DraftStructuringStep:
             content_document=document,
         )
         ready_path = output_dir / self.options.generate_ready_filename
-        self._write_json(ready_path, generate_ready.model_dump(mode="json"))
+        write_json_artifact(context, ready_path, generate_ready)
         context.add_artifact("generate_ready", generate_ready)
         context.add_artifact("generate_ready_path", str(ready_path))
 
@@ -189,7 +202,8 @@ class DraftStructuringStep:
             ai_summary=ai_summary,
         )
         ready_meta_path = output_dir / self.options.generate_ready_meta_filename
-        self._write_json(ready_meta_path, ready_meta_payload)
+        write_json_artifact(context, ready_meta_path, ready_meta_payload)
+        context.add_artifact("generate_ready_meta", ready_meta_payload)
         context.add_artifact("generate_ready_meta_path", str(ready_meta_path))
 
         context.add_artifact("draft_document", draft)
@@ -223,11 +237,13 @@ class DraftStructuringStep:
             policy_path=self.options.layout_ai_policy_path,
             policy_id=self.options.layout_ai_policy_id,
             enable_simulated_ai=self.options.enable_ai_simulation,
+            ai_batch_size=self.options.layout_ai_batch_size,
+            ai_concurrency=self.options.layout_ai_concurrency,
         )
         self._recommender = CardLayoutRecommender(config)
         return self._recommender
 
-    def _load_layouts(self, path: Path | None) -> list[LayoutProfile]:
+    def _load_layouts(self, path: Path | None) -> LayoutCatalogIndex[LayoutProfile]:
         if path is None:
             source_hint = (
                 str(self.options.spec_source_path)
@@ -238,53 +254,16 @@ class DraftStructuringStep:
                 "layouts.jsonl が指定されていないため、JobSpec (%s) の layout を基準にしたヒューリスティック候補を使用します",
                 source_hint,
             )
-            return []
-
-        records: list[LayoutProfile] = []
-        try:
-            text = path.read_text(encoding="utf-8")
-        except FileNotFoundError as exc:
-            msg = f"layouts.jsonl を読み込めません: {path}"
-            raise DraftStructuringError(msg) from exc
+            return LayoutCatalogIndex([])
 
-        for line in text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError as exc:
-                msg = f"layouts.jsonl の解析に失敗しました: {path}"
-                raise DraftStructuringError(msg) from exc
-
-            layout_id = payload.get("layout_id")
-            if not layout_id:
-                logger.debug("layout_id が存在しないレコードをスキップ: %s", payload)
-                continue
-
-            text_hint = payload.get("text_hint") or {}
-            media_hint = payload.get("media_hint") or {}
-            if not isinstance(text_hint, dict):
-                text_hint = {}
-            if not isinstance(media_hint, dict):
-                media_hint = {}
-
-            record = LayoutProfile(
-                layout_id=layout_id,
-                layout_name=payload.get("layout_name") or layout_id,
-                usage_tags=normalize_usage_tags(payload.get("usage_tags", [])),
-                text_hint=text_hint,
-                media_hint=media_hint,
-            )
-            records.append(record)
-        return records
+        return shared_file_cache.get("draft_layout_catalog", path, _read_layouts)
 
     def _build_document(
         self,
         *,
         spec: JobSpec,
         document: ContentApprovalDocument,
-        layouts: Sequence[LayoutProfile],
+        layouts: LayoutCatalogIndex[LayoutProfile],
         analyzer_map: dict[str, DraftAnalyzerSummary],
         chapter_template: ChapterTemplate | None,
         recommender: CardLayoutRecommender,
@@ -301,7 +280,9 @@ class DraftStructuringStep:
             "models": {},
         }
 
-        for index, spec_slide in enumerate(spec.slides, start=1):
+        planned: list[tuple[ContentSlide, Slide, DraftSection, DraftAnalyzerSummary | None]] = []
+        inputs: list[RecommendationInput] = []
+        for spec_slide in spec.slides:
             content_slide = slides_by_id.get(spec_slide.id)
             if content_slide is None:
                 logger.debug("content_approved に存在しないスライドをスキップ: %s", spec_slide.id)
@@ -318,15 +299,29 @@ class DraftStructuringStep:
                 section_map[section_key] = section
                 sections.append(section)
 
-            card_order = len(section.slides) + 1
             analyzer_summary = analyzer_map.get(content_slide.id)
-            recommendation, card = self._build_card(
+            planned.append((content_slide, spec_slide, section, analyzer_summary))
+            inputs.append(
+                RecommendationInput(
+                    slide=content_slide,
+                    preferred_layout=spec_slide.layout,
+                    analyzer_summary=analyzer_summary,
+                    group=section_key,
+                )
+            )
+
+        # 章ごとにまとめてレイアウト AI へ問い合わせる
+        recommendations = recommender.recommend_batch(inputs, layouts=layouts)
+
+        for (content_slide, spec_slide, section, analyzer_summary), recommendation in zip(
+            planned, recommendations, strict=True
+        ):
+            card = self._build_card(
                 content_slide,
                 spec_slide.layout,
-                layouts,
-                order=card_order,
+                recommendation,
+                order=len(section.slides) + 1,
                 analyzer_summary=analyzer_summary,
-                recommender=recommender,
             )
             section.slides.append(card)
 
@@ -462,18 +457,11 @@ class DraftStructuringStep:
         self,
         content_slide: ContentSlide,
         default_layout: str,
-        layouts: Sequence[LayoutProfile],
+        recommendation: RecommendationResult,
         *,
         order: int,
         analyzer_summary: DraftAnalyzerSummary | None,
-        recommender: CardLayoutRecommender,
-    ) -> tuple[RecommendationResult, DraftSlideCard]:
-        recommendation = recommender.recommend(
-            slide=content_slide,
-            preferred_layout=default_layout,
-            layouts=layouts,
-            analyzer_summary=analyzer_summary,
-        )
+    ) -> DraftSlideCard:
         candidates = recommendation.candidates
         layout_hint = candidates[0][0].layout_id if candidates else default_layout
         layout_detail = candidates[0][1] if candidates else None
@@ -489,21 +477,7 @@ class DraftStructuringStep:
             layout_score_detail=layout_detail,
             analyzer_summary=analyzer_summary,
         )
-        return recommendation, card
-
-    @staticmethod
-    def _write_document(path: Path, document: DraftDocument) -> None:
-        payload = document.model_dump(mode="json")
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-
-    @staticmethod
-    def _write_json(path: Path, payload: object) -> None:
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-
-    @staticmethod
-    def _write_log(path: Path, entries: Iterable[dict[str, object]]) -> None:
-        payload = list(entries)
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        return card
 
     @staticmethod
     def _spec_id_from_title(title: str | None) -> str:
@@ -776,3 +750,44 @@ class DraftStructuringStep:
 
         evaluation.section_scores = normalized_scores
         return evaluation
+
+
+def _read_layouts(path: Path) -> LayoutCatalogIndex[LayoutProfile]:
+    records: list[LayoutProfile] = []
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError as exc:
+        msg = f"layouts.jsonl を読み込めません: {path}"
+        raise DraftStructuringError(msg) from exc
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError as exc:
+            msg = f"layouts.jsonl の解析に失敗しました: {path}"
+            raise DraftStructuringError(msg) from exc
+
+        layout_id = payload.get("layout_id")
+        if not layout_id:
+            logger.debug("layout_id が存在しないレコードをスキップ: %s", payload)
+            continue
+
+        text_hint = payload.get("text_hint") or {}
+        media_hint = payload.get("media_hint") or {}
+        if not isinstance(text_hint, dict):
+            text_hint = {}
+        if not isinstance(media_hint, dict):
+            media_hint = {}
+
+        record = LayoutProfile(
+            layout_id=layout_id,
+            layout_name=payload.get("layout_name") or layout_id,
+            usage_tags=normalize_usage_tags(payload.get("usage_tags", [])),
+            text_hint=text_hint,
+            media_hint=media_hint,
+        )
+        records.append(record)
+    return LayoutCatalogIndex(records)
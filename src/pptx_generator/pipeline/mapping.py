@@ -31,7 +31,10 @@ from ..models import (
     Slide,
     JobSpec,
 )
+from ..utils.file_cache import shared_file_cache
+from ..utils.layout_catalog import LayoutCatalogIndex
 from ..utils.usage_tags import normalize_usage_tag_value, normalize_usage_tags
+from .artifact_writer import write_json_artifact
 from .base import PipelineContext
 
 logger = logging.getLogger(__name__)
@@ -258,37 +261,20 @@ class MappingStep:
         )
 
         generate_ready_path = output_dir / self.options.generate_ready_filename
-        generate_ready_path.write_text(
-            json.dumps(
-                generate_ready_document.model_dump(mode="json"),
-                ensure_ascii=False,
-                indent=2,
-            ),
-            encoding="utf-8",
-        )
+        write_json_artifact(context, generate_ready_path, generate_ready_document)
 
         mapping_log_path = output_dir / self.options.mapping_log_filename
-        mapping_log_path.write_text(
-            json.dumps(
-                mapping_log.model_dump(mode="json"),
-                ensure_ascii=False,
-                indent=2,
-            ),
-            encoding="utf-8",
-        )
+        write_json_artifact(context, mapping_log_path, mapping_log)
 
         if fallback_records and self.options.fallback_report_filename:
             fallback_path = output_dir / self.options.fallback_report_filename
-            fallback_path.write_text(
-                json.dumps(
-                    {
-                        "generated_at": generate_ready_meta.generated_at,
-                        "slides": fallback_records,
-                    },
-                    ensure_ascii=False,
-                    indent=2,
-                ),
-                encoding="utf-8",
+            write_json_artifact(
+                context,
+                fallback_path,
+                {
+                    "generated_at": generate_ready_meta.generated_at,
+                    "slides": fallback_records,
+                },
             )
             context.add_artifact("mapping_fallback_report_path", str(fallback_path))
 
@@ -350,37 +336,10 @@ class MappingStep:
 
     def _load_layout_catalog(
         self, path: Path | None
-    ) -> dict[str, LayoutProfile]:
+    ) -> LayoutCatalogIndex[LayoutProfile]:
         if path is None:
-            return {}
-        try:
-            text = path.read_text(encoding="utf-8")
-        except FileNotFoundError:
-            logger.warning("layouts.jsonl が見つからないため既定値を使用します: %s", path)
-            return {}
-        catalog: dict[str, LayoutProfile] = {}
-        for line in text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                payload = json.loads(line)
-            except json.JSONDecodeError:
-                logger.debug("layouts.jsonl の 1 レコード解析に失敗しました: %s", line)
-                continue
-            layout_id = payload.get("layout_id")
-            if not layout_id:
-                continue
-            usage_tags = normalize_usage_tags(payload.get("usage_tags", []))
-            layout_name = payload.get("layout_name") or layout_id
-            catalog[layout_id] = LayoutProfile(
-                layout_id=layout_id,
-                layout_name=layout_name,
-                usage_tags=usage_tags,
-                text_hint=payload.get("text_hint") or {},
-                media_hint=payload.get("media_hint") or {},
-            )
-        return catalog
+            return LayoutCatalogIndex([])
+        return shared_file_cache.get("mapping_layout_catalog", path, _read_layout_catalog)
 
     @staticmethod
     def _build_section_lookup(draft_document: DraftDocument) -> dict[str, str]:
@@ -405,7 +364,7 @@ class MappingStep:
         *,
         slide_id: str,
         content_slide: ContentSlide | None,
-        layout_catalog: Mapping[str, LayoutProfile],
+        layout_catalog: LayoutCatalogIndex[LayoutProfile],
         previous_layout: str | None,
     ) -> list[MappingCandidate]:
         raw_intent = (content_slide.intent if content_slide else None)
@@ -426,33 +385,45 @@ class MappingStep:
             else False
         )
 
-        candidates: list[MappingCandidate] = []
-        for profile in layout_catalog.values():
+        # タグを共有するレイアウトと直前レイアウトは個別に評価し、
+        # それ以外は容量特徴ごとに上位候補になり得る件数だけ評価する
+        targeted = layout_catalog.matching((intent, type_hint))
+        previous_position = layout_catalog.position(previous_layout) if previous_layout else None
+        if previous_position is not None:
+            targeted.add(previous_position)
+        positions = sorted(
+            targeted | set(layout_catalog.representatives(targeted, self.options.max_candidates))
+        )
+
+        scored: list[tuple[float, int, str]] = []
+        for position in positions:
+            features = layout_catalog.features[position]
             score = 0.0
 
-            if intent and intent in profile.usage_tags:
+            if intent and intent in features.usage_tags:
                 score += 0.5
-            if type_hint and type_hint in profile.usage_tags:
+            if type_hint and type_hint in features.usage_tags:
                 score += 0.15
-            if profile.max_lines() is not None:
-                if body_lines <= profile.max_lines():
+            if features.max_lines is not None:
+                if body_lines <= features.max_lines:
                     score += 0.3
                 else:
-                    score -= min(0.3, (body_lines - profile.max_lines()) * 0.05)
+                    score -= min(0.3, (body_lines - features.max_lines) * 0.05)
             elif body_lines <= 6:
                 score += 0.1
             if has_table:
-                score += 0.05 if profile.allows_table() else -0.2
-            if previous_layout and profile.layout_id == previous_layout:
+                score += 0.05 if features.allows_table else -0.2
+            if position == previous_position:
                 score -= 0.05
 
             score = max(0.0, min(1.0, round(score, 3)))
             if score <= 0.0:
                 continue
-            candidates.append(
-                MappingCandidate(layout_id=profile.layout_id, score=score)
-            )
-        candidates.sort(key=lambda candidate: candidate.score, reverse=True)
+            scored.append((score, position, features.layout_id))
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        candidates = [
+            MappingCandidate(layout_id=layout_id, score=score) for score, _, layout_id in scored
+        ]
         return candidates[: self.options.max_candidates]
 
     @staticmethod
@@ -477,6 +448,7 @@ class MappingStep:
             elements: dict[str, Any] = {
                 "title": content_slide.elements.title,
             }
+            # 後続工程が generate_ready 側を書き換えても承認済みコンテンツに波及しないようコピーする
             if content_slide.elements.body:
                 elements["body"] = list(content_slide.elements.body)
             elif "body" in base:
@@ -647,3 +619,36 @@ class MappingStep:
             appendix_limit=0,
         )
         return DraftDocument(sections=[section], meta=meta)
+
+
+def _read_layout_catalog(path: Path) -> LayoutCatalogIndex[LayoutProfile]:
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        logger.warning("layouts.jsonl が見つからないため既定値を使用します: %s", path)
+        return LayoutCatalogIndex([])
+    profiles: list[LayoutProfile] = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError:
+            logger.debug("layouts.jsonl の 1 レコード解析に失敗しました: %s", line)
+            continue
+        layout_id = payload.get("layout_id")
+        if not layout_id:
+            continue
+        usage_tags = normalize_usage_tags(payload.get("usage_tags", []))
+        layout_name = payload.get("layout_name") or layout_id
+        profiles.append(
+            LayoutProfile(
+                layout_id=layout_id,
+                layout_name=layout_name,
+                usage_tags=usage_tags,
+                text_hint=payload.get("text_hint") or {},
+                media_hint=payload.get("media_hint") or {},
+            )
+        )
+    return LayoutCatalogIndex(profiles)
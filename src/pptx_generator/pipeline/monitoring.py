@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable
 
+from .artifact_writer import write_json_artifact
 from .base import PipelineContext
 
 logger = logging.getLogger(__name__)
@@ -52,7 +53,7 @@ class MonitoringIntegrationStep:
             analysis_before = self._load_analysis(context, "analysis_pre_polisher_path")
 
             report = self._build_report(context, rendering_log, analysis_after, analysis_before)
-            output_path = self._write_report(report, context.workdir)
+            output_path = self._write_report(context, report)
 
             context.add_artifact("monitoring_report", report)
             context.add_artifact("monitoring_report_path", output_path)
@@ -81,6 +82,9 @@ class MonitoringIntegrationStep:
     def _load_analysis(
         self, context: PipelineContext, artifact_key: str
     ) -> dict[str, Any] | None:
+        raw = context.artifacts.get(artifact_key.removesuffix("_path"))
+        if isinstance(raw, dict):
+            return raw
         path_value = context.artifacts.get(artifact_key)
         if path_value is None:
             return None
@@ -181,11 +185,9 @@ class MonitoringIntegrationStep:
         }
         return report
 
-    def _write_report(self, payload: dict[str, Any], workdir: Path) -> Path:
-        workdir.mkdir(parents=True, exist_ok=True)
-        output_path = workdir / self.options.output_filename
-        output_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-        return output_path
+    def _write_report(self, context: PipelineContext, payload: dict[str, Any]) -> Path:
+        output_path = context.workdir / self.options.output_filename
+        return write_json_artifact(context, output_path, payload)
 
     def _cleanup_pdf_only(self, context: PipelineContext) -> None:
         cleanup_target = context.artifacts.pop("pdf_cleanup_pptx_path", None)
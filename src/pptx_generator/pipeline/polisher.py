@@ -108,6 +108,8 @@ class PolisherStep:
         if self.options.rules_path:
             metadata["rules_path"] = str(self.options.rules_path)
 
+        # Polisher は PPTX を上書きするため、レンダラーが登録したハッシュは使えない
+        context.discard_artifact_hash(pptx_path)
         context.add_artifact("polisher_metadata", metadata)
 
     def _build_command(self, pptx_path: Path) -> list[str]:
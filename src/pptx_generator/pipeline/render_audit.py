@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -12,6 +11,7 @@ from typing import Any
 from pptx import Presentation
 from pptx.enum.shapes import PP_PLACEHOLDER
 
+from .artifact_writer import write_json_artifact
 from .base import PipelineContext
 
 logger = logging.getLogger(__name__)
@@ -114,12 +114,8 @@ class RenderingAuditStep:
             "slides": slides_payload,
         }
 
-        output_dir = context.workdir
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = output_dir / self.options.output_filename
-        output_path.write_text(
-            json.dumps(rendering_log, ensure_ascii=False, indent=2),
-            encoding="utf-8",
+        output_path = write_json_artifact(
+            context, context.workdir / self.options.output_filename, rendering_log
         )
 
         context.add_artifact("rendering_log", rendering_log)
@@ -7,6 +7,7 @@ import os
 import tempfile
 import time
 from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path
 from urllib.parse import urlparse
 from urllib.request import urlopen
@@ -30,6 +31,8 @@ from ..models import (
     TextboxParagraph,
 )
 from ..settings import BrandingConfig, BrandingFont, BoxSpec, ParagraphStyle
+from ..utils.file_cache import shared_file_cache
+from .artifact_hashing import digest_file
 from .base import PipelineContext
 
 logger = logging.getLogger(__name__)
@@ -89,7 +92,7 @@ class SimpleRendererStep:
         start = time.perf_counter()
         try:
             self._render_slides(presentation, context.spec)
-            output_path = self._save(presentation, context.workdir)
+            output_path = self._save(context, presentation)
             context.add_artifact("pptx_path", output_path)
             logger.info("PPTX を出力しました: %s", output_path)
         finally:
@@ -101,6 +104,11 @@ class SimpleRendererStep:
     def _load_template(self) -> Presentation:
         if self.options.template_path and self.options.template_path.exists():
             logger.debug("テンプレートを使用: %s", self.options.template_path)
+            if shared_file_cache.enabled:
+                payload = shared_file_cache.get(
+                    "template_bytes", self.options.template_path, Path.read_bytes
+                )
+                return Presentation(BytesIO(payload))
             return Presentation(self.options.template_path)
         logger.debug("既定テンプレートを利用")
         return Presentation()
@@ -621,10 +629,12 @@ class SimpleRendererStep:
     def _box_spec_to_layout_box(self, spec: BoxSpec) -> LayoutBox:
         return LayoutBox(spec.left_in, spec.top_in, spec.width_in, spec.height_in)
 
-    def _save(self, presentation: Presentation, workdir: Path) -> Path:
-        workdir.mkdir(parents=True, exist_ok=True)
-        output_path = workdir / self.options.output_filename
+    def _save(self, context: PipelineContext, presentation: Presentation) -> Path:
+        output_path = context.workdir / self.options.output_filename
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # zip はヘッダーを後から書き戻すため、直接保存してから 1 度だけ読み直してハッシュを取る
         presentation.save(output_path)
+        context.record_artifact_hash(output_path, digest_file(output_path))
         return output_path
 
     def _apply_brand_font(self, paragraph, branding_font: BrandingFont) -> None:
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import heapq
 import logging
+import math
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from difflib import SequenceMatcher
-from typing import Iterable, Literal
+from typing import Literal, Sequence
 
 from ..brief.models import BriefCard, BriefDocument
 from ..content_ai import (LLMClient, SlideMatchCandidate,
@@ -15,6 +18,9 @@ from ..models import ContentApprovalDocument, ContentSlide, JobSpec, Slide
 
 logger = logging.getLogger(__name__)
 
+# ヒューリスティックスコアを信頼度 (0.0～1.0) に換算する際の分母
+HEURISTIC_CONFIDENCE_SCALE = 5.0
+
 
 @dataclass(slots=True)
 class SlideAlignmentRecord:
@@ -39,14 +45,34 @@ class SlideAlignmentResult:
 
 @dataclass(slots=True)
 class SlideIdAlignerOptions:
-    """整合処理の設定。"""
+    """整合処理の設定。
+
+    ``ambiguity_margin`` は割当先と次点候補の信頼度差の下限で、これを下回るカードと
+    信頼度がしきい値未満のカードだけを LLM に問い合わせる。
+    """
 
     confidence_threshold: float = 0.6
     max_candidates: int = 12
+    ambiguity_margin: float = 0.1
+    llm_batch_size: int = 8
+    llm_concurrency: int = 4
+
+
+@dataclass(slots=True)
+class _CardCandidates:
+    """カードごとの候補スライド（スコア降順）。"""
+
+    card: BriefCard
+    slide_indices: list[int]
+    scores: list[float]
 
 
 class SlideIdAligner:
-    """BriefCard ↔ JobSpec の ID 整合を担当するクラス。"""
+    """BriefCard ↔ JobSpec の ID 整合を担当するクラス。
+
+    候補は文書ごとに 1 度だけ構築する文字 bigram の TF-IDF 索引で絞り込み、
+    カード→スライドの割当は候補グラフ上の最大重みマッチングで一括して決める。
+    """
 
     def __init__(
         self,
@@ -88,17 +114,16 @@ class SlideIdAligner:
                 },
             )
 
-        slide_assignments: dict[str, int] = {}
+        scorer = _SlideScorer(candidate_slides)
         records: list[SlideAlignmentRecord] = []
-
+        entries: dict[int, _CardCandidates] = {}
         for slide in content_document.slides:
-            original_id = slide.id
-            card = card_map.get(original_id)
+            card = card_map.get(slide.id)
             if card is None:
-                logger.debug("SlideIdAligner: card_id=%s が brief_document に見つかりません", original_id)
+                logger.debug("SlideIdAligner: card_id=%s が brief_document に見つかりません", slide.id)
                 records.append(
                     SlideAlignmentRecord(
-                        card_id=original_id,
+                        card_id=slide.id,
                         recommended_slide_id=None,
                         confidence=0.0,
                         reason="card_not_found",
@@ -106,20 +131,68 @@ class SlideIdAligner:
                     )
                 )
                 continue
+            entry = self._select_candidates(card, scorer)
+            entries[len(records)] = entry
+            records.append(
+                SlideAlignmentRecord(
+                    card_id=card.card_id,
+                    recommended_slide_id=None,
+                    confidence=0.0,
+                    reason=None,
+                    status="pending",
+                    candidates=tuple(candidate_slides[index].id for index in entry.slide_indices),
+                )
+            )
 
-            candidates = self._select_candidates(card, candidate_slides)
-            match_request = self._build_match_request(card, candidates)
-            response = self._client.match_slide(match_request)
-
-            candidate_ids = tuple(candidate.id for candidate in candidates)
-            record = SlideAlignmentRecord(
-                card_id=card.card_id,
-                recommended_slide_id=response.slide_id,
-                confidence=response.confidence,
-                reason=response.reason,
-                status="pending",
-                candidates=candidate_ids,
+        # 1. 候補グラフ上で全カードの割当を一括で解く
+        positions = list(entries)
+        assignment = _max_weight_assignment(
+            [
+                [
+                    (slide_index, score)
+                    for slide_index, score in zip(entries[position].slide_indices, entries[position].scores)
+                    if score > 0
+                ]
+                for position in positions
+            ]
+        )
+        proposals: dict[int, SlideMatchResponse] = {}
+        ambiguous: list[int] = []
+        for position, slide_index in zip(positions, assignment):
+            entry = entries[position]
+            if slide_index is None:
+                ambiguous.append(position)
+                continue
+            score = entry.scores[entry.slide_indices.index(slide_index)]
+            runner_up = max(
+                (value for index, value in zip(entry.slide_indices, entry.scores) if index != slide_index),
+                default=0.0,
             )
+            confidence = _heuristic_confidence(score)
+            margin = confidence - _heuristic_confidence(runner_up)
+            if (
+                confidence < self._options.confidence_threshold
+                or margin < self._options.ambiguity_margin
+            ):
+                ambiguous.append(position)
+                continue
+            proposals[position] = SlideMatchResponse(
+                slide_id=candidate_slides[slide_index].id,
+                confidence=confidence,
+                reason=f"global assignment score={score:.2f}",
+            )
+
+        # 2. 判定が曖昧なカードだけを LLM に問い合わせる
+        proposals.update(self._match_with_llm(ambiguous, entries, candidate_slides))
+
+        slide_assignments: dict[str, int] = {}
+        for position, record in enumerate(records):
+            response = proposals.get(position)
+            if response is None:
+                continue
+            record.recommended_slide_id = response.slide_id
+            record.confidence = response.confidence
+            record.reason = response.reason
 
             recommended_slide_id = response.slide_id
             if recommended_slide_id and recommended_slide_id not in record.candidates:
@@ -130,7 +203,7 @@ class SlideIdAligner:
                 previous_index = slide_assignments.get(recommended_slide_id)
                 if previous_index is None:
                     record.status = "applied"
-                    slide_assignments[recommended_slide_id] = len(records)
+                    slide_assignments[recommended_slide_id] = position
                 else:
                     previous_record = records[previous_index]
                     if response.confidence > previous_record.confidence:
@@ -138,37 +211,51 @@ class SlideIdAligner:
                         previous_record.status = "pending"
                         previous_record.reason = (previous_record.reason or "") + " | reassigned"
                         record.status = "applied"
-                        slide_assignments[recommended_slide_id] = len(records)
+                        slide_assignments[recommended_slide_id] = position
                     else:
                         record.status = "pending"
                         record.reason = (record.reason or "") + " | lower_than_existing"
                         record.recommended_slide_id = None
-            records.append(record)
 
-        assigned_slides = {slide_id for slide_id in slide_assignments}
+        # 3. 未確定カードは空いているスライドに改めて一括割当する
+        assigned_slides = set(slide_assignments)
+        unresolved = [
+            position
+            for position in entries
+            if records[position].status == "pending" and not records[position].recommended_slide_id
+        ]
+        slide_positions = {slide.id: index for index, slide in enumerate(candidate_slides)}
+        taken = {slide_positions[slide_id] for slide_id in assigned_slides if slide_id in slide_positions}
+        fallback_assignment = _max_weight_assignment(
+            [
+                [
+                    (slide_index, score + 1.0)
+                    for slide_index, score in zip(entries[position].slide_indices, entries[position].scores)
+                    if slide_index not in taken
+                ]
+                for position in unresolved
+            ]
+        )
         fallback_applied = 0
-        for index, record in enumerate(records):
-            if record.status == "applied" and record.recommended_slide_id:
-                continue
-            if record.status == "pending" and record.recommended_slide_id:
-                continue
-            if not record.candidates:
+        for position, slide_index in zip(unresolved, fallback_assignment):
+            if slide_index is None:
                 continue
-            for candidate_id in record.candidates:
-                if candidate_id not in assigned_slides:
-                    record.recommended_slide_id = candidate_id
-                    record.status = "fallback"
-                    record.reason = (record.reason or "") + " | fallback_candidate"
-                    assigned_slides.add(candidate_id)
-                    slide_assignments[candidate_id] = index
-                    fallback_applied += 1
-                    break
-
+            record = records[position]
+            slide_id = candidate_slides[slide_index].id
+            record.recommended_slide_id = slide_id
+            record.status = "fallback"
+            record.reason = (record.reason or "") + " | fallback_candidate"
+            assigned_slides.add(slide_id)
+            slide_assignments[slide_id] = position
+            fallback_applied += 1
+
+        record_lookup: dict[str, SlideAlignmentRecord] = {}
+        for record in records:
+            record_lookup.setdefault(record.card_id, record)
         updated_slides: list[ContentSlide] = []
         applied = 0
         for slide in content_document.slides:
-            original_id = slide.id
-            record = next((entry for entry in records if entry.card_id == original_id), None)
+            record = record_lookup.get(slide.id)
             if record and record.recommended_slide_id and record.status in {"applied", "fallback"}:
                 updated_slides.append(slide.model_copy(update={"id": record.recommended_slide_id}))
                 applied += 1
@@ -202,16 +289,64 @@ class SlideIdAligner:
             "pending": sum(1 for record in records if record.status == "pending"),
         }
         logger.info(
-            "SlideIdAligner: cards_total=%d jobspec_total=%d jobspec_unassigned=%d applied=%d pending=%d threshold=%.2f",
+            "SlideIdAligner: cards_total=%d jobspec_total=%d jobspec_unassigned=%d applied=%d pending=%d threshold=%.2f llm_cards=%d",
             meta["cards_total"],
             meta["jobspec_total"],
             meta["jobspec_unassigned"],
             meta["applied"],
             meta["pending"],
             meta["threshold"],
+            len(ambiguous),
         )
         return SlideAlignmentResult(document=aligned_document, records=records, meta=meta)
 
+    def _match_with_llm(
+        self,
+        positions: Sequence[int],
+        entries: dict[int, _CardCandidates],
+        candidate_slides: Sequence[Slide],
+    ) -> dict[int, SlideMatchResponse]:
+        """曖昧なカードを ``llm_batch_size`` 件ずつまとめ、``llm_concurrency`` 並列で問い合わせる。"""
+
+        if not positions:
+            return {}
+        requests = {
+            position: self._build_match_request(
+                entries[position].card,
+                [candidate_slides[index] for index in entries[position].slide_indices],
+            )
+            for position in positions
+        }
+        client = self._client
+        match_batch = getattr(client, "match_slide_batch", None)
+        batch_size = max(1, self._options.llm_batch_size) if callable(match_batch) else 1
+        chunks = [list(positions[start : start + batch_size]) for start in range(0, len(positions), batch_size)]
+
+        def run_chunk(chunk: list[int]) -> list[SlideMatchResponse]:
+            chunk_requests = [requests[position] for position in chunk]
+            responses: list[SlideMatchResponse | None] = [None] * len(chunk)
+            if len(chunk) > 1:
+                try:
+                    responses = list(match_batch(chunk_requests))
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning("SlideIdAligner: バッチ整合に失敗したため個別に問い合わせます: %s", exc)
+            return [
+                response if response is not None else client.match_slide(request)
+                for request, response in zip(chunk_requests, responses, strict=True)
+            ]
+
+        workers = max(1, min(self._options.llm_concurrency, len(chunks)))
+        if workers == 1:
+            chunk_responses = [run_chunk(chunk) for chunk in chunks]
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="slide-align") as executor:
+                chunk_responses = list(executor.map(run_chunk, chunks))
+
+        results: dict[int, SlideMatchResponse] = {}
+        for chunk, responses in zip(chunks, chunk_responses, strict=True):
+            results.update(zip(chunk, responses, strict=True))
+        return results
+
     def _build_match_request(
         self,
         card: BriefCard,
@@ -251,11 +386,16 @@ class SlideIdAligner:
             "",
             "# 候補スライド一覧",
             *candidate_entries,
-            "",
-            "以下の JSON 形式で回答してください:",
-            '{"card_id": "' + card.card_id + '", "recommended_slide_id": "...", "confidence": 0.0～1.0, "reason": "..."}',
         ]
-        prompt = "\n".join(prompt_parts)
+        context = "\n".join(prompt_parts)
+        prompt = "\n".join(
+            [
+                context,
+                "",
+                "以下の JSON 形式で回答してください:",
+                '{"card_id": "' + card.card_id + '", "recommended_slide_id": "...", "confidence": 0.0～1.0, "reason": "..."}',
+            ]
+        )
         system_prompt = (
             "あなたはスライド構成のアシスタントです。カードの意図とテンプレート情報を比較し、最も適切な slide_id を1つだけ選んでください。"
         )
@@ -269,38 +409,200 @@ class SlideIdAligner:
             prompt=prompt,
             system_prompt=system_prompt,
             candidates=candidate_models,
+            context=context,
         )
 
-    def _select_candidates(self, card: BriefCard, candidates: Iterable[Slide]) -> list[Slide]:
-        scored: list[tuple[float, Slide]] = []
-        for slide in candidates:
-            score = self._heuristic_score(card, slide)
-            scored.append((score, slide))
-        scored.sort(key=lambda item: item[0], reverse=True)
-        limited = [slide for _, slide in scored[: self._options.max_candidates]]
-        if not limited:
-            return list(candidates)[: self._options.max_candidates]
-        return limited
-
-    @staticmethod
-    def _heuristic_score(card: BriefCard, slide: Slide) -> float:
-        score = 0.0
-        if slide.id == card.card_id:
-            score += 5.0
-        title = (slide.title or "").lower()
+    def _select_candidates(self, card: BriefCard, scorer: _SlideScorer) -> _CardCandidates:
+        scored = scorer.score(card)
+        ranked = sorted(scored.items(), key=lambda item: (-item[1], item[0]))
+        limited = ranked[: self._options.max_candidates]
+        if len(limited) < self._options.max_candidates:
+            # 類似スライドが少ない場合は JobSpec の先頭から候補を補う
+            for index in range(min(scorer.size, self._options.max_candidates + len(limited))):
+                if len(limited) >= self._options.max_candidates:
+                    break
+                if index not in scored:
+                    limited.append((index, 0.0))
+        return _CardCandidates(
+            card=card,
+            slide_indices=[index for index, _ in limited],
+            scores=[score for _, score in limited],
+        )
+
+
+class _SlideScorer:
+    """JobSpec スライドの特徴量と類似度索引。文書ごとに 1 度だけ構築する。
+
+    本文類似度は文字 bigram の TF-IDF ベクトルのコサイン類似度で求め、
+    転置索引により bigram を共有するスライドだけを評価する。
+    """
+
+    def __init__(self, slides: Sequence[Slide]) -> None:
+        self.size = len(slides)
+        self._titles = [(slide.title or "").lower() for slide in slides]
+        self._layouts = [(slide.layout or "").lower() for slide in slides]
+        self._positions: dict[str, int] = {}
+        for index, slide in enumerate(slides):
+            self._positions.setdefault(slide.id, index)
+
+        documents = [
+            _shingles((slide.notes or slide.title or "").lower()) for slide in slides
+        ]
+        document_frequency: Counter[str] = Counter()
+        for shingles in documents:
+            document_frequency.update(shingles.keys())
+        self._idf = {
+            shingle: math.log((1 + self.size) / (1 + frequency)) + 1.0
+            for shingle, frequency in document_frequency.items()
+        }
+        self._postings: dict[str, list[tuple[int, float]]] = {}
+        for index, shingles in enumerate(documents):
+            for shingle, weight in self._normalize(shingles).items():
+                self._postings.setdefault(shingle, []).append((index, weight))
+
+        self._title_matches: dict[str, tuple[int, ...]] = {}
+        self._layout_matches: dict[str, tuple[int, ...]] = {}
+
+    def score(self, card: BriefCard) -> dict[int, float]:
+        """スコアが正のスライドだけを返す。"""
+
+        scores: dict[int, float] = {}
+
+        def add(index: int, value: float) -> None:
+            scores[index] = scores.get(index, 0.0) + value
+
+        position = self._positions.get(card.card_id)
+        if position is not None:
+            add(position, 5.0)
         chapter = card.chapter.lower()
-        if chapter and chapter in title:
-            score += 3.0
-        if card.story.phase and card.story.phase.lower() in (slide.layout or "").lower():
-            score += 1.5
-        if card.intent_tags:
-            for intent in card.intent_tags:
-                if intent.lower() in title:
-                    score += 1.0
-        if slide.notes:
-            ratio = SequenceMatcher(None, card.message.lower(), slide.notes.lower()).ratio()
-            score += ratio * 2.0
-        else:
-            ratio = SequenceMatcher(None, card.message.lower(), title).ratio()
-            score += ratio * 2.0
-        return score
+        if chapter:
+            for index in self._matching_titles(chapter):
+                add(index, 3.0)
+        if card.story.phase:
+            for index in self._matching_layouts(card.story.phase.lower()):
+                add(index, 1.5)
+        for intent in card.intent_tags:
+            for index in self._matching_titles(intent.lower()):
+                add(index, 1.0)
+
+        query = self._normalize(_shingles(card.message.lower()))
+        similarities: dict[int, float] = {}
+        for shingle, weight in query.items():
+            for index, slide_weight in self._postings.get(shingle, ()):
+                similarities[index] = similarities.get(index, 0.0) + weight * slide_weight
+        for index, similarity in similarities.items():
+            add(index, min(1.0, similarity) * 2.0)
+        return {index: score for index, score in scores.items() if score > 0}
+
+    def _normalize(self, shingles: Counter[str]) -> dict[str, float]:
+        weighted = {
+            shingle: count * self._idf[shingle] for shingle, count in shingles.items() if shingle in self._idf
+        }
+        norm = math.sqrt(sum(value * value for value in weighted.values()))
+        if norm == 0:
+            return {}
+        return {shingle: value / norm for shingle, value in weighted.items()}
+
+    def _matching_titles(self, needle: str) -> tuple[int, ...]:
+        matches = self._title_matches.get(needle)
+        if matches is None:
+            matches = tuple(index for index, title in enumerate(self._titles) if needle in title)
+            self._title_matches[needle] = matches
+        return matches
+
+    def _matching_layouts(self, needle: str) -> tuple[int, ...]:
+        matches = self._layout_matches.get(needle)
+        if matches is None:
+            matches = tuple(index for index, layout in enumerate(self._layouts) if needle in layout)
+            self._layout_matches[needle] = matches
+        return matches
+
+
+def _shingles(text: str) -> Counter[str]:
+    compact = "".join(text.split())
+    if len(compact) < 2:
+        return Counter([compact]) if compact else Counter()
+    return Counter(compact[index : index + 2] for index in range(len(compact) - 1))
+
+
+def _heuristic_confidence(score: float) -> float:
+    return min(1.0, max(0.0, score) / HEURISTIC_CONFIDENCE_SCALE)
+
+
+def _max_weight_assignment(edges: Sequence[Sequence[tuple[int, float]]]) -> list[int | None]:
+    """左頂点 ``i`` から右頂点への重み付き辺 ``edges[i]`` について最大重みマッチングを求める。
+
+    各左頂点に重み 0 の「未割当」列を加えた割当問題として、最短増加路法（ハンガリアン法の
+    疎グラフ版）で 1 行ずつ解く。探索は空き列に到達した時点で終わるため、候補が局所的なら
+    ほぼ線形時間で収束する。返り値は左頂点ごとの割当先（未割当は None）。
+    """
+
+    left_count = len(edges)
+    right_ids = sorted({right for items in edges for right, _ in items})
+    column_of = {right: column for column, right in enumerate(right_ids)}
+    real_columns = len(right_ids)
+    adjacency = [
+        [(column_of[right], -weight) for right, weight in items] + [(real_columns + row, 0.0)]
+        for row, items in enumerate(edges)
+    ]
+
+    u = [0.0] * left_count
+    v = [0.0] * (real_columns + left_count)
+    row_for_column = [-1] * (real_columns + left_count)
+    column_for_row = [-1] * left_count
+
+    for current_row in range(left_count):
+        distance: dict[int, float] = {}
+        predecessor: dict[int, int] = {}
+        finalized: list[int] = []
+        finalized_set: set[int] = set()
+        scanned_rows = [current_row]
+        heap: list[tuple[float, int]] = []
+
+        def relax(row: int, base: float) -> None:
+            for column, cost in adjacency[row]:
+                if column in finalized_set:
+                    continue
+                reduced = base + cost - u[row] - v[column]
+                if reduced < distance.get(column, math.inf):
+                    distance[column] = reduced
+                    predecessor[column] = row
+                    heapq.heappush(heap, (reduced, column))
+
+        relax(current_row, 0.0)
+        sink = -1
+        shortest = 0.0
+        while heap:
+            value, column = heapq.heappop(heap)
+            if column in finalized_set or value > distance[column]:
+                continue
+            finalized.append(column)
+            finalized_set.add(column)
+            if row_for_column[column] == -1:
+                sink = column
+                shortest = value
+                break
+            next_row = row_for_column[column]
+            scanned_rows.append(next_row)
+            relax(next_row, value)
+
+        # 双対変数を更新して被約費用の非負性を保つ
+        u[current_row] += shortest
+        for row in scanned_rows[1:]:
+            u[row] += shortest - distance[column_for_row[row]]
+        for column in finalized:
+            v[column] -= shortest - distance[column]
+
+        column = sink
+        while True:
+            row = predecessor[column]
+            row_for_column[column] = row
+            previous_column = column_for_row[row]
+            column_for_row[row] = column
+            if row == current_row:
+                break
+            column = previous_column
+
+    return [
+        right_ids[column] if column < real_columns else None for column in column_for_row
+    ]
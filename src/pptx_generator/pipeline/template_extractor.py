@@ -10,7 +10,7 @@ from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from pptx import Presentation
 from pptx.shapes.base import BaseShape
@@ -22,11 +22,17 @@ from ..models import (JobSpecScaffold, JobSpecScaffoldBounds,
                       TemplateSpec)
 from .base import PipelineContext, PipelineStep
 
+if TYPE_CHECKING:
+    from ..extraction_cache import CacheStatus, TemplateExtractionCache
+    from ..template_package import TemplatePackage
+
 logger = logging.getLogger(__name__)
 
 # SlideBullet拡張仕様で使用される可能性のあるアンカー名パターン
 SLIDE_BULLET_ANCHORS = {"bullets", "bullet_list", "content", "body"}
 JOBSPEC_SCHEMA_VERSION = "0.1"
+# 抽出ロジックを変更した場合は更新し、抽出キャッシュを無効化する
+TEMPLATE_EXTRACTOR_VERSION = "1"
 MAX_SAMPLE_TEXT_LENGTH = 200
 
 
@@ -46,8 +52,14 @@ class TemplateExtractorStep:
     
     name = "TemplateExtractor"
     
-    def __init__(self, options: TemplateExtractorOptions) -> None:
+    def __init__(
+        self,
+        options: TemplateExtractorOptions,
+        *,
+        package: TemplatePackage | None = None,
+    ) -> None:
         self.options = options
+        self.package = package
     
     def run(self, context: PipelineContext) -> None:
         """テンプレート抽出を実行する。"""
@@ -74,11 +86,14 @@ class TemplateExtractorStep:
     
     def extract_template_spec(self) -> TemplateSpec:
         """テンプレートファイルから仕様を抽出する。"""
-        if not self.options.template_path.exists():
+        if self.package is None and not self.options.template_path.exists():
             raise FileNotFoundError(f"テンプレートファイルが見つかりません: {self.options.template_path}")
         
         try:
-            presentation = Presentation(self.options.template_path)
+            if self.package is not None:
+                presentation = self.package.presentation
+            else:
+                presentation = Presentation(self.options.template_path)
         except Exception as exc:
             raise RuntimeError(f"テンプレートファイルの読み込みに失敗しました: {exc}") from exc
         
@@ -400,13 +415,38 @@ class TemplateExtractorStep:
 class TemplateExtractor:
     """スタンドアロンでテンプレート抽出を行うクラス。"""
     
-    def __init__(self, options: TemplateExtractorOptions) -> None:
+    def __init__(
+        self,
+        options: TemplateExtractorOptions,
+        *,
+        cache: TemplateExtractionCache | None = None,
+        package: TemplatePackage | None = None,
+    ) -> None:
         self.options = options
-        self.step = TemplateExtractorStep(options)
+        self.step = TemplateExtractorStep(options, package=package)
+        self.cache = cache
+        self.cache_status: CacheStatus = "disabled"
+        if cache is not None and package is not None:
+            cache.remember_digest(options.template_path, package.sha256)
     
     def extract(self) -> TemplateSpec:
         """テンプレート抽出を実行してTemplateSpecを返す。"""
-        return self.step.extract_template_spec()
+        if self.cache is None or not self.options.template_path.exists():
+            return self.step.extract_template_spec()
+        template_spec, self.cache_status = self.cache.template_spec(
+            self.options.template_path,
+            variant=self.cache_variant(),
+            extract=self.step.extract_template_spec,
+        )
+        return template_spec
+
+    def cache_variant(self) -> dict[str, str | None]:
+        """抽出キャッシュのキーに含める抽出条件。"""
+        return {
+            "extractor_version": TEMPLATE_EXTRACTOR_VERSION,
+            "layout_filter": self.options.layout_filter,
+            "anchor_filter": self.options.anchor_filter,
+        }
 
     def build_jobspec_scaffold(self, template_spec: TemplateSpec) -> JobSpecScaffold:
         """テンプレート仕様からジョブスペック雛形を構築する。"""
@@ -1,5 +1,6 @@
 """テンプレート監査関連ユーティリティ。"""
 
+from .golden import GoldenRunInputs, run_golden_specs
 from .release import (
     build_release_report,
     build_template_release,
@@ -7,7 +8,9 @@ from .release import (
 )
 
 __all__ = [
+    "GoldenRunInputs",
     "build_release_report",
     "build_template_release",
     "load_template_release",
+    "run_golden_specs",
 ]
@@ -0,0 +1,223 @@
+"""ゴールデンサンプル検証の実行ロジック。"""
+
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..models import SpecValidationError, TemplateReleaseGoldenRun
+from ..pipeline import (AnalyzerOptions, PipelineContext, PipelineRunner,
+                        RefinerOptions, RenderingOptions, SimpleAnalyzerStep,
+                        SimpleRefinerStep, SimpleRendererStep,
+                        SpecValidatorStep)
+from ..settings import BrandingConfig, RulesConfig
+from ..spec_loader import load_jobspec_from_path
+from ..utils.file_cache import shared_file_cache
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class GoldenRunInputs:
+    """全ゴールデンサンプルで共有する読み取り専用の入力。"""
+
+    template_path: Path
+    rules_config: RulesConfig
+    branding_config: BrandingConfig
+
+
+@dataclass(slots=True)
+class GoldenRunOutcome:
+    """1 件のゴールデンサンプル実行結果。"""
+
+    result: TemplateReleaseGoldenRun
+    warnings: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+
+
+# ワーカープロセスごとに 1 度だけ設定される共有入力
+_WORKER_INPUTS: GoldenRunInputs | None = None
+
+
+def run_golden_specs(
+    golden_specs: list[Path],
+    *,
+    inputs: GoldenRunInputs,
+    golden_root: Path,
+    workers: int = 1,
+) -> tuple[list[TemplateReleaseGoldenRun], list[str], list[str]]:
+    """ゴールデンサンプルを実行し、入力順に結果を集約する。
+
+    ``workers`` が 2 以上の場合はプロセスプールで並列実行する。各ワーカーは
+    ルール・ブランド設定を初期化時に 1 度だけ受け取り、テンプレートはプロセス内
+    キャッシュ経由で再利用する。
+    """
+
+    jobs = list(zip(golden_specs, assign_run_dirs(golden_specs, golden_root)))
+    worker_count = max(1, min(workers, len(jobs)))
+
+    if worker_count == 1:
+        outcomes = [run_golden_spec(spec_path, run_dir, inputs) for spec_path, run_dir in jobs]
+    else:
+        logger.info("ゴールデンサンプルを %d プロセスで実行します (%d 件)", worker_count, len(jobs))
+        with ProcessPoolExecutor(
+            max_workers=worker_count,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(inputs,),
+        ) as executor:
+            outcomes = list(executor.map(_run_in_worker, jobs))
+
+    results: list[TemplateReleaseGoldenRun] = []
+    warnings: list[str] = []
+    errors: list[str] = []
+    for outcome in outcomes:
+        results.append(outcome.result)
+        warnings.extend(outcome.warnings)
+        errors.extend(outcome.errors)
+    return results, warnings, errors
+
+
+def assign_run_dirs(golden_specs: list[Path], golden_root: Path) -> list[Path]:
+    """spec ごとに重複しない出力ディレクトリを割り当てる。
+
+    ファイル名 (stem) が一意な場合は従来どおり ``golden_root/<stem>`` を使い、
+    重複する場合のみ連番を付与する。
+    """
+
+    stem_counts = Counter(spec_path.stem for spec_path in golden_specs)
+    seen: Counter[str] = Counter()
+    run_dirs: list[Path] = []
+    for spec_path in golden_specs:
+        stem = spec_path.stem
+        seen[stem] += 1
+        if stem_counts[stem] > 1:
+            run_dirs.append(golden_root / f"{stem}-{seen[stem]:02d}")
+        else:
+            run_dirs.append(golden_root / stem)
+    return run_dirs
+
+
+def run_golden_spec(spec_path: Path, run_dir: Path, inputs: GoldenRunInputs) -> GoldenRunOutcome:
+    """ゴールデンサンプル 1 件を validator → refiner → renderer → analyzer で検証する。"""
+
+    rules_config = inputs.rules_config
+    branding_config = inputs.branding_config
+    outcome = GoldenRunOutcome(
+        result=TemplateReleaseGoldenRun(
+            spec_path=str(spec_path),
+            status="passed",
+            output_dir=str(run_dir),
+        )
+    )
+    result = outcome.result
+
+    try:
+        spec = load_jobspec_from_path(spec_path)
+    except SpecValidationError as exc:
+        detail = json.dumps(exc.errors, ensure_ascii=False)
+        message = f"golden spec {spec_path} のスキーマ検証に失敗しました"
+        result.status = "failed"
+        result.errors.extend([message, detail])
+        outcome.errors.append(message)
+        return outcome
+    except Exception as exc:  # noqa: BLE001
+        message = f"golden spec {spec_path} の読み込みに失敗しました: {exc}"
+        result.status = "failed"
+        result.errors.append(message)
+        outcome.errors.append(message)
+        return outcome
+
+    run_dir.mkdir(parents=True, exist_ok=True)
+    context = PipelineContext(spec=spec, workdir=run_dir)
+
+    renderer = SimpleRendererStep(
+        RenderingOptions(
+            template_path=inputs.template_path,
+            output_filename=f"{spec_path.stem}.pptx",
+            branding=branding_config,
+        )
+    )
+    refiner = SimpleRefinerStep(
+        RefinerOptions(
+            max_bullet_level=rules_config.max_bullet_level,
+        )
+    )
+    analyzer = SimpleAnalyzerStep(
+        AnalyzerOptions(
+            min_font_size=branding_config.body_font.size_pt,
+            default_font_size=branding_config.body_font.size_pt,
+            default_font_color=branding_config.body_font.color_hex,
+            preferred_text_color=branding_config.primary_color,
+            background_color=branding_config.background_color,
+            max_bullet_level=rules_config.max_bullet_level,
+            large_text_threshold_pt=branding_config.body_font.size_pt,
+        )
+    )
+
+    steps = [
+        SpecValidatorStep(
+            max_title_length=rules_config.max_title_length,
+            max_bullet_length=rules_config.max_bullet_length,
+            max_bullet_level=rules_config.max_bullet_level,
+            forbidden_words=rules_config.forbidden_words,
+        ),
+        refiner,
+        renderer,
+        analyzer,
+    ]
+    runner = PipelineRunner(steps)
+
+    try:
+        runner.execute(context)
+    except SpecValidationError as exc:
+        detail = json.dumps(exc.errors, ensure_ascii=False)
+        message = f"golden spec {spec_path} の業務ルール検証に失敗しました"
+        result.status = "failed"
+        result.errors.extend([message, detail])
+        outcome.errors.append(message)
+    except Exception as exc:  # noqa: BLE001
+        logger.exception("ゴールデンサンプル実行中にエラーが発生しました: %s", spec_path)
+        message = f"golden spec {spec_path} の実行に失敗しました: {exc}"
+        result.status = "failed"
+        result.errors.append(message)
+        outcome.errors.append(message)
+    else:
+        pptx_path = context.artifacts.get("pptx_path")
+        if pptx_path is not None:
+            result.pptx_path = str(pptx_path)
+        analysis_path = context.artifacts.get("analysis_path")
+        if analysis_path is not None:
+            result.analysis_path = str(analysis_path)
+        pdf_path = context.artifacts.get("pdf_path")
+        if pdf_path is not None:
+            result.pdf_path = str(pdf_path)
+
+        analyzer_warnings = context.artifacts.get("analyzer_warnings")
+        if isinstance(analyzer_warnings, list):
+            new_warnings = [str(item) for item in analyzer_warnings]
+            result.warnings.extend(new_warnings)
+            for warning in new_warnings:
+                outcome.warnings.append(f"golden spec {spec_path}: {warning}")
+
+    return outcome
+
+
+def _init_worker(inputs: GoldenRunInputs) -> None:
+    global _WORKER_INPUTS
+    _WORKER_INPUTS = inputs
+    # テンプレート PPTX のバイト列をワーカー内で使い回す
+    shared_file_cache.enable()
+
+
+def _run_in_worker(job: tuple[Path, Path]) -> GoldenRunOutcome:
+    if _WORKER_INPUTS is None:  # pragma: no cover - initializer 未実行時のみ
+        msg = "golden run worker is not initialized"
+        raise RuntimeError(msg)
+    spec_path, run_dir = job
+    return run_golden_spec(spec_path, run_dir, _WORKER_INPUTS)
@@ -7,7 +7,7 @@ import json
 from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 import logging
 
 from ..models import (
@@ -33,6 +33,9 @@ from ..models import (
 )
 from .environment import collect_environment_info
 
+if TYPE_CHECKING:
+    from ..template_package import TemplatePackage
+
 
 logger = logging.getLogger(__name__)
 
@@ -49,10 +52,14 @@ def build_template_release(
     golden_runs: list[TemplateReleaseGoldenRun] | None = None,
     extra_warnings: Iterable[str] | None = None,
     extra_errors: Iterable[str] | None = None,
+    package: TemplatePackage | None = None,
 ) -> TemplateRelease:
     """TemplateSpec からテンプレリリースメタを生成する。"""
 
-    template_hash = _compute_sha256(template_path)
+    if package is not None:
+        template_hash = f"sha256:{package.sha256}"
+    else:
+        template_hash = _compute_sha256(template_path)
 
     details: list[TemplateReleaseLayoutDetail] = []
     warnings: list[str] = []
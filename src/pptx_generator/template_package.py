@@ -0,0 +1,169 @@
+"""テンプレート PPTX を一度だけ読み込み、抽出・検証・リリース工程で共有する。"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import mmap
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO
+from xml.etree import ElementTree as ET
+from zipfile import BadZipFile, ZipFile
+
+if TYPE_CHECKING:
+    from pptx.presentation import Presentation as PresentationType
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class TemplatePackageError(RuntimeError):
+    """テンプレートパッケージを開けない場合の例外。"""
+
+
+class TemplatePackage:
+    """メモリマップしたテンプレートと、遅延パース済みパーツを保持する。
+
+    - ``sha256`` はオープン時にマップ済みバッファを 1 回走査して算出する
+    - ``xml(part)`` は ZIP パーツを初回アクセス時のみ展開・パースする
+    - ``presentation`` は python-pptx のパース結果を共有する（読み取り専用で利用すること）
+    """
+
+    def __init__(self, path: Path, handle: BinaryIO, buffer: mmap.mmap) -> None:
+        self.path = path
+        self._handle = handle
+        self._buffer = buffer
+        self._sha256 = _digest(buffer)
+        self._zip: ZipFile | None = None
+        self._xml_parts: dict[str, ET.Element] = {}
+        self._presentation: PresentationType | None = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def open(cls, path: Path) -> TemplatePackage:
+        """テンプレートをメモリマップで開く。"""
+
+        if not path.exists():
+            msg = f"テンプレートファイルが見つかりません: {path}"
+            raise FileNotFoundError(msg)
+        handle = path.open("rb")
+        try:
+            buffer = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:  # 空ファイルは mmap できない
+            handle.close()
+            msg = f"テンプレートファイルが空です: {path}"
+            raise TemplatePackageError(msg) from exc
+        return cls(path, handle, buffer)
+
+    def __enter__(self) -> TemplatePackage:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+            self._presentation = None
+            if not self._buffer.closed:
+                self._buffer.close()
+            self._handle.close()
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256
+
+    @property
+    def size(self) -> int:
+        return len(self._buffer)
+
+    def reader(self) -> BinaryIO:
+        """独立した読み取り位置を持つファイルライクオブジェクトを返す。"""
+
+        return io.BufferedReader(_MappedReader(self._buffer))
+
+    def xml(self, part_name: str) -> ET.Element:
+        """ZIP パーツを XML として返す。存在しない場合は KeyError。"""
+
+        with self._lock:
+            cached = self._xml_parts.get(part_name)
+            if cached is not None:
+                return cached
+            archive = self._archive()
+            with archive.open(part_name) as stream:
+                root = ET.parse(stream).getroot()
+            self._xml_parts[part_name] = root
+            return root
+
+    @property
+    def presentation(self) -> PresentationType:
+        """python-pptx の Presentation を初回アクセス時に生成して返す。"""
+
+        with self._lock:
+            if self._presentation is None:
+                from pptx import Presentation
+
+                self._presentation = Presentation(self.reader())
+            return self._presentation
+
+    def _archive(self) -> ZipFile:
+        if self._zip is None:
+            try:
+                self._zip = ZipFile(self.reader())
+            except BadZipFile as exc:
+                msg = f"テンプレートが PPTX (ZIP) 形式ではありません: {self.path}"
+                raise TemplatePackageError(msg) from exc
+        return self._zip
+
+
+class _MappedReader(io.RawIOBase):
+    """mmap を seek 可能なファイルとして扱うための薄いラッパー。"""
+
+    def __init__(self, buffer: mmap.mmap) -> None:
+        self._buffer = buffer
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, target: bytearray | memoryview) -> int:  # type: ignore[override]
+        end = min(self._position + len(target), len(self._buffer))
+        size = max(0, end - self._position)
+        target[:size] = self._buffer[self._position:end]
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._buffer) + offset
+        else:
+            msg = f"unsupported whence: {whence}"
+            raise ValueError(msg)
+        if position < 0:
+            msg = "negative seek position"
+            raise ValueError(msg)
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+
+def _digest(buffer: mmap.mmap) -> str:
+    digest = hashlib.sha256()
+    view = memoryview(buffer)
+    try:
+        for offset in range(0, len(view), _HASH_CHUNK_SIZE):
+            digest.update(view[offset:offset + _HASH_CHUNK_SIZE])
+    finally:
+        view.release()
+    return digest.hexdigest()
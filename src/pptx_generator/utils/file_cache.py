@@ -0,0 +1,129 @@
+"""ファイル更新時刻で無効化されるインメモリキャッシュ。"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    """キャッシュ済みの値と取得時のファイル状態。"""
+
+    stamp: tuple[int, int] | None
+    value: Any
+
+
+class FileCache:
+    """設定ファイルやテンプレートの読み込み結果を保持する。
+
+    常駐プロセス (`pptx serve`) で設定の再読込を避けるためのキャッシュで、
+    無効化判定はファイルの mtime とサイズで行う。既定では無効化されており、
+    `enable()` されるまでは毎回ローダーを呼び出す。
+    """
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        self._enabled = enabled
+        self._entries: dict[tuple[Hashable, ...], _CacheEntry] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def enable(self) -> None:
+        self._enabled = True
+
+    def disable(self) -> None:
+        self._enabled = False
+        self.clear()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get(
+        self,
+        kind: str,
+        path: Path,
+        loader: Callable[[Path], T],
+        *,
+        variant: Hashable = None,
+    ) -> T:
+        """`path` の読み込み結果を返す。ファイルが更新されていれば再読込する。"""
+
+        if not self._enabled:
+            return loader(path)
+
+        resolved = Path(path).expanduser().resolve()
+        stamp = _file_stamp(resolved)
+        if stamp is None:
+            # 存在しないファイルはキャッシュせず、ローダー側のエラーに委ねる
+            return loader(path)
+
+        key = (kind, str(resolved), variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.stamp == stamp:
+                self._hits += 1
+                return entry.value
+            if entry is not None:
+                self._invalidations += 1
+            self._misses += 1
+
+        value = loader(path)
+        with self._lock:
+            self._entries[key] = _CacheEntry(stamp=stamp, value=value)
+        logger.debug("file cache loaded: kind=%s path=%s", kind, resolved)
+        return value
+
+    def get_object(self, kind: str, key: Hashable, factory: Callable[[], T]) -> T:
+        """ファイルに紐付かないオブジェクト (AI クライアント等) を返す。"""
+
+        if not self._enabled:
+            return factory()
+
+        cache_key = (kind, key)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._hits += 1
+                return entry.value
+            self._misses += 1
+
+        value = factory()
+        with self._lock:
+            self._entries[cache_key] = _CacheEntry(stamp=None, value=value)
+        return value
+
+    def stats(self) -> dict[str, int | bool]:
+        with self._lock:
+            return {
+                "enabled": self._enabled,
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+            }
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+# プロセス全体で共有するキャッシュ。`pptx serve` 起動時に有効化される。
+shared_file_cache = FileCache()
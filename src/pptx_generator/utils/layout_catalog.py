@@ -0,0 +1,126 @@
+"""layouts.jsonl から構築するレイアウト検索用インデックス。"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from typing import Generic, Iterable, Iterator, Protocol, TypeVar
+
+
+class LayoutProfileLike(Protocol):
+    """インデックス化に必要なレイアウト情報。"""
+
+    layout_id: str
+    usage_tags: tuple[str, ...]
+
+    def allows_table(self) -> bool: ...
+
+    def max_lines(self) -> int | None: ...
+
+
+P = TypeVar("P", bound=LayoutProfileLike)
+
+CapacityKey = tuple[int | None, bool, int]
+
+
+@dataclass(slots=True, frozen=True)
+class LayoutFeatures:
+    """スコアリングで参照するレイアウト特徴量（事前計算済み）。"""
+
+    position: int
+    layout_id: str
+    usage_tags: frozenset[str]
+    max_lines: int | None
+    allows_table: bool
+
+    @property
+    def capacity_key(self) -> CapacityKey:
+        """タグ以外でスコアが決まる要素。同じキーのレイアウトはタグ不一致時に同点になる。"""
+
+        return self.max_lines, self.allows_table, len(self.usage_tags)
+
+
+class LayoutCatalogIndex(Generic[P]):
+    """レイアウト一覧と usage tag の転置インデックス。
+
+    ``max_lines`` / テーブル可否 / タグ集合を構築時に 1 度だけ算出し、
+    タグを共有しないレイアウトは ``capacity_key`` ごとにまとめて保持する。
+    レイアウト ID とタグはインデックス側の構造にだけ intern し、渡されたプロファイルは変更しない。
+    """
+
+    def __init__(self, profiles: Iterable[P]) -> None:
+        self._profiles: dict[str, P] = {}
+        for profile in profiles:
+            self._profiles[sys.intern(profile.layout_id)] = profile
+
+        self.profiles: tuple[P, ...] = tuple(self._profiles.values())
+        self.layout_ids: tuple[str, ...] = tuple(self._profiles)
+        self.features: tuple[LayoutFeatures, ...] = tuple(
+            LayoutFeatures(
+                position=position,
+                layout_id=layout_id,
+                usage_tags=frozenset(sys.intern(tag) for tag in profile.usage_tags),
+                max_lines=profile.max_lines(),
+                allows_table=profile.allows_table(),
+            )
+            for position, (layout_id, profile) in enumerate(self._profiles.items())
+        )
+        self._positions = {feature.layout_id: feature.position for feature in self.features}
+
+        by_tag: dict[str, list[int]] = {}
+        capacity_groups: dict[CapacityKey, list[int]] = {}
+        for feature in self.features:
+            for tag in feature.usage_tags:
+                by_tag.setdefault(tag, []).append(feature.position)
+            capacity_groups.setdefault(feature.capacity_key, []).append(feature.position)
+        self.by_tag: dict[str, tuple[int, ...]] = {tag: tuple(items) for tag, items in by_tag.items()}
+        self.capacity_groups: dict[CapacityKey, tuple[int, ...]] = {
+            key: tuple(items) for key, items in capacity_groups.items()
+        }
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def __iter__(self) -> Iterator[P]:
+        return iter(self.profiles)
+
+    def __bool__(self) -> bool:
+        return bool(self.profiles)
+
+    def get(self, layout_id: str | None) -> P | None:
+        if layout_id is None:
+            return None
+        return self._profiles.get(layout_id)
+
+    def position(self, layout_id: str) -> int | None:
+        return self._positions.get(layout_id)
+
+    def matching(self, tags: Iterable[str | None]) -> set[int]:
+        """いずれかのタグを持つレイアウトの位置を返す。"""
+
+        positions: set[int] = set()
+        for tag in tags:
+            if tag:
+                positions.update(self.by_tag.get(tag, ()))
+        return positions
+
+    def representatives(self, exclude: set[int], limit: int) -> list[int]:
+        """``exclude`` 以外のレイアウトを ``capacity_key`` ごとに先頭 ``limit`` 件ずつ返す。
+
+        同じキーのレイアウトは同点になるため、上位 ``limit`` 件の選定にはこれで足りる。
+        """
+
+        selected: list[int] = []
+        for positions in self.capacity_groups.values():
+            taken = 0
+            for position in positions:
+                if taken >= limit:
+                    break
+                if position in exclude:
+                    continue
+                selected.append(position)
+                taken += 1
+        return selected
+
+
+__all__ = ["LayoutCatalogIndex", "LayoutFeatures", "LayoutProfileLike"]
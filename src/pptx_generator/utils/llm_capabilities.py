@@ -0,0 +1,231 @@
+"""LLM プロバイダー × モデルごとのパラメータ互換性を記憶するレジストリ。"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPABILITY_TTL_SECONDS = 6 * 60 * 60
+
+
+@dataclass(slots=True)
+class CapabilityEntry:
+    """直近に成功したパラメータ構成とフォールバックモデル。"""
+
+    variant: dict[str, Any] = field(default_factory=dict)
+    fallback_model: str | None = None
+    recorded_at: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "variant": self.variant,
+            "fallback_model": self.fallback_model,
+            "recorded_at": self.recorded_at,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: dict[str, Any]) -> CapabilityEntry:
+        variant = payload.get("variant")
+        fallback_model = payload.get("fallback_model")
+        return cls(
+            variant=dict(variant) if isinstance(variant, dict) else {},
+            fallback_model=str(fallback_model) if fallback_model else None,
+            recorded_at=float(payload.get("recorded_at", 0.0)),
+        )
+
+
+class ProviderCapabilityRegistry:
+    """パラメータ互換性の学習結果をプロセス全体（任意でディスク）で共有する。
+
+    クライアントは呼び出し前に ``lookup`` で既知の構成を適用し、成功時に ``record`` する。
+    エントリは ``ttl_seconds`` 経過で失効し、次回は既定の構成から再判定する。
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_CAPABILITY_TTL_SECONDS,
+        path: Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._path = path
+        self._clock = clock
+        self._entries: dict[str, CapabilityEntry] = {}
+        self._loaded = path is None
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._avoided_retries = 0
+
+    @classmethod
+    def from_env(cls) -> ProviderCapabilityRegistry:
+        """環境変数 PPTX_LLM_CAPABILITY_TTL / PPTX_LLM_CAPABILITY_CACHE から生成する。"""
+
+        ttl_value = os.getenv("PPTX_LLM_CAPABILITY_TTL")
+        try:
+            ttl_seconds = float(ttl_value) if ttl_value else DEFAULT_CAPABILITY_TTL_SECONDS
+        except ValueError:
+            logger.warning("PPTX_LLM_CAPABILITY_TTL が数値ではないため既定値を使用します: %s", ttl_value)
+            ttl_seconds = DEFAULT_CAPABILITY_TTL_SECONDS
+        path_value = os.getenv("PPTX_LLM_CAPABILITY_CACHE")
+        return cls(ttl_seconds=ttl_seconds, path=Path(path_value) if path_value else None)
+
+    # ------------------------------------------------------------------ #
+    # 公開 API
+    # ------------------------------------------------------------------ #
+    def lookup(self, provider: str, model: str) -> CapabilityEntry | None:
+        """有効期限内のエントリを返す。失効していれば削除して None。"""
+
+        key = _key(provider, model)
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            if self._clock() - entry.recorded_at > self._ttl_seconds:
+                del self._entries[key]
+                self._expired += 1
+                self._misses += 1
+                return None
+            self._hits += 1
+            return entry
+
+    def record(
+        self,
+        provider: str,
+        model: str,
+        *,
+        variant: dict[str, Any] | None = None,
+        fallback_model: str | None = None,
+    ) -> None:
+        """成功した構成を記録する。内容が変わらない場合は有効期限を延ばさない。"""
+
+        key = _key(provider, model)
+        normalized = dict(variant or {})
+        with self._lock:
+            self._ensure_loaded()
+            current = self._entries.get(key)
+            if (
+                current is not None
+                and current.variant == normalized
+                and current.fallback_model == fallback_model
+                and self._clock() - current.recorded_at <= self._ttl_seconds
+            ):
+                return
+            self._entries[key] = CapabilityEntry(
+                variant=normalized,
+                fallback_model=fallback_model,
+                recorded_at=self._clock(),
+            )
+            self._persist()
+
+    def invalidate(self, provider: str, model: str) -> None:
+        with self._lock:
+            self._ensure_loaded()
+            if self._entries.pop(_key(provider, model), None) is not None:
+                self._persist()
+
+    def note_avoided(self, count: int = 1) -> None:
+        """既知の構成を適用したことで省略できたリトライ回数を加算する。"""
+
+        if count <= 0:
+            return
+        with self._lock:
+            self._avoided_retries += count
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            self._persist()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "expired": self._expired,
+                "avoided_retries": self._avoided_retries,
+            }
+
+    # ------------------------------------------------------------------ #
+    # 内部ユーティリティ
+    # ------------------------------------------------------------------ #
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        if self._path is None:
+            msg = "保存先のない LLM 互換性キャッシュは読み込めません"
+            raise RuntimeError(msg)
+        try:
+            payload = json.loads(self._path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("LLM 互換性キャッシュを読み込めないため破棄します: %s (%s)", self._path, exc)
+            return
+        if not isinstance(payload, dict):
+            return
+        for key, value in payload.items():
+            if isinstance(value, dict):
+                self._entries[str(key)] = CapabilityEntry.from_dict(value)
+
+    def _persist(self) -> None:
+        if self._path is None:
+            return
+        payload = {key: entry.to_dict() for key, entry in self._entries.items()}
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self._path.parent,
+                prefix=f".{self._path.stem}-",
+                suffix=".tmp",
+                delete=False,
+            ) as handle:
+                handle.write(json.dumps(payload, ensure_ascii=False, sort_keys=True))
+                temp_path = Path(handle.name)
+            os.replace(temp_path, self._path)
+        except OSError as exc:
+            logger.warning("LLM 互換性キャッシュの保存に失敗しました: %s (%s)", self._path, exc)
+
+
+def _key(provider: str, model: str) -> str:
+    return f"{provider.strip().lower()}::{model.strip()}"
+
+
+_shared_registry: ProviderCapabilityRegistry | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_capability_registry() -> ProviderCapabilityRegistry:
+    """プロセス共通のレジストリを返す。初回呼び出し時に環境変数から生成する。"""
+
+    global _shared_registry
+    with _shared_lock:
+        if _shared_registry is None:
+            _shared_registry = ProviderCapabilityRegistry.from_env()
+        return _shared_registry
+
+
+def reset_shared_capability_registry(registry: ProviderCapabilityRegistry | None = None) -> None:
+    """共有レジストリを差し替える（テスト・設定変更用）。"""
+
+    global _shared_registry
+    with _shared_lock:
+        _shared_registry = registry
@@ -0,0 +1,235 @@
+"""LLM プロバイダー SDK クライアントをプロセス内で共有するプール。"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+
+@dataclass(slots=True, frozen=True)
+class HttpPoolSettings:
+    """SDK に渡す HTTP 接続プールの設定。"""
+
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS
+    http2: bool = False
+
+    @classmethod
+    def from_env(cls) -> HttpPoolSettings:
+        """PPTX_LLM_HTTP_* 環境変数から設定を生成する。
+
+        HTTP/2 は ``PPTX_LLM_HTTP2`` が auto（既定）の場合、h2 パッケージが利用可能なときのみ有効化する。
+        """
+
+        http2_flag = os.getenv("PPTX_LLM_HTTP2", "auto").strip().lower()
+        h2_available = importlib.util.find_spec("h2") is not None
+        if http2_flag in {"1", "true", "on", "yes"}:
+            if not h2_available:
+                logger.warning("PPTX_LLM_HTTP2 が指定されましたが h2 パッケージがないため HTTP/1.1 を使用します")
+            http2 = h2_available
+        elif http2_flag in {"0", "false", "off", "no"}:
+            http2 = False
+        else:
+            http2 = h2_available
+        return cls(
+            max_connections=_int_env("PPTX_LLM_HTTP_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS),
+            max_keepalive_connections=_int_env(
+                "PPTX_LLM_HTTP_KEEPALIVE_CONNECTIONS", DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=_float_env("PPTX_LLM_HTTP_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY_SECONDS),
+            http2=http2,
+        )
+
+    def httpx_kwargs(self) -> dict[str, Any]:
+        import httpx
+
+        return {
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            "http2": self.http2,
+        }
+
+
+class SdkClientPool:
+    """(provider, endpoint, 認証情報) ごとに SDK クライアントを 1 つだけ生成する。
+
+    認証情報はハッシュ化したフィンガープリントのみをキーに含める。
+    """
+
+    def __init__(self, settings: HttpPoolSettings | None = None) -> None:
+        self._settings = settings
+        self._clients: dict[tuple[Hashable, ...], Any] = {}
+        self._lock = threading.Lock()
+        self._created = 0
+        self._reused = 0
+
+    @property
+    def settings(self) -> HttpPoolSettings:
+        if self._settings is None:
+            self._settings = HttpPoolSettings.from_env()
+        return self._settings
+
+    def get(self, key: tuple[Hashable, ...], factory: Callable[[], Any]) -> Any:
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._reused += 1
+                return client
+            client = factory()
+            self._clients[key] = client
+            self._created += 1
+            return client
+
+    # ------------------------------------------------------------------ #
+    # プロバイダー別ファクトリ
+    # ------------------------------------------------------------------ #
+    def openai(self, *, api_key: str, base_url: str | None = None) -> Any:
+        """OpenAI クライアントを返す。"""
+
+        import openai
+
+        def factory() -> Any:
+            http_client = openai.DefaultHttpxClient(**self.settings.httpx_kwargs())
+            return openai.OpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
+
+        key = ("openai", base_url or "", _fingerprint(api_key))
+        return self.get(key, factory)
+
+    def azure_openai(
+        self,
+        *,
+        api_key: str,
+        endpoint: str,
+        api_version: str,
+    ) -> Any:
+        """AzureOpenAI クライアントを返す。"""
+
+        import openai
+
+        def factory() -> Any:
+            http_client = openai.DefaultHttpxClient(**self.settings.httpx_kwargs())
+            return openai.AzureOpenAI(
+                api_key=api_key,
+                api_version=api_version,
+                azure_endpoint=endpoint,
+                http_client=http_client,
+            )
+
+        key = ("azure-openai", endpoint, api_version, _fingerprint(api_key))
+        return self.get(key, factory)
+
+    def anthropic(self, *, api_key: str) -> Any:
+        """Anthropic クライアントを返す。"""
+
+        import anthropic
+
+        def factory() -> Any:
+            http_client = anthropic.DefaultHttpxClient(**self.settings.httpx_kwargs())
+            return anthropic.Anthropic(api_key=api_key, http_client=http_client)
+
+        key = ("anthropic", _fingerprint(api_key))
+        return self.get(key, factory)
+
+    def bedrock_runtime(self, *, profile: str | None, region: str | None) -> Any | None:
+        """bedrock-runtime クライアントを返す。認証情報が見つからない場合は None。
+
+        botocore の接続プールは ``max_connections`` に合わせ、TCP keep-alive を有効にする。
+        """
+
+        import boto3
+        from botocore.config import Config
+
+        key = ("bedrock-runtime", profile or "", region or "")
+        with self._lock:
+            cached = self._clients.get(key)
+            if cached is not None:
+                self._reused += 1
+                return cached
+
+        session_kwargs: dict[str, object] = {}
+        if profile:
+            session_kwargs["profile_name"] = profile
+        if region:
+            session_kwargs["region_name"] = region
+        session = boto3.Session(**session_kwargs)
+        if session.get_credentials() is None:
+            return None
+
+        client_kwargs: dict[str, object] = {
+            "config": Config(
+                max_pool_connections=self.settings.max_connections,
+                tcp_keepalive=True,
+            )
+        }
+        if region:
+            client_kwargs["region_name"] = region
+        return self.get(key, lambda: session.client("bedrock-runtime", **client_kwargs))
+
+    # ------------------------------------------------------------------ #
+    # 管理
+    # ------------------------------------------------------------------ #
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "created": self._created,
+                "reused": self._reused,
+            }
+
+    def close(self) -> None:
+        """クライアントの接続を閉じてプールを空にする。"""
+
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            close = getattr(client, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception:  # noqa: BLE001
+                    logger.debug("SDK クライアントのクローズに失敗しました", exc_info=True)
+
+
+def _fingerprint(secret: str) -> str:
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()[:16]
+
+
+def _int_env(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning("%s が整数ではないため既定値 %s を使用します: %s", name, default, value)
+        return default
+
+
+def _float_env(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("%s が数値ではないため既定値 %s を使用します: %s", name, default, value)
+        return default
+
+
+shared_sdk_clients = SdkClientPool()
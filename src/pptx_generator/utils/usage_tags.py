@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+from functools import lru_cache
 from typing import Iterable, Tuple
 
 CANONICAL_USAGE_TAGS: frozenset[str] = frozenset(
@@ -51,6 +52,7 @@ def _deduplicate_preserve_order(tags: Iterable[str]) -> Tuple[str, ...]:
     return tuple(ordered.keys())
 
 
+@lru_cache(maxsize=4096)
 def normalize_usage_tag_value(tag: str | None) -> str | None:
     canonical, _ = _normalise_single_tag(tag)
     return canonical
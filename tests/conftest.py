@@ -1,3 +1,7 @@
 import os
 
 os.environ.setdefault("PPTX_LLM_PROVIDER", "mock")
+# テストごとに抽出結果を再計算させるため、ディスク上の抽出キャッシュは無効化する
+os.environ.setdefault("PPTX_EXTRACTION_CACHE", "0")
+# 取り込み時の変換キャッシュも同様に無効化する
+os.environ.setdefault("PPTX_IMPORT_CACHE", "0")
@@ -5,7 +5,8 @@ import os
 import pytest
 
 from pptx_generator.content_ai import (LLMClientConfigurationError,
-                                       MockLLMClient, create_llm_client)
+                                       MockLLMClient, create_llm_client,
+                                       llm_client_config_key)
 
 
 def test_create_llm_client_default_returns_mock(monkeypatch: pytest.MonkeyPatch) -> None:
@@ -18,3 +19,84 @@ def test_create_llm_client_unknown_provider(monkeypatch: pytest.MonkeyPatch) ->
     monkeypatch.setenv("PPTX_LLM_PROVIDER", "unknown-provider")
     with pytest.raises(LLMClientConfigurationError):
         create_llm_client()
+
+
+def test_llm_client_config_key_tracks_full_client_configuration(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PPTX_LLM_PROVIDER", "openai")
+    monkeypatch.setenv("OPENAI_MODEL", "model-a")
+    base = llm_client_config_key()
+
+    monkeypatch.setenv("UNRELATED_SETTING", "x")
+    assert llm_client_config_key() == base
+
+    monkeypatch.setenv("OPENAI_MODEL", "model-b")
+    assert llm_client_config_key() != base
+
+    monkeypatch.setenv("OPENAI_MODEL", "model-a")
+    monkeypatch.setenv("OPENAI_API_KEY", "secret")
+    key = llm_client_config_key()
+    assert key != base
+    assert "secret" not in key
+
+
+
+def test_generate_batch_splits_requests_by_output_token_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    from pptx_generator.content_ai import client as client_module
+
+    calls: list[tuple[list[int], int]] = []
+
+    def call(chunk: list[int], max_tokens: int) -> list[int]:
+        calls.append((chunk, max_tokens))
+        return [item * 10 for item in chunk]
+
+    monkeypatch.setenv("PPTX_LLM_BATCH_MAX_TOKENS", "2500")
+    results = client_module._run_in_token_budget([1, 2, 3, 4, 5], 1000, call)
+
+    # 1 件 1000 トークンで上限 2500 のため 2 件ずつに分け、上限を超えて要求しない
+    assert calls == [([1, 2], 2000), ([3, 4], 2000), ([5], 1000)]
+    assert results == [10, 20, 30, 40, 50]
+
+    monkeypatch.setenv("PPTX_LLM_BATCH_MAX_TOKENS", "500")
+    calls.clear()
+    client_module._run_in_token_budget([1, 2], 1000, call)
+    assert calls == [([1], 1000), ([2], 1000)]
+
+
+def test_match_slide_batch_splits_requests_by_output_token_budget(monkeypatch: pytest.MonkeyPatch) -> None:
+    import json
+    from types import SimpleNamespace
+
+    from pptx_generator.content_ai.client import (AnthropicClaudeClient,
+                                                  SlideMatchCandidate,
+                                                  SlideMatchRequest)
+
+    calls: list[dict[str, object]] = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        prompt = kwargs["messages"][0]["content"][0]["text"]
+        card_ids = [line.split(": ", 1)[1] for line in prompt.splitlines() if line.startswith("## card_id: ")]
+        matches = [{"card_id": card_id, "recommended_slide_id": "s1", "confidence": 0.9, "reason": "r"} for card_id in card_ids]
+        return SimpleNamespace(content=[SimpleNamespace(type="text", text=json.dumps({"matches": matches}))])
+
+    monkeypatch.setenv("PPTX_LLM_BATCH_MAX_TOKENS", "2500")
+    client = AnthropicClaudeClient(SimpleNamespace(messages=SimpleNamespace(create=create)), model="claude-test", max_tokens=1000)
+    requests = [
+        SlideMatchRequest(
+            card_id=f"card-{index}",
+            card_chapter=None,
+            card_intent=(),
+            card_story_phase=None,
+            card_summary="summary",
+            prompt="prompt",
+            system_prompt="system",
+            candidates=[SlideMatchCandidate(slide_id="s1")],
+        )
+        for index in range(5)
+    ]
+
+    responses = client.match_slide_batch(requests)
+
+    # 1 件 1000 トークンで上限 2500 のため 2 件ずつに分け、上限を超えて要求しない
+    assert [call["max_tokens"] for call in calls] == [2000, 2000, 1000]
+    assert [response.slide_id if response else None for response in responses] == ["s1"] * 5
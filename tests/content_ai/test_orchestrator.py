@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-
+import json
 import logging
+from pathlib import Path
 
 import pytest
 
-from pptx_generator.content_ai import ContentAIOrchestrator, load_policy_set
+from pptx_generator.content_ai import (AIGenerationRequest,
+                                       AIGenerationResponse,
+                                       ContentAIOrchestrator, MockLLMClient,
+                                       load_policy_set)
+from pptx_generator.content_ai.client import _split_batch_response
 from pptx_generator.models import JobSpec
 
 
@@ -40,3 +44,80 @@ def test_orchestrator_generates_document(caplog: pytest.LogCaptureFixture, monke
             assert len(line) <= 40
 
     assert meta["spec"]["title"] in logs[0]["prompt"]
+
+
+def test_orchestrator_batches_slides_and_matches_single_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("PPTX_LLM_PROVIDER", "mock")
+    spec = JobSpec.parse_file(Path("samples/json/sample_jobspec.json"))
+    policy_set = load_policy_set(Path("config/content_ai_policies.json"))
+
+    single_document, _, _ = ContentAIOrchestrator(policy_set).generate_document(spec, slide_limit=5)
+    batched_document, _, logs = ContentAIOrchestrator(policy_set, batch_size=2).generate_document(
+        spec, slide_limit=5
+    )
+
+    assert [slide.model_dump() for slide in batched_document.slides] == [
+        slide.model_dump() for slide in single_document.slides
+    ]
+    # 5 件を 2 件ずつ処理すると最後の 1 件は単発リクエストになる
+    assert [entry["batched"] for entry in logs] == [True, True, True, True, False]
+
+
+class _PartialBatchClient(MockLLMClient):
+    def __init__(self) -> None:
+        self.single_calls: list[str] = []
+        self.batch_calls = 0
+
+    def generate(self, request: AIGenerationRequest) -> AIGenerationResponse:
+        self.single_calls.append(request.slide.id)
+        return super().generate(request)
+
+    def generate_batch(self, requests: list[AIGenerationRequest]) -> list[AIGenerationResponse | None]:
+        self.batch_calls += 1
+        # 2 件目のスライドだけ応答から欠落させる
+        payload = {
+            "slides": [
+                {"slide_id": request.slide.id, "title": f"batched {request.slide.id}", "body": ["line"]}
+                for index, request in enumerate(requests)
+                if index != 1
+            ]
+        }
+        return _split_batch_response(json.dumps(payload), requests, model="fake")
+
+
+def test_orchestrator_falls_back_to_single_calls_for_unparsed_slides() -> None:
+    spec = JobSpec.parse_file(Path("samples/json/sample_jobspec.json"))
+    policy_set = load_policy_set(Path("config/content_ai_policies.json"))
+    client = _PartialBatchClient()
+
+    document, _, logs = ContentAIOrchestrator(policy_set, client, batch_size=3).generate_document(
+        spec, slide_limit=3
+    )
+
+    assert client.batch_calls == 1
+    assert client.single_calls == [spec.slides[1].id]
+    assert document.slides[0].elements.title == f"batched {spec.slides[0].id}"
+    assert document.slides[2].elements.title == f"batched {spec.slides[2].id}"
+    assert [entry["batched"] for entry in logs] == [True, False, True]
+
+
+class _FailingBatchClient(_PartialBatchClient):
+    def generate_batch(self, requests: list[AIGenerationRequest]) -> list[AIGenerationResponse | None]:
+        self.batch_calls += 1
+        raise RuntimeError("batch endpoint unavailable")
+
+
+def test_orchestrator_falls_back_to_single_calls_when_batch_raises() -> None:
+    spec = JobSpec.parse_file(Path("samples/json/sample_jobspec.json"))
+    policy_set = load_policy_set(Path("config/content_ai_policies.json"))
+    client = _FailingBatchClient()
+
+    document, _, logs = ContentAIOrchestrator(policy_set, client, batch_size=2).generate_document(
+        spec, slide_limit=3
+    )
+
+    # 2 件のバッチが失敗して単発に切り替わり、残り 1 件は最初から単発
+    assert client.batch_calls == 1
+    assert client.single_calls == [slide.id for slide in spec.slides[:3]]
+    assert [slide.id for slide in document.slides] == [slide.id for slide in spec.slides[:3]]
+    assert [entry["batched"] for entry in logs] == [False, False, False]
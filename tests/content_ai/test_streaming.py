@@ -0,0 +1,109 @@
+"""ストリーミング応答の逐次解析テスト。"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+from pptx_generator.content_ai import load_policy_set
+from pptx_generator.content_ai.client import (AIGenerationRequest,
+                                              AnthropicClaudeClient)
+from pptx_generator.content_ai.streaming import (IncrementalSlideParser,
+                                                 consume_stream)
+from pptx_generator.models import JobSpec
+
+
+def _chunks(text: str, size: int) -> list[str]:
+    return [text[index : index + size] for index in range(0, len(text), size)]
+
+
+def test_incremental_parser_emits_fields_as_they_complete() -> None:
+    parser = IncrementalSlideParser(max_body_lines=6)
+    events = []
+    payload = 'はい。{"title": "売上\\"概況\\"", "note": null, "body": ["一行目", "二行目"]}'
+    for chunk in _chunks(payload, 3):
+        events.extend(parser.feed(chunk))
+
+    assert [(event.kind, event.value) for event in events] == [
+        ("title", '売上"概況"'),
+        ("body", "一行目"),
+        ("body", "二行目"),
+    ]
+    assert parser.completed
+
+
+def test_consume_stream_stops_after_body_limit() -> None:
+    body = [f"行{index}" for index in range(20)]
+    text = json.dumps({"title": "T", "note": "N", "body": body}, ensure_ascii=False)
+    chunks = _chunks(text, 4)
+    consumed: list[str] = []
+
+    def tracked():
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    ticks = iter([1.0, 1.5, 2.0])
+    outcome = consume_stream(tracked(), max_body_lines=3, started_at=0.5, clock=lambda: next(ticks))
+
+    assert outcome.stopped_early
+    assert len(consumed) < len(chunks)
+    assert json.loads(outcome.text) == {"title": "T", "note": "N", "body": body[:4]}
+    assert outcome.first_token_ms == 500.0
+    assert outcome.latency_ms == 1000.0
+
+
+def test_anthropic_client_streams_and_reports_latency() -> None:
+    text = json.dumps(
+        {"title": "ストリーム", "note": None, "body": [f"項目{index}" for index in range(10)]},
+        ensure_ascii=False,
+    )
+    events = [
+        SimpleNamespace(type="content_block_delta", delta=SimpleNamespace(type="text_delta", text=chunk))
+        for chunk in _chunks(text, 5)
+    ]
+    calls: list[dict[str, object]] = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return iter(events)
+
+    client = AnthropicClaudeClient(
+        SimpleNamespace(messages=SimpleNamespace(create=create)),
+        model="claude-test",
+        max_tokens=256,
+        stream=True,
+    )
+    spec = JobSpec.parse_file(Path("samples/json/sample_jobspec.json"))
+    policy = load_policy_set(Path("config/content_ai_policies.json")).get_policy(None)
+    partial_events = []
+    request = AIGenerationRequest(
+        prompt="prompt",
+        policy=policy,
+        spec=spec,
+        slide=spec.slides[0],
+        intent="overview",
+        on_partial=partial_events.append,
+    )
+
+    response = client.generate(request)
+
+    assert calls[0]["stream"] is True
+    assert response.title == "ストリーム"
+    assert len(response.body) == 6
+    assert "stream_stopped_early" in response.warnings
+    assert response.first_token_ms is not None
+    assert response.latency_ms is not None
+    assert partial_events[0].kind == "title"
+
+
+def test_consume_stream_ignores_blank_body_items_for_limit() -> None:
+    body = ["行0", "", "  ", "行1", "行2", "行3", "行4"]
+    text = json.dumps({"title": "T", "note": "N", "body": body}, ensure_ascii=False)
+
+    outcome = consume_stream(iter(_chunks(text, 4)), max_body_lines=3, started_at=0.0, clock=lambda: 1.0)
+
+    # 空行を除いて 4 行目が届くまでは打ち切らない
+    assert outcome.stopped_early
+    assert json.loads(outcome.text)["body"] == body[:6]
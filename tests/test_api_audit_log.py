@@ -0,0 +1,137 @@
+"""監査ログストアとカーソルページングのテスト。"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from pptx_generator.api import create_app
+from pptx_generator.api.audit_log import AuditLogCursorError, AuditLogStore
+from pptx_generator.api.store import ContentStore, SlideNotFoundError
+
+_BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _entry(spec_id: str, slide_id: str, action: str, minutes: int) -> dict[str, str]:
+    return {
+        "spec_id": spec_id,
+        "slide_id": slide_id,
+        "action": action,
+        "timestamp": (_BASE + timedelta(minutes=minutes)).isoformat(),
+    }
+
+
+def _collect(store: AuditLogStore, limit: int, **kwargs) -> list[list[int]]:
+    pages = []
+    cursor = None
+    while True:
+        page = store.query(limit=limit, cursor=cursor, **kwargs)
+        pages.append([item["minute"] for item in page.items])
+        if page.next_cursor is None:
+            return pages
+        cursor = page.next_cursor
+
+
+def test_cursor_pages_merge_specs_in_time_order(tmp_path) -> None:
+    store = AuditLogStore(tmp_path / "audit")
+    for minute in range(0, 10, 2):
+        store.append("spec-a", {**_entry("spec-a", "s1", "update", minute), "minute": minute}, target_id="s1")
+    for minute in range(1, 10, 2):
+        action = "approve" if minute % 3 == 0 else "update"
+        store.append("spec-b", {**_entry("spec-b", "s2", action, minute), "minute": minute}, target_id="s2")
+
+    assert _collect(store, 3) == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+    assert _collect(store, 2, action="approve") == [[3, 9]]
+    assert _collect(store, 10, since=_BASE + timedelta(minutes=6)) == [[6, 7, 8, 9]]
+    assert [item["minute"] for item in store.query(["spec-b"], limit=2, offset=1).items] == [3, 5]
+    assert [item["minute"] for item in store.by_target("spec-a", "s1")] == [0, 2, 4, 6, 8]
+
+    with pytest.raises(AuditLogCursorError):
+        store.query(cursor="not-a-cursor")
+
+
+def test_content_store_migrates_legacy_logs(tmp_path) -> None:
+    base = tmp_path / "store"
+    base.mkdir()
+    legacy = {
+        "spec_id": "job-legacy",
+        "revision": 2,
+        "cards": {},
+        "logs": [_entry("job-legacy", "agenda", "update", 0), _entry("job-legacy", "agenda", "approve", 5)],
+    }
+    (base / "job-legacy.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    store = ContentStore(base_dir=base)
+
+    state = json.loads((base / "job-legacy.json").read_text(encoding="utf-8"))
+    assert "logs" not in state
+    items, next_cursor = store.list_logs(spec_id="job-legacy")
+    assert [item["action"] for item in items] == ["update", "approve"]
+    assert next_cursor is None
+    assert [item["action"] for item in store.list_card_history("job-legacy", "agenda")] == ["update", "approve"]
+
+    # 再生成しても二重に移行しない
+    items, _ = ContentStore(base_dir=base).list_logs(spec_id="job-legacy")
+    assert len(items) == 2
+
+
+def test_logs_api_returns_cursor_and_rejects_invalid(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("CONTENT_API_TOKEN", raising=False)
+    store = ContentStore(base_dir=tmp_path / "store")
+    client = TestClient(create_app(store))
+    response = client.post(
+        "/v1/content/cards",
+        json={"spec_id": "job-1", "cards": [{"slide_id": "cover", "title": "Cover", "body": [], "intent": "cover"}]},
+    )
+    etag = response.headers["ETag"]
+    for index in range(3):
+        response = client.patch(
+            "/v1/content/cards/cover",
+            params={"spec_id": "job-1"},
+            json={"title": f"Cover {index}", "body": []},
+            headers={"If-Match": etag},
+        )
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+    state = json.loads((tmp_path / "store" / "job-1.json").read_text(encoding="utf-8"))
+    assert "logs" not in state
+
+    first = client.get("/v1/content/logs", params={"spec_id": "job-1", "limit": 2}).json()
+    assert len(first["items"]) == 2
+    assert first["next_cursor"]
+    assert first["next_offset"] == "2"
+    second = client.get("/v1/content/logs", params={"spec_id": "job-1", "cursor": first["next_cursor"]}).json()
+    assert len(second["items"]) == 1
+    assert second["next_cursor"] is None
+
+    response = client.get("/v1/content/logs", params={"cursor": "broken"})
+    assert response.status_code == 400
+
+
+def test_content_store_migrates_legacy_files_added_after_first_scan(tmp_path) -> None:
+    base = tmp_path / "store"
+    ContentStore(base_dir=base)
+    legacy = {
+        "spec_id": "job-restored",
+        "revision": 1,
+        "cards": {},
+        "logs": [_entry("job-restored", "agenda", "update", 0)],
+    }
+    (base / "job-restored.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    # 既に走査済みのディレクトリへ後から置かれたファイルも、次回起動時に移行する
+    items, _ = ContentStore(base_dir=base).list_logs(spec_id="job-restored")
+    assert [item["action"] for item in items] == ["update"]
+    assert "logs" not in json.loads((base / "job-restored.json").read_text(encoding="utf-8"))
+
+    # 起動後に置かれたファイルは読み込み時に移行する
+    store = ContentStore(base_dir=base)
+    (base / "job-late.json").write_text(json.dumps({**legacy, "spec_id": "job-late"}), encoding="utf-8")
+    with pytest.raises(SlideNotFoundError):
+        store.get_card_etag("job-late", "agenda")
+    items, _ = store.list_logs(spec_id="job-late")
+    assert [item["action"] for item in items] == ["update"]
@@ -0,0 +1,173 @@
+"""変更フィード（SSE）のテスト。"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from pptx_generator.api import create_app
+from pptx_generator.api.audit_log import AuditLogStore, cursor_position
+from pptx_generator.api.change_feed import (ChangeEvent, ChangeFeed,
+                                            stream_changes)
+from pptx_generator.api.store import CardState, ContentStore
+from pptx_generator.models import ContentElements, ContentSlide
+
+
+def _parse_sse(text: str) -> list[dict[str, object]]:
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if fields:
+            events.append({"id": fields["id"], **json.loads(fields["data"])})
+    return events
+
+
+def _update(store: ContentStore, spec_id: str, title: str) -> None:
+    _, etag = store.get_card(spec_id, "cover")
+    store.update_card(
+        spec_id,
+        "cover",
+        title=title,
+        body=None,
+        table_data=None,
+        note=None,
+        intent=None,
+        type_hint=None,
+        story=None,
+        autofix_applied=None,
+        expected_etag=etag,
+        actor="tester",
+    )
+
+
+def _store_with_card(tmp_path: Path, spec_id: str) -> ContentStore:
+    store = ContentStore(base_dir=tmp_path)
+    slide = ContentSlide(id="cover", intent="cover", elements=ContentElements(title="Cover"))
+    store.create_cards(spec_id, [CardState(slide=slide)])
+    return store
+
+
+def test_changes_endpoint_replays_from_cursor(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.delenv("CONTENT_API_TOKEN", raising=False)
+    store = _store_with_card(tmp_path, "job-1")
+    _update(store, "job-1", "A")
+    _update(store, "job-1", "B")
+    client = TestClient(create_app(store))
+
+    response = client.get("/v1/content/changes", params={"spec_id": "job-1", "follow": "false"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(response.text)
+    assert [(event["target"], event["action"], event["revision"]) for event in events] == [
+        ("cover", "update", 'W/"cards-2"'),
+        ("cover", "update", 'W/"cards-3"'),
+    ]
+
+    resumed = client.get(
+        "/v1/content/changes",
+        params={"spec_id": "job-1", "follow": "false"},
+        headers={"Last-Event-ID": str(events[0]["id"])},
+    )
+    assert [event["revision"] for event in _parse_sse(resumed.text)] == ['W/"cards-3"']
+
+    assert client.get("/v1/content/changes", params={"cursor": "broken"}).status_code == 400
+
+
+def test_live_stream_receives_store_updates(tmp_path: Path) -> None:
+    store = _store_with_card(tmp_path, "job-2")
+
+    async def scenario() -> list[dict[str, object]]:
+        stream = stream_changes(
+            store.changes,
+            lambda after: store.list_changes("job-2", after),
+            spec_id="job-2",
+            cursor=None,
+            heartbeat_interval=5,
+        )
+        assert await anext(stream) == b": connected\n\n"
+        await asyncio.to_thread(_update, store, "job-2", "Live")
+        chunk = await anext(stream)
+        await stream.aclose()
+        return _parse_sse(chunk.decode("utf-8"))
+
+    events = asyncio.run(scenario())
+
+    assert [(event["spec_id"], event["action"], event["revision"]) for event in events] == [
+        ("job-2", "update", 'W/"cards-2"'),
+    ]
+    assert store.changes.subscriber_count == 0
+
+
+def test_slow_subscriber_catches_up_from_audit_log(tmp_path: Path) -> None:
+    audit = AuditLogStore(tmp_path / "audit")
+    feed = ChangeFeed(queue_size=1)
+
+    def replay(after: str | None) -> tuple[list[ChangeEvent], str | None]:
+        page = audit.query(["spec"], limit=2, cursor=after)
+        return [_event(entry, cursor) for entry, cursor in zip(page.items, page.cursors)], page.next_cursor
+
+    def _event(entry: dict[str, str], cursor: str) -> ChangeEvent:
+        return ChangeEvent(spec_id="spec", target=entry["target"], action="update", revision=None, cursor=cursor)
+
+    async def scenario() -> list[str]:
+        stream = stream_changes(feed, replay, spec_id="spec", cursor=None, heartbeat_interval=5)
+        await anext(stream)
+        for index in range(5):
+            entry = {"target": f"t{index}", "action": "update", "timestamp": f"2026-01-01T00:00:0{index}+00:00"}
+            feed.publish(_event(entry, audit.append("spec", entry, target_id=entry["target"])))
+        chunks = [await anext(stream) for _ in range(5)]
+        await stream.aclose()
+        return [str(_parse_sse(chunk.decode("utf-8"))[0]["target"]) for chunk in chunks]
+
+    assert asyncio.run(scenario()) == ["t0", "t1", "t2", "t3", "t4"]
+
+
+def test_overflow_without_cursor_catches_up_from_subscription_head(tmp_path: Path) -> None:
+    audit = AuditLogStore(tmp_path / "audit")
+    feed = ChangeFeed(queue_size=1)
+    for index in range(3):
+        audit.append("spec", {"target": f"old{index}", "action": "update", "timestamp": f"2026-01-01T00:00:0{index}+00:00"})
+
+    def _event(entry: dict[str, str], cursor: str) -> ChangeEvent:
+        return ChangeEvent(spec_id="spec", target=entry["target"], action="update", revision=None, cursor=cursor)
+
+    def replay(after: str | None) -> tuple[list[ChangeEvent], str | None]:
+        page = audit.query(["spec"], limit=2, cursor=after)
+        return [_event(entry, cursor) for entry, cursor in zip(page.items, page.cursors)], page.next_cursor
+
+    async def scenario() -> list[str]:
+        stream = stream_changes(
+            feed,
+            replay,
+            spec_id="spec",
+            cursor=None,
+            heartbeat_interval=5,
+            head=lambda: audit.head_cursor(["spec"]),
+        )
+        await anext(stream)
+        for index in range(3):
+            entry = {"target": f"new{index}", "action": "update", "timestamp": f"2026-01-01T00:00:1{index}+00:00"}
+            feed.publish(_event(entry, audit.append("spec", entry)))
+        chunks = [await anext(stream) for _ in range(3)]
+        await stream.aclose()
+        return [str(_parse_sse(chunk.decode("utf-8"))[0]["target"]) for chunk in chunks]
+
+    # 購読前の履歴（old*）は送られない
+    assert asyncio.run(scenario()) == ["new0", "new1", "new2"]
+
+
+def test_audit_sequence_continues_after_reset(tmp_path: Path) -> None:
+    audit = AuditLogStore(tmp_path / "audit")
+    before = [audit.append("spec", {"action": "update", "timestamp": "2026-01-01T00:00:00+00:00"}, target_id="t") for _ in range(2)]
+    audit.reset("spec")
+    after = audit.append("spec", {"action": "update", "timestamp": "2026-01-01T00:00:01+00:00"}, target_id="t")
+
+    assert cursor_position(after)[1] == 2
+    assert audit.head_cursor(["spec"]) == after
+    assert audit.count("spec") == 1
+    assert len(audit.by_target("spec", "t")) == 1
+    page = audit.query(["spec"], cursor=before[-1])
+    assert page.cursors == [after]
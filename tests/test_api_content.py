@@ -129,3 +129,80 @@ def test_requires_token_when_configured(tmp_path, monkeypatch) -> None:
         },
     )
     assert response.status_code == 401
+
+
+def test_card_get_returns_304_and_refreshes_history(client: TestClient) -> None:
+    response = client.post(
+        "/v1/content/cards",
+        json={"spec_id": "job-poll", "cards": [{"slide_id": "cover", "title": "Cover", "body": [], "intent": "cover"}]},
+        headers=_auth_headers(),
+    )
+    etag = response.headers["ETag"]
+    params = {"spec_id": "job-poll"}
+
+    first = client.get("/v1/content/cards/cover", params=params, headers=_auth_headers())
+    assert first.status_code == 200
+    assert first.json()["history"] == []
+    polled = client.get("/v1/content/cards/cover", params=params, headers={**_auth_headers(), "If-None-Match": etag})
+    assert polled.status_code == 304
+    assert polled.headers["ETag"] == etag
+
+    for title in ("Cover A", "Cover B"):
+        response = client.patch(
+            "/v1/content/cards/cover",
+            params=params,
+            json={"title": title},
+            headers=_auth_headers(etag),
+        )
+        etag = response.headers["ETag"]
+        refreshed = client.get("/v1/content/cards/cover", params=params, headers=_auth_headers())
+        assert refreshed.headers["ETag"] == etag
+
+    body = refreshed.json()
+    assert body["title"] == "Cover B"
+    assert [entry["action"] for entry in body["history"]] == ["update", "update"]
+    missing = client.get("/v1/content/cards/other", params=params, headers={**_auth_headers(), "If-None-Match": etag})
+    assert missing.status_code == 404
+
+
+def test_bulk_operations_apply_in_single_revision(client: TestClient) -> None:
+    cards = [{"slide_id": f"s{index}", "title": f"Slide {index}", "body": [], "intent": "content"} for index in range(3)]
+    response = client.post("/v1/content/cards", json={"spec_id": "job-bulk", "cards": cards}, headers=_auth_headers())
+    etag = response.headers["ETag"]
+    params = {"spec_id": "job-bulk"}
+
+    failed = client.post(
+        "/v1/content/cards/bulk",
+        params=params,
+        json={"operations": [{"slide_id": "s0", "action": "approve"}, {"slide_id": "missing", "action": "approve"}]},
+        headers=_auth_headers(etag),
+    )
+    assert failed.status_code == 409
+    detail = failed.json()["detail"]
+    assert [item["error"] is None for item in detail["results"]] == [True, False]
+    assert client.get("/v1/content/cards/s0", params=params, headers=_auth_headers()).json()["status"] == "draft"
+
+    response = client.post(
+        "/v1/content/cards/bulk",
+        params=params,
+        json={
+            "operations": [
+                {"slide_id": "s0", "action": "update", "title": "Updated"},
+                {"slide_id": "s0", "action": "approve", "notes": "ok"},
+                {"slide_id": "s1", "action": "approve"},
+                {"slide_id": "s2", "action": "return", "reason": "要修正"},
+            ]
+        },
+        headers=_auth_headers(etag),
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] == 'W/"cards-2"'
+    results = response.json()["results"]
+    assert [item["status"] for item in results] == ["draft", "approved", "approved", "returned"]
+    assert results[0]["content_hash"].startswith("sha256:")
+
+    card = client.get("/v1/content/cards/s0", params=params, headers=_auth_headers()).json()
+    assert card["title"] == "Updated"
+    assert [entry["action"] for entry in card["history"]] == ["update", "approve"]
+    logs = client.get("/v1/content/logs", params=params, headers=_auth_headers()).json()["items"]
+    assert len(logs) == 4
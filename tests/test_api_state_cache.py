@@ -0,0 +1,135 @@
+"""spec 状態キャッシュとストアの排他制御のテスト。"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from pptx_generator.api.draft_store import DraftStore, SectionNotFoundError
+from pptx_generator.api.executor import StoreExecutor
+from pptx_generator.api.state_cache import SpecStateCache
+from pptx_generator.api.store import (CardState, ContentStore,
+                                      RevisionMismatchError, SpecNotFoundError)
+from pptx_generator.models import (ContentElements, ContentSlide,
+                                   DraftDocument, DraftSection, DraftSlideCard)
+
+
+def test_group_commit_defers_write_until_flush(tmp_path: Path) -> None:
+    cache = SpecStateCache(tmp_path, capacity=1, commit_interval=60)
+    with cache.transaction("spec-1"):
+        cache.store("spec-1", {"revision": 1})
+    with cache.transaction("spec-2"):
+        cache.store("spec-2", {"revision": 7})
+
+    assert not (tmp_path / "spec-1.json").exists()
+    # LRU から追い出されても未書き出し分から読み戻せる
+    assert cache.load("spec-1") == {"revision": 1}
+    assert cache.spec_ids() == ["spec-1", "spec-2"]
+
+    cache.flush()
+
+    assert json.loads((tmp_path / "spec-2.json").read_text(encoding="utf-8")) == {"revision": 7}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_concurrent_updates_do_not_lose_revisions(tmp_path: Path) -> None:
+    store = ContentStore(base_dir=tmp_path)
+    slide = ContentSlide(id="cover", intent="cover", elements=ContentElements(title="Cover"))
+    store.create_cards("spec-1", [CardState(slide=slide)])
+    succeeded: list[int] = []
+
+    def worker(index: int) -> None:
+        for _ in range(5):
+            while True:
+                _, etag = store.get_card("spec-1", "cover")
+                try:
+                    store.update_card(
+                        "spec-1",
+                        "cover",
+                        title=f"Cover {index}",
+                        body=None,
+                        table_data=None,
+                        note=None,
+                        intent=None,
+                        type_hint=None,
+                        story=None,
+                        autofix_applied=None,
+                        expected_etag=etag,
+                        actor=f"worker-{index}",
+                    )
+                except RevisionMismatchError:
+                    continue
+                succeeded.append(index)
+                break
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    _, etag = ContentStore(base_dir=tmp_path).get_card("spec-1", "cover")
+    assert etag == f'W/"cards-{1 + len(succeeded)}"'
+    assert len(succeeded) == 30
+    items, _ = store.list_logs(spec_id="spec-1", limit=100)
+    assert len(items) == 30
+
+
+def test_failed_operation_does_not_leave_partial_state(tmp_path: Path) -> None:
+    store = DraftStore(base_dir=tmp_path)
+    board = DraftDocument(
+        sections=[DraftSection(name="A", order=1, slides=[DraftSlideCard(ref_id="s1", order=1, layout_hint="Title")])],
+    )
+    etag = store.create_board("spec-1", board)
+
+    with pytest.raises(SectionNotFoundError):
+        store.move_slide(
+            "spec-1",
+            "s1",
+            target_section="missing",
+            position=None,
+            expected_etag=etag,
+            actor=None,
+        )
+
+    current, current_etag = store.get_board("spec-1")
+    assert current_etag == etag
+    assert [slide.ref_id for slide in current.sections[0].slides] == ["s1"]
+
+
+def test_state_is_stored_compact_and_exported_pretty(tmp_path: Path) -> None:
+    store = ContentStore(base_dir=tmp_path)
+    slide = ContentSlide(id="cover", intent="cover", elements=ContentElements(title="表紙"))
+    store.create_cards("spec", [CardState(slide=slide)])
+
+    raw = (tmp_path / "spec.json").read_text(encoding="utf-8")
+    assert "\n" not in raw
+    assert ", " not in raw and ": " not in raw
+    assert "表紙" in raw
+
+    exported = store.export_state("spec")
+    assert exported.startswith("{\n  ")
+    assert json.loads(exported) == json.loads(raw)
+    with pytest.raises(SpecNotFoundError):
+        store.export_state("missing")
+
+
+def test_store_executor_runs_calls_on_worker_threads(monkeypatch) -> None:
+    monkeypatch.setenv("PPTX_STORE_WORKERS", "2")
+    executor = StoreExecutor.from_env()
+
+    async def scenario() -> set[str]:
+        names = await asyncio.gather(*(executor.run(lambda: threading.current_thread().name) for _ in range(4)))
+        return set(names)
+
+    try:
+        names = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert executor.max_workers == 2
+    assert names and all(name.startswith("pptx-store") for name in names)
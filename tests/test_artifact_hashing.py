@@ -0,0 +1,56 @@
+"""書き出し時ハッシュと並列ハッシュ計算のテスト。"""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+from pptx_generator.models import JobAuth, JobMeta, JobSpec
+from pptx_generator.pipeline import ArtifactWriter, PipelineContext
+from pptx_generator.pipeline.artifact_hashing import (digest_file,
+                                                      hash_files,
+                                                      write_bytes_hashed)
+from pptx_generator.pipeline.artifact_writer import write_json_artifact
+
+
+def _context(tmp_path: Path, writer: ArtifactWriter | None = None) -> PipelineContext:
+    spec = JobSpec(meta=JobMeta(schema_version="1.0", title="資料"), auth=JobAuth(created_by="tester"), slides=[])
+    return PipelineContext(spec=spec, workdir=tmp_path, artifact_writer=writer)
+
+
+def test_write_bytes_hashed_matches_file_contents(tmp_path: Path) -> None:
+    payload = b"x" * (3 * 1024 * 1024 + 7)
+    digest = write_bytes_hashed(tmp_path / "deck" / "large.bin", payload)
+
+    expected = hashlib.sha256(payload).hexdigest()
+    assert digest.sha256 == expected
+    assert digest.size == len(payload)
+    other = tmp_path / "other.bin"
+    other.write_bytes(b"other")
+    assert hash_files([tmp_path / "deck" / "large.bin", other]) == {
+        tmp_path / "deck" / "large.bin": expected,
+        other: hashlib.sha256(b"other").hexdigest(),
+    }
+    assert digest_file(tmp_path / "deck" / "large.bin") == digest
+
+
+def test_context_records_hashes_and_detects_external_changes(tmp_path: Path) -> None:
+    with ArtifactWriter() as writer:
+        context = _context(tmp_path, writer)
+        path = write_json_artifact(context, tmp_path / "analysis.json", {"issues": []})
+        writer.flush()
+
+    recorded = context.artifact_hash(path)
+    assert recorded is not None
+    assert recorded.label() == "sha256:" + hashlib.sha256(path.read_bytes()).hexdigest()
+
+    path.write_text('{"issues": ["changed"]}', encoding="utf-8")
+    assert context.artifact_hash(path) is None
+
+    sync_context = _context(tmp_path)
+    write_json_artifact(sync_context, path, {"issues": []})
+    rewritten = sync_context.artifact_hash(path)
+    assert rewritten is not None
+    assert rewritten.sha256 == recorded.sha256
+    sync_context.discard_artifact_hash(path)
+    assert sync_context.artifact_hash(path) is None
@@ -0,0 +1,80 @@
+"""ArtifactWriter のテスト。"""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from pptx_generator.models import JobMeta
+from pptx_generator.pipeline import ArtifactWriteError, ArtifactWriter
+
+
+def test_writer_flushes_models_and_plain_payloads(tmp_path: Path) -> None:
+    with ArtifactWriter() as writer:
+        writer.write_json(tmp_path / "nested" / "meta.json", JobMeta(schema_version="1.0", title="資料"))
+        writer.write_json(tmp_path / "log.json", [{"index": index} for index in range(3)])
+        writer.flush()
+
+        assert json.loads((tmp_path / "nested" / "meta.json").read_text(encoding="utf-8"))["title"] == "資料"
+        assert json.loads((tmp_path / "log.json").read_text(encoding="utf-8"))[-1] == {"index": 2}
+
+
+def test_writer_reports_failures_on_flush(tmp_path: Path) -> None:
+    blocker = tmp_path / "blocker"
+    blocker.write_text("", encoding="utf-8")
+    writer = ArtifactWriter()
+
+    writer.write_json(blocker / "out.json", {"value": 1})
+    with pytest.raises(ArtifactWriteError):
+        writer.flush()
+
+    writer.close()
+    with pytest.raises(ArtifactWriteError):
+        writer.write_json(tmp_path / "late.json", {})
+
+
+def test_writer_coalesces_pending_writes_and_reuses_encoding(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    from pptx_generator.pipeline import artifact_writer
+
+    encoded: list[object] = []
+    gate = {"gate": True}
+    release = threading.Event()
+    original = artifact_writer.encode_json
+
+    def tracking(payload: object) -> str:
+        if payload is gate:
+            # 後続の登録が済むまでワーカーを止める
+            release.wait(timeout=5)
+        else:
+            encoded.append(payload)
+        return original(payload)
+
+    monkeypatch.setattr(artifact_writer, "encode_json", tracking)
+    shared = {"sections": ["A", "B"]}
+    target = tmp_path / "mapping_log.json"
+
+    writer = ArtifactWriter(fsync="flush")
+    writer.write_json(tmp_path / "gate.json", gate)
+    writer.write_json(tmp_path / "draft.json", shared)
+    writer.write_json(tmp_path / "approved.json", shared)
+    writer.write_json(target, {"version": 1})
+    writer.write_json(target, {"version": 2})
+    release.set()
+    writer.close()
+
+    assert json.loads(target.read_text(encoding="utf-8")) == {"version": 2}
+    assert (tmp_path / "draft.json").read_bytes() == (tmp_path / "approved.json").read_bytes()
+    assert encoded == [shared, {"version": 2}]
+
+
+def test_writer_rejects_unknown_fsync_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    with pytest.raises(ValueError):
+        ArtifactWriter(fsync="sometimes")  # type: ignore[arg-type]
+
+    monkeypatch.setenv("PPTX_ARTIFACT_FSYNC", "always")
+    writer = ArtifactWriter.from_env()
+    writer.close()
+    assert writer.fsync == "always"
@@ -0,0 +1,62 @@
+"""ベンチマークスイート（合成データ生成・結果比較）のテスト。"""
+
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.api_load import percentile
+from benchmarks.harness import compare_results, measure
+from benchmarks.synthetic import (DeckShape, build_content_document,
+                                  build_generate_ready, build_jobspec)
+from pptx_generator.generate_ready import generate_ready_to_jobspec
+
+
+def test_synthetic_deck_scales_with_shape() -> None:
+    shape = DeckShape(slides=8, bullets_per_slide=3, tables=2, table_rows=4, table_cols=3, charts=1, images=5)
+
+    spec = build_jobspec(shape)
+
+    assert len(spec.slides) == 8
+    assert all(len(slide.bullets[0].items) == 3 for slide in spec.slides)
+    assert sum(len(slide.tables) for slide in spec.slides) == 2
+    assert spec.slides[0].tables[0].columns == ["列1", "列2", "列3"]
+    assert len(spec.slides[0].tables[0].rows) == 4
+    assert sum(len(slide.charts) for slide in spec.slides) == 1
+    assert sum(len(slide.images) for slide in spec.slides) == 5
+
+    converted = generate_ready_to_jobspec(build_generate_ready(shape))
+    assert [slide.id for slide in converted.slides] == [slide.id for slide in spec.slides]
+    assert sum(len(slide.tables) for slide in converted.slides) == 2
+
+    content = build_content_document(shape)
+    assert [slide.id for slide in content.slides] == [slide.id for slide in spec.slides]
+
+
+def test_compare_results_flags_regressions_beyond_threshold() -> None:
+    baseline = {"benchmarks": {"renderer": {"median_s": 1.0}, "mapping": {"median_s": 0.5}, "dropped": {"median_s": 1.0}}}
+    current = {"benchmarks": {"renderer": {"median_s": 1.05}, "mapping": {"median_s": 0.6}, "added": {"median_s": 1.0}}}
+
+    report = compare_results(baseline, current, threshold=0.1)
+
+    assert [item.name for item in report.regressions] == ["mapping"]
+    assert report.missing == ["dropped"]
+    assert report.added == ["added"]
+
+
+def test_measure_collects_requested_samples() -> None:
+    calls: list[int] = []
+
+    result = measure("noop", lambda: calls.append(1), repeat=3, warmup=2)
+
+    assert len(calls) == 5
+    assert result.summary()["repeat"] == 3
+
+
+def test_percentile_interpolates_between_samples() -> None:
+    samples = [0.4, 0.1, 0.3, 0.2]
+
+    assert percentile(samples, 50) == pytest.approx(0.25)
+    assert percentile(samples, 99) == pytest.approx(0.397)
+    assert percentile([0.5], 99) == 0.5
+    with pytest.raises(ValueError):
+        percentile([], 50)
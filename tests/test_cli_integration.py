@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import shutil
@@ -396,6 +397,53 @@ def test_cli_compose_generates_stage45_outputs(tmp_path: Path) -> None:
     assert (output_dir / "generate_ready_meta.json").exists()
 
 
+def test_cli_run_generates_all_stage_outputs(tmp_path: Path) -> None:
+    draft_dir = tmp_path / "run-draft"
+    compose_dir = tmp_path / "run-compose"
+    output_dir = tmp_path / "run-gen"
+    runner = CliRunner()
+    brief_paths = _prepare_brief_inputs(runner, tmp_path)
+    spec_path = _create_matching_jobspec(tmp_path, brief_paths)
+
+    result = runner.invoke(
+        app,
+        [
+            "run",
+            str(spec_path),
+            "--draft-output",
+            str(draft_dir),
+            "--compose-output",
+            str(compose_dir),
+            "--output",
+            str(output_dir),
+            "--template",
+            str(SAMPLE_TEMPLATE),
+            *_brief_args(brief_paths),
+        ],
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0, result.output
+    assert (draft_dir / "draft_approved.json").exists()
+    assert (compose_dir / "generate_ready_meta.json").exists()
+    assert (output_dir / "proposal.pptx").exists()
+
+    ready_path = compose_dir / "generate_ready.json"
+    ready_payload = json.loads(ready_path.read_text(encoding="utf-8"))
+
+    audit_payload = json.loads((output_dir / "audit_log.json").read_text(encoding="utf-8"))
+    assert audit_payload["artifacts"]["generate_ready"] == str(ready_path)
+    assert audit_payload["slides"] == len(ready_payload["slides"])
+    hashes = audit_payload["hashes"]
+    # 書き出し時に登録したハッシュがディスク上の最終内容と一致すること
+    for label, path in (
+        ("pptx", output_dir / "proposal.pptx"),
+        ("mapping_log", compose_dir / "mapping_log.json"),
+        ("generate_ready", ready_path),
+        ("analysis", output_dir / "analysis.json"),
+    ):
+        assert hashes[label] == "sha256:" + hashlib.sha256(path.read_bytes()).hexdigest()
+
 def test_cli_gen_missing_template_path(tmp_path: Path) -> None:
     mapping_dir = tmp_path / "mapping"
     draft_dir = tmp_path / "draft"
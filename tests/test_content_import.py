@@ -4,7 +4,9 @@ from pathlib import Path
 
 import pytest
 
-from pptx_generator.content_import import ContentImportError, ContentImportService
+from pptx_generator.content_import import (ContentImportError,
+                                           ContentImportService,
+                                           ConversionCache)
 
 
 def test_import_from_text_file(tmp_path: Path) -> None:
@@ -37,3 +39,88 @@ def test_import_without_sources_raises() -> None:
     service = ContentImportService()
     with pytest.raises(ContentImportError):
         service.import_sources([])
+
+
+def test_streamed_html_matches_single_chunk() -> None:
+    html = (
+        "<html><body><h1># 概要</h1><p>段落 &amp; 補足</p><ul><li>- 項目A</li>"
+        "<li>- 項目B</li></ul><script>ignored()</script><h2># 次章</h2><p>本文</p></body></html>"
+    )
+    raw = html.encode("utf-8")
+    service = ContentImportService(cache=ConversionCache(enabled=False))
+
+    expected, expected_hash = service._read_text_stream(
+        [raw], encoding="utf-8", markup="html", warnings=[], decode_warning=""
+    )
+    chunked, chunked_hash = service._read_text_stream(
+        [raw[index : index + 7] for index in range(0, len(raw), 7)],
+        encoding="utf-8",
+        markup="html",
+        warnings=[],
+        decode_warning="",
+    )
+
+    assert chunked == expected
+    assert chunked_hash == expected_hash
+    assert [title for title, _ in chunked] == ["概要", "次章"]
+
+
+def test_import_preserves_source_order_with_workers(tmp_path: Path) -> None:
+    sources = []
+    for index in range(6):
+        source = tmp_path / f"draft-{index}.txt"
+        source.write_text(f"# 章{index}\n本文{index}", encoding="utf-8")
+        sources.append(str(source))
+
+    service = ContentImportService(max_workers=4)
+    result = service.import_sources(sources)
+
+    assert [slide.elements.title for slide in result.document.slides] == [f"章{index}" for index in range(6)]
+    assert [entry["source"] for entry in result.meta["sources"]] == sources
+
+
+def test_pdf_conversion_is_cached_by_hash(tmp_path: Path) -> None:
+    class _FakePool:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        def convert(self, path: Path) -> str:
+            self.calls += 1
+            return "# PDF 見出し\nPDF 本文"
+
+    source = tmp_path / "report.pdf"
+    source.write_bytes(b"%PDF-1.4 dummy")
+    pool = _FakePool()
+    service = ContentImportService(cache=ConversionCache(tmp_path / "cache"), libreoffice_pool=pool)
+
+    first = service.import_sources([str(source)])
+    second = service.import_sources([str(source)])
+
+    assert pool.calls == 1
+    assert first.meta["sources"][0]["conversion_cache"] == "miss"
+    assert second.meta["sources"][0]["conversion_cache"] == "hit"
+    assert second.document.slides[0].elements.title == "PDF 見出し"
+    assert first.meta["sources"][0]["pdf"]["cached"] is False
+    assert second.meta["sources"][0]["pdf"]["cached"] is True
+
+
+def test_import_cache_defaults_to_output_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("PPTX_IMPORT_CACHE", raising=False)
+    monkeypatch.delenv("PPTX_IMPORT_CACHE_DIR", raising=False)
+    monkeypatch.chdir(tmp_path)
+
+    class _FakePool:
+        def convert(self, path: Path) -> str:
+            return "# PDF 見出し\nPDF 本文"
+
+    source = tmp_path / "report.pdf"
+    source.write_bytes(b"%PDF-1.4 dummy")
+    output_dir = tmp_path / "out"
+
+    without_output = ContentImportService(libreoffice_pool=_FakePool())  # type: ignore[arg-type]
+    assert without_output.import_sources([str(source)]).meta["sources"][0]["conversion_cache"] == "disabled"
+
+    service = ContentImportService(libreoffice_pool=_FakePool(), output_dir=output_dir)  # type: ignore[arg-type]
+    assert service.import_sources([str(source)]).meta["sources"][0]["conversion_cache"] == "miss"
+    assert list((output_dir / ".cache" / "import").rglob("*.txt"))
+    assert not (tmp_path / ".pptx").exists()
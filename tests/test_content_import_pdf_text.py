@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import zlib
+from pathlib import Path
+
+import pytest
+
+from pptx_generator.content_import import (ContentImportError,
+                                           ContentImportService,
+                                           ConversionCache,
+                                           NativePdfTextExtractor,
+                                           PdfPageRangeError,
+                                           PdfTextExtractionError,
+                                           parse_page_range)
+
+_TO_UNICODE = (
+    b"/CIDInit /ProcSet findresource begin 12 dict begin begincmap\n"
+    b"1 begincodespacerange <0000> <FFFF> endcodespacerange\n"
+    b"3 beginbfchar <0001> <63D0> <0002> <6848> <0003> <66F8> endbfchar\n"
+    b"1 beginbfrange <0010> <0012> <3042> endbfrange\n"
+    b"endcmap CMapName currentdict /CMap defineresource pop end end"
+)
+
+
+def _build_pdf(page_contents: list[bytes]) -> bytes:
+    """Helvetica (F1) と ToUnicode 付き Type0 フォント (F2) を持つ最小構成の PDF を組み立てる。"""
+
+    objects: dict[int, bytes] = {
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        4: b"<< /Type /Font /Subtype /Type0 /BaseFont /Gothic /Encoding /Identity-H "
+        b"/DescendantFonts [5 0 R] /ToUnicode 6 0 R >>",
+        5: b"<< /Type /Font /Subtype /CIDFontType2 /BaseFont /Gothic /DW 1000 >>",
+        6: b"<< /Length %d >>\nstream\n" % len(_TO_UNICODE) + _TO_UNICODE + b"\nendstream",
+    }
+    kids = []
+    number = 7
+    for content in page_contents:
+        body = zlib.compress(content)
+        objects[number] = b"<< /Type /Page /Parent 2 0 R /Contents %d 0 R >>" % (number + 1)
+        objects[number + 1] = b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(body) + body + b"\nendstream"
+        kids.append(b"%d 0 R" % number)
+        number += 2
+    objects[1] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[2] = (
+        b"<< /Type /Pages /Kids [" + b" ".join(kids) + b"] /Count %d "
+        b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> >>" % len(kids)
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for key in sorted(objects):
+        offsets[key] = len(out)
+        out += b"%d 0 obj\n" % key + objects[key] + b"\nendobj\n"
+    xref_offset = len(out)
+    size = max(objects) + 1
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % size
+    for key in range(1, size):
+        out += b"%010d 00000 n \n" % offsets[key]
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_offset)
+    return bytes(out)
+
+
+def _line(y: int, text: bytes) -> bytes:
+    return b"BT /F1 10 Tf 72 %d Td (%s) Tj ET\n" % (y, text)
+
+
+def test_native_extractor_returns_pages_with_offsets(tmp_path: Path) -> None:
+    source = tmp_path / "rfp.pdf"
+    source.write_bytes(_build_pdf([_line(800, b"Page one"), _line(800, b"Page two"), _line(800, b"Page three")]))
+
+    result = NativePdfTextExtractor(max_workers=1).extract(source)
+
+    assert result.backend == "native"
+    assert result.page_count == 3
+    assert [page.text for page in result.pages] == ["Page one", "Page two", "Page three"]
+    for page in result.pages:
+        assert result.text[page.offset : page.offset + page.chars] == page.text
+        assert page.elapsed_ms >= 0
+
+
+def test_native_extractor_orders_runs_by_position(tmp_path: Path) -> None:
+    content = (
+        _line(700, b"second line")
+        + b"BT /F1 10 Tf 72 800 Td [(Left)-1200(Right)] TJ ET\n"
+        + b"BT /F1 10 Tf 72 800 Td 0 -50 Td (\\(middle\\)) Tj ET\n"
+        + b"BT /F2 12 Tf 72 600 Td <000100020003> Tj <001000110012> Tj ET\n"
+    )
+    source = tmp_path / "layout.pdf"
+    source.write_bytes(_build_pdf([content]))
+
+    result = NativePdfTextExtractor(max_workers=1).extract(source)
+
+    assert result.text.splitlines() == ["Left Right", "(middle)", "second line", "提案書あぃい"]
+
+
+def test_native_extractor_honours_page_range(tmp_path: Path) -> None:
+    source = tmp_path / "range.pdf"
+    source.write_bytes(_build_pdf([_line(800, b"P%d" % index) for index in range(1, 6)]))
+
+    result = NativePdfTextExtractor(max_workers=1).extract(source, page_range="2-3,5")
+
+    assert [page.page_number for page in result.pages] == [2, 3, 5]
+    assert result.text == "P2\nP3\nP5"
+    assert parse_page_range("1-3,7,10-", 12) == [1, 2, 3, 7, 10, 11, 12]
+    with pytest.raises(PdfTextExtractionError):
+        NativePdfTextExtractor(max_workers=1).extract(source, page_range="3-1")
+    with pytest.raises(PdfPageRangeError):
+        NativePdfTextExtractor(max_workers=1).extract(source, page_range="6-")
+
+
+def test_import_rejects_page_range_beyond_last_page(tmp_path: Path) -> None:
+    class _UnusedPool:
+        def convert(self, path: Path) -> str:
+            raise AssertionError("LibreOffice should not be used")
+
+    source = tmp_path / "short.pdf"
+    source.write_bytes(_build_pdf([_line(800, b"Only page")]))
+    service = ContentImportService(
+        cache=ConversionCache(enabled=False),
+        libreoffice_pool=_UnusedPool(),  # type: ignore[arg-type]
+        pdf_extractor=NativePdfTextExtractor(max_workers=1),
+        pdf_page_range="5-8",
+    )
+
+    with pytest.raises(ContentImportError, match="最終ページ"):
+        service.import_sources([str(source)])
+
+
+def test_auto_backend_falls_back_when_glyphs_are_unmapped(tmp_path: Path) -> None:
+    converted: list[Path] = []
+
+    class _Pool:
+        def convert(self, path: Path) -> str:
+            converted.append(path)
+            return "# 提案書\n本文"
+
+    # ToUnicode に無いコード (0x0030-0x0037) が大半を占めるページ
+    content = _line(800, b"OK") + b"BT /F2 12 Tf 72 700 Td <00300031003200330034003500360037> Tj ET\n"
+    source = tmp_path / "unmapped.pdf"
+    source.write_bytes(_build_pdf([content]))
+    native = NativePdfTextExtractor(max_workers=1).extract(source)
+    assert native.unmapped_chars == 8
+
+    def _import(ratio: float):
+        return ContentImportService(
+            cache=ConversionCache(enabled=False),
+            libreoffice_pool=_Pool(),  # type: ignore[arg-type]
+            pdf_extractor=NativePdfTextExtractor(max_workers=1),
+            pdf_unmapped_ratio=ratio,
+        ).import_sources([str(source)])
+
+    result = _import(0.5)
+    assert result.meta["sources"][0]["pdf"]["backend"] == "libreoffice"
+    assert any("ToUnicode" in warning for warning in result.warnings)
+    assert len(converted) == 1
+
+    assert _import(0.9).meta["sources"][0]["pdf"]["backend"] == "native"
+    assert len(converted) == 1
+
+
+def test_native_extractor_recovers_from_broken_xref(tmp_path: Path) -> None:
+    data = _build_pdf([_line(800, b"Recovered")])
+    marker = data.rindex(b"startxref")
+    source = tmp_path / "broken.pdf"
+    source.write_bytes(data[:marker] + b"startxref\n999999\n%%EOF\n")
+
+    result = NativePdfTextExtractor(max_workers=1).extract(source)
+
+    assert result.text == "Recovered"
+
+
+def test_native_extractor_parallel_matches_serial(tmp_path: Path) -> None:
+    source = tmp_path / "large.pdf"
+    source.write_bytes(_build_pdf([_line(800, b"Section %d" % index) for index in range(6)]))
+
+    serial = NativePdfTextExtractor(max_workers=1).extract(source)
+    parallel = NativePdfTextExtractor(max_workers=2, parallel_min_pages=2).extract(source)
+
+    assert parallel.text == serial.text
+    assert [page.offset for page in parallel.pages] == [page.offset for page in serial.pages]
+
+
+def test_import_uses_native_backend_and_reports_pages(tmp_path: Path) -> None:
+    class _UnusedPool:
+        def convert(self, path: Path) -> str:
+            raise AssertionError("LibreOffice should not be used")
+
+    source = tmp_path / "proposal.pdf"
+    source.write_bytes(_build_pdf([_line(800, b"# Overview") + _line(780, b"Body text"), _line(800, b"Appendix")]))
+    service = ContentImportService(
+        cache=ConversionCache(enabled=False),
+        libreoffice_pool=_UnusedPool(),  # type: ignore[arg-type]
+        pdf_extractor=NativePdfTextExtractor(max_workers=1),
+    )
+
+    result = service.import_sources([str(source)])
+
+    pdf_meta = result.meta["sources"][0]["pdf"]
+    assert pdf_meta["backend"] == "native"
+    assert pdf_meta["page_count"] == 2
+    assert [page["page"] for page in pdf_meta["pages"]] == [1, 2]
+    assert [page["chars"] for page in pdf_meta["pages"]] == [len("# Overview\nBody text"), len("Appendix")]
+    assert result.document.slides[0].elements.title == "Overview"
+    assert result.document.slides[0].elements.body == ["Body text", "Appendix"]
+
+
+def test_cached_pdf_result_reports_current_timings(tmp_path: Path) -> None:
+    source = tmp_path / "cached.pdf"
+    source.write_bytes(_build_pdf([_line(800, b"# Title") + _line(780, b"Body"), _line(800, b"More")]))
+    service = ContentImportService(
+        cache=ConversionCache(tmp_path / "cache"),
+        pdf_extractor=NativePdfTextExtractor(max_workers=1),
+    )
+
+    first = service.import_sources([str(source)]).meta["sources"][0]["pdf"]
+    second = service.import_sources([str(source)]).meta["sources"][0]["pdf"]
+
+    assert first["cached"] is False
+    assert second["cached"] is True
+    assert [page["elapsed_ms"] for page in second["pages"]] == [0.0, 0.0]
+    assert [page["offset"] for page in second["pages"]] == [page["offset"] for page in first["pages"]]
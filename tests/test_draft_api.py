@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+
 from fastapi.testclient import TestClient
 
+from pptx_generator.api.change_feed import stream_changes
 from pptx_generator.api.draft_app import create_draft_app
 from pptx_generator.api.draft_store import DraftStore
 from pptx_generator.models import (DraftDocument, DraftLayoutCandidate,
@@ -48,3 +52,92 @@ def test_locked_slide_returns_423(tmp_path) -> None:
 
     assert response.status_code == 423
     assert "ロック" in response.json()["detail"]
+
+
+def test_board_get_honours_if_none_match(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("DRAFT_API_TOKEN", raising=False)
+    store = DraftStore(base_dir=tmp_path)
+    etag = store.create_board("spec-poll", _locked_board())
+    client = TestClient(create_draft_app(store))
+
+    first = client.get("/v1/draft/board", params={"spec_id": "spec-poll"})
+    assert first.status_code == 200
+    assert first.headers["ETag"] == etag
+
+    cached = client.get("/v1/draft/board", params={"spec_id": "spec-poll"}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    # 上書き後はリビジョンが進むため古い ETag では 304 にならない
+    new_etag = store.overwrite_board("spec-poll", _locked_board())
+    assert new_etag != etag
+    refreshed = client.get("/v1/draft/board", params={"spec_id": "spec-poll"}, headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.json()["revision"] == new_etag
+
+
+def test_changes_feed_replays_board_updates(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("DRAFT_API_TOKEN", raising=False)
+    store = DraftStore(base_dir=tmp_path)
+    store.create_board("spec-feed", _locked_board())
+    etag = store.get_board_etag("spec-feed")
+    store.approve_section("spec-feed", "Section", expected_etag=etag, actor="reviewer", notes=None)
+    client = TestClient(create_draft_app(store))
+
+    response = client.get("/v1/draft/changes", params={"spec_id": "spec-feed", "follow": "false"})
+
+    assert response.status_code == 200
+    data_lines = [line[len("data: ") :] for line in response.text.splitlines() if line.startswith("data: ")]
+    assert [json.loads(line) for line in data_lines] == [
+        {"spec_id": "spec-feed", "target": "Section", "action": "approve", "revision": 'W/"draft-2"'},
+    ]
+
+
+def _open_board() -> DraftDocument:
+    return DraftDocument(
+        sections=[
+            DraftSection(
+                name="Section",
+                order=1,
+                slides=[DraftSlideCard(ref_id="slide-1", order=1, layout_hint="Title")],
+            )
+        ]
+    )
+
+
+def test_live_stream_survives_board_overwrite(tmp_path) -> None:
+    store = DraftStore(base_dir=tmp_path)
+    store.create_board("spec-live", _open_board())
+
+    def hint(value: str) -> None:
+        store.update_layout_hint(
+            "spec-live",
+            "slide-1",
+            layout_hint=value,
+            notes=None,
+            expected_etag=store.get_board_etag("spec-live"),
+            actor="tester",
+        )
+
+    async def scenario() -> list[str]:
+        stream = stream_changes(
+            store.changes,
+            lambda after: store.list_changes("spec-live", after),
+            spec_id="spec-live",
+            cursor=None,
+            heartbeat_interval=5,
+            head=lambda: store.head_change_cursor("spec-live"),
+        )
+        assert await anext(stream) == b": connected\n\n"
+        received = []
+        for value in ("A", "B"):
+            await asyncio.to_thread(hint, value)
+            received.append(await anext(stream))
+        # 上書きで監査ログが作り直されても、以降の通知は届く
+        await asyncio.to_thread(store.overwrite_board, "spec-live", _open_board())
+        await asyncio.to_thread(hint, "C")
+        received.append(await anext(stream))
+        await stream.aclose()
+        return [str(json.loads(chunk.decode("utf-8").split("data: ", 1)[1])["revision"]) for chunk in received]
+
+    assert asyncio.run(scenario()) == ['W/"draft-2"', 'W/"draft-3"', 'W/"draft-5"']
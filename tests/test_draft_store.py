@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
 
-from pptx_generator.api.draft_store import (DraftStore, LockedContentError,
+from pptx_generator.api.draft_store import (BoardOperation, BulkOperationError,
+                                            DraftStore, LockedContentError,
                                             RevisionMismatchError)
 from pptx_generator.models import (DraftDocument, DraftLayoutCandidate,
                                    DraftMeta, DraftSection, DraftSlideCard)
@@ -148,3 +150,89 @@ def test_revision_mismatch(tmp_path: Path, draft_board: DraftDocument) -> None:
             expected_etag='W/"draft-999"',
             actor=None,
         )
+
+
+def test_logs_are_paged_by_cursor_and_reset_on_overwrite(tmp_path: Path, draft_board: DraftDocument) -> None:
+    store = DraftStore(base_dir=tmp_path)
+    etag = store.create_board("spec-3", draft_board)
+    for hint in ("A", "B", "C"):
+        etag = store.update_layout_hint(
+            spec_id="spec-3",
+            slide_id="s1",
+            layout_hint=hint,
+            notes=None,
+            expected_etag=etag,
+            actor="tester",
+        )
+
+    assert "logs" not in json.loads((tmp_path / "spec-3.json").read_text(encoding="utf-8"))
+    first, cursor = store.list_logs("spec-3", limit=2)
+    assert [entry.changes["layout_hint"] for entry in first] == ["A", "B"]
+    assert cursor is not None
+    rest, cursor = store.list_logs("spec-3", limit=2, cursor=cursor)
+    assert [entry.changes["layout_hint"] for entry in rest] == ["C"]
+    assert cursor is None
+
+    store.overwrite_board("spec-3", draft_board)
+    assert store.list_logs("spec-3") == ([], None)
+
+
+def test_legacy_logs_are_migrated_on_load(tmp_path: Path, draft_board: DraftDocument) -> None:
+    store = DraftStore(base_dir=tmp_path)
+    store.create_board("spec-4", draft_board)
+    path = tmp_path / "spec-4.json"
+    payload = json.loads(path.read_text(encoding="utf-8"))
+    payload["logs"] = [
+        {
+            "target_type": "slide",
+            "target_id": "s1",
+            "action": "hint",
+            "actor": "legacy",
+            "timestamp": "2025-01-01T00:00:00+00:00",
+            "changes": {"layout_hint": "Old"},
+        }
+    ]
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+    logs, _ = DraftStore(base_dir=tmp_path).list_logs("spec-4")
+
+    assert [entry.actor for entry in logs] == ["legacy"]
+    assert "logs" not in json.loads(path.read_text(encoding="utf-8"))
+
+
+def test_board_operations_are_applied_atomically(tmp_path: Path, draft_board: DraftDocument) -> None:
+    store = DraftStore(base_dir=tmp_path)
+    etag = store.create_board("spec-5", draft_board)
+
+    with pytest.raises(BulkOperationError) as excinfo:
+        store.apply_board_operations(
+            "spec-5",
+            [
+                BoardOperation(slide_id="s1", action="move", target_section="Section B", position=1),
+                BoardOperation(slide_id="s2", action="move", target_section="Missing"),
+            ],
+            expected_etag=etag,
+            actor="tester",
+        )
+    assert [result.error is None for result in excinfo.value.results] == [True, False]
+    assert store.get_board_etag("spec-5") == etag
+
+    new_etag, results = store.apply_board_operations(
+        "spec-5",
+        [
+            BoardOperation(slide_id="s1", action="move", target_section="Section B", position=1),
+            BoardOperation(slide_id="s2", action="move", target_section="Section B", position=1),
+            BoardOperation(slide_id="s3", action="hint", layout_hint="Closing"),
+        ],
+        expected_etag=etag,
+        actor="tester",
+    )
+
+    assert new_etag == 'W/"draft-2"'
+    assert results[1].changes == {"from_section": "Section A", "to_section": "Section B", "position": 1}
+    board, _ = store.get_board("spec-5")
+    section_b = next(section for section in board.sections if section.name == "Section B")
+    assert [(slide.ref_id, slide.order) for slide in section_b.slides] == [("s2", 1), ("s1", 2), ("s3", 3)]
+    assert section_b.slides[2].layout_hint == "Closing"
+    logs, _ = store.list_logs("spec-5")
+    assert [entry.action for entry in logs] == ["move", "move", "hint"]
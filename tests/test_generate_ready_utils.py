@@ -127,3 +127,38 @@ def test_generate_ready_to_jobspec_defaults() -> None:
     slide = spec.slides[0]
     assert slide.id == "slide-1"
     assert slide.layout == "layout_basic"
+
+
+def test_conversion_copies_lists() -> None:
+    rows = [["A", "1"], ["B", "2"]]
+    values = [1, 2.5]
+    document = GenerateReadyDocument(
+        slides=[
+            GenerateReadySlide(
+                layout_id="layout_basic",
+                elements={
+                    "title": "タイトル",
+                    "body": ["a", "b"],
+                    "table_anchor": {"headers": ["H1", "H2"], "rows": rows},
+                    "numeric_table": {"headers": ["N"], "rows": [[1], [2]]},
+                    "chart_anchor": {"type": "bar", "categories": ["Q1", "Q2"], "series": [{"name": "S", "values": values}]},
+                    "textbox_anchor": {"text": "テキスト"},
+                },
+                meta=MappingSlideMeta(sources=["slide-1"]),
+            )
+        ],
+        meta=GenerateReadyMeta(generated_at="2025-10-18T00:00:00Z"),
+    )
+
+    slide = generate_ready_to_jobspec(document).slides[0]
+    assert slide.tables[1].rows == [["1"], ["2"]]
+    # 後続工程がレンダリング用スライドを書き換えても generate_ready 側は変わらない
+    slide.tables[0].rows[0][0] = "changed"
+    slide.tables[0].rows.append(["C", "3"])
+    slide.tables[0].columns.append("H3")
+    slide.charts[0].series[0].values.append(9)
+    slide.charts[0].categories.append("Q3")
+    assert rows == [["A", "1"], ["B", "2"]]
+    assert values == [1, 2.5]
+    assert document.slides[0].elements["table_anchor"]["headers"] == ["H1", "H2"]
+    assert document.slides[0].elements["chart_anchor"]["categories"] == ["Q1", "Q2"]
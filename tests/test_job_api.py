@@ -0,0 +1,99 @@
+"""Job API behavior tests."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import click
+import pytest
+from fastapi.testclient import TestClient
+
+from pptx_generator.api.job_app import create_job_app
+from pptx_generator.api.job_runner import JobManager, JobNotFoundError
+
+SAMPLE_BRIEF = Path("samples/contents/sample_import_content_summary.txt")
+
+
+def _wait_for_job(client: TestClient, job_id: str, timeout: float = 30.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        payload = client.get(f"/v1/jobs/{job_id}").json()
+        if payload["status"] in {"succeeded", "failed"}:
+            return payload
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_prepare_job_runs_and_serves_artifacts(tmp_path) -> None:
+    manager = JobManager(max_workers=1, max_queue=2)
+    client = TestClient(create_job_app(manager))
+    output_dir = tmp_path / "prepare"
+
+    response = client.post(
+        "/v1/jobs",
+        json={"command": "prepare", "args": [str(SAMPLE_BRIEF), "--output", str(output_dir)]},
+    )
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    job = _wait_for_job(client, job_id)
+    assert job["status"] == "succeeded"
+    assert job["exit_code"] == 0
+    assert job["output_dirs"] == {"output_dir": str(output_dir)}
+
+    artifacts = client.get(f"/v1/jobs/{job_id}/artifacts").json()["items"]
+    names = {item["name"] for item in artifacts}
+    assert "output_dir/prepare_card.json" in names
+
+    artifact = client.get(f"/v1/jobs/{job_id}/artifacts/output_dir/prepare_card.json")
+    assert artifact.status_code == 200
+    assert artifact.json()["cards"]
+
+    traversal = client.get(f"/v1/jobs/{job_id}/artifacts/output_dir/../../etc/passwd")
+    assert traversal.status_code == 404
+    manager.shutdown()
+
+
+def test_invalid_job_arguments_return_400(tmp_path) -> None:
+    manager = JobManager(max_workers=1)
+    client = TestClient(create_job_app(manager))
+
+    response = client.post(
+        "/v1/jobs",
+        json={"command": "gen", "args": [str(tmp_path / "missing.json")]},
+    )
+
+    assert response.status_code == 400
+    assert client.get("/v1/jobs").json()["items"] == []
+    manager.shutdown()
+
+
+def test_unknown_job_returns_404() -> None:
+    manager = JobManager(max_workers=1)
+    client = TestClient(create_job_app(manager))
+
+    assert client.get("/v1/jobs/unknown").status_code == 404
+    assert client.get("/v1/jobs/unknown/artifacts").status_code == 404
+    manager.shutdown()
+
+
+def test_finished_jobs_are_retired_beyond_retention_limit() -> None:
+    @click.group()
+    def group() -> None:
+        pass
+
+    @group.command("prepare")
+    @click.argument("name")
+    def prepare(name: str) -> None:
+        pass
+
+    manager = JobManager(max_workers=1, max_finished=2, cli_group=group)
+    records = [manager.submit("prepare", [f"job{index}"]) for index in range(4)]
+    manager.shutdown()
+
+    assert [record.status for record in records] == ["succeeded"] * 4
+    assert {record.job_id for record in manager.list_jobs()} == {records[2].job_id, records[3].job_id}
+    with pytest.raises(JobNotFoundError):
+        manager.get(records[0].job_id)
+    assert manager.stats()["succeeded"] == 2
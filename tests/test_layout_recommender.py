@@ -10,6 +10,7 @@ from pptx_generator.draft_recommender import (
     LayoutProfile,
 )
 from pptx_generator.models import ContentElements, ContentSlide, DraftAnalyzerSummary
+from pptx_generator.utils.file_cache import FileCache
 
 
 def _sample_slide(intent: str = "overview") -> ContentSlide:
@@ -127,3 +128,84 @@ def test_layout_ai_missing_policy_falls_back_to_simulation(tmp_path) -> None:
     assert result.candidates
     _, detail = result.candidates[0]
     assert detail.ai_recommendation > 0.0
+
+
+def test_recommend_batch_groups_cards_and_falls_back_per_card(monkeypatch) -> None:
+    from pptx_generator.draft_recommender import RecommendationInput
+    from pptx_generator.layout_ai import LayoutAIResponse
+
+    class FakeBatchClient:
+        def __init__(self) -> None:
+            self.batches: list[list[str]] = []
+            self.singles: list[str] = []
+
+        def recommend(self, request):
+            self.singles.append(request.card_payload["slide_id"])
+            return LayoutAIResponse(model="fake", recommended=[("Content", 1.0)])
+
+        def recommend_batch(self, requests):
+            self.batches.append([request.card_payload["slide_id"] for request in requests])
+            return [LayoutAIResponse(model="fake", recommended=[("Title", 1.0)])] + [None] * (len(requests) - 1)
+
+    client = FakeBatchClient()
+    monkeypatch.setattr(
+        "pptx_generator.draft_recommender.create_layout_ai_client", lambda policy: client
+    )
+    layouts = [
+        LayoutProfile("Title", "Title", ("title", "overview"), {"max_lines": 3}, {}),
+        LayoutProfile("Content", "Content", ("content",), {"max_lines": 6}, {}),
+    ]
+    slides = [_sample_slide().model_copy(update={"id": f"slide-{index}"}) for index in range(1, 4)]
+    recommender = CardLayoutRecommender(
+        CardLayoutRecommenderConfig(
+            ai_weight=0.3,
+            policy_path=Path("config/layout_ai_policies.json"),
+            enable_simulated_ai=False,
+            ai_batch_size=2,
+            ai_concurrency=2,
+        )
+    )
+
+    results = recommender.recommend_batch(
+        [
+            RecommendationInput(slide=slides[0], preferred_layout="Title", group="a"),
+            RecommendationInput(slide=slides[1], preferred_layout="Title", group="a"),
+            RecommendationInput(slide=slides[2], preferred_layout="Title", group="b"),
+        ],
+        layouts=layouts,
+    )
+
+    assert client.batches == [["slide-1", "slide-2"]]
+    assert client.singles == ["slide-3"]
+    assert results[0].ai_scores == {"Title": 0.3}
+    assert results[1].ai_scores == {} and results[1].ai_response is None
+    assert results[1].candidates, "AI 応答がなくてもヒューリスティック候補は返る"
+    assert results[2].ai_scores == {"Content": 0.3}
+
+
+def test_layout_ai_client_is_rebuilt_when_llm_env_changes(monkeypatch) -> None:
+    created: list[object] = []
+
+    def factory(policy):
+        created.append(object())
+        return created[-1]
+
+    monkeypatch.setattr("pptx_generator.draft_recommender.create_layout_ai_client", factory)
+    # pptx serve と同様にキャッシュを有効にする
+    monkeypatch.setattr("pptx_generator.draft_recommender.shared_file_cache", FileCache(enabled=True))
+    config = CardLayoutRecommenderConfig(
+        ai_weight=0.3,
+        policy_path=Path("config/layout_ai_policies.json"),
+        enable_simulated_ai=False,
+    )
+
+    monkeypatch.setenv("PPTX_LLM_PROVIDER", "layout-env-a")
+    first = CardLayoutRecommender(config)._ensure_layout_ai()
+    again = CardLayoutRecommender(config)._ensure_layout_ai()
+    monkeypatch.setenv("PPTX_LLM_PROVIDER", "layout-env-b")
+    changed = CardLayoutRecommender(config)._ensure_layout_ai()
+
+    assert first is not None and again is not None and changed is not None
+    assert again[1] is first[1]
+    assert changed[1] is not first[1]
+    assert len(created) == 2
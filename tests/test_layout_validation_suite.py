@@ -6,6 +6,7 @@ from pathlib import Path
 from click.testing import CliRunner
 
 from pptx_generator.cli import app
+from pptx_generator.extraction_cache import TemplateExtractionCache
 from pptx_generator.layout_validation import (
     LayoutValidationOptions,
     LayoutValidationSuite,
@@ -45,6 +46,44 @@ def test_layout_validation_suite_creates_outputs(tmp_path) -> None:
     assert diagnostics["stats"]["layouts_total"] >= result.record_count
 
 
+def test_layout_validation_suite_reuses_extraction_cache(tmp_path, monkeypatch) -> None:
+    cache = TemplateExtractionCache(tmp_path / "cache")
+
+    def _run(output_dir: Path) -> dict:
+        options = LayoutValidationOptions(
+            template_path=TEMPLATE_PATH,
+            output_dir=output_dir,
+            template_id="sample",
+            extraction_cache=cache,
+        )
+        result = LayoutValidationSuite(options).run()
+        return json.loads(result.diagnostics_path.read_text(encoding="utf-8"))
+
+    first = _run(tmp_path / "first")
+    assert first["stats"]["extraction_cache"] == {
+        "layout_records": "miss",
+        "template_spec": "miss",
+    }
+
+    def _fail(self):  # noqa: ANN001
+        raise AssertionError("キャッシュヒット時は再抽出しない")
+
+    monkeypatch.setattr(
+        "pptx_generator.pipeline.template_extractor.TemplateExtractorStep.extract_template_spec",
+        _fail,
+    )
+    second = _run(tmp_path / "second")
+    assert second["stats"]["extraction_cache"] == {"layout_records": "hit"}
+    assert (tmp_path / "first" / "layouts.jsonl").read_text(encoding="utf-8") == (
+        tmp_path / "second" / "layouts.jsonl"
+    ).read_text(encoding="utf-8")
+
+    spec = TemplateExtractor(
+        TemplateExtractorOptions(template_path=TEMPLATE_PATH), cache=cache
+    ).extract()
+    assert spec.layouts
+
+
 def test_layout_validation_suite_generates_diff_report(tmp_path) -> None:
     output_dir = tmp_path / "current"
     options = LayoutValidationOptions(
@@ -208,3 +247,14 @@ def test_layout_validation_reports_analyzer_snapshot_gaps(tmp_path) -> None:
     diff_report = json.loads(result.diff_report_path.read_text(encoding="utf-8"))
     diff_codes = {issue["code"] for issue in diff_report["issues"]}
     assert "analyzer_anchor_missing" in diff_codes
+
+
+def test_extraction_cache_defaults_to_user_cache_dir(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("PPTX_EXTRACTION_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    monkeypatch.chdir(tmp_path)
+
+    cache = TemplateExtractionCache.from_env()
+
+    assert cache.base_dir == tmp_path / "xdg" / "pptx-generator" / "extract"
+    assert not cache.base_dir.is_relative_to(Path.cwd() / ".pptx")
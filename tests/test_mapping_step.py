@@ -6,7 +6,8 @@ import json
 from pathlib import Path
 from typing import Iterable
 
-from pptx_generator.models import JobSpec
+from pptx_generator.models import (ContentElements, ContentSlide,
+                                   ContentTableData, JobSpec)
 from pptx_generator.pipeline.base import PipelineContext
 from pptx_generator.pipeline.mapping import MappingOptions, MappingStep
 from pptx_generator.brief import BriefCard, BriefDocument, BriefStoryContext, BriefStoryInfo
@@ -169,3 +170,25 @@ def test_mapping_step_applies_fallback_when_body_overflow(tmp_path: Path) -> Non
     assert fallback_report_path.exists()
     report_payload = json.loads(fallback_report_path.read_text(encoding="utf-8"))
     assert report_payload["slides"][0]["slide_id"] == "s01"
+
+
+def test_mapping_elements_do_not_share_lists_with_approved_content() -> None:
+    content_slide = ContentSlide(
+        id="s01",
+        intent="overview",
+        elements=ContentElements(
+            title="概要",
+            body=["一行目", "二行目"],
+            table_data=ContentTableData(headers=["H"], rows=[["R1"]]),
+        ),
+        status="approved",
+    )
+
+    elements = MappingStep._build_elements(None, content_slide)
+    elements["body"].append("追加")
+    elements["table"]["headers"].append("H2")
+    elements["table"]["rows"][0].append("R2")
+
+    assert content_slide.elements.body == ["一行目", "二行目"]
+    assert content_slide.elements.table_data.headers == ["H"]
+    assert content_slide.elements.table_data.rows == [["R1"]]
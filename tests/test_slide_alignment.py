@@ -146,3 +146,74 @@ def test_slide_id_aligner_does_not_replace_id_when_pending(monkeypatch: pytest.M
     pending = next(record for record in result.records if record.card_id == "intro")
     assert pending.status == "pending"
     assert pending.recommended_slide_id == captured["candidate"]
+
+
+def test_max_weight_assignment_prefers_global_optimum() -> None:
+    from pptx_generator.pipeline.slide_alignment import _max_weight_assignment
+
+    # 貪欲法では card0 → slide0 (3.0) を先に取り、合計 3.5 に留まる
+    edges = [
+        [(0, 3.0), (1, 2.5)],
+        [(0, 2.9), (2, 0.5)],
+    ]
+
+    assert _max_weight_assignment(edges) == [1, 0]
+    assert _max_weight_assignment([[], [(4, 1.0)]]) == [None, 4]
+
+
+def test_slide_id_aligner_sends_only_ambiguous_cards_to_llm_in_batches() -> None:
+    spec = _build_spec()
+    brief = _build_brief()
+    document = _build_content_document()
+    batches: list[list[str]] = []
+
+    class BatchClient:
+        def match_slide(self, request):  # pragma: no cover - バッチで応答するため呼ばれない
+            raise AssertionError("match_slide should not be called")
+
+        def match_slide_batch(self, requests):
+            batches.append([request.card_id for request in requests])
+            return [
+                SlideMatchResponse(slide_id=request.candidates[0].slide_id, confidence=0.99, reason="llm")
+                for request in requests
+            ]
+
+    aligner = SlideIdAligner(
+        SlideIdAlignerOptions(confidence_threshold=0.95, llm_batch_size=8),
+        llm_client=BatchClient(),
+    )
+
+    result = aligner.align(spec=spec, brief_document=brief, content_document=document)
+
+    # orphan は ID 一致でヒューリスティックのみで確定し、残り 2 枚が 1 リクエストにまとめられる
+    assert batches == [["intro", "solution"]]
+    records = {record.card_id: record for record in result.records}
+    assert records["orphan"].status == "applied"
+    assert records["orphan"].reason.startswith("global assignment")
+    assert [slide.id for slide in result.document.slides] == ["intro-slide", "solution-slide", "orphan"]
+
+
+def test_match_batch_prompt_omits_single_card_output_format() -> None:
+    from pptx_generator.content_ai.client import _build_match_batch_prompt
+
+    captured: list = []
+
+    class CapturingClient:
+        def match_slide(self, request):
+            captured.append(request)
+            return SlideMatchResponse(slide_id=request.candidates[0].slide_id, confidence=0.99, reason="llm")
+
+    aligner = SlideIdAligner(SlideIdAlignerOptions(confidence_threshold=0.95), llm_client=CapturingClient())
+    aligner.align(spec=_build_spec(), brief_document=_build_brief(), content_document=_build_content_document())
+
+    assert captured
+    # 単発問い合わせでは従来どおりカード単位の出力形式を指示する
+    assert '"recommended_slide_id"' in captured[0].prompt
+    prompt = _build_match_batch_prompt(captured)
+    # バッチでは matches 配列の形式だけを指示する
+    assert prompt.count("JSON 形式で回答してください") == 1
+    assert prompt.count('"recommended_slide_id"') == 1
+    assert '{"matches": [' in prompt
+    for request in captured:
+        assert f"card_id: {request.card_id}" in prompt
+        assert request.candidates[0].slide_id in prompt
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+
+from pptx_generator.branding_extractor import extract_branding_config
+from pptx_generator.pipeline.template_extractor import (TemplateExtractor,
+                                                        TemplateExtractorOptions)
+from pptx_generator.template_package import TemplatePackage
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+TEMPLATE_PATH = ROOT_DIR / "samples" / "templates" / "templates.pptx"
+
+
+def test_template_package_matches_direct_readers() -> None:
+    expected_hash = hashlib.sha256(TEMPLATE_PATH.read_bytes()).hexdigest()
+    direct_branding = extract_branding_config(TEMPLATE_PATH)
+    direct_spec = TemplateExtractor(
+        TemplateExtractorOptions(template_path=TEMPLATE_PATH)
+    ).extract()
+
+    with TemplatePackage.open(TEMPLATE_PATH) as package:
+        assert package.sha256 == expected_hash
+
+        branding = extract_branding_config(TEMPLATE_PATH, package=package)
+        assert branding.fonts == direct_branding.fonts
+        assert branding.colors == direct_branding.colors
+        assert branding.footer == direct_branding.footer
+
+        spec = TemplateExtractor(
+            TemplateExtractorOptions(template_path=TEMPLATE_PATH), package=package
+        ).extract()
+        assert [layout.model_dump() for layout in spec.layouts] == [
+            layout.model_dump() for layout in direct_spec.layouts
+        ]
+        # python-pptx のパース結果は共有される
+        assert package.presentation is package.presentation
@@ -10,6 +10,10 @@ from pptx_generator.models import (LayoutInfo, ShapeInfo, TemplateReleaseEnviron
                                    TemplateReleaseGoldenRun, TemplateSpec)
 from pptx_generator.template_audit import build_release_report, build_template_release
 from pptx_generator.template_audit import release as release_module
+from pptx_generator.settings import BrandingConfig, RulesConfig
+from pptx_generator.template_audit.golden import (GoldenRunInputs,
+                                                  assign_run_dirs,
+                                                  run_golden_specs)
 
 
 @pytest.fixture(autouse=True)
@@ -245,3 +249,71 @@ def test_build_template_release_with_golden_runs(tmp_path: Path) -> None:
     assert "golden error" in release.diagnostics.errors
     assert release.summary.analyzer_issue_total == 0
     assert release.summary.analyzer_fix_total == 0
+
+
+def test_assign_run_dirs_disambiguates_duplicate_stems(tmp_path: Path) -> None:
+    specs = [
+        Path("a/sample.json"),
+        Path("b/sample.json"),
+        Path("c/other.json"),
+    ]
+
+    run_dirs = assign_run_dirs(specs, tmp_path)
+
+    assert run_dirs == [
+        tmp_path / "sample-01",
+        tmp_path / "sample-02",
+        tmp_path / "other",
+    ]
+
+
+def _golden_inputs() -> GoldenRunInputs:
+    return GoldenRunInputs(
+        template_path=Path("samples/templates/templates.pptx"),
+        rules_config=RulesConfig.load(Path("config/rules.json")),
+        branding_config=BrandingConfig.load(Path("config/branding.json")),
+    )
+
+
+def _golden_specs(tmp_path: Path) -> list[Path]:
+    sample = Path("samples/json/sample_jobspec.json").read_text(encoding="utf-8")
+    first = tmp_path / "specs" / "a" / "deck.json"
+    broken = tmp_path / "specs" / "broken.json"
+    second = tmp_path / "specs" / "b" / "deck.json"
+    for path in (first, second):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(sample, encoding="utf-8")
+    broken.write_text('{"meta": {}}', encoding="utf-8")
+    return [first, broken, tmp_path / "specs" / "missing.json", second]
+
+
+def _summarize(results: list[TemplateReleaseGoldenRun], root: Path) -> list[tuple[str, str, str, int]]:
+    return [
+        (result.spec_path, result.status, str(Path(result.output_dir).relative_to(root)), len(result.errors))
+        for result in results
+    ]
+
+
+def test_run_golden_specs_process_pool_matches_serial_order(tmp_path: Path) -> None:
+    specs = _golden_specs(tmp_path)
+
+    serial = run_golden_specs(specs, inputs=_golden_inputs(), golden_root=tmp_path / "serial", workers=1)
+    parallel = run_golden_specs(specs, inputs=_golden_inputs(), golden_root=tmp_path / "parallel", workers=3)
+
+    assert [result.spec_path for result in parallel[0]] == [str(path) for path in specs]
+    assert [result.status for result in parallel[0]] == ["passed", "failed", "failed", "passed"]
+    assert _summarize(parallel[0], tmp_path / "parallel") == _summarize(serial[0], tmp_path / "serial")
+    assert parallel[1] == serial[1]
+    assert parallel[2] == serial[2]
+    assert (tmp_path / "parallel" / "deck-02" / "deck.pptx").exists()
+
+
+def test_run_golden_specs_process_pool_propagates_worker_errors(tmp_path: Path) -> None:
+    specs = _golden_specs(tmp_path)
+    golden_root = tmp_path / "golden"
+    golden_root.mkdir()
+    # 出力ディレクトリと同名のファイルがあるとワーカー内で例外になる
+    (golden_root / "deck-02").write_text("", encoding="utf-8")
+
+    with pytest.raises(FileExistsError):
+        run_golden_specs(specs, inputs=_golden_inputs(), golden_root=golden_root, workers=2)
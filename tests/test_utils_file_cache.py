@@ -0,0 +1,42 @@
+import os
+
+from pptx_generator.utils.file_cache import FileCache
+
+
+def test_file_cache_reuses_value_until_file_changes(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text("{}", encoding="utf-8")
+    calls = []
+
+    def loader(target):
+        calls.append(target)
+        return target.read_text(encoding="utf-8")
+
+    cache = FileCache(enabled=True)
+    assert cache.get("rules", path, loader) == "{}"
+    assert cache.get("rules", path, loader) == "{}"
+    assert len(calls) == 1
+
+    path.write_text('{"a": 1}', encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert cache.get("rules", path, loader) == '{"a": 1}'
+    assert len(calls) == 2
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["invalidations"] == 1
+
+
+def test_file_cache_disabled_always_calls_loader(tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text("{}", encoding="utf-8")
+    calls = []
+
+    cache = FileCache()
+    cache.get("rules", path, lambda target: calls.append(target))
+    cache.get("rules", path, lambda target: calls.append(target))
+
+    assert len(calls) == 2
+    assert cache.stats()["entries"] == 0
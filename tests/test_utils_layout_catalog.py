@@ -0,0 +1,103 @@
+import random
+
+from pptx_generator.draft_recommender import (CardLayoutRecommender,
+                                              CardLayoutRecommenderConfig,
+                                              LayoutProfile)
+from pptx_generator.models import (ContentElements, ContentSlide,
+                                   ContentTableData)
+from pptx_generator.utils.layout_catalog import LayoutCatalogIndex
+
+
+def _profile(layout_id, tags, max_lines=None, allow_table=False):
+    return LayoutProfile(
+        layout_id,
+        layout_id,
+        tags,
+        {"max_lines": max_lines} if max_lines is not None else {},
+        {"allow_table": allow_table},
+    )
+
+
+def test_layout_catalog_index_precomputes_features_and_tags():
+    index = LayoutCatalogIndex(
+        [
+            _profile("Title", ("title",), max_lines=2),
+            _profile("Content", ("content", "overview"), max_lines="6"),
+            _profile("Table", ("table",), allow_table=True),
+        ]
+    )
+
+    assert len(index) == 3
+    assert index.layout_ids == ("Title", "Content", "Table")
+    assert index.get("Content").layout_name == "Content"
+    assert index.features[1].max_lines == 6
+    assert index.features[2].allows_table is True
+    assert index.matching(["overview", "table", None, "unknown"]) == {1, 2}
+
+
+def test_layout_catalog_index_representatives_limit_each_capacity_group():
+    index = LayoutCatalogIndex(
+        [_profile(f"Plain{number}", (), max_lines=5) for number in range(10)]
+        + [_profile("Wide", (), max_lines=10)]
+    )
+
+    assert index.representatives({0}, 3) == [1, 2, 3, 10]
+
+
+def test_layout_catalog_index_does_not_modify_profiles():
+    tags = ["content", "overview"]
+    profile = LayoutProfile("Content", "Content", tags, {}, {})
+
+    index = LayoutCatalogIndex([profile])
+
+    assert profile.usage_tags is tags
+    assert index.features[0].usage_tags == frozenset(tags)
+    assert index.get("Content") is profile
+
+
+def test_pruned_candidate_search_matches_exhaustive_scan(monkeypatch):
+    rng = random.Random(20251019)
+    vocabulary = ["title", "content", "overview", "agenda", "table", "summary", "visual", "closing"]
+    intents = [None, "content", "overview", "agenda", "summary", "unknown"]
+
+    for _ in range(30):
+        profiles = [
+            _profile(
+                f"Layout{number}",
+                tuple(rng.sample(vocabulary, rng.randint(0, 3))),
+                max_lines=rng.choice([None, 2, 4, 6]),
+                allow_table=rng.random() < 0.3,
+            )
+            for number in range(rng.randint(1, 40))
+        ]
+        index = LayoutCatalogIndex(profiles)
+        recommender = CardLayoutRecommender(
+            CardLayoutRecommenderConfig(enable_ai=rng.random() < 0.5, max_candidates=rng.randint(1, 6))
+        )
+        for _ in range(5):
+            slide = ContentSlide(
+                id="s1",
+                intent=rng.choice(intents[1:]),
+                type_hint=rng.choice(intents),
+                elements=ContentElements(
+                    title=" ".join(rng.sample(vocabulary, 2)),
+                    body=[rng.choice(vocabulary) for _ in range(rng.randint(0, 6))],
+                    table_data=ContentTableData(headers=["a"], rows=[["1"]]) if rng.random() < 0.3 else None,
+                ),
+                status="draft",
+            )
+            preferred = rng.choice(index.layout_ids)
+
+            def _summary(result):
+                return [(candidate.layout_id, candidate.score) for candidate, _ in result.candidates]
+
+            pruned = _summary(recommender._finalize(slide, preferred, index, None, {}, None))
+            with monkeypatch.context() as patch:
+                # 全レイアウトを個別に評価する
+                patch.setattr(
+                    index,
+                    "representatives",
+                    lambda exclude, limit: [position for position in range(len(index)) if position not in exclude],
+                )
+                exhaustive = _summary(recommender._finalize(slide, preferred, index, None, {}, None))
+            assert pruned == exhaustive
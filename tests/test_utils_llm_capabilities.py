@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+from pptx_generator.content_ai.client import OpenAIChatClient
+from pptx_generator.utils.llm_capabilities import ProviderCapabilityRegistry
+
+
+def test_capability_registry_expires_and_persists(tmp_path):
+    now = [1000.0]
+    path = tmp_path / "capabilities.json"
+    registry = ProviderCapabilityRegistry(ttl_seconds=60, path=path, clock=lambda: now[0])
+
+    registry.record("openai-chat", "gpt-x", variant={"token_param": "max_tokens"})
+    reloaded = ProviderCapabilityRegistry(ttl_seconds=60, path=path, clock=lambda: now[0])
+    entry = reloaded.lookup("openai-chat", "gpt-x")
+    assert entry is not None
+    assert entry.variant == {"token_param": "max_tokens"}
+
+    now[0] += 61
+    assert reloaded.lookup("openai-chat", "gpt-x") is None
+    stats = reloaded.stats()
+    assert stats["hits"] == 1
+    assert stats["expired"] == 1
+    assert stats["entries"] == 0
+
+
+def test_openai_client_reuses_learned_token_parameter():
+    calls = []
+
+    def create(**kwargs):
+        calls.append(dict(kwargs))
+        if "max_completion_tokens" in kwargs:
+            raise ValueError("Unsupported parameter: 'max_completion_tokens'; use 'max_tokens' instead")
+        message = SimpleNamespace(content='{"title": "t", "body": ["b"]}', refusal=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason="stop")])
+
+    transport = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    registry = ProviderCapabilityRegistry()
+    client = OpenAIChatClient(transport, model="legacy", temperature=0.3, max_tokens=256, capabilities=registry)
+    messages = [{"role": "user", "content": "hi"}]
+
+    client._complete(messages, model_name="legacy", max_tokens=256, log_extra={})
+    assert len(calls) == 2
+
+    client._complete(messages, model_name="legacy", max_tokens=256, log_extra={})
+    assert len(calls) == 3
+    assert calls[-1]["max_tokens"] == 256
+    assert "max_completion_tokens" not in calls[-1]
+    assert registry.stats()["avoided_retries"] == 1
@@ -0,0 +1,42 @@
+from pptx_generator.content_ai.client import OpenAIChatClient
+from pptx_generator.utils import llm_sdk
+from pptx_generator.utils.llm_sdk import HttpPoolSettings, SdkClientPool
+
+
+def test_sdk_client_pool_shares_clients_per_credentials():
+    pool = SdkClientPool(HttpPoolSettings(max_connections=4, max_keepalive_connections=2))
+
+    first = pool.openai(api_key="key-a")
+    second = pool.openai(api_key="key-a")
+    other = pool.openai(api_key="key-b")
+
+    assert first is second
+    assert other is not first
+    assert pool.stats() == {"clients": 2, "created": 2, "reused": 1}
+
+    pool.close()
+    assert pool.stats()["clients"] == 0
+
+
+def test_http_pool_settings_from_env(monkeypatch):
+    monkeypatch.setenv("PPTX_LLM_HTTP_MAX_CONNECTIONS", "8")
+    monkeypatch.setenv("PPTX_LLM_HTTP_KEEPALIVE_EXPIRY", "invalid")
+    monkeypatch.setenv("PPTX_LLM_HTTP2", "0")
+
+    settings = HttpPoolSettings.from_env()
+
+    assert settings.max_connections == 8
+    assert settings.keepalive_expiry == llm_sdk.DEFAULT_KEEPALIVE_EXPIRY_SECONDS
+    assert settings.http2 is False
+
+
+def test_openai_client_from_env_uses_shared_pool(monkeypatch):
+    pool = SdkClientPool(HttpPoolSettings())
+    monkeypatch.setattr("pptx_generator.content_ai.client.shared_sdk_clients", pool)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+    first = OpenAIChatClient.from_env()
+    second = OpenAIChatClient.from_env()
+
+    assert first._client is second._client
+    assert pool.stats()["reused"] == 1